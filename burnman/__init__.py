@@ -227,7 +227,8 @@ from .utils import geotherm
 # Classes and associated functions for representing rocks and minerals:
 from .classes.material import Material, material_property
 from .classes.perplex import PerplexMaterial
-from .classes.mineral import Mineral
+from .classes.tabulated import TabulatedMaterial
+from .classes.mineral import Mineral, EndmemberStateRegistry, StateCache
 from .classes.combinedmineral import CombinedMineral
 from .classes.solution import Solution, SolidSolution, RelaxedSolution
 from .classes.elasticsolutionmodel import ElasticSolutionModel
@@ -251,18 +252,12 @@ from .classes.polytope import MaterialPolytope
 from .classes import seismic
 from .classes import averaging_schemes
 
-# Mineral library
-from . import minerals
-
 # Equations of state
 from . import eos
 
-# Calibrants
-from . import calibrants
-
 # High level tools
 from . import tools
-from .tools.equilibration import equilibrate
+from .tools.equilibration import equilibrate, equilibrate_many
 from .tools.partitioning import calculate_nakajima_fp_pv_partition_coefficient
 
 # Optimization functions
@@ -273,3 +268,10 @@ from .optimize import nonlinear_solvers
 from .optimize import eos_fitting
 
 __version__ = importlib.metadata.version("burnman")
+
+# The mineral library (minerals) and calibrants are only imported
+# when they are first accessed, as importing them is slow.
+# They are listed in __all__, so that from burnman import * still binds them.
+_lazy_submodules = ["minerals", "calibrants"]
+__all__ = [name for name in vars() if not name.startswith("_")] + _lazy_submodules
+__getattr__, __dir__ = utils.misc.lazy_submodules(__name__, _lazy_submodules)
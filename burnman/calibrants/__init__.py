@@ -47,42 +47,50 @@ Calibrant database
   - :mod:`~burnman.calibrants.Zhao_2000`
 """
 
-from . import Anderson_1989
-from . import Armentrout_2015
-from . import Campbell_2009
-from . import Chidester_2021
-from . import Decker_1971
-from . import Dewaele_2008
-from . import Dewaele_2012
-from . import Dewaele_2013
-from . import Dewaele_2020
-from . import Dorogokupets_2007
-from . import Dorogokupets_2017
-from . import Dubrovinsky_1998
-from . import Fei_2007
-from . import Fei_2016
-from . import Holmes_1989
-from . import Huang_2016
-from . import LeGodec_2000
-from . import Litasov_2013
-from . import Matsui_2009
-from . import Matsui_2010
-from . import Matsui_2012
-from . import Miozzi_2020
-from . import Ono_2022
-from . import Pigott_2015
-from . import Shi_2022
-from . import Shim_2002
-from . import Sokolova_2013
-from . import Speziale_2001
-from . import Tange_2009
-from . import Tateno_2019
-from . import Tsuchiya_2003
-from . import Walker_2002
-from . import Zeng_2010
-from . import Zha_2004
-from . import Zha_2008
-from . import Zhang_1999
-from . import Zhao_1997
-from . import Zhao_2000
-from . import tools
+from ..utils.misc import lazy_submodules
+
+# The submodules are only imported when they are first accessed,
+# as importing all of them makes importing burnman slow.
+__all__ = [
+    "Anderson_1989",
+    "Armentrout_2015",
+    "Campbell_2009",
+    "Chidester_2021",
+    "Decker_1971",
+    "Dewaele_2008",
+    "Dewaele_2012",
+    "Dewaele_2013",
+    "Dewaele_2020",
+    "Dorogokupets_2007",
+    "Dorogokupets_2017",
+    "Dubrovinsky_1998",
+    "Fei_2007",
+    "Fei_2016",
+    "Holmes_1989",
+    "Huang_2016",
+    "LeGodec_2000",
+    "Litasov_2013",
+    "Matsui_2009",
+    "Matsui_2010",
+    "Matsui_2012",
+    "Miozzi_2020",
+    "Ono_2022",
+    "Pigott_2015",
+    "Shi_2022",
+    "Shim_2002",
+    "Sokolova_2013",
+    "Speziale_2001",
+    "Tange_2009",
+    "Tateno_2019",
+    "Tsuchiya_2003",
+    "Walker_2002",
+    "Zeng_2010",
+    "Zha_2004",
+    "Zha_2008",
+    "Zhang_1999",
+    "Zhao_1997",
+    "Zhao_2000",
+    "tools",
+]
+
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
@@ -10,6 +10,7 @@ BurnMan object classes
 
 from . import material
 from . import perplex
+from . import tabulated
 from . import mineral
 from . import combinedmineral
 from . import solutionmodel
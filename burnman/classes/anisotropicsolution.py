@@ -6,7 +6,7 @@ import numpy as np
 import copy
 from scipy.linalg import expm, logm
 from scipy.optimize import minimize
-from .solution import Solution
+from .solution import Solution, relax_solution
 from .anisotropicmineral import (
     AnisotropicMineral,
     convert_f_Pth_to_f_T_derivatives,
@@ -286,6 +286,11 @@ class RelaxedAnisotropicSolution(AnisotropicSolution):
     high spin and low spin iron, and so a single vector should be passed:
     np.array([[0., -1., 1.]]) or some multiple thereof.
 
+    The structure parameters are relaxed using Newton's method
+    (see :func:`burnman.classes.solution.relax_solution`).
+    The number of iterations used in the last relaxation is stored
+    in the relaxation_iterations attribute.
+
     States of the mineral can only be queried after setting the
     pressure and temperature using set_state() and the composition using
     set_composition().
@@ -320,6 +325,14 @@ class RelaxedAnisotropicSolution(AnisotropicSolution):
 
         self.q_initial = np.zeros(len(relaxation_vectors)) + 0.001
 
+        # Matrix converting endmember amounts into structure parameters,
+        # used to warm-start each relaxation from the last relaxed state
+        self._dqdn = np.linalg.inv(np.hstack((self.dndq, self.dndx)))[
+            : self.n_relaxation_vectors
+        ]
+        self._q_relaxed = None
+        self.relaxation_iterations = None
+
         try:
             molar_fractions = anisotropic_solution.molar_fractions
         except AttributeError:
@@ -370,9 +383,11 @@ class RelaxedAnisotropicSolution(AnisotropicSolution):
             unrelaxed vectors specified during initialisation.
         :type molar_fractions: 1D numpy array
         :param q_initial: Initial values of the structure parameters.
-            Defaults to None, in which case the preexisting
-            initial values are used
-            (first set to 0.001 during initialisation).
+            Defaults to None, in which case the relaxation starts
+            from the most recently relaxed structure parameters,
+            if they give non-negative site occupancies at the new
+            composition, or otherwise from the preexisting
+            initial values (first set to 0.001 during initialisation).
         :type q_initial: 1D numpy array, optional
         :param relaxed: Whether to minimize the Gibbs energy
             of the material by changing the values of the structure
@@ -386,13 +401,24 @@ class RelaxedAnisotropicSolution(AnisotropicSolution):
             "ij, j", self.dndx, molar_fractions
         )
 
+        if relaxed and q_initial is None and self._q_relaxed is not None:
+            n_warm = np.einsum("ij, j", self.dndq, self._q_relaxed) + np.einsum(
+                "ij, j", self.dndx, molar_fractions
+            )
+            occupancies = np.einsum(
+                "i, ij", n_warm, self.solution_model.endmember_occupancies
+            )
+            if np.all(occupancies >= 0.0):
+                n = n_warm
+
         self.unrelaxed.set_composition(n)
 
         if self.unrelaxed.pressure is not None and relaxed:
             self._relax_at_PTX()
-            AnisotropicSolution.set_composition(self, n)
-            self.unrelaxed._scalar_solution.set_composition(self.molar_fractions)
-            self.unrelaxed.set_composition(self.molar_fractions)
+            if self.pressure is None:
+                AnisotropicSolution.set_state(
+                    self, self.unrelaxed.pressure, self.unrelaxed.temperature
+                )
 
     def _relax_at_PTX(self):
         """
@@ -403,18 +429,25 @@ class RelaxedAnisotropicSolution(AnisotropicSolution):
         state and composition have already been set. This function
         should not generally be needed by the user.
         """
+        _, self.relaxation_iterations, converged = relax_solution(
+            self.unrelaxed._scalar_solution, self.dndq
+        )
         n0 = copy.copy(self.unrelaxed._scalar_solution.molar_fractions)
 
-        def G_func(dq):
-            n = n0 + np.einsum("ij, j", self.dndq, dq)
-            self.unrelaxed._scalar_solution.set_composition(n)
-            return self.unrelaxed._scalar_solution.molar_gibbs
+        if not converged:
 
-        sol = minimize(G_func, np.zeros(len(self.dndq[0])), method="Nelder-Mead")
-        assert sol.success
-        n = n0 + np.einsum("ij, j", self.dndq, sol.x)
-        self.unrelaxed.set_composition(n)
-        AnisotropicSolution.set_composition(self, n)
+            def G_func(dq):
+                n = n0 + np.einsum("ij, j", self.dndq, dq)
+                self.unrelaxed._scalar_solution.set_composition(n)
+                return self.unrelaxed._scalar_solution.molar_gibbs
+
+            sol = minimize(G_func, np.zeros(len(self.dndq[0])), method="Nelder-Mead")
+            assert sol.success
+            n0 = n0 + np.einsum("ij, j", self.dndq, sol.x)
+
+        self._q_relaxed = np.einsum("ij, j", self._dqdn, n0)
+        self.unrelaxed.set_composition(n0)
+        AnisotropicSolution.set_composition(self, n0)
 
     def set_state_with_volume(
         self, volume, temperature, pressure_guesses=[0.0e9, 10.0e9]
@@ -5,7 +5,6 @@
 
 
 import numpy as np
-from sympy import Matrix, nsimplify
 import warnings
 
 from .material import Material, material_property, cached_property
@@ -175,8 +174,12 @@ class Composite(Material):
         Update the material to the given pressure [Pa] and temperature [K].
         """
         Material.set_state(self, pressure, temperature)
+        registry = self.state_registry
         for phase in self.phases:
-            phase.set_state(pressure, temperature)
+            if registry is None:
+                phase.set_state(pressure, temperature)
+            else:
+                registry.set_state(phase, pressure, temperature)
 
     def debug_print(self, indent=""):
         print("{0}Composite: {1}".format(indent, self.name))
@@ -585,6 +588,7 @@ class Composite(Material):
         An sympy Matrix where each element M[i,j] corresponds
         to the number of atoms of element[j] in endmember[i].
         """
+        from sympy import Matrix, nsimplify
 
         def f(i, j):
             e = self.elements[j]
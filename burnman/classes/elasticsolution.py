@@ -5,7 +5,6 @@
 
 
 import numpy as np
-from sympy import Matrix, nsimplify
 import scipy.optimize as opt
 
 from burnman.classes.solutionmodel import IdealSolution
@@ -110,6 +109,9 @@ class ElasticSolution(Mineral):
 
         self.reset()
         self.molar_fractions = np.array(molar_fractions)
+        # Allows the solution model to store quantities
+        # calculated for the current composition
+        self.solution_model._composition_key = self.molar_fractions
 
         if self.temperature is not None:
             _ = self.molar_volume
@@ -729,6 +731,7 @@ class ElasticSolution(Mineral):
         A sympy Matrix where each element M[i,j] corresponds
         to the number of atoms of element[j] in endmember[i].
         """
+        from sympy import Matrix, nsimplify
 
         def f(i, j):
             e = self.elements[j]
@@ -4,25 +4,18 @@
 # GPL v2 or later.
 
 
-import importlib
 import warnings
 import numpy as np
 from ..utils.chemistry import process_solution_chemistry
 from .solutionmodel import _ideal_activities_fct
 from .solutionmodel import _non_ideal_hessian_fct, _non_ideal_interactions_fct
-from .solutionmodel import _non_ideal_hessian_subreg
-from .solutionmodel import _non_ideal_interactions_subreg
+from .solutionmodel import _interaction_tensor
+from .solutionmodel import _subregular_terms
+from .solutionmodel import _subregular_interactions, _subregular_hessian
 from .solutionmodel import logish, inverseish
+from .solutionmodel import _import_autograd
 from .. import constants
 
-try:
-    ag = importlib.import_module("autograd")
-except ImportError as err:
-    print(
-        f"Warning: {err}. "
-        "For full functionality of BurnMan, please install autograd."
-    )
-
 
 class ElasticSolutionModel(object):
     """
@@ -40,6 +33,10 @@ class ElasticSolutionModel(object):
     averages of the different endmember values.
     """
 
+    _composition_key = None
+    _Wsym = None
+    _subregular_terms_cache = None
+
     def __init__(self):
         """
         Does nothing.
@@ -541,6 +538,11 @@ class ElasticSubregularSolution(ElasticIdealSolution):
 
     Interaction parameters are inserted into a 3D interaction matrix during
     initialization to make use of numpy vector algebra.
+    The sums of these matrices over all permutations of their indices,
+    from which the partial properties and hessians are calculated,
+    are computed when first needed and stored. They are recalculated
+    whenever one of the interaction matrices (Wijke, Wijks and Wijkp)
+    is assigned or modified in place.
 
     :param endmembers: A list of all the independent endmembers in the solution.
         The first item of each list gives the Mineral object corresponding
@@ -572,6 +574,10 @@ class ElasticSubregularSolution(ElasticIdealSolution):
     :type entropy_ternary_terms: list of lists
     """
 
+    Wijke = _interaction_tensor("Wijke")
+    Wijks = _interaction_tensor("Wijks")
+    Wijkp = _interaction_tensor("Wijkp")
+
     def __init__(
         self,
         endmembers,
@@ -652,17 +658,24 @@ class ElasticSubregularSolution(ElasticIdealSolution):
         # initialize ideal solution model
         ElasticIdealSolution.__init__(self, endmembers)
 
-    def _non_ideal_function(self, Wijk, molar_fractions):
-        n = len(molar_fractions)
-        return _non_ideal_interactions_subreg(molar_fractions, n, Wijk)
+    def _non_ideal_terms(self, molar_fractions):
+        return _subregular_terms(
+            self, (self.Wijke, self.Wijks, self.Wijkp), molar_fractions
+        )
 
     def _non_ideal_interactions(self, molar_fractions):
         # equation (6') of Helffrich and Wood, 1989
-        Eint = self._non_ideal_function(self.Wijke, molar_fractions)
-        Sint = self._non_ideal_function(self.Wijks, molar_fractions)
-        Pint = self._non_ideal_function(self.Wijkp, molar_fractions)
+        Eint, Sint, Pint = _subregular_interactions(
+            *self._non_ideal_terms(molar_fractions)
+        )
         return Eint, Sint, Pint
 
+    def _non_ideal_hessians(self, molar_fractions):
+        hess_E, hess_S, hess_P = _subregular_hessian(
+            *self._non_ideal_terms(molar_fractions)
+        )
+        return hess_E, hess_S, hess_P
+
     def _non_ideal_excess_partial_helmholtz(self, volume, temperature, molar_fractions):
         Eint, Sint, Pint = self._non_ideal_interactions(molar_fractions)
         return Eint - temperature * Sint - volume * Pint
@@ -680,39 +693,31 @@ class ElasticSubregularSolution(ElasticIdealSolution):
         ideal_entropies = ElasticIdealSolution._ideal_excess_partial_entropies(
             self, temperature, molar_fractions
         )
-        non_ideal_entropies = self._non_ideal_function(self.Wijks, molar_fractions)
+        non_ideal_entropies = self._non_ideal_interactions(molar_fractions)[1]
         return ideal_entropies + non_ideal_entropies
 
     def excess_partial_pressures(self, volume, temperature, molar_fractions):
-        non_ideal_pressures = self._non_ideal_function(self.Wijkp, molar_fractions)
+        non_ideal_pressures = self._non_ideal_interactions(molar_fractions)[2]
         return non_ideal_pressures
 
     def helmholtz_hessian(self, volume, temperature, molar_fractions):
-        n = len(molar_fractions)
         ideal_entropy_hessian = ElasticIdealSolution._ideal_entropy_hessian(
             self, temperature, molar_fractions
         )
-        nonideal_helmholtz_hessian = _non_ideal_hessian_subreg(
-            molar_fractions,
-            n,
-            self.Wijke - temperature * self.Wijks - volume * self.Wijkp,
-        )
+        hess_E, hess_S, hess_P = self._non_ideal_hessians(molar_fractions)
+        nonideal_helmholtz_hessian = hess_E - temperature * hess_S - volume * hess_P
 
         return nonideal_helmholtz_hessian - temperature * ideal_entropy_hessian
 
     def entropy_hessian(self, volume, temperature, molar_fractions):
-        n = len(molar_fractions)
         ideal_entropy_hessian = ElasticIdealSolution._ideal_entropy_hessian(
             self, temperature, molar_fractions
         )
-        nonideal_entropy_hessian = _non_ideal_hessian_subreg(
-            molar_fractions, n, self.Wijks
-        )
+        nonideal_entropy_hessian = self._non_ideal_hessians(molar_fractions)[1]
         return ideal_entropy_hessian + nonideal_entropy_hessian
 
     def pressure_hessian(self, volume, temperature, molar_fractions):
-        n = len(molar_fractions)
-        return _non_ideal_hessian_subreg(molar_fractions, n, self.Wijkp)
+        return self._non_ideal_hessians(molar_fractions)[2]
 
 
 class ElasticFunctionSolution(ElasticIdealSolution):
@@ -749,6 +754,7 @@ class ElasticFunctionSolution(ElasticIdealSolution):
         self.n_endmembers = len(endmembers)
         self._excess_helmholtz_function = excess_helmholtz_function
 
+        ag = _import_autograd()
         self._non_ideal_excess_partial_helmholtz = ag.jacobian(
             excess_helmholtz_function, argnum=2
         )
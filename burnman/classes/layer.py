@@ -4,16 +4,62 @@
 # GPL v2 or later.
 
 import numpy as np
-from scipy.integrate import odeint
-from scipy.integrate import quad
-from scipy.interpolate import UnivariateSpline, interp1d
+from scipy.interpolate import interp1d
 from scipy.optimize import fsolve
 from burnman import constants
 from burnman.utils import geotherm
+from burnman.utils.math import cumulative_integral
 import warnings
 
 from .material import Material, material_property
 
+# The properties of the layer material that are stored by the layer
+_material_property_names = [
+    "molar_internal_energy",
+    "molar_gibbs",
+    "molar_helmholtz",
+    "molar_mass",
+    "molar_volume",
+    "density",
+    "molar_entropy",
+    "molar_enthalpy",
+    "isothermal_bulk_modulus_reuss",
+    "isentropic_bulk_modulus_reuss",
+    "isothermal_compressibility_reuss",
+    "isentropic_compressibility_reuss",
+    "shear_modulus",
+    "p_wave_velocity",
+    "bulk_sound_velocity",
+    "shear_wave_velocity",
+    "grueneisen_parameter",
+    "thermal_expansivity",
+    "molar_heat_capacity_v",
+    "molar_heat_capacity_p",
+]
+
+# Short names of the properties of the layer material
+_material_property_aliases = {
+    "energy": "molar_internal_energy",
+    "helmholtz": "molar_helmholtz",
+    "gibbs": "molar_gibbs",
+    "V": "molar_volume",
+    "rho": "density",
+    "S": "molar_entropy",
+    "H": "molar_enthalpy",
+    "K_T": "isothermal_bulk_modulus_reuss",
+    "K_S": "isentropic_bulk_modulus_reuss",
+    "beta_T": "isothermal_compressibility_reuss",
+    "beta_S": "isentropic_compressibility_reuss",
+    "G": "shear_modulus",
+    "v_p": "p_wave_velocity",
+    "v_phi": "bulk_sound_velocity",
+    "v_s": "shear_wave_velocity",
+    "gr": "grueneisen_parameter",
+    "alpha": "thermal_expansivity",
+    "C_v": "molar_heat_capacity_v",
+    "C_p": "molar_heat_capacity_p",
+}
+
 
 class Layer(object):
     """
@@ -38,9 +84,28 @@ class Layer(object):
     although the evaluate() function can take a newly defined depthlist
     and values are interpolated between these (sufficient sampling of the layer
     is needed for this to be accurate).
+
+    Each material property of the layer (e.g. density) is evaluated
+    across the whole layer the first time that it is requested,
+    which requires the state of the material to be set at every radius.
+    Many properties are most efficiently obtained with a single call
+    to evaluate(), which evaluates all of the requested properties
+    of the material in one pass.
+
+    Gravity, pressure, mass and moment of inertia are obtained by
+    integrating over the radial grid (see
+    :func:`burnman.utils.math.cumulative_integral`).
+    By default, a high order scheme is used, with errors that decrease
+    as the fourth power of the (even) grid spacing. If
+    high_order_integration is set to False, the trapezoidal rule is
+    used instead, with errors that decrease as the square of the grid
+    spacing. The trapezoidal rule should only be used for finely
+    sampled layers.
     """
 
-    def __init__(self, name=None, radii=None, verbose=False):
+    def __init__(
+        self, name=None, radii=None, verbose=False, high_order_integration=True
+    ):
         self.name = name
         assert np.all(np.diff(radii) > 0)
         self.radii = radii
@@ -49,10 +114,13 @@ class Layer(object):
         self.thickness = self.outer_radius - self.inner_radius
         self.n_slices = len(self.radii)
         self.verbose = verbose
+        self.high_order_integration = high_order_integration
         self._cached = {}
         self._pressures = None
         self._temperatures = None
-        self.sublayers = None
+        self._material_properties = {}
+        self._interpolators = {}
+        self._sublayers = None
         self.material = None
         self.pressure_mode = "self-consistent"
         self.temperature_mode = None
@@ -76,7 +144,35 @@ class Layer(object):
         self._cached = {}
         self._pressures = None
         self._temperatures = None
-        self.sublayers = None
+        self._material_properties = {}
+        self._interpolators = {}
+        self._sublayers = None
+
+    @property
+    def sublayers(self):
+        """
+        Copies of the layer material, with states set to the
+        pressure and temperature at each radius of the layer,
+        or None if make() has not been called.
+
+        .. deprecated::
+            The layer no longer stores a copy of the material
+            for each radius; the copies are made when this attribute is
+            first accessed. Use the properties of the layer or
+            :func:`Layer.evaluate` instead.
+        """
+        warnings.warn(
+            "Layer.sublayers is deprecated and will be removed in a future "
+            "version. Use the properties of the layer or Layer.evaluate() instead.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        if self._sublayers is None and hasattr(self, "temperatures"):
+            self._sublayers = []
+            for i in range(len(self.radii)):
+                self._sublayers.append(self.material.copy())
+                self._sublayers[i].set_state(self.pressures[i], self.temperatures[i])
+        return self._sublayers
 
     def set_material(self, material):
         """
@@ -200,8 +296,8 @@ class Layer(object):
         """
         This routine needs to be called before evaluating any properties.
         If pressures and temperatures are not user-defined, they
-        are computed here. This method also initializes an array of copied
-        materials from which properties can be computed.
+        are computed here. The material properties across the layer
+        are evaluated when they are first requested.
         """
         self.reset()
         if not hasattr(self, "material"):
@@ -254,11 +350,6 @@ class Layer(object):
         else:
             raise NotImplementedError("pressure mode not recognised")
 
-        self.sublayers = []
-        for r in range(len(self.radii)):
-            self.sublayers.append(self.material.copy())
-            self.sublayers[r].set_state(self.pressures[r], self.temperatures[r])
-
     def evaluate(self, properties, radlist=None, radius_planet=None):
         """
         Function that is used to evaluate properties
@@ -283,6 +374,9 @@ class Layer(object):
         """
 
         if radlist is None:
+            self._evaluate_material_properties(
+                [_material_property_aliases.get(prop, prop) for prop in properties]
+            )
             values = np.empty([len(properties), len(self.radii)])
             for i, prop in enumerate(properties):
                 if prop == "depth":
@@ -291,34 +385,99 @@ class Layer(object):
                     try:
                         values[i] = getattr(self, prop)
                     except:
-                        values[i] = np.array(
-                            [
-                                getattr(self.sublayers[i], prop)
-                                for i in range(len(self.sublayers))
-                            ]
-                        )
+                        values[i] = self._material_property(prop)
         else:
-            func_p = interp1d(self.radii, self.pressures)
-            pressures = func_p(radlist)
-            func_t = interp1d(self.radii, self.temperatures)
-            temperatures = func_t(radlist)
+            pressures = self._interpolator("pressures")(radlist)
+            temperatures = self._interpolator("temperatures")(radlist)
+
+            # All the requested properties of the layer material
+            # are evaluated in a single pass
+            names = [
+                name
+                for name in dict.fromkeys(
+                    _material_property_aliases.get(prop, prop) for prop in properties
+                )
+                if name in _material_property_names
+            ]
+            material_values = {}
+            if len(names) > 0:
+                try:
+                    material_values = dict(
+                        zip(
+                            names,
+                            self.material.evaluate(names, pressures, temperatures),
+                        )
+                    )
+                except Exception:
+                    # The properties will be interpolated instead
+                    pass
+
             values = np.empty([len(properties), len(radlist)])
             for i, prop in enumerate(properties):
+                name = _material_property_aliases.get(prop, prop)
                 if prop == "depth":
                     values[i] = radius_planet - radlist
+                elif name in material_values:
+                    values[i] = material_values[name]
                 else:
-                    try:
-                        values[i] = self.material.evaluate(
-                            [prop], pressures, temperatures
-                        )
-                    except:
-                        func_prop = interp1d(self.radii, getattr(self, prop))
-                        values[i] = func_prop(radlist)
+                    values[i] = self._interpolator(prop)(radlist)
 
         if values.shape[0] == 1:
             values = values[0]
         return values
 
+    def _interpolator(self, name):
+        """
+        Returns a linear interpolator for the named property of the layer
+        as a function of radius. The interpolators are stored, so that
+        they are only built once after each call to make().
+        """
+        if name not in self._interpolators:
+            self._interpolators[name] = interp1d(self.radii, getattr(self, name))
+        return self._interpolators[name]
+
+    def _evaluate_material_properties(self, names):
+        """
+        Evaluates the requested properties of the layer material
+        that have not already been evaluated, at the pressures and
+        temperatures of the layer. The properties are evaluated in a single
+        pass, and stored as arrays. If this fails, each property
+        is evaluated individually.
+        """
+        names = [
+            name
+            for name in dict.fromkeys(names)
+            if name in _material_property_names
+            and name not in self._material_properties
+        ]
+        if len(names) == 0:
+            return
+        try:
+            values = self.material.evaluate(names, self.pressures, self.temperatures)
+        except (AttributeError, NotImplementedError, TypeError, ValueError) as e:
+            if len(names) == 1:
+                raise
+            warnings.warn(
+                "The properties of the layer material could not be evaluated "
+                f"in a single pass ({e}), so they will be "
+                "evaluated individually.",
+                stacklevel=3,
+            )
+            return
+        self._material_properties.update(zip(names, values))
+
+    def _material_property(self, name):
+        """
+        Returns the values of a property of the layer material at the
+        pressures and temperatures of the layer.
+        The values are stored, so that they are only evaluated once.
+        """
+        if name not in self._material_properties:
+            self._material_properties[name] = self.material.evaluate(
+                [name], self.pressures, self.temperatures
+            )[0]
+        return self._material_properties[name]
+
     def _evaluate_temperature(self, pressures=None, temperature_top=None):
         """
         Returns the temperatures of the layer for given pressures.
@@ -351,46 +510,39 @@ class Layer(object):
     def _compute_gravity(self, density, gravity_bottom):
         """
         Computes the gravity of a layer
+        by integrating Poisson's equation across the radial grid.
         Used by _evaluate_eos()
         """
-        # Create a spline fit of density as a function of radius
-        rhofunc = UnivariateSpline(self.radii, density)
-        # Numerically integrate Poisson's equation
-
-        def poisson(p, x):
-            return 4.0 * np.pi * constants.G * rhofunc(x) * x * x
-
-        grav = np.ravel(
-            odeint(poisson, gravity_bottom * self.radii[0] * self.radii[0], self.radii)
+        r2 = self.radii * self.radii
+        grav = cumulative_integral(
+            4.0 * np.pi * constants.G * density * r2,
+            self.radii,
+            initial=gravity_bottom * r2[0],
+            high_order=self.high_order_integration,
         )
 
         if self.radii[0] == 0:
             grav[0] = 0
-            grav[1:] = grav[1:] / self.radii[1:] / self.radii[1:]
+            grav[1:] = grav[1:] / r2[1:]
         else:
-            grav[:] = grav[:] / self.radii[:] / self.radii[:]
+            grav[:] = grav[:] / r2[:]
         return grav
 
     def _compute_pressure(self, density, gravity, pressure_top):
         """
         Calculate the pressure profile based on density and gravity.
-        This integrates the equation for hydrostatic equilibrium P = rho g z.
+        This integrates the equation for hydrostatic equilibrium P = rho g z
+        across the radial grid.
         Used by _evaluate_eos()
         """
         # flip radius, density and gravity to increasing pressure
         depthfromtop = -self.radii[::-1] + max(self.radii)
-        density = density[::-1]
-        gravity = gravity[::-1]
-        # Make a spline fit of density as a function of depth
-        rhofunc = UnivariateSpline(depthfromtop, density)
-        # Make a spline fit of gravity as a function of depth
-        gfunc = UnivariateSpline(depthfromtop, gravity)
-
-        # integrate the hydrostatic equation
-        pressure = np.ravel(
-            odeint((lambda p, x: gfunc(x) * rhofunc(x)), pressure_top, depthfromtop)
+        pressure = cumulative_integral(
+            density[::-1] * gravity[::-1],
+            depthfromtop,
+            initial=pressure_top,
+            high_order=self.high_order_integration,
         )
-
         return pressure[::-1]
 
     @property
@@ -398,32 +550,26 @@ class Layer(object):
         """
         Calculates the mass of the layer [kg]
         """
-        mass = 0.0
-        radii = self.radii
         density = self.evaluate(["density"])
-        rhofunc = UnivariateSpline(radii, density)
-        mass = np.abs(
-            quad(lambda r: 4 * np.pi * rhofunc(r) * r * r, radii[0], radii[-1])[0]
-        )
-        return mass
+        mass = cumulative_integral(
+            4.0 * np.pi * density * self.radii * self.radii,
+            self.radii,
+            high_order=self.high_order_integration,
+        )[-1]
+        return np.abs(mass)
 
     @property
     def moment_of_inertia(self):
         """
         Returns the moment of inertia of the layer [kg m^2]
         """
-        moment = 0.0
-        radii = self.radii
         density = self.evaluate(["density"])
-        rhofunc = UnivariateSpline(radii, density)
-        moment = np.abs(
-            quad(
-                lambda r: 8.0 / 3.0 * np.pi * rhofunc(r) * r * r * r * r,
-                radii[0],
-                radii[-1],
-            )[0]
-        )
-        return moment
+        moment = cumulative_integral(
+            8.0 / 3.0 * np.pi * density * np.power(self.radii, 4.0),
+            self.radii,
+            high_order=self.high_order_integration,
+        )[-1]
+        return np.abs(moment)
 
     @property
     def gravity(self):
@@ -514,12 +660,7 @@ class Layer(object):
         :returns: The internal energies in [J/mol] at the predefined radii.
         :rtype: numpy.array
         """
-        return np.array(
-            [
-                self.sublayers[i].molar_internal_energy
-                for i in range(len(self.sublayers))
-            ]
-        )
+        return self._material_property("molar_internal_energy")
 
     @material_property
     def molar_gibbs(self):
@@ -532,9 +673,7 @@ class Layer(object):
         :returns: Gibbs energies in [J/mol] at the predefined radii.
         :rtype: numpy.array
         """
-        return np.array(
-            [self.sublayers[i].molar_gibbs for i in range(len(self.sublayers))]
-        )
+        return self._material_property("molar_gibbs")
 
     @material_property
     def molar_helmholtz(self):
@@ -547,9 +686,7 @@ class Layer(object):
         :returns: Helmholtz energies in [J/mol] at the predefined radii.
         :rtype: numpy.array
         """
-        return np.array(
-            [self.sublayers[i].molar_helmholtz for i in range(len(self.sublayers))]
-        )
+        return self._material_property("molar_helmholtz")
 
     @material_property
     def molar_mass(self):
@@ -561,9 +698,7 @@ class Layer(object):
         :returns: Molar mass in [kg/mol].
         :rtype: numpy.array
         """
-        return np.array(
-            [self.sublayers[i].molar_mass for i in range(len(self.sublayers))]
-        )
+        return self._material_property("molar_mass")
 
     @material_property
     def molar_volume(self):
@@ -576,9 +711,7 @@ class Layer(object):
         :returns: Molar volumes in [m^3/mol] at the predefined radii.
         :rtype: numpy.array
         """
-        return np.array(
-            [self.sublayers[i].molar_volume for i in range(len(self.sublayers))]
-        )
+        return self._material_property("molar_volume")
 
     @material_property
     def density(self):
@@ -591,7 +724,7 @@ class Layer(object):
         :returns: The densities of this material in [kg/m^3] at the predefined radii.
         :rtype: numpy.array
         """
-        return np.array([self.sublayers[i].density for i in range(len(self.sublayers))])
+        return self._material_property("density")
 
     @material_property
     def molar_entropy(self):
@@ -604,9 +737,7 @@ class Layer(object):
         :returns: Entropies in [J/K/mol] at the predefined radii.
         :rtype: numpy.array
         """
-        return np.array(
-            [self.sublayers[i].molar_entropy for i in range(len(self.sublayers))]
-        )
+        return self._material_property("molar_entropy")
 
     @material_property
     def molar_enthalpy(self):
@@ -619,9 +750,7 @@ class Layer(object):
         :returns: Enthalpies in [J/mol] at the predefined radii.
         :rtype: numpy.array
         """
-        return np.array(
-            [self.sublayers[i].molar_enthalpy for i in range(len(self.sublayers))]
-        )
+        return self._material_property("molar_enthalpy")
 
     @material_property
     def isothermal_bulk_modulus_reuss(self):
@@ -636,12 +765,7 @@ class Layer(object):
         :returns: Bulk moduli in [Pa] at the predefined radii.
         :rtype: numpy.array
         """
-        return np.array(
-            [
-                self.sublayers[i].isothermal_bulk_modulus_reuss
-                for i in range(len(self.sublayers))
-            ]
-        )
+        return self._material_property("isothermal_bulk_modulus_reuss")
 
     @material_property
     def isentropic_bulk_modulus_reuss(self):
@@ -654,12 +778,7 @@ class Layer(object):
         :returns: Adiabatic bulk modulus in [Pa] at the predefined radii.
         :rtype: numpy.array
         """
-        return np.array(
-            [
-                self.sublayers[i].isentropic_bulk_modulus_reuss
-                for i in range(len(self.sublayers))
-            ]
-        )
+        return self._material_property("isentropic_bulk_modulus_reuss")
 
     @material_property
     def isothermal_compressibility_reuss(self):
@@ -673,12 +792,7 @@ class Layer(object):
         :returns: Isothermal compressibilities in [1/Pa] at the predefined radii.
         :rtype: numpy.array
         """
-        return np.array(
-            [
-                self.sublayers[i].isothermal_compressibility_reuss
-                for i in range(len(self.sublayers))
-            ]
-        )
+        return self._material_property("isothermal_compressibility_reuss")
 
     @material_property
     def isentropic_compressibility_reuss(self):
@@ -692,12 +806,7 @@ class Layer(object):
         :returns: Adiabatic compressibilities in [1/Pa] at the predefined radii.
         :rtype: numpy.array
         """
-        return np.array(
-            [
-                self.sublayers[i].isentropic_compressibility_reuss
-                for i in range(len(self.sublayers))
-            ]
-        )
+        return self._material_property("isentropic_compressibility_reuss")
 
     @material_property
     def shear_modulus(self):
@@ -710,9 +819,7 @@ class Layer(object):
         :returns: Shear moduli in [Pa] at the predefined radii.
         :rtype: numpy.array
         """
-        return np.array(
-            [self.sublayers[i].shear_modulus for i in range(len(self.sublayers))]
-        )
+        return self._material_property("shear_modulus")
 
     @material_property
     def p_wave_velocity(self):
@@ -725,9 +832,7 @@ class Layer(object):
         :returns: P wave speeds in [m/s] at the predefined radii.
         :rtype: numpy.array
         """
-        return np.array(
-            [self.sublayers[i].p_wave_velocity for i in range(len(self.sublayers))]
-        )
+        return self._material_property("p_wave_velocity")
 
     @material_property
     def bulk_sound_velocity(self):
@@ -740,9 +845,7 @@ class Layer(object):
         :returns: Bulk sound velocities in [m/s] at the predefined radii.
         :rtype: numpy.array
         """
-        return np.array(
-            [self.sublayers[i].bulk_sound_velocity for i in range(len(self.sublayers))]
-        )
+        return self._material_property("bulk_sound_velocity")
 
     @material_property
     def shear_wave_velocity(self):
@@ -755,9 +858,7 @@ class Layer(object):
         :returns: Shear wave speeds in [m/s] at the predefined radii.
         :rtype: numpy.array
         """
-        return np.array(
-            [self.sublayers[i].shear_wave_velocity for i in range(len(self.sublayers))]
-        )
+        return self._material_property("shear_wave_velocity")
 
     @material_property
     def grueneisen_parameter(self):
@@ -770,9 +871,7 @@ class Layer(object):
         :returns: Grueneisen parameters [unitless] at the predefined radii.
         :rtype: numpy.array
         """
-        return np.array(
-            [self.sublayers[i].grueneisen_parameter for i in range(len(self.sublayers))]
-        )
+        return self._material_property("grueneisen_parameter")
 
     @material_property
     def thermal_expansivity(self):
@@ -785,9 +884,7 @@ class Layer(object):
         :returns: Thermal expansivities in [1/K] at the predefined radii.
         :rtype: numpy.array
         """
-        return np.array(
-            [self.sublayers[i].thermal_expansivity for i in range(len(self.sublayers))]
-        )
+        return self._material_property("thermal_expansivity")
 
     @material_property
     def molar_heat_capacity_v(self):
@@ -800,12 +897,7 @@ class Layer(object):
         :returns: Heat capacities in [J/K/mol] at the predefined radii.
         :rtype: numpy.array
         """
-        return np.array(
-            [
-                self.sublayers[i].molar_heat_capacity_v
-                for i in range(len(self.sublayers))
-            ]
-        )
+        return self._material_property("molar_heat_capacity_v")
 
     @material_property
     def molar_heat_capacity_p(self):
@@ -818,12 +910,7 @@ class Layer(object):
         :returns: Heat capacities in [J/K/mol] at the predefined radii.
         :rtype: numpy.array
         """
-        return np.array(
-            [
-                self.sublayers[i].molar_heat_capacity_p
-                for i in range(len(self.sublayers))
-            ]
-        )
+        return self._material_property("molar_heat_capacity_p")
 
     # Aliased properties
     @property
@@ -12,7 +12,9 @@ from functools import cached_property
 cached_property = cached_property  # for easier access
 
 
-def material_property(func):
+def material_property(
+    func=None, dependencies=("pressure", "temperature", "composition")
+):
     """
     Decorator @material_property to be used for cached properties of materials.
 
@@ -22,12 +24,22 @@ def material_property(func):
 
     Internally, the values are stored in a dictionary member called _cached, which
     is emptied by .reset().
+
+    By default, each property is assumed to depend on the pressure, temperature
+    and composition of the material. Properties that do not depend on
+    all of these can declare the variables they do depend on, e.g.
+    @material_property(dependencies=("pressure", "temperature")).
+    These properties are kept by calls to reset() that only
+    change other variables (e.g. by Solution.set_composition).
     """
+    if func is None:
+        return lambda f: material_property(f, dependencies)
 
     class mat_obj:
         def __init__(self, func):
             self.func = func
             self.varname = self.func.__name__
+            self.dependencies = frozenset(dependencies)
 
         def get(self, obj):
             if not hasattr(obj, "_cached"):
@@ -44,6 +56,26 @@ def material_property(func):
     return property(mat_obj(func).get, doc=func.__doc__)
 
 
+_property_dependencies_cache = {}
+
+
+def _property_dependencies(cls):
+    """
+    Returns a dictionary containing the state variables on which each
+    material_property of the class cls depends.
+    """
+    if cls not in _property_dependencies_cache:
+        dependencies = {}
+        for name in dir(cls):
+            prop = getattr(cls, name, None)
+            if isinstance(prop, property):
+                owner = getattr(prop.fget, "__self__", None)
+                if hasattr(owner, "dependencies"):
+                    dependencies[owner.varname] = owner.dependencies
+        _property_dependencies_cache[cls] = dependencies
+    return _property_dependencies_cache[cls]
+
+
 class Material(object):
     """
     Base class for all materials. The main functionality is unroll() which
@@ -52,8 +84,14 @@ class Material(object):
 
     The user needs to call set_method() (once in the beginning) and set_state()
     before querying the material with unroll() or density().
+
+    The state_registry attribute is used by solutions and composites
+    to share the states of identical endmembers. It is None by default;
+    see :class:`burnman.EndmemberStateRegistry`.
     """
 
+    state_registry = None
+
     def __init__(self):
         self._pressure = None
         self._temperature = None
@@ -201,13 +239,29 @@ class Material(object):
         pressure = brentq(_delta_volume, sol[0], sol[1], args=args)
         self.set_state(pressure, temperature)
 
-    def reset(self):
+    def reset(self, changed=None):
         """
-        Resets all cached material properties.
+        Resets cached material properties.
 
         It is typically not required for the user to call this function.
+
+        :param changed: The state variables that have changed
+            (any of "pressure", "temperature" and "composition").
+            Only the cached properties that depend on at least one of
+            these variables are reset. If None (default), all cached
+            properties are reset.
+        :type changed: tuple of str or None
         """
-        self._cached = {}
+        if changed is None or not hasattr(self, "_cached"):
+            self._cached = {}
+            return
+
+        dependencies = _property_dependencies(type(self))
+        self._cached = {
+            name: value
+            for name, value in self._cached.items()
+            if name in dependencies and dependencies[name].isdisjoint(changed)
+        }
 
     def copy(self):
         return deepcopy(self)
@@ -253,7 +307,11 @@ class Material(object):
         old_pressure = self.pressure
         old_temperature = self.temperature
         try:
-            old_molar_fractions = self.molar_fractions
+            # The composition of a relaxed solution is set using
+            # the amounts of its unrelaxed vectors
+            old_molar_fractions = getattr(
+                self, "unrelaxed_vectors", self.molar_fractions
+            )
         except AttributeError:
             old_molar_fractions = None
 
@@ -331,7 +389,11 @@ class Material(object):
         old_pressure = self.pressure
         old_temperature = self.temperature
         try:
-            old_molar_fractions = self.molar_fractions
+            # The composition of a relaxed solution is set using
+            # the amounts of its unrelaxed vectors
+            old_molar_fractions = getattr(
+                self, "unrelaxed_vectors", self.molar_fractions
+            )
         except AttributeError:
             old_molar_fractions = None
 
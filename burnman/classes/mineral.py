@@ -4,16 +4,117 @@
 # GPL v2 or later.
 
 
+import pickle
 import warnings
+from collections import OrderedDict
+from copy import deepcopy
 
 import numpy as np
 
 from .material import Material, material_property
 from .. import eos
+from ..eos.equation_of_state import _unchanged
 from ..utils.misc import copy_documentation
 from ..utils.math import bracket
 from scipy.optimize import brentq
 
+# The cached properties of Mineral which are filled by the compiled
+# kernels, in the order given by burnman.eos.kernels.kernel_properties
+_kernel_property_names = (
+    ("_molar_volume_unmodified", "molar_volume"),
+    ("molar_gibbs",),
+    ("molar_entropy",),
+    ("isothermal_bulk_modulus_reuss",),
+    ("isentropic_bulk_modulus_reuss",),
+    ("shear_modulus",),
+    ("thermal_expansivity",),
+    ("molar_heat_capacity_p",),
+    ("molar_heat_capacity_v",),
+    ("grueneisen_parameter",),
+)
+
+
+def _frozen(array):
+    """
+    Returns an immutable copy of a numpy array, which compares
+    equal to another frozen array only if they are bitwise identical.
+    """
+    return (array.shape, array.dtype.str, array.tobytes())
+
+
+def _snapshot(values):
+    """
+    Returns a snapshot of a dictionary, which can be compared with the
+    current values using _unchanged_values. Mutable values are copied,
+    so that in-place changes (e.g. to lists and numpy arrays)
+    are also detected.
+    """
+    copies = {
+        key: value if isinstance(value, np.ndarray) else deepcopy(value)
+        for key, value in values.items()
+    }
+    arrays = {
+        key: _frozen(value)
+        for key, value in values.items()
+        if isinstance(value, np.ndarray)
+    }
+    return copies, arrays
+
+
+def _unchanged_values(values, snapshot):
+    """
+    Returns True if a dictionary is unchanged since the snapshot
+    (see _snapshot) was taken.
+    """
+    copies, arrays = snapshot
+    try:
+        # numpy arrays are compared by identity here,
+        # and by value below
+        if values != copies:
+            return False
+    except ValueError:
+        # Containers of numpy arrays cannot be compared directly
+        return False
+    return all(_frozen(values[key]) == array for key, array in arrays.items())
+
+
+def _mineral_signature(mineral):
+    """
+    Returns a hashable object identifying the class, equation of state,
+    parameters and property modifiers of a mineral. The parameters are
+    compared by value, so that minerals created separately from the same
+    dataset have the same signature, and so that changes to the
+    parameters change the signature.
+
+    Pickling the parameters is about as expensive as setting the state
+    of a mineral, so the signature is stored on the mineral along with
+    copies of the parameters and property modifiers (see _snapshot),
+    and is only recalculated when they have changed.
+    """
+    params, modifiers = mineral.params, mineral.property_modifiers
+    stored = mineral.__dict__.get("_signature")
+    if (
+        stored is not None
+        and stored[0] is params
+        and stored[1] is type(mineral.method)
+        and _unchanged_values(params, stored[2])
+        and _unchanged(modifiers, stored[3])
+    ):
+        return stored[4]
+    signature = (
+        type(mineral),
+        type(mineral.method),
+        pickle.dumps((params, modifiers)),
+    )
+    mineral._signature = (
+        params,
+        type(mineral.method),
+        _snapshot(params),
+        deepcopy(modifiers),
+        signature,
+    )
+    return signature
+
 
 class Mineral(Material):
     """
@@ -40,8 +141,14 @@ class Mineral(Material):
     To convert this to m^3/(mol of molecule) you should multiply by 10^(-30) *
     N_a / Z, where N_a is Avogadro's number and Z is the number of formula units per
     unit cell. You can look up Z in many places, including www.mindat.org
+
+    The states of a mineral can be stored in a
+    :class:`burnman.StateCache` by setting the state_cache attribute
+    of the mineral (or of the Mineral class).
     """
 
+    state_cache = None
+
     def __init__(self, params=None, property_modifiers=None):
         Material.__init__(self)
         if params is not None:
@@ -136,6 +243,19 @@ class Mineral(Material):
 
     @copy_documentation(Material.set_state)
     def set_state(self, pressure, temperature):
+        key = None
+        if self.state_cache is not None and type(self).set_state is Mineral.set_state:
+            key = self._state_key(pressure, temperature)
+        if key is not None:
+            entry = self.state_cache.get(key)
+            if entry is not None:
+                Material.set_state(self, pressure, temperature)
+                # The entry is copied, so that properties set
+                # later (e.g. by set_state_with_volume) do not change it
+                self._cached = dict(entry[0])
+                self._property_modifiers = entry[1]
+                return
+
         Material.set_state(self, pressure, temperature)
         self._property_modifiers = (
             eos.property_modifiers.calculate_property_modifications(self)
@@ -145,6 +265,56 @@ class Mineral(Material):
             raise AttributeError(
                 "no method set for mineral, or equation_of_state given in mineral.params"
             )
+        self._set_compiled_properties()
+
+        if key is not None:
+            self.state_cache.put(key, (dict(self._cached), self._property_modifiers))
+
+    def _state_key(self, pressure, temperature):
+        """
+        Returns the key under which the state of the mineral at the given
+        pressure and temperature is stored in a state cache, or None if
+        the state cannot be cached.
+        """
+        # (np.ndim is comparatively slow, so floats are checked first)
+        if not (isinstance(pressure, float) and isinstance(temperature, float)) and (
+            np.ndim(pressure) or np.ndim(temperature)
+        ):
+            return None
+        try:
+            return (pressure, temperature, _mineral_signature(self))
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return None
+
+    def _set_compiled_properties(self):
+        """
+        If the equation of state has a compiled kernel, evaluates all of
+        the main properties of the mineral in a single call and stores
+        them in the property cache. Properties which are overloaded by
+        a derived class are not stored. Nothing is done if the mineral has
+        property modifiers or if the state is an array, in which case the
+        properties are calculated by the equation of state when requested.
+        """
+        if (
+            self.property_modifiers
+            or np.ndim(self._pressure)
+            or np.ndim(self._temperature)
+        ):
+            return
+        compiled_properties = getattr(self.method, "_compiled_properties", None)
+        if compiled_properties is None:
+            return
+        values = compiled_properties(self._pressure, self._temperature, self.params)
+        if values is None:
+            return
+        for names, value in zip(_kernel_property_names, values):
+            # A zero shear modulus is left to the shear_modulus
+            # property, which warns the user
+            if names[0] == "shear_modulus" and value < np.finfo("float").eps:
+                continue
+            for name in names:
+                if getattr(type(self), name) is getattr(Mineral, name):
+                    self._cached[name] = value
 
     def set_state_with_volume(
         self, volume, temperature, pressure_guesses=[0.0e9, 10.0e9]
@@ -212,8 +382,82 @@ class Mineral(Material):
             self.set_state(
                 self.method.pressure(temperature, volume, self.params), temperature
             )
+            # Properties filled by a compiled kernel were evaluated at the
+            # volume found from the pressure, rather than the given volume
+            self.reset()
         self._cached["_molar_volume_unmodified"] = volume
 
+    @copy_documentation(Material.evaluate)
+    def evaluate(self, vars_list, pressures, temperatures, molar_fractions=None):
+        if molar_fractions is None and self._can_evaluate_arrays():
+            try:
+                return self._evaluate_arrays(vars_list, pressures, temperatures)
+            except (TypeError, ValueError, NotImplementedError):
+                # Properties whose implementations only accept scalars
+                # raise TypeError or ValueError when given arrays, and
+                # properties not provided by the equation of state raise
+                # NotImplementedError. Fall back to the state-by-state
+                # evaluation, which either succeeds or raises the
+                # appropriate error. Any other error is a genuine failure.
+                pass
+        return Material.evaluate(
+            self, vars_list, pressures, temperatures, molar_fractions
+        )
+
+    def _can_evaluate_arrays(self):
+        """
+        Returns True if the properties of this mineral can be evaluated
+        over whole arrays of pressures and temperatures at once.
+        This requires an equation of state that supports array input,
+        no property modifiers and no overloading of set_state.
+        """
+        return (
+            getattr(self.method, "vectorized", False)
+            and not self.property_modifiers
+            and type(self).set_state is Mineral.set_state
+        )
+
+    def _evaluate_arrays(self, vars_list, pressures, temperatures):
+        """
+        Evaluates the requested properties for all pressures and
+        temperatures in a single pass by temporarily setting the state
+        of the mineral to the arrays of pressures and temperatures.
+        The original state is restored afterwards.
+        """
+        pressures, temperatures = np.broadcast_arrays(
+            np.array(pressures, dtype=float), np.array(temperatures, dtype=float)
+        )
+        old_state = (
+            self._pressure,
+            self._temperature,
+            self._cached,
+            getattr(self, "_property_modifiers", None),
+        )
+        try:
+            self._cached = {}
+            self._pressure = pressures
+            self._temperature = temperatures
+            self._property_modifiers = {
+                "G": 0.0,
+                "dGdT": 0.0,
+                "dGdP": 0.0,
+                "d2GdT2": 0.0,
+                "d2GdP2": 0.0,
+                "d2GdPdT": 0.0,
+            }
+            output = [
+                np.broadcast_to(getattr(self, var), pressures.shape).copy()
+                for var in vars_list
+            ]
+        finally:
+            (
+                self._pressure,
+                self._temperature,
+                self._cached,
+                self._property_modifiers,
+            ) = old_state
+        return np.array(output)
+
     """
     Properties from equations of state
     We choose the P, T properties (e.g. Gibbs(P, T) rather than Helmholtz(V, T)),
@@ -302,7 +546,7 @@ class Mineral(Material):
         G = self.method.shear_modulus(
             self.pressure, self.temperature, self._molar_volume_unmodified, self.params
         )
-        if G < np.finfo("float").eps:
+        if np.any(G < np.finfo("float").eps):
             warnings.formatwarning = (
                 lambda msg, *a: "Warning from file '{0}', line {1}:\n{2}\n\n".format(
                     a[1], a[2], msg
@@ -376,7 +620,16 @@ class Mineral(Material):
     @material_property
     @copy_documentation(Material.isentropic_bulk_modulus_reuss)
     def isentropic_bulk_modulus_reuss(self):
-        if self.temperature < 1.0e-10:
+        if np.ndim(self.temperature):
+            with np.errstate(divide="ignore", invalid="ignore"):
+                return np.where(
+                    self.temperature < 1.0e-10,
+                    self.isothermal_bulk_modulus_reuss,
+                    self.isothermal_bulk_modulus_reuss
+                    * self.molar_heat_capacity_p
+                    / self.molar_heat_capacity_v,
+                )
+        elif self.temperature < 1.0e-10:
             return self.isothermal_bulk_modulus_reuss
         else:
             return (
@@ -417,7 +670,26 @@ class Mineral(Material):
     @copy_documentation(Material.grueneisen_parameter)
     def grueneisen_parameter(self):
         eps = np.finfo("float").eps
-        if np.abs(self.molar_heat_capacity_v) > eps:
+        if np.ndim(self.molar_heat_capacity_v):
+            # Array states are only used without property modifiers
+            low_C_v = np.abs(self.molar_heat_capacity_v) <= eps
+            with np.errstate(divide="ignore", invalid="ignore"):
+                gr = (
+                    self.thermal_expansivity
+                    * self.isothermal_bulk_modulus_reuss
+                    * self.molar_volume
+                    / self.molar_heat_capacity_v
+                )
+            if np.any(low_C_v):
+                gr = np.where(
+                    low_C_v,
+                    self.method._grueneisen_parameter(
+                        self.pressure, self.temperature, self.molar_volume, self.params
+                    ),
+                    gr,
+                )
+            return gr
+        elif np.abs(self.molar_heat_capacity_v) > eps:
             return (
                 self.thermal_expansivity
                 * self.isothermal_bulk_modulus_reuss
@@ -456,3 +728,180 @@ class Mineral(Material):
         return (
             self.molar_volume * self.temperature * self.thermal_expansivity
         ) / self.molar_heat_capacity_p
+
+
+class EndmemberStateRegistry(object):
+    """
+    A registry of endmember states which allows minerals with the same
+    class, equation of state, parameters and property modifiers to share
+    their state at a given pressure and temperature. Solutions and
+    composites which contain the same endmembers (such as the pyrope
+    endmember of several garnet solutions built from the same dataset)
+    then only solve the equation of state of each endmember once.
+
+    The registry is not used by default. It can be used by all solutions
+    and composites by setting ``burnman.Material.state_registry`` to an
+    instance of this class, or by a single solution or composite by setting
+    its ``state_registry`` attribute. A composite only passes the registry
+    to the minerals that it contains directly; solutions within the
+    composite use their own ``state_registry`` attribute.
+
+    The registry only stores the states at the most recent pressure and
+    temperature. Minerals which share a state also share their cached
+    properties, so that a property calculated for one mineral is not
+    recalculated for the others. Minerals which override
+    :func:`Mineral.set_state`, such as solutions, and array-valued states
+    are passed to the set_state method of the mineral.
+
+    This class is available as ``burnman.EndmemberStateRegistry``.
+
+    :ivar hits: The number of states taken from the registry.
+    :vartype hits: int
+    :ivar misses: The number of states calculated and added to the registry.
+    :vartype misses: int
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.clear()
+
+    def clear(self):
+        """
+        Removes all of the states from the registry. The hit and
+        miss counters are not reset.
+        """
+        self._state = None
+        self._entries = {}
+
+    def set_state(self, mineral, pressure, temperature):
+        """
+        Sets the state of a mineral, reusing the state of an identical
+        mineral if that state has already been calculated at the same
+        pressure and temperature.
+
+        :param mineral: The mineral to update.
+        :type mineral: :class:`burnman.Mineral`
+        :param pressure: The pressure [Pa].
+        :type pressure: float
+        :param temperature: The temperature [K].
+        :type temperature: float
+        """
+        if (
+            type(mineral).set_state is not Mineral.set_state
+            or np.ndim(pressure)
+            or np.ndim(temperature)
+        ):
+            mineral.set_state(pressure, temperature)
+            return
+
+        try:
+            key = _mineral_signature(mineral)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            mineral.set_state(pressure, temperature)
+            return
+
+        if (pressure, temperature) != self._state:
+            self._state = (pressure, temperature)
+            self._entries = {}
+
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            mineral.set_state(pressure, temperature)
+            self._entries[key] = (mineral._cached, mineral._property_modifiers)
+        else:
+            self.hits += 1
+            Material.set_state(mineral, pressure, temperature)
+            mineral._cached, mineral._property_modifiers = entry
+
+    @property
+    def hit_rate(self):
+        """
+        The fraction of the states set through the registry
+        which were taken from it.
+        """
+        n = self.hits + self.misses
+        return self.hits / n if n > 0 else 0.0
+
+
+class StateCache(object):
+    """
+    A size-bounded cache of mineral and solution states. When a state
+    is set again, the properties that were calculated at that state are
+    restored from the cache instead of being recalculated. The least
+    recently used states are discarded once the cache holds more than
+    maxsize states.
+
+    The cache is not used by default. A mineral or solution uses the
+    cache given by its state_cache attribute, which can be set on a single
+    object or on a class (for example on ``burnman.Mineral`` to cache the
+    states of all minerals and solutions). Classes which override
+    :func:`Mineral.set_state` (other than :class:`burnman.Solution`) and
+    array-valued states are not cached.
+
+    States are stored under their pressure and temperature, the
+    class, equation of state, parameters and property modifiers of the
+    mineral and, for solutions, the solution model parameters and
+    composition. The parameters are compared by value, so changing them
+    automatically leads to a new state being calculated.
+
+    This class is available as ``burnman.StateCache``.
+
+    :param maxsize: The maximum number of states to store.
+    :type maxsize: int
+
+    :ivar hits: The number of states restored from the cache.
+    :vartype hits: int
+    :ivar misses: The number of states which were not found in the cache.
+    :vartype misses: int
+    """
+
+    def __init__(self, maxsize=128):
+        if maxsize < 1:
+            raise ValueError("maxsize must be a positive integer.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """
+        Removes all of the states from the cache. The hit and
+        miss counters are not reset.
+        """
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        """
+        Returns the entry stored under key, or None if there is no
+        such entry, and updates the hit and miss counters.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key, entry):
+        """
+        Stores an entry under key, discarding the least recently used
+        entry if the cache is full.
+        """
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    @property
+    def hit_rate(self):
+        """
+        The fraction of the states looked up in the cache which were found.
+        """
+        n = self.hits + self.misses
+        return self.hits / n if n > 0 else 0.0
@@ -9,6 +9,7 @@ This module provides several helper minerals/materials.
 
 """
 
+import numpy as np
 
 from .material import Material, material_property
 from .composite import Composite
@@ -42,6 +43,50 @@ class HelperRockSwitcher(Material):
         self.current_rock = self.select_rock()
         self.current_rock.set_state(pressure, temperature)
 
+    def evaluate(self, vars_list, pressures, temperatures, molar_fractions=None):
+        """
+        As :func:`burnman.Material.evaluate`, but the states are first
+        sorted by the rock that is selected at each pressure and temperature.
+        Each rock then evaluates all of its states at once, so that
+        array-native evaluation (see :func:`burnman.Mineral.evaluate`)
+        is used where it is available.
+        """
+        if molar_fractions is not None:
+            return Material.evaluate(
+                self, vars_list, pressures, temperatures, molar_fractions
+            )
+
+        pressures = np.array(pressures, dtype=float)
+        temperatures = np.array(temperatures, dtype=float)
+        assert pressures.shape == temperatures.shape
+
+        old_pressure = self.pressure
+        old_temperature = self.temperature
+        selected = []
+        for P, T in zip(pressures.flat, temperatures.flat):
+            Material.set_state(self, P, T)
+            selected.append(self.select_rock())
+        if old_pressure is None or old_temperature is None:
+            self._pressure = self._temperature = None
+            self.reset()
+        else:
+            self.set_state(old_pressure, old_temperature)
+
+        output = np.empty((len(vars_list), pressures.size))
+        for rock in {id(r): r for r in selected}.values():
+            indices = np.array([i for i, r in enumerate(selected) if r is rock])
+            rock_output = rock.evaluate(
+                vars_list, pressures.flat[indices], temperatures.flat[indices]
+            )
+            if not isinstance(rock_output, np.ndarray) or rock_output.shape != (
+                len(vars_list),
+                len(indices),
+            ):
+                # Some properties are not scalars
+                return Material.evaluate(self, vars_list, pressures, temperatures)
+            output[:, indices] = rock_output
+        return output.reshape((len(vars_list),) + pressures.shape)
+
     def unroll(self):
         return self.current_rock.unroll()
 
@@ -3,6 +3,9 @@
 # GPL v2 or later.
 
 
+import hashlib
+import os
+import warnings
 import numpy as np
 from scipy.interpolate import RegularGridInterpolator
 from scipy.interpolate import griddata
@@ -11,44 +14,40 @@ from .material import Material, material_property
 
 from ..utils.misc import copy_documentation
 
-
-class PerplexMaterial(Material):
+ordered_property_list = [
+    "rho,kg/m3",
+    "alpha,1/K",
+    "beta,1/bar",
+    "Ks,bar",
+    "Gs,bar",
+    "v0,km/s",
+    "vp,km/s",
+    "vs,km/s",
+    "s,J/K/kg",
+    "h,J/kg",
+    "cp,J/K/kg",
+    "V,J/bar/mol",
+]
+
+
+def _read_2D_perplex_table(filename):
     """
-    This is the base class for a PerpleX material. States of the material
-    can only be queried after setting the pressure and temperature
-    using set_state().
+    Reads a 2D PerpleX tab file.
 
-    Instances of this class are initialised with
-    a 2D PerpleX tab file. This file should be in the standard format
-    (as output by werami), and should have columns with the following names:
-    'rho,kg/m3', 'alpha,1/K', 'beta,1/bar', 'Ks,bar', 'Gs,bar', 'v0,km/s',
-    'vp,km/s', 'vs,km/s', 's,J/K/kg', 'h,J/kg', 'cp,J/K/kg', 'V,J/bar/mol'.
-    The order of these names is not important.
-
-    Properties of the material are determined by linear interpolation from
-    the PerpleX grid. They are all returned in SI units on a molar basis,
-    even though the PerpleX tab file is not in these units.
-
-    This class is available as ``burnman.PerplexMaterial``.
+    :returns: The pressures [Pa] and temperatures [K] of the grid, and
+        an array of shape (len(ordered_property_list), nP, nT) containing
+        the properties in ordered_property_list (in PerpleX units),
+        with NaNs filled in.
+    :rtype: tuple
     """
-
-    def __init__(self, tab_file, name="Perple_X material"):
-        self.name = name
-        self.params = {"name": name}
-        (
-            self._property_interpolators,
-            self.params["molar_mass"],
-            self.bounds,
-        ) = self._read_2D_perplex_file(tab_file)
-        Material.__init__(self)
-
-    def _read_2D_perplex_file(self, filename):
-        with open(filename, "r") as f:
-            datastream = f.read()
-
-        lines = [
-            line.strip().split() for line in datastream.split("\n") if line.strip()
-        ]
+    with open(filename, "r") as f:
+        lines = []
+        while len(lines) < 13:
+            line = f.readline()
+            if not line:
+                raise Exception("This is not a 2D PerpleX table")
+            if line.strip():
+                lines.append(line.split())
 
         if lines[2][0] != "2":
             raise Exception("This is not a 2D PerpleX table")
@@ -70,59 +69,153 @@ class PerplexMaterial(Material):
                 "Are the independent variables P(bar) and T(K)?"
             )
 
-        Pmin = Pmin * 1.0e5  # bar to Pa
-        Pint = Pint * 1.0e5  # bar to Pa
-        Pmax = Pmin + Pint * (nP - 1.0)
-        Tmax = Tmin + Tint * (nT - 1.0)
-        pressures = np.linspace(Pmin, Pmax, nP)
-        temperatures = np.linspace(Tmin, Tmax, nT)
         n_properties = int(lines[11][0])
         property_list = lines[12]
 
-        # property_table[i][j][k] returns the kth property at the ith pressure and jth temperature
-        table = np.array(
-            [[float(string) for string in line] for line in lines[13 : 13 + nP * nT]]
+        # The data block is parsed by numpy directly from the file
+        table = np.loadtxt(f, max_rows=nP * nT, ndmin=2)
+
+    if table.shape != (nP * nT, n_properties):
+        raise Exception(
+            f"The PerpleX table should contain {nP * nT} rows of "
+            f"{n_properties} properties, but has shape {table.shape}."
         )
 
-        if lines[3][0] == "P(bar)":
-            property_table = np.swapaxes(table.reshape(nT, nP, n_properties), 0, 1)
-        else:
-            property_table = table.reshape(nP, nT, n_properties)
-
-        ordered_property_list = [
-            "rho,kg/m3",
-            "alpha,1/K",
-            "beta,1/bar",
-            "Ks,bar",
-            "Gs,bar",
-            "v0,km/s",
-            "vp,km/s",
-            "vs,km/s",
-            "s,J/K/kg",
-            "h,J/kg",
-            "cp,J/K/kg",
-            "V,J/bar/mol",
-        ]
-        p_indices = [
-            i
-            for i, p in enumerate(property_list)
-            for ordered_p in ordered_property_list
-            if p == ordered_p
-        ]
+    missing = [p for p in ordered_property_list if p not in property_list]
+    if len(missing) > 0:
+        raise Exception(f"The PerpleX table is missing the properties {missing}.")
 
-        properties = {}
-        for i, p_idx in enumerate(p_indices):
-            # Fill in NaNs as long as they aren't in the corners of the P-T grid
-            a = np.array(property_table[:, :, [p_idx]][:, :, 0])
-            x, y = np.indices(a.shape)
-            a[np.isnan(a)] = griddata(
-                (x[~np.isnan(a)], y[~np.isnan(a)]),  # points we know
-                a[~np.isnan(a)],  # values we know
-                (x[np.isnan(a)], y[np.isnan(a)]),
-            )
+    Pmin = Pmin * 1.0e5  # bar to Pa
+    Pint = Pint * 1.0e5  # bar to Pa
+    Pmax = Pmin + Pint * (nP - 1.0)
+    Tmax = Tmin + Tint * (nT - 1.0)
+    pressures = np.linspace(Pmin, Pmax, nP)
+    temperatures = np.linspace(Tmin, Tmax, nT)
 
-            # Fill any remaining NaNs with zeros
-            properties[ordered_property_list[i]] = np.nan_to_num(a, 0.0)
+    # property_table[i][j][k] returns the kth property at the ith pressure and jth temperature
+    if lines[3][0] == "P(bar)":
+        property_table = np.swapaxes(table.reshape(nT, nP, n_properties), 0, 1)
+    else:
+        property_table = table.reshape(nP, nT, n_properties)
+
+    p_indices = [property_list.index(p) for p in ordered_property_list]
+    properties = np.moveaxis(property_table[:, :, p_indices], 2, 0).copy()
+    return pressures, temperatures, _fill_nans(properties)
+
+
+def _fill_nans(properties):
+    """
+    Fills NaNs in an array of 2D property grids (shape (n, nP, nT))
+    by linear interpolation from the surrounding grid points.
+    Properties with the same NaN pattern are filled together, so that
+    only one triangulation is needed for each pattern.
+    NaNs that lie outside the convex hull of the known points
+    (e.g. in the corners of the P-T grid) are replaced by zeros.
+    """
+    nans = np.isnan(properties).reshape(len(properties), -1)
+    patterns, groups = np.unique(nans, axis=0, return_inverse=True)
+    groups = groups.ravel()
+    x, y = np.indices(properties.shape[1:])
+    for i, pattern in enumerate(patterns):
+        if not np.any(pattern):
+            continue
+        mask = pattern.reshape(x.shape)
+        group = properties[groups == i]
+        group[:, mask] = griddata(
+            (x[~mask], y[~mask]),  # points we know
+            group[:, ~mask].T,  # values we know
+            (x[mask], y[mask]),
+        ).T
+        properties[groups == i] = group
+
+    # Fill any remaining NaNs with zeros
+    return np.nan_to_num(properties, copy=False)
+
+
+def _file_hash(filename):
+    sha256 = hashlib.sha256()
+    with open(filename, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def _read_cached_2D_perplex_table(filename):
+    """
+    As _read_2D_perplex_table, but reads the parsed table from
+    filename + ".npz" if that cache exists and was created from a file
+    with the same modification time or contents. Otherwise, the tab
+    file is parsed and the cache is (re)written.
+    """
+    cache_file = filename + ".npz"
+    mtime = os.path.getmtime(filename)
+    try:
+        with np.load(cache_file) as cache:
+            if cache["mtime"] == mtime or cache["sha256"] == _file_hash(filename):
+                return cache["pressures"], cache["temperatures"], cache["properties"]
+    except Exception:
+        # A missing, outdated or unreadable cache is simply rebuilt
+        pass
+
+    pressures, temperatures, properties = _read_2D_perplex_table(filename)
+    try:
+        np.savez(
+            cache_file,
+            mtime=mtime,
+            sha256=_file_hash(filename),
+            pressures=pressures,
+            temperatures=temperatures,
+            properties=properties,
+        )
+    except OSError as e:
+        warnings.warn(f"Could not write the PerpleX cache file {cache_file}: {e}")
+    return pressures, temperatures, properties
+
+
+class PerplexMaterial(Material):
+    """
+    This is the base class for a PerpleX material. States of the material
+    can only be queried after setting the pressure and temperature
+    using set_state().
+
+    Instances of this class are initialised with
+    a 2D PerpleX tab file. This file should be in the standard format
+    (as output by werami), and should have columns with the following names:
+    'rho,kg/m3', 'alpha,1/K', 'beta,1/bar', 'Ks,bar', 'Gs,bar', 'v0,km/s',
+    'vp,km/s', 'vs,km/s', 's,J/K/kg', 'h,J/kg', 'cp,J/K/kg', 'V,J/bar/mol'.
+    The order of these names is not important.
+
+    Properties of the material are determined by linear interpolation from
+    the PerpleX grid. They are all returned in SI units on a molar basis,
+    even though the PerpleX tab file is not in these units.
+
+    Large tables are slow to parse. If cache is True, the parsed
+    property grids are also stored in a numpy .npz file next to the tab
+    file (tab_file + ".npz"), which is read instead of the tab file
+    on subsequent loads as long as the tab file is unchanged (the same
+    modification time or the same SHA-256 hash).
+
+    This class is available as ``burnman.PerplexMaterial``.
+    """
+
+    def __init__(self, tab_file, name="Perple_X material", cache=False):
+        self.name = name
+        self.params = {"name": name}
+        (
+            self._property_interpolators,
+            self.params["molar_mass"],
+            self.bounds,
+        ) = self._read_2D_perplex_file(tab_file, cache)
+        Material.__init__(self)
+
+    def _read_2D_perplex_file(self, filename, cache=False):
+        if cache:
+            pressures, temperatures, table = _read_cached_2D_perplex_table(filename)
+        else:
+            pressures, temperatures, table = _read_2D_perplex_table(filename)
+        Pmin, Pmax = pressures[0], pressures[-1]
+        Tmin, Tmax = temperatures[0], temperatures[-1]
+        properties = dict(zip(ordered_property_list, table))
 
         densities = properties["rho,kg/m3"]
         volumes = 1.0e-5 * properties["V,J/bar/mol"]
@@ -3,6 +3,7 @@
 # Copyright (C) 2012 - 2017 by the BurnMan team, released under the GNU
 # GPL v2 or later.
 
+import time
 import numpy as np
 import warnings
 from .material import material_property
@@ -44,7 +45,7 @@ class Planet(object):
 
         self.name = name
 
-        self.radii = self.evaluate(["radii"])
+        self.radii = np.concatenate([layer.radii for layer in self.layers])
         self.n_slices = len(self.radii)
         self.radius_planet = max(self.radii)
         self.volume = 4.0 / 3.0 * np.pi * np.power(self.radius_planet, 3.0)
@@ -128,39 +129,35 @@ class Planet(object):
         :rtype: numpy.array
         """
         if radlist is None:
-            values = np.empty(
-                [len(properties), np.sum([len(layer.radii) for layer in self.layers])]
-            )
-            for i, prop in enumerate(properties):
-                if prop == "depth":
-                    values[i] = np.array(
-                        [
-                            self.radius_planet - r
-                            for layer in self.layers
-                            for r in layer.radii
-                        ]
+            values = np.concatenate(
+                [
+                    np.reshape(
+                        layer.evaluate(properties, radius_planet=self.radius_planet),
+                        (len(properties), -1),
                     )
-                else:
-                    j = 0
-                    for layer in self.layers:
-                        vals = getattr(layer, prop)
-                        values[i, j : j + len(vals)] = vals
-                        j += len(vals)
+                    for layer in self.layers
+                ],
+                axis=1,
+            )
         else:
+            radlist = np.asarray(radlist)
             values = np.empty([len(properties), len(radlist)])
-            l_idx = [
-                i
-                for i, layer in enumerate(self.layers)
-                for r in radlist
-                if r >= layer.inner_radius and r <= layer.outer_radius
-            ]
-
-            for j, r in enumerate(radlist):
-                values[:, j] = (
-                    self.layers[l_idx[j]]
-                    .evaluate(properties, [r], self.radius_planet)
-                    .T[0]
+            # Each layer evaluates all the properties at the radii
+            # it contains in a single pass. Radii on a boundary
+            # between two layers are assigned to the lower layer.
+            unassigned = np.ones(len(radlist), dtype=bool)
+            for layer in self.layers:
+                mask = (
+                    unassigned
+                    & (radlist >= layer.inner_radius)
+                    & (radlist <= layer.outer_radius)
                 )
+                if np.any(mask):
+                    values[:, mask] = np.reshape(
+                        layer.evaluate(properties, radlist[mask], self.radius_planet),
+                        (len(properties), -1),
+                    )
+                    unassigned &= ~mask
 
         if values.shape[0] == 1:
             values = values[0]
@@ -218,11 +215,17 @@ class Planet(object):
         """
         This routine needs to be called before evaluating any properties.
         If pressures and temperatures are self-consistent, they
-        are computed across the planet here. Also initializes an array of materials
-        in each Layer to compute properties from.
+        are computed across the planet here. The material properties
+        of each Layer are evaluated when they are first requested.
+
+        The time spent in each self-consistency iteration is stored in
+        the attribute iteration_times, a list containing the time [s] spent
+        evaluating the equations of state (densities and temperatures) and
+        the time spent integrating the gravity and pressure profiles.
         """
 
         self.reset()
+        self.iteration_times = []
         for layer in self.layers:
             assert layer.temperature_mode is not None
 
@@ -240,10 +243,17 @@ class Planet(object):
             while i < self.n_max_iterations:
                 i += 1
                 ref_press = new_press
-                new_grav, new_press = self._evaluate_eos(
-                    new_press, temperatures, self.gravity_bottom, self.pressure_top
-                )
+                time_0 = time.perf_counter()
+                density = self._evaluate_density(new_press, temperatures)
+                time_1 = time.perf_counter()
+                new_grav = self._compute_gravity(density, self.gravity_bottom)
+                new_press = self._compute_pressure(density, new_grav, self.pressure_top)
+                time_2 = time.perf_counter()
                 temperatures = self._evaluate_temperature(new_press)
+                time_3 = time.perf_counter()
+                self.iteration_times.append(
+                    (time_1 - time_0 + time_3 - time_2, time_2 - time_1)
+                )
                 rel_err = abs((max(ref_press) - max(new_press)) / max(new_press))
                 if self.verbose:
                     print(
@@ -259,27 +269,15 @@ class Planet(object):
             self._gravity = new_grav
 
         for layer in self.layers:
-            layer.sublayers = []
+            layer.reset()
             layer.pressures = self.pressures[layer.n_start : layer.n_end]
             layer.temperatures = self.temperatures[layer.n_start : layer.n_end]
             layer.gravity_bottom = self._gravity[layer.n_start - 1]
             layer.pressure_mode = "set-in-planet"
-            for i in range(len(layer.radii)):
-                layer.sublayers.append(layer.material.copy())
-                layer.sublayers[i].set_state(layer.pressures[i], layer.temperatures[i])
-
-    def _evaluate_eos(self, pressures, temperatures, gravity_bottom, pressure_top):
-        """
-        Used to update the pressure profile in set_state()
-        """
-        density = self._evaluate_density(pressures, temperatures)
-        grav = self._compute_gravity(density, gravity_bottom)
-        press = self._compute_pressure(density, grav, pressure_top)
-        return grav, press
 
     def _evaluate_density(self, pressures, temperatures):
         """
-        Used to update the density profile in _evaluate_eos()
+        Used to update the density profile in make()
         """
         density = []
         for layer in self.layers:
@@ -315,7 +313,7 @@ class Planet(object):
         Calculate the gravity of the planet, based on a density profile.
         This integrates Poisson's equation in radius, under the assumption
         that the planet is laterally homogeneous.
-        Used to update the gravity profile in _evaluate_eos()
+        Used to update the gravity profile in make()
         """
 
         start_gravity = gravity_bottom
@@ -334,7 +332,7 @@ class Planet(object):
         """
         Calculate the pressure profile based on density and gravity.
         This integrates the equation for hydrostatic equilibrium P = rho g z.
-        Used to update the pressure profile in _evaluate_eos()
+        Used to update the pressure profile in make()
         """
         start_pressure = pressure_top
         press = []
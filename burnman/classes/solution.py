@@ -5,11 +5,10 @@
 
 
 import numpy as np
-from sympy import Matrix, nsimplify
 from collections import OrderedDict
 
-from .material import material_property, cached_property
-from .mineral import Mineral
+from .material import Material, material_property, cached_property
+from .mineral import Mineral, _mineral_signature, _snapshot, _unchanged_values
 from .solutionmodel import MechanicalSolution
 from .solutionmodel import PolynomialSolution
 from .averaging_schemes import reuss_average_function
@@ -20,8 +19,43 @@ from ..utils.misc import copy_documentation
 from ..utils.math import complete_basis
 
 import copy
+import pickle
 from scipy.optimize import minimize
 
+# Attributes of a solution model which hold the endmembers
+# or quantities calculated from the other attributes
+_derived_model_attributes = (
+    "endmembers",
+    "_composition_key",
+    "_Wsym",
+    "_subregular_terms_cache",
+    "_signature",
+)
+
+
+def _solution_model_signature(model):
+    """
+    Returns a hashable object identifying a solution model by the
+    values of its parameters and the signatures of its endmembers
+    (see burnman.classes.mineral._mineral_signature).
+    As for minerals, the pickled parameters are stored on the model
+    along with a snapshot of the parameters, and are only
+    recalculated when the parameters have changed.
+    """
+    attributes = {
+        name: value
+        for name, value in vars(model).items()
+        if name not in _derived_model_attributes
+    }
+    stored = model.__dict__.get("_signature")
+    if stored is None or not _unchanged_values(attributes, stored[0]):
+        stored = (_snapshot(attributes), pickle.dumps((type(model), attributes)))
+        model._signature = stored
+    return (
+        stored[1],
+        tuple(_mineral_signature(mbr[0]) for mbr in model.endmembers),
+    )
+
 
 class Solution(Mineral):
     """
@@ -103,8 +137,13 @@ class Solution(Mineral):
         if type(self.solution_model) is PolynomialSolution:
             self.solution_model.set_composition(molar_fractions)
 
-        self.reset()
+        # Properties that only depend on pressure and temperature
+        # (such as the endmember properties) are unchanged
+        self.reset(changed=("composition",))
         self.molar_fractions = np.array(molar_fractions)
+        # A new array is created for each composition, so the solution
+        # model can store quantities calculated for this array
+        self.solution_model._composition_key = self.molar_fractions
 
     def set_method(self, method):
         for i in range(self.n_endmembers):
@@ -116,9 +155,269 @@ class Solution(Mineral):
         if type(self.solution_model) is PolynomialSolution:
             self.solution_model.set_state(pressure, temperature)
 
+        key = None
+        if self.state_cache is not None and type(self).set_state is Solution.set_state:
+            key = self._state_key(pressure, temperature)
+        if key is not None:
+            entry = self.state_cache.get(key)
+            if entry is not None:
+                self._restore_state(pressure, temperature, entry)
+                return
+
         Mineral.set_state(self, pressure, temperature)
+        registry = self.state_registry
         for mbr in self.solution_model.endmembers:
-            mbr[0].set_state(pressure, temperature)
+            if registry is None:
+                mbr[0].set_state(pressure, temperature)
+            else:
+                registry.set_state(mbr[0], pressure, temperature)
+
+        if key is not None:
+            endmember_states = [
+                (
+                    (dict(mbr[0]._cached), mbr[0]._property_modifiers)
+                    if type(mbr[0]).set_state is Mineral.set_state
+                    else None
+                )
+                for mbr in self.solution_model.endmembers
+            ]
+            self.state_cache.put(
+                key, (dict(self._cached), self._property_modifiers, endmember_states)
+            )
+
+    def _state_key(self, pressure, temperature):
+        """
+        Returns the key under which the state of the solution at the given
+        pressure and temperature and its current composition is stored in
+        a state cache, or None if the state cannot be cached.
+        """
+        if (
+            type(self.solution_model) is PolynomialSolution
+            or not hasattr(self, "molar_fractions")
+            or np.ndim(self.molar_fractions) != 1
+        ):
+            return None
+        key = Mineral._state_key(self, pressure, temperature)
+        if key is None:
+            return None
+        try:
+            signatures = _solution_model_signature(self.solution_model)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return None
+        return key + (signatures, self.molar_fractions.tobytes())
+
+    def _restore_state(self, pressure, temperature, entry):
+        """
+        Sets the state of the solution and its endmembers from an entry
+        in the state cache.
+        """
+        Material.set_state(self, pressure, temperature)
+        cached, self._property_modifiers, endmember_states = entry
+        # The stored properties are copied, so that properties set
+        # later do not change the entry
+        self._cached = dict(cached)
+        for mbr, state in zip(self.solution_model.endmembers, endmember_states):
+            if state is None:
+                mbr[0].set_state(pressure, temperature)
+            else:
+                Material.set_state(mbr[0], pressure, temperature)
+                mbr[0]._cached = dict(state[0])
+                mbr[0]._property_modifiers = state[1]
+
+    def evaluate(self, vars_list, pressures, temperatures, molar_fractions=None):
+        """
+        Returns an array of material properties requested through a list of strings
+        at given pressure, temperature and composition conditions.
+        At the end it resets the set_state to the original values.
+
+        If the solution model is vectorized
+        (see :class:`burnman.SolutionModel`) and all of the requested
+        properties are compositional properties of the solution
+        (activities, excess, partial and molar Gibbs energies,
+        entropies, volumes and enthalpies and their compositional hessians),
+        all the compositions are evaluated in a single pass.
+        Otherwise, the properties are evaluated state by state.
+
+        :param vars_list: Variables to be returned for given conditions
+        :type vars_list: list of strings
+
+        :param pressures: ndlist or ndarray of float of pressures in [Pa].
+        :type pressures: :class:`numpy.array`, n-dimensional
+
+        :param temperatures: ndlist or ndarray of float of temperatures in [K].
+        :type temperatures: :class:`numpy.array`, n-dimensional
+
+        :param molar_fractions: Molar fractions of the endmembers at each state.
+            If None, the current composition is used.
+        :type molar_fractions: :class:`numpy.array`, n+1-dimensional
+
+        :returns: List or array returning all variables at given conditions.
+            output[i][j] is property vars_list[j] for temperatures[i],
+            pressures[i] and molar_fractions[i].
+            Attempts to return an array, falls back to a list if the returned
+            properties have different shapes.
+        :rtype: list or :class:`numpy.array`, n-dimensional
+        """
+        if molar_fractions is not None and self._can_evaluate_batched(vars_list):
+            return self._evaluate_batched(
+                vars_list, pressures, temperatures, molar_fractions
+            )
+        return Mineral.evaluate(
+            self, vars_list, pressures, temperatures, molar_fractions
+        )
+
+    _batched_property_aliases = {
+        "gibbs": "molar_gibbs",
+        "S": "molar_entropy",
+        "V": "molar_volume",
+        "H": "molar_enthalpy",
+    }
+
+    _batched_properties = (
+        "activities",
+        "activity_coefficients",
+        "excess_partial_gibbs",
+        "excess_partial_entropies",
+        "excess_partial_volumes",
+        "partial_gibbs",
+        "partial_entropies",
+        "partial_volumes",
+        "excess_gibbs",
+        "excess_entropy",
+        "excess_volume",
+        "excess_enthalpy",
+        "molar_gibbs",
+        "molar_entropy",
+        "molar_volume",
+        "molar_enthalpy",
+        "gibbs_hessian",
+        "entropy_hessian",
+        "volume_hessian",
+    )
+
+    def _can_evaluate_batched(self, vars_list):
+        """
+        Returns True if the requested properties can be evaluated
+        for many compositions in a single pass.
+        This requires a vectorized solution model and
+        no overloading of set_state or set_composition.
+        """
+        return (
+            getattr(self.solution_model, "vectorized", False)
+            and type(self).set_state is Solution.set_state
+            and type(self).set_composition is Solution.set_composition
+            and all(
+                self._batched_property_aliases.get(var, var) in self._batched_properties
+                for var in vars_list
+            )
+        )
+
+    def _evaluate_batched(self, vars_list, pressures, temperatures, molar_fractions):
+        """
+        Evaluates the requested properties for all compositions in a
+        single pass by passing the stacked compositions, pressures and
+        temperatures directly to the solution model.
+        The state of the solution is not modified.
+        """
+        model = self.solution_model
+        pressures = np.array(pressures, dtype=float)
+        temperatures = np.array(temperatures, dtype=float)
+        molar_fractions = np.array(molar_fractions, dtype=float)
+
+        assert pressures.shape == temperatures.shape
+        assert temperatures.shape == molar_fractions.shape[:-1]
+        assert molar_fractions.shape[-1] == self.n_endmembers
+
+        if type(model) is not MechanicalSolution:
+            if np.any(np.abs(molar_fractions.sum(axis=-1) - 1.0) > 1.0e-4):
+                raise ValueError(
+                    "Molar fractions do not sum to one for "
+                    "the current instance of "
+                    f"<{self.name}>"
+                )
+
+        P, T, X = pressures, temperatures, molar_fractions
+
+        # Composition sweeps usually revisit a small number of
+        # pressure-temperature conditions, so the endmember properties
+        # are only evaluated at the unique conditions.
+        PT, PT_indices = np.unique(
+            np.stack([P.ravel(), T.ravel()], axis=-1), axis=0, return_inverse=True
+        )
+        PT_indices = PT_indices.reshape(P.shape)
+        endmember_properties = {}
+
+        def endmember_property(name):
+            if name not in endmember_properties:
+                endmember_properties[name] = np.stack(
+                    [
+                        np.reshape(mbr[0].evaluate([name], PT[:, 0], PT[:, 1]), -1)
+                        for mbr in model.endmembers
+                    ],
+                    axis=-1,
+                )[PT_indices]
+            return endmember_properties[name]
+
+        properties = {
+            "activities": lambda: model.activities(P, T, X),
+            "activity_coefficients": lambda: model.activity_coefficients(P, T, X),
+            "excess_partial_gibbs": lambda: model.excess_partial_gibbs_energies(
+                P, T, X
+            ),
+            "excess_partial_entropies": lambda: model.excess_partial_entropies(P, T, X),
+            "excess_partial_volumes": lambda: model.excess_partial_volumes(P, T, X),
+            "partial_gibbs": lambda: endmember_property("gibbs")
+            + model.excess_partial_gibbs_energies(P, T, X),
+            "partial_entropies": lambda: endmember_property("S")
+            + model.excess_partial_entropies(P, T, X),
+            "partial_volumes": lambda: endmember_property("V")
+            + model.excess_partial_volumes(P, T, X),
+            "excess_gibbs": lambda: model.excess_gibbs_energy(P, T, X),
+            "excess_entropy": lambda: model.excess_entropy(P, T, X),
+            "excess_volume": lambda: model.excess_volume(P, T, X),
+            "excess_enthalpy": lambda: model.excess_enthalpy(P, T, X),
+            "molar_gibbs": lambda: np.einsum(
+                "...i, ...i->...", X, endmember_property("gibbs")
+            )
+            + model.excess_gibbs_energy(P, T, X),
+            "molar_entropy": lambda: np.einsum(
+                "...i, ...i->...", X, endmember_property("S")
+            )
+            + model.excess_entropy(P, T, X),
+            "molar_volume": lambda: np.einsum(
+                "...i, ...i->...", X, endmember_property("V")
+            )
+            + model.excess_volume(P, T, X),
+            "molar_enthalpy": lambda: np.einsum(
+                "...i, ...i->...", X, endmember_property("H")
+            )
+            + model.excess_enthalpy(P, T, X),
+            "gibbs_hessian": lambda: model.gibbs_hessian(P, T, X),
+            "entropy_hessian": lambda: model.entropy_hessian(P, T, X),
+            "volume_hessian": lambda: model.volume_hessian(P, T, X),
+        }
+
+        try:
+            if type(model) is PolynomialSolution:
+                model.set_composition(X)
+                model.set_state(P, T)
+            output = []
+            for var in vars_list:
+                value = properties[self._batched_property_aliases.get(var, var)]()
+                output.append(np.array(value, dtype=float))
+        finally:
+            if type(model) is PolynomialSolution:
+                # restore the composition and state of the model
+                if hasattr(self, "molar_fractions"):
+                    model.set_composition(self.molar_fractions)
+                if self.pressure is not None and self.temperature is not None:
+                    model.set_state(self.pressure, self.temperature)
+
+        try:
+            output = np.array(output)
+        except ValueError:  # if the lists are different shapes
+            pass
+        return output
 
     @material_property
     def formula(self):
@@ -225,16 +524,36 @@ class Solution(Mineral):
             self.pressure, self.temperature, self.molar_fractions
         )
 
+    @material_property(dependencies=("pressure", "temperature"))
+    def _endmember_gibbs(self):
+        """
+        Returns the molar Gibbs energies of the endmembers [J/mol].
+        """
+        return np.array([mbr[0].gibbs for mbr in self.solution_model.endmembers])
+
+    @material_property(dependencies=("pressure", "temperature"))
+    def _endmember_volumes(self):
+        """
+        Returns the molar volumes of the endmembers [m^3].
+        """
+        return np.array([mbr[0].molar_volume for mbr in self.solution_model.endmembers])
+
+    @material_property(dependencies=("pressure", "temperature"))
+    def _endmember_entropies(self):
+        """
+        Returns the molar entropies of the endmembers [J/K].
+        """
+        return np.array(
+            [mbr[0].molar_entropy for mbr in self.solution_model.endmembers]
+        )
+
     @material_property
     def partial_gibbs(self):
         """
         Returns endmember partial molar gibbs free energy [J/mol].
         Property specific to solutions.
         """
-        return (
-            np.array([mbr[0].gibbs for mbr in self.solution_model.endmembers])
-            + self.excess_partial_gibbs
-        )
+        return self._endmember_gibbs + self.excess_partial_gibbs
 
     @material_property
     def partial_volumes(self):
@@ -242,10 +561,7 @@ class Solution(Mineral):
         Returns endmember partial volumes [m^3].
         Property specific to solutions.
         """
-        return (
-            np.array([mbr[0].molar_volume for mbr in self.solution_model.endmembers])
-            + self.excess_partial_volumes
-        )
+        return self._endmember_volumes + self.excess_partial_volumes
 
     @material_property
     def partial_entropies(self):
@@ -253,10 +569,7 @@ class Solution(Mineral):
         Returns endmember partial entropies [J/K].
         Property specific to solutions.
         """
-        return (
-            np.array([mbr[0].molar_entropy for mbr in self.solution_model.endmembers])
-            + self.excess_partial_entropies
-        )
+        return self._endmember_entropies + self.excess_partial_entropies
 
     @material_property
     def excess_gibbs(self):
@@ -599,6 +912,7 @@ class Solution(Mineral):
         A sympy Matrix where each element M[i,j] corresponds
         to the number of atoms of element[j] in endmember[i].
         """
+        from sympy import Matrix, nsimplify
 
         def f(i, j):
             e = self.elements[j]
@@ -766,6 +1080,96 @@ class Solution(Mineral):
 SolidSolution = Solution
 
 
+def relax_solution(solution, dndq, tol=1.0e-10, max_iterations=50):
+    """
+    Minimizes the Gibbs energy of a solution at constant pressure and
+    temperature by changing the amounts of the endmembers along
+    a set of relaxation vectors, starting from the current composition.
+
+    The minimization uses Newton's method, with gradients and
+    hessians obtained from the partial Gibbs energies and the
+    compositional hessian of the solution. Negative curvatures are
+    replaced by their absolute values, so that each step is
+    a descent direction. Steps are damped so that
+    site occupancies do not become negative, and are
+    shortened until the Gibbs energy decreases sufficiently.
+
+    On exit, the composition of the solution is set to the
+    relaxed composition.
+
+    :param solution: The solution to relax. The state and
+        composition of the solution must already have been set.
+    :type solution: :class:`burnman.Solution`
+    :param dndq: Matrix whose columns are the relaxation vectors
+        (changes in the endmember amounts per unit change
+        of each structure parameter).
+    :type dndq: 2D numpy array
+    :param tol: The iterations stop when the largest change in the
+        structure parameters is smaller than this value
+        (and no site occupancy changes by more than a
+        millionth of its value).
+    :type tol: float
+    :param max_iterations: Maximum number of Newton iterations.
+    :type max_iterations: int
+
+    :returns: The change in the structure parameters, the number of
+        Newton iterations and whether the minimization converged.
+    :rtype: tuple of 1D numpy array, int and bool
+    """
+    n = np.array(solution.molar_fractions, dtype=float)
+    occupancies = getattr(
+        solution.solution_model, "endmember_occupancies", np.eye(len(n))
+    )
+    dq_total = np.zeros(dndq.shape[1])
+    mu = solution.partial_gibbs
+    G = np.einsum("i, i", n, mu)
+
+    for i in range(max_iterations):
+        g = np.einsum("i, ij->j", mu, dndq)
+        H = np.einsum("ij, ik, jl->kl", solution.gibbs_hessian, dndq, dndq)
+        w, v = np.linalg.eigh(H)
+        w = np.maximum(np.abs(w), 1.0e-12 * max(np.max(np.abs(w)), 1.0))
+        dq = -np.einsum("ij, j, kj, k->i", v, 1.0 / w, v, g)
+
+        # Do not step past the point where a site occupancy becomes zero
+        dn = np.einsum("ij, j->i", dndq, dq)
+        occ = np.einsum("i, ij->j", n, occupancies)
+        docc = np.einsum("i, ij->j", dn, occupancies)
+        mask = np.logical_and(docc < 0.0, occ > 0.0)
+        lmda = 1.0
+        if np.any(mask):
+            lmda = min(1.0, 0.99 * np.min(occ[mask] / -docc[mask]))
+
+        # Backtracking line search (Armijo condition), allowing for
+        # rounding errors in the Gibbs energy
+        slope = np.einsum("i, i", g, dq)
+        while True:
+            solution.set_composition(n + lmda * dn)
+            mu = solution.partial_gibbs
+            G_new = np.einsum("i, i", n + lmda * dn, mu)
+            if G_new - G <= 1.0e-4 * lmda * slope + 1.0e-14 * np.abs(G):
+                break
+            lmda *= 0.5
+            if lmda < 1.0e-8:
+                # The Gibbs energy cannot be reduced along the Newton
+                # direction, so the minimization has failed
+                solution.set_composition(n)
+                return dq_total, i + 1, False
+
+        n = n + lmda * dn
+        G = G_new
+        dq_total += lmda * dq
+
+        # Close to the edges of the solution, small steps in q can
+        # still be large relative changes in the site occupancies
+        if np.max(np.abs(lmda * dq)) < tol and np.all(
+            np.abs(lmda * docc) <= 1.0e-6 * occ
+        ):
+            return dq_total, i + 1, True
+
+    return dq_total, max_iterations, False
+
+
 class RelaxedSolution(Solution):
     """
     A class implementing a relaxed solution
@@ -780,6 +1184,11 @@ class RelaxedSolution(Solution):
     high spin and low spin iron, and so a single vector should be passed:
     np.array([[0., -1., 1.]]) or some multiple thereof.
 
+    The structure parameters are relaxed using Newton's method
+    (see :func:`burnman.classes.solution.relax_solution`).
+    The number of iterations used in the last relaxation is stored
+    in the relaxation_iterations attribute.
+
     States of the mineral can only be queried after setting the
     pressure and temperature using set_state() and the composition using
     set_composition().
@@ -814,6 +1223,14 @@ class RelaxedSolution(Solution):
 
         self.q_initial = np.zeros(len(relaxation_vectors)) + 0.001
 
+        # Matrix converting endmember amounts into structure parameters,
+        # used to warm-start each relaxation from the last relaxed state
+        self._dqdn = np.linalg.inv(np.hstack((self.dndq, self.dndx)))[
+            : self.n_relaxation_vectors
+        ]
+        self._q_relaxed = None
+        self.relaxation_iterations = None
+
         try:
             molar_fractions = solution.molar_fractions
         except AttributeError:
@@ -862,9 +1279,11 @@ class RelaxedSolution(Solution):
             unrelaxed vectors specified during initialisation.
         :type molar_fractions: 1D numpy array
         :param q_initial: Initial values of the structure parameters.
-            Defaults to None, in which case the preexisting
-            initial values are used
-            (first set to 0.001 during initialisation).
+            Defaults to None, in which case the relaxation starts
+            from the most recently relaxed structure parameters,
+            if they give non-negative site occupancies at the new
+            composition, or otherwise from the preexisting
+            initial values (first set to 0.001 during initialisation).
         :type q_initial: 1D numpy array, optional
         :param relaxed: Whether to minimize the Gibbs energy
             of the material by changing the values of the structure
@@ -878,12 +1297,24 @@ class RelaxedSolution(Solution):
             "ij, j", self.dndx, molar_fractions
         )
 
+        if relaxed and q_initial is None and self._q_relaxed is not None:
+            n_warm = np.einsum("ij, j", self.dndq, self._q_relaxed) + np.einsum(
+                "ij, j", self.dndx, molar_fractions
+            )
+            occupancies = np.einsum(
+                "i, ij", n_warm, self.solution_model.endmember_occupancies
+            )
+            if np.all(occupancies >= 0.0):
+                n = n_warm
+
         self.unrelaxed.set_composition(n)
 
         if self.unrelaxed.pressure is not None and relaxed:
             self._relax_at_PTX()
-            Solution.set_composition(self, n)
-            self.unrelaxed.set_composition(self.molar_fractions)
+            if self.pressure is None:
+                Solution.set_state(
+                    self, self.unrelaxed.pressure, self.unrelaxed.temperature
+                )
 
     def _relax_at_PTX(self):
         """
@@ -894,18 +1325,25 @@ class RelaxedSolution(Solution):
         state and composition have already been set. This function
         should not generally be needed by the user.
         """
+        _, self.relaxation_iterations, converged = relax_solution(
+            self.unrelaxed, self.dndq
+        )
         n0 = copy.copy(self.unrelaxed.molar_fractions)
 
-        def G_func(dq):
-            n = n0 + np.einsum("ij, j", self.dndq, dq)
-            self.unrelaxed.set_composition(n)
-            return self.unrelaxed.molar_gibbs
+        if not converged:
 
-        sol = minimize(G_func, np.zeros(len(self.dndq[0])), method="Nelder-Mead")
-        assert sol.success
-        n = n0 + np.einsum("ij, j", self.dndq, sol.x)
-        self.unrelaxed.set_composition(n)
-        Solution.set_composition(self, n)
+            def G_func(dq):
+                n = n0 + np.einsum("ij, j", self.dndq, dq)
+                self.unrelaxed.set_composition(n)
+                return self.unrelaxed.molar_gibbs
+
+            sol = minimize(G_func, np.zeros(len(self.dndq[0])), method="Nelder-Mead")
+            assert sol.success
+            n0 = n0 + np.einsum("ij, j", self.dndq, sol.x)
+
+        self._q_relaxed = np.einsum("ij, j", self._dqdn, n0)
+        self.unrelaxed.set_composition(n0)
+        Solution.set_composition(self, n0)
 
     def set_state_with_volume(
         self, volume, temperature, pressure_guesses=[0.0e9, 10.0e9]
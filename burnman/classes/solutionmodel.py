@@ -18,13 +18,19 @@ Interaction = make_dataclass(
     "Interaction", ["inds", "expts", "f_r", "m_jr", "f_rs", "m_jrs"]
 )
 
-try:
-    ag = importlib.import_module("autograd")
-except ImportError as err:
-    print(
-        f"Warning: {err}. "
-        "For full functionality of BurnMan, please install autograd."
-    )
+
+def _import_autograd():
+    """
+    Returns the autograd module. It is only imported when it is
+    first needed (by the function-based solution models),
+    as importing it is slow.
+    """
+    try:
+        return importlib.import_module("autograd")
+    except ImportError as err:
+        raise ImportError(
+            f"{err}. This solution model requires autograd, please install it."
+        ) from err
 
 
 def _ideal_activities_fct(
@@ -36,10 +42,10 @@ def _ideal_activities_fct(
     endmember_configurational_entropies,
 ):
     site_noccupancies = np.dot(molar_fractions, endmember_noccupancies)
-    site_multiplicities = np.einsum("i, ij", molar_fractions, site_multiplicities)
+    site_multiplicities = np.einsum("...i, ij", molar_fractions, site_multiplicities)
     site_occupancies = site_noccupancies * inverseish(site_multiplicities)
 
-    a = np.power(site_occupancies, endmember_noccupancies).prod(-1)
+    a = np.power(site_occupancies[..., np.newaxis, :], endmember_noccupancies).prod(-1)
     normalisation_constants = np.exp(
         endmember_configurational_entropies / constants.gas_constant
     )
@@ -47,63 +53,141 @@ def _ideal_activities_fct(
 
 
 def _non_ideal_hessian_fct(phi, molar_fractions, n_endmembers, alpha, W):
-    q = np.eye(n_endmembers) - phi * np.ones((n_endmembers, n_endmembers))
+    # q_ij = delta_ij - phi_j, so that
+    # hess_im = alpha_i alpha_m / sum(p.alpha) sum_jk q_ij W_jk q_mk
+    q = np.eye(n_endmembers) - phi[..., np.newaxis, :]
     sum_pa = np.dot(molar_fractions, alpha)
-    hess = np.einsum("m, i, ij, jk, mk->im", -alpha / sum_pa, -alpha, q, W, q)
-    hess += hess.T
+    qWq = np.matmul(np.matmul(q, W), np.swapaxes(q, -1, -2))
+    hess = np.einsum("i, m, ...im->...im", alpha, alpha, qWq) / np.expand_dims(
+        sum_pa, (-1, -2)
+    )
+    hess += np.swapaxes(hess, -1, -2)
     return hess
 
 
 def _non_ideal_interactions_fct(phi, molar_fractions, n_endmembers, alpha, W):
     # -sum(sum(qi.qj.Wij*)
     # equation (2) of Holland and Powell 2003
-    q = np.eye(n_endmembers) - phi * np.ones((n_endmembers, n_endmembers))
+    q = np.eye(n_endmembers) - phi[..., np.newaxis, :]
     # The following are equivalent to
     # np.einsum('i, ij, jk, ik->i', -self.alphas, q, self.Wx, q)
-    Wint = -alpha * (q.dot(W) * q).sum(-1)
+    Wint = -alpha * (np.matmul(q, W) * q).sum(-1)
     return Wint
 
 
-def _non_ideal_hessian_subreg(p, n_endmembers, Wijk):
-    Id = np.identity(n_endmembers)
-    IIp = np.einsum("il, jm, k->ijklm", Id, Id, p)
-    Ipp = np.einsum("il, j, k->ijkl", Id, p, p)
-    ppp = np.einsum("i, j, k->ijk", p, p, p)
-
-    A = (
-        IIp
-        + np.transpose(IIp, axes=[0, 2, 1, 3, 4])
-        + np.transpose(IIp, axes=[1, 0, 2, 3, 4])
-        + np.transpose(IIp, axes=[1, 2, 0, 3, 4])
-        + np.transpose(IIp, axes=[2, 1, 0, 3, 4])
-        + np.transpose(IIp, axes=[2, 0, 1, 3, 4])
-    )
-    B = 2.0 * (
-        Ipp
-        + np.transpose(Ipp, axes=[1, 0, 2, 3])
-        + np.transpose(Ipp, axes=[2, 1, 0, 3])
+def _symmetrised_subregular_interactions(*Wijks):
+    """
+    Returns the stack of the given subregular interaction tensors,
+    each summed over the six permutations of its indices.
+    """
+    W = np.array(Wijks)
+    return (
+        W
+        + np.transpose(W, axes=[0, 1, 3, 2])
+        + np.transpose(W, axes=[0, 2, 1, 3])
+        + np.transpose(W, axes=[0, 2, 3, 1])
+        + np.transpose(W, axes=[0, 3, 1, 2])
+        + np.transpose(W, axes=[0, 3, 2, 1])
     )
 
-    Asum = (
-        A - B[:, :, :, :, None] - B[:, :, :, None, :] + 6.0 * ppp[:, :, :, None, None]
+
+def _subregular_contractions(p, Wsym):
+    """
+    Contractions of a stack of symmetrised subregular interaction tensors
+    (see _symmetrised_subregular_interactions) with the
+    (optionally stacked) proportions p:
+    T_lm = sum_k Wsym_lmk p_k, g_l = sum_m T_lm p_m / 2 and
+    G = sum_ijk W_ijk p_i p_j p_k = g.p / 3.
+    The stacking axis of Wsym is the first axis of each output.
+    """
+    T = np.einsum("xlmk, ...k->x...lm", Wsym, p)
+    g = 0.5 * np.einsum("x...lm, ...m->x...l", T, p)
+    G = np.einsum("x...l, ...l->x...", g, p) / 3.0
+    return T, g, G
+
+
+def _subregular_interactions(T, g, G):
+    # equation (6') of Helffrich and Wood, 1989
+    return g - 2.0 * G[..., np.newaxis]
+
+
+def _subregular_hessian(T, g, G):
+    # Second derivatives of n G_excess with respect to the
+    # endmember amounts. Equivalent to the contraction of W with the
+    # 5D tensor of permuted Kronecker deltas and proportions, but O(n^3).
+    return (
+        T
+        - 2.0 * g[..., :, np.newaxis]
+        - 2.0 * g[..., np.newaxis, :]
+        + 6.0 * G[..., np.newaxis, np.newaxis]
     )
-    hess = np.einsum("ijklm, ijk->lm", Asum, Wijk)
-    return hess
 
 
-def _non_ideal_interactions_subreg(p, n_endmembers, Wijk):
-    Aijkl = np.einsum("li, j, k->ijkl", np.identity(n_endmembers), p, p)
-    ppp = np.einsum("i, j, k->ijk", p, p, p)
+def _interaction_tensor(name):
+    """
+    Returns a property for one of the interaction tensors of a
+    subregular model. Assigning a new tensor discards the
+    symmetrised tensors and contractions calculated from the
+    previous tensors. In-place modifications are detected
+    by _subregular_terms.
+    """
+
+    def fget(model):
+        return model.__dict__["_" + name]
 
-    Asum = (
-        Aijkl
-        + np.transpose(Aijkl, axes=[1, 0, 2, 3])
-        + np.transpose(Aijkl, axes=[1, 2, 0, 3])
-        - 2 * ppp[:, :, :, None]
-    )
+    def fset(model, W):
+        model.__dict__["_" + name] = W
+        model._Wsym = None
+        model._subregular_terms_cache = None
 
-    Wint = np.einsum("ijk, ijkl->l", Wijk, Asum)
-    return Wint
+    return property(fget, fset)
+
+
+def _subregular_terms(model, Wijks, p):
+    """
+    Returns the contractions (see _subregular_contractions) of the
+    interaction tensors Wijks of a subregular model with the
+    proportions p. The symmetrised tensors
+    (see _symmetrised_subregular_interactions) are stored along with
+    copies of the tensors they were calculated from, and are
+    recalculated when one of the interaction tensors is replaced or
+    modified in place.
+
+    The contractions are also stored if p is the array of molar
+    fractions most recently set by a :class:`burnman.Solution`
+    (the _composition_key of the model), as the partial properties
+    and hessians are usually requested together. The solution replaces
+    this array whenever its composition changes, so the array itself
+    serves as the key for the stored contractions.
+    """
+    if model._Wsym is None or not all(
+        np.array_equal(W, W_copy) for W, W_copy in zip(Wijks, model._Wsym[0])
+    ):
+        model._Wsym = (
+            tuple(np.array(W, dtype=float) for W in Wijks),
+            _symmetrised_subregular_interactions(*Wijks),
+        )
+        model._subregular_terms_cache = None
+
+    cache = model._subregular_terms_cache
+    if cache is not None and cache[0] is p:
+        return cache[1]
+    terms = _subregular_contractions(np.asarray(p, dtype=float), model._Wsym[1])
+    if p is model._composition_key:
+        model._subregular_terms_cache = (p, terms)
+    return terms
+
+
+def _expand(x, n_axes):
+    """
+    Appends n_axes trailing axes to a scalar or array of state variables
+    (such as pressure or temperature), so that it broadcasts against
+    stacked arrays of per-endmember (n_axes=1) or per-endmember-pair
+    (n_axes=2) properties.
+    """
+    if np.ndim(x) == 0:
+        return x
+    return np.expand_dims(x, tuple(range(-n_axes, 0)))
 
 
 def logish(x, eps=np_eps):
@@ -136,7 +220,8 @@ def dpdn(molar_amounts, n, ones, eye):
     with respect to endmember amounts.
 
     :param molar_amounts: molar amounts of independent endmembers
-    :type molar_fractions: 1D numpy array
+        (or a stack of such arrays along the leading axes)
+    :type molar_fractions: numpy array
     :param n: sum of the endmember amounts (usually equal to one)
     :type n: float
     :param ones: a vector of ones of length equal to the number of endmembers
@@ -144,7 +229,7 @@ def dpdn(molar_amounts, n, ones, eye):
     :param eye: the identity matrix of size equal to the number of endmembers
     :type eye: 2D numpy array
     """
-    return (eye - np.einsum("k, m->km", molar_amounts, ones)) / n
+    return (eye - np.einsum("...k, m->...km", molar_amounts, ones)) / n
 
 
 def d2pdndn(molar_amounts, nsqr, ones, eyeones):
@@ -153,7 +238,8 @@ def d2pdndn(molar_amounts, nsqr, ones, eyeones):
     with respect to endmember amounts.
 
     :param molar_amounts: molar amounts of independent endmembers
-    :type molar_fractions: 1D numpy array
+        (or a stack of such arrays along the leading axes)
+    :type molar_fractions: numpy array
     :param nsqr: square of the sum of the endmember amounts (usually equal to one)
     :type n: float
     :param ones: a vector of ones of length equal to the number of endmembers
@@ -162,7 +248,9 @@ def d2pdndn(molar_amounts, nsqr, ones, eyeones):
     :type eyeones: 3D numpy array
     """
 
-    return (2.0 * np.einsum("n, m, k->knm", ones, ones, molar_amounts) - eyeones) / nsqr
+    return (
+        2.0 * np.einsum("n, m, ...k->...knm", ones, ones, molar_amounts) - eyeones
+    ) / nsqr
 
 
 class SolutionModel(object):
@@ -179,8 +267,28 @@ class SolutionModel(object):
     they essentially have no effect, and the Gibbs free energy and molar
     volume of a solution will be equal to the weighted arithmetic
     averages of the different endmember values.
+
+    Solution models whose functions also accept stacked compositions
+    should set the class attribute vectorized to True
+    (as do the mechanical, ideal, regular, subregular and polynomial
+    models). In that case, molar_fractions is an array of shape
+    (..., n_endmembers) and the pressures and temperatures must be
+    broadcastable to molar_fractions.shape[:-1]. Excess properties are
+    then returned with shape molar_fractions.shape[:-1],
+    partial properties with the shape of molar_fractions and hessians
+    with shape molar_fractions.shape + (n_endmembers,).
+    Solutions using those models evaluate many compositions
+    in a single call (see :func:`burnman.Solution.evaluate`).
+    The :class:`burnman.classes.solutionmodel.PolynomialSolution` model
+    stores the composition and state, so set_composition and set_state
+    must be called with the stacked compositions and states first.
     """
 
+    vectorized = False
+    _composition_key = None
+    _Wsym = None
+    _subregular_terms_cache = None
+
     def __init__(self):
         """
         Does nothing.
@@ -205,8 +313,9 @@ class SolutionModel(object):
         :returns: The excess Gibbs energy.
         :rtype: float
         """
-        return np.dot(
-            np.array(molar_fractions),
+        return np.einsum(
+            "...i, ...i->...",
+            molar_fractions,
             self.excess_partial_gibbs_energies(pressure, temperature, molar_fractions),
         )
 
@@ -227,7 +336,8 @@ class SolutionModel(object):
         :returns: The excess volume of the solution.
         :rtype: float
         """
-        return np.dot(
+        return np.einsum(
+            "...i, ...i->...",
             molar_fractions,
             self.excess_partial_volumes(pressure, temperature, molar_fractions),
         )
@@ -249,7 +359,8 @@ class SolutionModel(object):
         :returns: The excess entropy of the solution.
         :rtype: float
         """
-        return np.dot(
+        return np.einsum(
+            "...i, ...i->...",
             molar_fractions,
             self.excess_partial_entropies(pressure, temperature, molar_fractions),
         )
@@ -368,22 +479,27 @@ class MechanicalSolution(SolutionModel):
     of the constituent materials.
     """
 
+    vectorized = True
+
     def __init__(self, endmembers):
         self.endmembers = endmembers
         self.n_endmembers = len(endmembers)
         self.site_formulae = [e[1] for e in endmembers]
 
+    def _zero(self, molar_fractions):
+        return np.zeros(np.shape(molar_fractions)[:-1])[()]
+
     def excess_gibbs_energy(self, pressure, temperature, molar_fractions):
-        return 0.0
+        return self._zero(molar_fractions)
 
     def excess_volume(self, pressure, temperature, molar_fractions):
-        return 0.0
+        return self._zero(molar_fractions)
 
     def excess_entropy(self, pressure, temperature, molar_fractions):
-        return 0.0
+        return self._zero(molar_fractions)
 
     def excess_enthalpy(self, pressure, temperature, molar_fractions):
-        return 0.0
+        return self._zero(molar_fractions)
 
     def excess_partial_gibbs_energies(self, pressure, temperature, molar_fractions):
         return np.zeros_like(molar_fractions)
@@ -413,6 +529,8 @@ class IdealSolution(SolutionModel):
     a Temkin-type model :cite:`Temkin1945`.
     """
 
+    vectorized = True
+
     def __init__(self, endmembers):
         self.endmembers = endmembers
         self.n_endmembers = len(endmembers)
@@ -443,25 +561,25 @@ class IdealSolution(SolutionModel):
         return self._ideal_excess_partial_entropies(temperature, molar_fractions)
 
     def excess_partial_volumes(self, pressure, temperature, molar_fractions):
-        return np.zeros((self.n_endmembers))
+        return np.zeros(np.shape(molar_fractions))
 
     def gibbs_hessian(self, pressure, temperature, molar_fractions):
         hess_S = self._ideal_entropy_hessian(temperature, molar_fractions)
-        return -temperature * hess_S
+        return -_expand(temperature, 2) * hess_S
 
     def entropy_hessian(self, pressure, temperature, molar_fractions):
         hess_S = self._ideal_entropy_hessian(temperature, molar_fractions)
         return hess_S
 
     def volume_hessian(self, pressure, temperature, molar_fractions):
-        return np.zeros((len(molar_fractions), len(molar_fractions)))
+        return np.zeros(np.shape(molar_fractions) + (self.n_endmembers,))
 
     def configurational_entropy(self, molar_fractions):
         site_noccupancies = np.einsum(
-            "i, ij", molar_fractions, self.endmember_noccupancies
+            "...i, ij", molar_fractions, self.endmember_noccupancies
         )
         site_multiplicities = np.einsum(
-            "i, ij", molar_fractions, self.site_multiplicities
+            "...i, ij", molar_fractions, self.site_multiplicities
         )
         site_occupancies = site_noccupancies * inverseish(site_multiplicities)
         conf_entropy = -(
@@ -472,7 +590,7 @@ class IdealSolution(SolutionModel):
 
     def _ideal_excess_partial_gibbs(self, temperature, molar_fractions):
         return -(
-            temperature
+            _expand(temperature, 1)
             * self._ideal_excess_partial_entropies(temperature, molar_fractions)
         )
 
@@ -488,14 +606,14 @@ class IdealSolution(SolutionModel):
 
     def _log_ideal_activities(self, molar_fractions):
         site_noccupancies = np.einsum(
-            "i, ij", molar_fractions, self.endmember_noccupancies
+            "...i, ij", molar_fractions, self.endmember_noccupancies
         )
         site_multiplicities = np.einsum(
-            "i, ij", molar_fractions, self.site_multiplicities
+            "...i, ij", molar_fractions, self.site_multiplicities
         )
 
         lna = np.einsum(
-            "ij, j->i",
+            "ij, ...j->...i",
             self.endmember_noccupancies,
             logish(site_noccupancies) - logish(site_multiplicities),
         )
@@ -506,19 +624,19 @@ class IdealSolution(SolutionModel):
 
     def _log_ideal_activity_derivatives(self, molar_fractions):
         site_noccupancies = np.einsum(
-            "i, ij", molar_fractions, self.endmember_noccupancies
+            "...i, ij", molar_fractions, self.endmember_noccupancies
         )
         site_multiplicities = np.einsum(
-            "i, ij", molar_fractions, self.site_multiplicities
+            "...i, ij", molar_fractions, self.site_multiplicities
         )
 
         dlnadp = np.einsum(
-            "pj, qj, j->pq",
+            "pj, qj, ...j->...pq",
             self.endmember_noccupancies,
             self.endmember_noccupancies,
             inverseish(site_noccupancies),
         ) - np.einsum(
-            "pj, qj, j->pq",
+            "pj, qj, ...j->...pq",
             self.endmember_noccupancies,
             self.site_multiplicities,
             inverseish(site_multiplicities),
@@ -633,7 +751,7 @@ class AsymmetricRegularSolution(IdealSolution):
 
     def _phi(self, molar_fractions):
         phi = self.alphas * molar_fractions
-        phi = np.divide(phi, np.sum(phi))
+        phi = np.divide(phi, np.sum(phi, axis=-1, keepdims=True))
         return phi
 
     def _non_ideal_interactions(self, W, molar_fractions):
@@ -648,7 +766,7 @@ class AsymmetricRegularSolution(IdealSolution):
         Eint = self._non_ideal_interactions(self.We, molar_fractions)
         Sint = self._non_ideal_interactions(self.Ws, molar_fractions)
         Vint = self._non_ideal_interactions(self.Wv, molar_fractions)
-        return Eint - temperature * Sint + pressure * Vint
+        return Eint - _expand(temperature, 1) * Sint + _expand(pressure, 1) * Vint
 
     def excess_partial_gibbs_energies(self, pressure, temperature, molar_fractions):
         ideal_gibbs = IdealSolution._ideal_excess_partial_gibbs(
@@ -674,15 +792,16 @@ class AsymmetricRegularSolution(IdealSolution):
             self, temperature, molar_fractions
         )
         phi = self._phi(molar_fractions)
+        T = _expand(temperature, 2)
         nonideal_gibbs_hessian = _non_ideal_hessian_fct(
             phi,
             molar_fractions,
             self.n_endmembers,
             self.alphas,
-            self.We - temperature * self.Ws + pressure * self.Wv,
+            self.We - T * self.Ws + _expand(pressure, 2) * self.Wv,
         )
 
-        return nonideal_gibbs_hessian - temperature * ideal_entropy_hessian
+        return nonideal_gibbs_hessian - T * ideal_entropy_hessian
 
     def entropy_hessian(self, pressure, temperature, molar_fractions):
         ideal_entropy_hessian = IdealSolution._ideal_entropy_hessian(
@@ -701,12 +820,12 @@ class AsymmetricRegularSolution(IdealSolution):
         )
 
     def activity_coefficients(self, pressure, temperature, molar_fractions):
-        if temperature > 1.0e-10:
+        if np.all(np.asarray(temperature) > 1.0e-10):
             return np.exp(
                 self._non_ideal_excess_partial_gibbs(
                     pressure, temperature, molar_fractions
                 )
-                / (constants.gas_constant * temperature)
+                / (constants.gas_constant * _expand(temperature, 1))
             )
         else:
             raise Exception("Activity coefficients not defined at 0 K.")
@@ -754,6 +873,11 @@ class SubregularSolution(IdealSolution):
 
     Interaction parameters are inserted into a 3D interaction matrix during
     initialization to make use of numpy vector algebra.
+    The sums of these matrices over all permutations of their indices,
+    from which the partial properties and hessians are calculated,
+    are computed when first needed and stored. They are recalculated
+    whenever one of the interaction matrices (Wijke, Wijks and Wijkv)
+    is assigned or modified in place.
 
     :param endmembers: A list of all the independent endmembers in the solution.
         The first item of each list gives the Mineral object corresponding
@@ -785,6 +909,10 @@ class SubregularSolution(IdealSolution):
     :type entropy_ternary_terms: list of lists
     """
 
+    Wijke = _interaction_tensor("Wijke")
+    Wijks = _interaction_tensor("Wijks")
+    Wijkv = _interaction_tensor("Wijkv")
+
     def __init__(
         self,
         endmembers,
@@ -865,20 +993,27 @@ class SubregularSolution(IdealSolution):
         # initialize ideal solution model
         IdealSolution.__init__(self, endmembers)
 
-    def _non_ideal_function(self, Wijk, molar_fractions):
-        n = len(molar_fractions)
-        return _non_ideal_interactions_subreg(molar_fractions, n, Wijk)
+    def _non_ideal_terms(self, molar_fractions):
+        return _subregular_terms(
+            self, (self.Wijke, self.Wijks, self.Wijkv), molar_fractions
+        )
 
     def _non_ideal_interactions(self, molar_fractions):
         # equation (6') of Helffrich and Wood, 1989
-        Eint = self._non_ideal_function(self.Wijke, molar_fractions)
-        Sint = self._non_ideal_function(self.Wijks, molar_fractions)
-        Vint = self._non_ideal_function(self.Wijkv, molar_fractions)
+        Eint, Sint, Vint = _subregular_interactions(
+            *self._non_ideal_terms(molar_fractions)
+        )
         return Eint, Sint, Vint
 
+    def _non_ideal_hessians(self, molar_fractions):
+        hess_E, hess_S, hess_V = _subregular_hessian(
+            *self._non_ideal_terms(molar_fractions)
+        )
+        return hess_E, hess_S, hess_V
+
     def _non_ideal_excess_partial_gibbs(self, pressure, temperature, molar_fractions):
         Eint, Sint, Vint = self._non_ideal_interactions(molar_fractions)
-        return Eint - temperature * Sint + pressure * Vint
+        return Eint - _expand(temperature, 1) * Sint + _expand(pressure, 1) * Vint
 
     def excess_partial_gibbs_energies(self, pressure, temperature, molar_fractions):
         ideal_gibbs = IdealSolution._ideal_excess_partial_gibbs(
@@ -893,47 +1028,40 @@ class SubregularSolution(IdealSolution):
         ideal_entropies = IdealSolution._ideal_excess_partial_entropies(
             self, temperature, molar_fractions
         )
-        non_ideal_entropies = self._non_ideal_function(self.Wijks, molar_fractions)
+        non_ideal_entropies = self._non_ideal_interactions(molar_fractions)[1]
         return ideal_entropies + non_ideal_entropies
 
     def excess_partial_volumes(self, pressure, temperature, molar_fractions):
-        non_ideal_volumes = self._non_ideal_function(self.Wijkv, molar_fractions)
+        non_ideal_volumes = self._non_ideal_interactions(molar_fractions)[2]
         return non_ideal_volumes
 
     def gibbs_hessian(self, pressure, temperature, molar_fractions):
-        n = len(molar_fractions)
         ideal_entropy_hessian = IdealSolution._ideal_entropy_hessian(
             self, temperature, molar_fractions
         )
-        nonideal_gibbs_hessian = _non_ideal_hessian_subreg(
-            molar_fractions,
-            n,
-            self.Wijke - temperature * self.Wijks + pressure * self.Wijkv,
-        )
+        hess_E, hess_S, hess_V = self._non_ideal_hessians(molar_fractions)
+        T = _expand(temperature, 2)
+        nonideal_gibbs_hessian = hess_E - T * hess_S + _expand(pressure, 2) * hess_V
 
-        return nonideal_gibbs_hessian - temperature * ideal_entropy_hessian
+        return nonideal_gibbs_hessian - T * ideal_entropy_hessian
 
     def entropy_hessian(self, pressure, temperature, molar_fractions):
-        n = len(molar_fractions)
         ideal_entropy_hessian = IdealSolution._ideal_entropy_hessian(
             self, temperature, molar_fractions
         )
-        nonideal_entropy_hessian = _non_ideal_hessian_subreg(
-            molar_fractions, n, self.Wijks
-        )
+        nonideal_entropy_hessian = self._non_ideal_hessians(molar_fractions)[1]
         return ideal_entropy_hessian + nonideal_entropy_hessian
 
     def volume_hessian(self, pressure, temperature, molar_fractions):
-        n = len(molar_fractions)
-        return _non_ideal_hessian_subreg(molar_fractions, n, self.Wijkv)
+        return self._non_ideal_hessians(molar_fractions)[2]
 
     def activity_coefficients(self, pressure, temperature, molar_fractions):
-        if temperature > 1.0e-10:
+        if np.all(np.asarray(temperature) > 1.0e-10):
             return np.exp(
                 self._non_ideal_excess_partial_gibbs(
                     pressure, temperature, molar_fractions
                 )
-                / (constants.gas_constant * temperature)
+                / (constants.gas_constant * _expand(temperature, 1))
             )
         else:
             raise Exception("Activity coefficients not defined at 0 K.")
@@ -966,6 +1094,8 @@ class FunctionSolution(IdealSolution):
     :type excess_gibbs_function: function
     """
 
+    vectorized = False
+
     def __init__(self, endmembers, excess_gibbs_function):
         """
         Initialization function for the GeneralSolution class.
@@ -977,6 +1107,7 @@ class FunctionSolution(IdealSolution):
         self.n_endmembers = len(endmembers)
         self._excess_gibbs_function = excess_gibbs_function
 
+        ag = _import_autograd()
         self._non_ideal_excess_partial_gibbs = ag.jacobian(
             excess_gibbs_function, argnum=2
         )
@@ -1059,12 +1190,12 @@ class FunctionSolution(IdealSolution):
         return ideal_entropy_hessian + nonideal_entropy_hessian
 
     def activity_coefficients(self, pressure, temperature, molar_fractions):
-        if temperature > 1.0e-10:
+        if np.all(np.asarray(temperature) > 1.0e-10):
             return np.exp(
                 self._non_ideal_excess_partial_gibbs(
                     pressure, temperature, molar_fractions
                 )
-                / (constants.gas_constant * temperature)
+                / (constants.gas_constant * _expand(temperature, 1))
             )
         else:
             raise Exception("Activity coefficients not defined at 0 K.")
@@ -1146,6 +1277,8 @@ class PolynomialSolution(IdealSolution):
         else:
             self.dqdp = transformation_matrix
         self.n_transformed_endmembers = len(self.dqdp)
+        self._interaction_endmember_states = None
+        self._interaction_endmember_properties = {}
         self.reset()
 
     def reset(self):
@@ -1161,16 +1294,46 @@ class PolynomialSolution(IdealSolution):
         It is typically not required for the user to call this function.
         """
         self.reset()
-        self.molar_fractions = molar_fractions
-        self.trans_fractions = np.einsum("ij, j->i", self.dqdp, molar_fractions)
+        self.molar_fractions = np.asarray(molar_fractions)
+        self.trans_fractions = np.einsum("ij, ...j->...i", self.dqdp, molar_fractions)
 
     def set_state(self, pressure, temperature):
         """
         Sets the states for the interaction endmembers.
+        If either the pressure or temperature is an array,
+        the properties of the interaction endmembers are instead
+        evaluated at each of the (broadcast) states when required.
         It is typically not required for the user to call this function.
         """
-        for mbr in self.interaction_endmembers:
-            mbr.set_state(pressure, temperature)
+        self._interaction_endmember_properties = {}
+        if np.ndim(pressure) == 0 and np.ndim(temperature) == 0:
+            self._interaction_endmember_states = None
+            for mbr in self.interaction_endmembers:
+                mbr.set_state(pressure, temperature)
+        else:
+            self._interaction_endmember_states = np.broadcast_arrays(
+                pressure, temperature
+            )
+
+    def _interaction_endmember_property(self, name):
+        """
+        Returns the values of a property of each of the interaction
+        endmembers at the current state(s).
+
+        :param name: Name of the property.
+        :type name: str
+        :return: Property values, with the interaction endmembers
+            along the first axis.
+        :rtype: numpy array
+        """
+        if self._interaction_endmember_states is None:
+            return np.array([getattr(mbr, name) for mbr in self.interaction_endmembers])
+        if name not in self._interaction_endmember_properties:
+            P, T = self._interaction_endmember_states
+            self._interaction_endmember_properties[name] = np.array(
+                [mbr.evaluate([name], P, T)[0] for mbr in self.interaction_endmembers]
+            ).reshape((self.n_interaction_endmembers,) + P.shape)
+        return self._interaction_endmember_properties[name]
 
     def _make_prefactors_and_exponents(self, a):
         """
@@ -1266,21 +1429,12 @@ class PolynomialSolution(IdealSolution):
         each polynomial interaction.
         :return: Interaction postfactors
             (not including the values of the interactions themselves)
-        :rtype: 1D numpy array
+        :rtype: numpy array
         """
-        c = np.empty(self.n_W_ESV + self.n_W_mbr)
-        for i in range(self.n_W_ESV):
-            c[i] = np.prod(
-                np.power(self.trans_fractions[self.c_ESV[i].inds], self.c_ESV[i].expts),
-                axis=0,
-            )
-        for i in range(self.n_W_mbr):
-            j = i + self.n_W_ESV
-            c[j] = np.prod(
-                np.power(self.trans_fractions[self.c_mbr[i].inds], self.c_mbr[i].expts),
-                axis=0,
-            )
-
+        q = self.trans_fractions
+        c = np.empty(q.shape[:-1] + (self.n_W_ESV + self.n_W_mbr,))
+        for i, ci in enumerate(self._interactions):
+            c[..., i] = np.prod(np.power(q[..., ci.inds], ci.expts), axis=-1)
         return c
 
     @material_property
@@ -1291,23 +1445,15 @@ class PolynomialSolution(IdealSolution):
         with respect to the transformed endmember proportions.
         :return: Interaction postfactors
             (not including the values of the interactions themselves)
-        :rtype: 2D numpy array
+        :rtype: numpy array
         """
-        c = np.empty((self.n_W_ESV + self.n_W_mbr, self.n_transformed_endmembers))
-        for i in range(self.n_W_ESV):
-            c[i] = self.c_ESV[i].f_r * np.prod(
-                np.power(
-                    self.trans_fractions[self.c_ESV[i].inds], self.c_ESV[i].m_jr.T
-                ),
-                axis=1,
-            )
-        for i in range(self.n_W_mbr):
-            j = i + self.n_W_ESV
-            c[j] = self.c_mbr[i].f_r * np.prod(
-                np.power(
-                    self.trans_fractions[self.c_mbr[i].inds], self.c_mbr[i].m_jr.T
-                ),
-                axis=1,
+        q = self.trans_fractions
+        c = np.empty(
+            q.shape[:-1] + (self.n_W_ESV + self.n_W_mbr, self.n_transformed_endmembers)
+        )
+        for i, ci in enumerate(self._interactions):
+            c[..., i, :] = ci.f_r * np.prod(
+                np.power(q[..., np.newaxis, ci.inds], ci.m_jr.T), axis=-1
             )
         return c
 
@@ -1319,29 +1465,21 @@ class PolynomialSolution(IdealSolution):
         with respect to the transformed endmember proportions.
         :return: Interaction postfactors
             (not including the values of the interactions themselves)
-        :rtype: 3D numpy array
+        :rtype: numpy array
         """
+        q = self.trans_fractions
         c = np.empty(
-            (
+            q.shape[:-1]
+            + (
                 self.n_W_ESV + self.n_W_mbr,
                 self.n_transformed_endmembers,
                 self.n_transformed_endmembers,
             )
         )
-        for i in range(self.n_W_ESV):
-            c[i] = self.c_ESV[i].f_rs * np.prod(
-                np.power(
-                    self.trans_fractions[self.c_ESV[i].inds], self.c_ESV[i].m_jrs.T
-                ),
-                axis=2,
-            )
-        for i in range(self.n_W_mbr):
-            j = i + self.n_W_ESV
-            c[j] = self.c_mbr[i].f_rs * np.prod(
-                np.power(
-                    self.trans_fractions[self.c_mbr[i].inds], self.c_mbr[i].m_jrs.T
-                ),
-                axis=2,
+        for i, ci in enumerate(self._interactions):
+            c[..., i, :, :] = ci.f_rs * np.prod(
+                np.power(q[..., np.newaxis, np.newaxis, ci.inds], ci.m_jrs.T),
+                axis=-1,
             )
         return c
 
@@ -1352,10 +1490,10 @@ class PolynomialSolution(IdealSolution):
         with respect to the original endmember amounts.
 
         :return: dqdn
-        :rtype: 2D numpy array
+        :rtype: numpy array
         """
         return np.einsum(
-            "ik, km->im",
+            "ik, ...km->...im",
             self.dqdp,
             dpdn(self.molar_fractions, 1.0, self.ones, self.eye),
         )
@@ -1368,10 +1506,10 @@ class PolynomialSolution(IdealSolution):
         with respect to the endmember amounts.
         :return: Interaction postfactors
             (not including the values of the interactions themselves)
-        :rtype: 2D numpy array
+        :rtype: numpy array
         """
-        return np.einsum("ir, rm->im", self._dc_xsdq, self._dqdn) + np.einsum(
-            "i, m->im", self._c_xs, self.ones
+        return np.einsum("...ir, ...rm->...im", self._dc_xsdq, self._dqdn) + np.einsum(
+            "...i, m->...im", self._c_xs, self.ones
         )
 
     @material_property
@@ -1382,14 +1520,24 @@ class PolynomialSolution(IdealSolution):
         with respect to the endmember amounts.
         :return: Interaction postfactors
             (not including the values of the interactions themselves)
-        :rtype: 3D numpy array
+        :rtype: numpy array
         """
         n = 1.0
-        a1 = np.einsum("irs, sn, rm", self._d2c_xsdqdq, self._dqdn, self._dqdn)
-        a2a = 1.0 / n * (np.einsum("ir, rm, n", self._dc_xsdq, self._dqdn, self.ones))
-        a2 = a2a + np.einsum("imn->inm", a2a)
+        a1 = np.einsum(
+            "...irs, ...sn, ...rm->...imn", self._d2c_xsdqdq, self._dqdn, self._dqdn
+        )
+        a2a = (
+            1.0
+            / n
+            * (
+                np.einsum(
+                    "...ir, ...rm, n->...imn", self._dc_xsdq, self._dqdn, self.ones
+                )
+            )
+        )
+        a2 = a2a + np.swapaxes(a2a, -1, -2)
         a3 = np.einsum(
-            "ir, rk, knm->inm",
+            "...ir, rk, ...knm->...inm",
             self._dc_xsdq,
             self.dqdp,
             d2pdndn(self.molar_fractions, n * n, self.ones, self.eyeones),
@@ -1404,12 +1552,14 @@ class PolynomialSolution(IdealSolution):
         with respect to the endmember amounts.
 
         :return: dEdn, dSdn and dVdn.
-        :rtype: 2D numpy array
+        :rtype: numpy array
         """
         if self.W_ESV is None:
-            return np.zeros((3, self.n_endmembers))
+            return np.zeros((3,) + self.molar_fractions.shape)
         else:
-            return np.einsum("ij, ik->jk", self.W_ESV, self._dc_xsdn[: self.n_W_ESV])
+            return np.einsum(
+                "ij, ...ik->j...k", self.W_ESV, self._dc_xsdn[..., : self.n_W_ESV, :]
+            )
 
     @material_property
     def _ESV_hessian_list(self):
@@ -1419,13 +1569,15 @@ class PolynomialSolution(IdealSolution):
         with respect to the endmember amounts.
 
         :return: d2Edndn, d2Sdndn and d2Vdndn.
-        :rtype: 3D numpy array
+        :rtype: numpy array
         """
         if self.W_ESV is None:
-            return np.zeros((3, self.n_endmembers, self.n_endmembers))
+            return np.zeros((3,) + self.molar_fractions.shape + (self.n_endmembers,))
         else:
             return np.einsum(
-                "ij, ikl->jkl", self.W_ESV, self._d2c_xsdndn[: self.n_W_ESV]
+                "ij, ...ikl->j...kl",
+                self.W_ESV,
+                self._d2c_xsdndn[..., : self.n_W_ESV, :, :],
             )
 
     @material_property
@@ -1434,12 +1586,14 @@ class PolynomialSolution(IdealSolution):
         :return: The value with which to multiply
         each interaction endmember property to get the
         total excess property.
-        :rtype: 1D numpy array
+        :rtype: numpy array
         """
         if self.W_mbr is None:
             return np.zeros((0))
         else:
-            return np.einsum("ij, i->j", self.W_mbr, self._c_xs[self.n_W_ESV :])
+            return np.einsum(
+                "ij, ...i->j...", self.W_mbr, self._c_xs[..., self.n_W_ESV :]
+            )
 
     @material_property
     def _mbr_gradient_list(self):
@@ -1448,12 +1602,14 @@ class PolynomialSolution(IdealSolution):
         each interaction endmember property to get the
         first derivatives of the total excess property
         with respect to the endmember amounts.
-        :rtype: 2D numpy array
+        :rtype: numpy array
         """
         if self.W_mbr is None:
             return np.zeros((0, self.n_endmembers))
         else:
-            return np.einsum("ij, ik->jk", self.W_mbr, self._dc_xsdn[self.n_W_ESV :])
+            return np.einsum(
+                "ij, ...ik->j...k", self.W_mbr, self._dc_xsdn[..., self.n_W_ESV :, :]
+            )
 
     @material_property
     def _mbr_hessian_list(self):
@@ -1462,21 +1618,35 @@ class PolynomialSolution(IdealSolution):
         each interaction endmember property to get the
         second derivatives of the total excess property
         with respect to the endmember amounts.
-        :rtype: 3D numpy array
+        :rtype: numpy array
         """
         if self.W_mbr is None:
             return np.zeros((0, self.n_endmembers, self.n_endmembers))
         else:
             return np.einsum(
-                "ij, ikl->jkl", self.W_mbr, self._d2c_xsdndn[self.n_W_ESV :]
+                "ij, ...ikl->j...kl",
+                self.W_mbr,
+                self._d2c_xsdndn[..., self.n_W_ESV :, :, :],
             )
 
+    @cached_property
+    def _interactions(self):
+        """
+        The ESV interactions followed by the endmember interactions.
+        """
+        interactions = []
+        if self.c_ESV is not None:
+            interactions.extend(self.c_ESV)
+        if self.c_mbr is not None:
+            interactions.extend(self.c_mbr)
+        return interactions
+
     def _non_ideal_excess_partial_gibbs(self, pressure, temperature, molar_fractions):
         dEdn, dSdn, dVdn = self._ESV_gradient_list
         mbr_gradients = self._mbr_gradient_list
-        mbr_gibbs = np.array([mbr.gibbs for mbr in self.interaction_endmembers])
-        gibbs = dEdn - temperature * dSdn + pressure * dVdn
-        gibbs += np.einsum("i, ij->j", mbr_gibbs, mbr_gradients)
+        mbr_gibbs = self._interaction_endmember_property("gibbs")
+        gibbs = dEdn - _expand(temperature, 1) * dSdn + _expand(pressure, 1) * dVdn
+        gibbs = gibbs + np.einsum("i..., i...j->...j", mbr_gibbs, mbr_gradients)
         return gibbs
 
     def excess_partial_gibbs_energies(self, pressure, temperature, molar_fractions):
@@ -1495,17 +1665,19 @@ class PolynomialSolution(IdealSolution):
 
         dSdn = self._ESV_gradient_list[1]
         mbr_gradients = self._mbr_gradient_list
-        mbr_entropies = np.array([mbr.S for mbr in self.interaction_endmembers])
+        mbr_entropies = self._interaction_endmember_property("S")
 
-        non_ideal_entropies = dSdn + np.einsum("i, ij->j", mbr_entropies, mbr_gradients)
+        non_ideal_entropies = dSdn + np.einsum(
+            "i..., i...j->...j", mbr_entropies, mbr_gradients
+        )
         return ideal_entropies + non_ideal_entropies
 
     def excess_partial_volumes(self, pressure, temperature, molar_fractions):
         dVdn = self._ESV_gradient_list[2]
         mbr_gradients = self._mbr_gradient_list
-        mbr_volumes = np.array([mbr.V for mbr in self.interaction_endmembers])
+        mbr_volumes = self._interaction_endmember_property("V")
 
-        return dVdn + np.einsum("i, ij->j", mbr_volumes, mbr_gradients)
+        return dVdn + np.einsum("i..., i...j->...j", mbr_volumes, mbr_gradients)
 
     def gibbs_hessian(self, pressure, temperature, molar_fractions):
         ideal_entropy_hessian = IdealSolution._ideal_entropy_hessian(
@@ -1514,32 +1686,34 @@ class PolynomialSolution(IdealSolution):
 
         d2Edndn, d2Sdndn, d2Vdndn = self._ESV_hessian_list
         mbr_hessian = self._mbr_hessian_list
-        mbr_gibbs = np.array([mbr.gibbs for mbr in self.interaction_endmembers])
+        mbr_gibbs = self._interaction_endmember_property("gibbs")
 
-        d2Gdndn = d2Edndn - temperature * d2Sdndn + pressure * d2Vdndn
-        d2Gdndn += np.einsum("i, ijk->jk", mbr_gibbs, mbr_hessian)
+        T = _expand(temperature, 2)
+        d2Gdndn = d2Edndn - T * d2Sdndn + _expand(pressure, 2) * d2Vdndn
+        d2Gdndn = d2Gdndn + np.einsum("i..., i...jk->...jk", mbr_gibbs, mbr_hessian)
 
-        return d2Gdndn - temperature * ideal_entropy_hessian
+        return d2Gdndn - T * ideal_entropy_hessian
 
     def entropy_hessian(self, pressure, temperature, molar_fractions):
         ideal_entropy_hessian = IdealSolution._ideal_entropy_hessian(
             self, temperature, molar_fractions
         )
 
+        # the cached ESV hessians must not be modified in place
         d2Sdndn = self._ESV_hessian_list[1]
         mbr_hessian = self._mbr_hessian_list
-        mbr_entropies = np.array([mbr.S for mbr in self.interaction_endmembers])
+        mbr_entropies = self._interaction_endmember_property("S")
 
-        d2Sdndn += np.einsum("i, ijk->jk", mbr_entropies, mbr_hessian)
+        d2Sdndn = d2Sdndn + np.einsum("i..., i...jk->...jk", mbr_entropies, mbr_hessian)
 
         return d2Sdndn + ideal_entropy_hessian
 
     def volume_hessian(self, pressure, temperature, molar_fractions):
         d2Vdndn = self._ESV_hessian_list[2]
         mbr_hessian = self._mbr_hessian_list
-        mbr_volumes = np.array([mbr.V for mbr in self.interaction_endmembers])
+        mbr_volumes = self._interaction_endmember_property("V")
 
-        d2Vdndn += np.einsum("i, ijk->jk", mbr_volumes, mbr_hessian)
+        d2Vdndn = d2Vdndn + np.einsum("i..., i...jk->...jk", mbr_volumes, mbr_hessian)
 
         return d2Vdndn
 
@@ -1568,12 +1742,12 @@ class PolynomialSolution(IdealSolution):
         return np.einsum("i, i", mbr_scalar, mbr_d2gibbsdpdp)
 
     def activity_coefficients(self, pressure, temperature, molar_fractions):
-        if temperature > 1.0e-10:
+        if np.all(np.asarray(temperature) > 1.0e-10):
             return np.exp(
                 self._non_ideal_excess_partial_gibbs(
                     pressure, temperature, molar_fractions
                 )
-                / (constants.gas_constant * temperature)
+                / (constants.gas_constant * _expand(temperature, 1))
             )
         else:
             raise Exception("Activity coefficients not defined at 0 K.")
@@ -0,0 +1,442 @@
+# This file is part of BurnMan - a thermoelastic and thermodynamic toolkit for
+# the Earth and Planetary Sciences
+# Copyright (C) 2012 - 2025 by the BurnMan team, released under the GNU
+# GPL v2 or later.
+
+import warnings
+import numpy as np
+
+from .material import Material, material_property
+from ..utils.misc import copy_documentation
+
+
+class TabulatedMaterial(Material):
+    """
+    A material whose properties are obtained by bilinear interpolation
+    of tables of properties on a rectilinear pressure-temperature grid.
+    States of the material can only be queried after setting the
+    pressure and temperature using set_state().
+
+    The tables contain the molar Gibbs energy, volume, entropy,
+    isobaric heat capacity, thermal expansivity, isothermal and
+    isentropic bulk moduli and shear modulus. All other properties are
+    obtained from these using standard thermodynamic relations.
+    Interpolation of all the properties requires only a single
+    lookup, so the tabulated material is usually much cheaper to
+    evaluate than the material from which the tables were made.
+
+    Tables are usually created from an existing material with
+    :func:`TabulatedMaterial.from_material`, which refines the grid
+    until the interpolated properties are accurate to a given tolerance.
+
+    This class is available as ``burnman.TabulatedMaterial``.
+
+    :param pressures: Strictly increasing grid pressures [Pa].
+    :type pressures: 1D numpy array
+    :param temperatures: Strictly increasing grid temperatures [K].
+    :type temperatures: 1D numpy array
+    :param tables: Dictionary of 2D arrays of shape
+        (len(pressures), len(temperatures)), with keys given by
+        TabulatedMaterial.tabulated_properties.
+    :type tables: dict
+    :param molar_mass: Molar mass of the material [kg/mol].
+    :type molar_mass: float
+    :param name: Name of the material.
+    :type name: str
+    """
+
+    tabulated_properties = [
+        "molar_gibbs",
+        "molar_volume",
+        "molar_entropy",
+        "molar_heat_capacity_p",
+        "thermal_expansivity",
+        "isothermal_bulk_modulus_reuss",
+        "isentropic_bulk_modulus_reuss",
+        "shear_modulus",
+    ]
+
+    def __init__(self, pressures, temperatures, tables, molar_mass, name=None):
+        self.pressures = np.array(pressures, dtype=float)
+        self.temperatures = np.array(temperatures, dtype=float)
+        if np.any(np.diff(self.pressures) <= 0.0) or np.any(
+            np.diff(self.temperatures) <= 0.0
+        ):
+            raise ValueError("The grid pressures and temperatures must be increasing.")
+
+        shape = (len(self.pressures), len(self.temperatures))
+        for prop in self.tabulated_properties:
+            if np.shape(tables[prop]) != shape:
+                raise ValueError(
+                    f"The {prop} table must have shape {shape}, "
+                    f"not {np.shape(tables[prop])}."
+                )
+
+        # _table[i, j, k] is the kth tabulated property at the
+        # ith pressure and the jth temperature
+        self._table = np.stack(
+            [
+                np.asarray(tables[prop], dtype=float)
+                for prop in self.tabulated_properties
+            ],
+            axis=-1,
+        )
+        self.bounds = [
+            [self.pressures[0], self.pressures[-1]],
+            [self.temperatures[0], self.temperatures[-1]],
+        ]
+        if name is not None:
+            self.name = name
+        Material.__init__(self)
+        self.params = {"name": self.name, "molar_mass": molar_mass}
+
+    @classmethod
+    def from_material(
+        cls,
+        material,
+        pressure_range,
+        temperature_range,
+        tolerance=1.0e-4,
+        n_initial=5,
+        max_refinements=8,
+        name=None,
+    ):
+        """
+        Creates a tabulated version of a material by sampling its
+        properties on a pressure-temperature grid.
+
+        The grid is refined adaptively. At each refinement, the material
+        is evaluated at the midpoints of every grid interval and at the
+        centre of every grid cell, and compared with the interpolated
+        values. Intervals in which the relative error of any tabulated
+        property exceeds the tolerance are bisected (an error at the
+        centre of a cell bisects both its pressure and its temperature
+        interval). For properties that pass through zero (such as the
+        Gibbs energy), the error is measured relative to at least
+        1% of the largest magnitude of that property in the table.
+
+        The material is evaluated at its current composition
+        (or, for composites, at its current molar fractions).
+
+        :param material: The material to tabulate, for example a
+            :class:`burnman.Mineral`, a :class:`burnman.Solution`
+            or a :class:`burnman.Composite`.
+        :type material: :class:`burnman.Material`
+        :param pressure_range: Minimum and maximum pressure [Pa].
+        :type pressure_range: list of two floats
+        :param temperature_range: Minimum and maximum temperature [K].
+        :type temperature_range: list of two floats
+        :param tolerance: Maximum allowed relative interpolation error.
+        :type tolerance: float
+        :param n_initial: Number of pressures and temperatures in the
+            initial (evenly spaced) grid.
+        :type n_initial: int
+        :param max_refinements: Maximum number of refinement steps.
+            If the tolerance has not been reached after this many
+            steps, a warning is issued.
+        :type max_refinements: int
+        :param name: Name of the tabulated material. Defaults to the
+            name of the material.
+        :type name: str
+
+        :returns: The tabulated material. The largest relative error
+            estimated during the final refinement step is stored as the
+            attribute max_error.
+        :rtype: :class:`burnman.TabulatedMaterial`
+        """
+        props = cls.tabulated_properties
+        samples = {}
+
+        def sample(pressures, temperatures):
+            # Evaluate the material only at the points not sampled before
+            P, T = [a.flatten() for a in np.meshgrid(pressures, temperatures)]
+            new = [i for i in range(len(P)) if (P[i], T[i]) not in samples]
+            if len(new) > 0:
+                values = material.evaluate(props, P[new], T[new])
+                for i, v in zip(new, values.T):
+                    samples[(P[i], T[i])] = v
+            values = np.array([samples[(p, t)] for p, t in zip(P, T)])
+            return np.swapaxes(
+                values.reshape(len(temperatures), len(pressures), len(props)),
+                0,
+                1,
+            )
+
+        def relative_error(estimate, values, scale):
+            error = np.abs(estimate - values)
+            denominator = np.maximum(np.abs(values), 0.01 * scale)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                error = np.where(error > 0.0, error / denominator, 0.0)
+            return np.where(np.isnan(error), 0.0, error)
+
+        pressures = np.linspace(*pressure_range, n_initial)
+        temperatures = np.linspace(*temperature_range, n_initial)
+
+        for i in range(max_refinements + 1):
+            table = sample(pressures, temperatures)
+            scale = np.nanmax(np.abs(table), axis=(0, 1))
+
+            Pmid = 0.5 * (pressures[1:] + pressures[:-1])
+            Tmid = 0.5 * (temperatures[1:] + temperatures[:-1])
+            error_P = relative_error(
+                0.5 * (table[1:] + table[:-1]), sample(Pmid, temperatures), scale
+            ).max(axis=(1, 2))
+            error_T = relative_error(
+                0.5 * (table[:, 1:] + table[:, :-1]), sample(pressures, Tmid), scale
+            ).max(axis=(0, 2))
+            # Bilinear interpolation can be exact along the grid lines
+            # but not inside the cells, so the cell centres are also checked
+            error_PT = relative_error(
+                0.25
+                * (table[1:, 1:] + table[1:, :-1] + table[:-1, 1:] + table[:-1, :-1]),
+                sample(Pmid, Tmid),
+                scale,
+            ).max(axis=2)
+            error_P = np.maximum(error_P, error_PT.max(axis=1))
+            error_T = np.maximum(error_T, error_PT.max(axis=0))
+            max_error = max(error_P.max(), error_T.max())
+
+            if max_error <= tolerance or i == max_refinements:
+                break
+
+            pressures = np.sort(np.concatenate((pressures, Pmid[error_P > tolerance])))
+            temperatures = np.sort(
+                np.concatenate((temperatures, Tmid[error_T > tolerance]))
+            )
+
+        if max_error > tolerance:
+            warnings.warn(
+                f"The tabulated material did not reach the requested "
+                f"tolerance ({tolerance:.1e}) after {max_refinements} "
+                f"refinements. The estimated maximum error is {max_error:.1e}.",
+                stacklevel=2,
+            )
+
+        molar_mass = material.evaluate(
+            ["molar_mass"], [pressures[0]], [temperatures[0]]
+        )[0][0]
+        if name is None:
+            name = f"Tabulated {material.name}"
+        tabulated = cls(
+            pressures,
+            temperatures,
+            {prop: table[:, :, k] for k, prop in enumerate(props)},
+            molar_mass,
+            name,
+        )
+        tabulated.max_error = max_error
+        return tabulated
+
+    @copy_documentation(Material.set_state)
+    def set_state(self, pressure, temperature):
+        if not np.logical_and(
+            np.all(self.bounds[0][0] <= pressure), np.all(pressure <= self.bounds[0][1])
+        ):
+            raise ValueError(
+                "The set_state pressure is outside the bounds of this material "
+                "({0:.4f}-{1:.4f} GPa)".format(
+                    self.bounds[0][0] / 1.0e9, self.bounds[0][1] / 1.0e9
+                )
+            )
+        if not np.logical_and(
+            np.all(self.bounds[1][0] <= temperature),
+            np.all(temperature <= self.bounds[1][1]),
+        ):
+            raise ValueError(
+                "The set_state temperature is outside the bounds of this material "
+                "({0:.1f}-{1:.1f} K)".format(self.bounds[1][0], self.bounds[1][1])
+            )
+        Material.set_state(self, pressure, temperature)
+
+    @copy_documentation(Material.evaluate)
+    def evaluate(self, vars_list, pressures, temperatures, molar_fractions=None):
+        if molar_fractions is not None:
+            return Material.evaluate(
+                self, vars_list, pressures, temperatures, molar_fractions
+            )
+
+        # All properties can be interpolated for whole arrays of
+        # pressures and temperatures at once
+        pressures, temperatures = np.broadcast_arrays(
+            np.array(pressures, dtype=float), np.array(temperatures, dtype=float)
+        )
+        old_state = (self._pressure, self._temperature, self._cached)
+        try:
+            self.set_state(pressures, temperatures)
+            output = [
+                np.broadcast_to(getattr(self, var), pressures.shape).copy()
+                for var in vars_list
+            ]
+        finally:
+            self._pressure, self._temperature, self._cached = old_state
+        return np.array(output)
+
+    @material_property
+    def _interpolated_properties(self):
+        """
+        All of the tabulated properties at the current state,
+        obtained by bilinear interpolation.
+        """
+        P = np.asarray(self.pressure, dtype=float)
+        T = np.asarray(self.temperature, dtype=float)
+        i = np.clip(
+            np.searchsorted(self.pressures, P, side="right") - 1,
+            0,
+            len(self.pressures) - 2,
+        )
+        j = np.clip(
+            np.searchsorted(self.temperatures, T, side="right") - 1,
+            0,
+            len(self.temperatures) - 2,
+        )
+        x = ((P - self.pressures[i]) / (self.pressures[i + 1] - self.pressures[i]))[
+            ..., np.newaxis
+        ]
+        y = (
+            (T - self.temperatures[j])
+            / (self.temperatures[j + 1] - self.temperatures[j])
+        )[..., np.newaxis]
+        t = self._table
+        values = (1.0 - x) * ((1.0 - y) * t[i, j] + y * t[i, j + 1]) + x * (
+            (1.0 - y) * t[i + 1, j] + y * t[i + 1, j + 1]
+        )
+        return np.moveaxis(values, -1, 0)
+
+    """
+    Properties by interpolation of the tables
+    """
+
+    @material_property
+    @copy_documentation(Material.molar_gibbs)
+    def molar_gibbs(self):
+        return self._interpolated_properties[0]
+
+    @material_property
+    @copy_documentation(Material.molar_volume)
+    def molar_volume(self):
+        return self._interpolated_properties[1]
+
+    @material_property
+    @copy_documentation(Material.molar_entropy)
+    def molar_entropy(self):
+        return self._interpolated_properties[2]
+
+    @material_property
+    @copy_documentation(Material.molar_heat_capacity_p)
+    def molar_heat_capacity_p(self):
+        return self._interpolated_properties[3]
+
+    @material_property
+    @copy_documentation(Material.thermal_expansivity)
+    def thermal_expansivity(self):
+        return self._interpolated_properties[4]
+
+    @material_property
+    @copy_documentation(Material.isothermal_bulk_modulus_reuss)
+    def isothermal_bulk_modulus_reuss(self):
+        return self._interpolated_properties[5]
+
+    @material_property
+    @copy_documentation(Material.isentropic_bulk_modulus_reuss)
+    def isentropic_bulk_modulus_reuss(self):
+        return self._interpolated_properties[6]
+
+    @material_property
+    @copy_documentation(Material.shear_modulus)
+    def shear_modulus(self):
+        return self._interpolated_properties[7]
+
+    """
+    Properties from the tabulated properties,
+    Legendre transformations
+    or Maxwell relations
+    """
+
+    @material_property
+    @copy_documentation(Material.molar_mass)
+    def molar_mass(self):
+        return self.params["molar_mass"]
+
+    @material_property
+    @copy_documentation(Material.density)
+    def density(self):
+        return self.molar_mass / self.molar_volume
+
+    @material_property
+    @copy_documentation(Material.molar_enthalpy)
+    def molar_enthalpy(self):
+        return self.molar_gibbs + self.temperature * self.molar_entropy
+
+    @material_property
+    @copy_documentation(Material.molar_internal_energy)
+    def molar_internal_energy(self):
+        return (
+            self.molar_gibbs
+            - self.pressure * self.molar_volume
+            + self.temperature * self.molar_entropy
+        )
+
+    @material_property
+    @copy_documentation(Material.molar_helmholtz)
+    def molar_helmholtz(self):
+        return self.molar_gibbs - self.pressure * self.molar_volume
+
+    @material_property
+    @copy_documentation(Material.isothermal_compressibility_reuss)
+    def isothermal_compressibility_reuss(self):
+        return 1.0 / self.isothermal_bulk_modulus_reuss
+
+    @material_property
+    @copy_documentation(Material.isentropic_compressibility_reuss)
+    def isentropic_compressibility_reuss(self):
+        return 1.0 / self.isentropic_bulk_modulus_reuss
+
+    @material_property
+    @copy_documentation(Material.molar_heat_capacity_v)
+    def molar_heat_capacity_v(self):
+        return (
+            self.molar_heat_capacity_p
+            - self.molar_volume
+            * self.temperature
+            * self.thermal_expansivity
+            * self.thermal_expansivity
+            * self.isothermal_bulk_modulus_reuss
+        )
+
+    @material_property
+    @copy_documentation(Material.grueneisen_parameter)
+    def grueneisen_parameter(self):
+        return (
+            self.thermal_expansivity
+            * self.molar_volume
+            * self.isentropic_bulk_modulus_reuss
+            / self.molar_heat_capacity_p
+        )
+
+    @material_property
+    @copy_documentation(Material.isentropic_thermal_gradient)
+    def isentropic_thermal_gradient(self):
+        return (
+            self.molar_volume
+            * self.temperature
+            * self.thermal_expansivity
+            / self.molar_heat_capacity_p
+        )
+
+    @material_property
+    @copy_documentation(Material.p_wave_velocity)
+    def p_wave_velocity(self):
+        return np.sqrt(
+            (self.isentropic_bulk_modulus_reuss + 4.0 / 3.0 * self.shear_modulus)
+            / self.density
+        )
+
+    @material_property
+    @copy_documentation(Material.bulk_sound_velocity)
+    def bulk_sound_velocity(self):
+        return np.sqrt(self.isentropic_bulk_modulus_reuss / self.density)
+
+    @material_property
+    @copy_documentation(Material.shear_wave_velocity)
+    def shear_wave_velocity(self):
+        return np.sqrt(self.shear_modulus / self.density)
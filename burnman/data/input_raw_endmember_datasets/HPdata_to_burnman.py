@@ -277,6 +277,31 @@ with open("HP_2011_ds62.py", "w") as outfile:
     )
 
 # Process uncertainties
+import numpy as np
+
+n_mbrs = int(ds[0][0])
+
+names = []
+for i in range(n_mbrs):
+    names.append(ds[i * 4 + 3][0])
+
+cov = []
+for i in range(n_mbrs * 4 + 4, len(ds) - 2):
+    cov.extend(map(float, ds[i]))
+
+i_utr = np.triu_indices(n_mbrs)
+i_ltr = np.tril_indices(n_mbrs)
+M = np.zeros((n_mbrs, n_mbrs))
+
+M[i_utr] = cov[1:]
+M[i_ltr] = M.T[i_ltr]
+
+M = M * 1.0e6  # (kJ/mol)^2 -> (J/mol)^2
+
+# The covariance matrix is saved in binary format,
+# to be placed in burnman/data/input_covariances
+np.save("HP_2011_ds62_cov.npy", M)
+
 with open("HP_2011_ds62_cov.py", "w") as outfile:
     outfile.write(
         "# This file is part of BurnMan - a thermoelastic and "
@@ -289,40 +314,21 @@ with open("HP_2011_ds62_cov.py", "w") as outfile:
         "Derived from Holland and Powell 2011 and references "
         "therein\n"
         "Update to dataset version 6.2\n"
-        "The values in this document are all in S.I. units,\n"
-        "unlike those in the original tc-ds62.txt\n"
+        "The values are all in S.I. units, unlike those in the original\n"
+        "tc-ds62.txt. The covariance matrix is stored in numpy binary format in\n"
+        "burnman/data/input_covariances/HP_2011_ds62_cov.npy, and is memory-mapped\n"
+        "read-only when this module is first imported.\n"
         "File autogenerated using HPdata_to_burnman.py\n"
         '"""\n\n'
-        "from numpy import array\n\n"
-        "cov = "
+        "from ..utils.misc import read_array\n\n"
+        "endmember_names = [\n"
+    )
+    for name in names:
+        outfile.write(f'    "{name}",\n')
+    outfile.write(
+        "]\n\n"
+        "cov = {\n"
+        '    "covariance_matrix": read_array("input_covariances/HP_2011_ds62_cov.npy"),\n'
+        '    "endmember_names": endmember_names,\n'
+        "}\n"
     )
-
-    import numpy as np
-
-    n_mbrs = int(ds[0][0])
-
-    names = []
-    for i in range(n_mbrs):
-        names.append(ds[i * 4 + 3][0])
-
-    cov = []
-    for i in range(n_mbrs * 4 + 4, len(ds) - 2):
-        cov.extend(map(float, ds[i]))
-
-    i_utr = np.triu_indices(n_mbrs)
-    i_ltr = np.tril_indices(n_mbrs)
-    M = np.zeros((n_mbrs, n_mbrs))
-
-    M[i_utr] = cov[1:]
-    M[i_ltr] = M.T[i_ltr]
-
-    M = M * 1.0e6  # (kJ/mol)^2 -> (J/mol)^2
-
-    d = {"endmember_names": names, "covariance_matrix": M}
-
-    np.set_printoptions(threshold=sys.maxsize)
-
-    pp = pprint.PrettyPrinter(indent=0, width=160, depth=3, stream=outfile)
-    pp.pprint(d)
-
-    outfile.write("\n")
@@ -463,6 +463,9 @@ print(
 
 st_class = (
     "class SLB3Stishovite(SLB3):\n"
+    "    # The shear modulus softening below is only defined for scalars\n"
+    "    vectorized = False\n"
+    "\n"
     "    def shear_modulus(self, pressure, temperature, volume, params):\n"
     '        """\n'
     "        Returns the shear modulus. :math:`[Pa]`\n"
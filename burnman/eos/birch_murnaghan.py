@@ -3,13 +3,103 @@
 # Copyright (C) 2012 - 2025 by the BurnMan team, released under the GNU
 # GPL v2 or later.
 
+from collections import namedtuple
 import numpy as np
 import scipy.optimize as opt
 from . import equation_of_state as eos
-from ..utils.math import bracket
+from . import kernels
+from ..utils.math import bracket, bracket_vectorized, safeguarded_newton
 import warnings
 
 
+# Parameters and derived constants used by the third order
+# Birch-Murnaghan functions (see _bm3_parameters)
+BM3Parameters = namedtuple(
+    "BM3Parameters",
+    [
+        "V_0",
+        "P_0",
+        "K_0",
+        "Kprime_0",
+        "G_0",
+        "Gprime_0",
+        "F_0",
+        "xi1",
+        "K_1",
+        "K_2",
+        "G2_1",
+        "G3_1",
+        "G3_2",
+        "kernel",
+    ],
+)
+
+
+def _bm3_parameters(params, kernel=None):
+    """
+    Returns the parameters of the third order Birch-Murnaghan equation of
+    state along with the constants derived from them, as a BM3Parameters
+    object. P_0 and F_0 default to zero, and G_0 and Gprime_0 to nan,
+    as in :func:`BirchMurnaghanBase.validate_parameters`.
+
+    :param params: Parameter dictionary
+    :type params: dict
+    :param kernel: The packed parameters for the compiled kernel, if any.
+    :type kernel: numpy.array or None
+    :return: The parameters and derived constants.
+    :rtype: BM3Parameters
+    """
+    V_0, K_0, Kprime_0 = params["V_0"], params["K_0"], params["Kprime_0"]
+    G_0 = params.get("G_0", np.nan)
+    Gprime_0 = params.get("Gprime_0", np.nan)
+    return BM3Parameters(
+        V_0=V_0,
+        P_0=params.get("P_0", 0.0),
+        K_0=K_0,
+        Kprime_0=Kprime_0,
+        G_0=G_0,
+        Gprime_0=Gprime_0,
+        F_0=params.get("F_0", 0.0),
+        xi1=0.75 * (4.0 - Kprime_0),
+        K_1=3.0 * K_0 * Kprime_0 - 5 * K_0,
+        K_2=27.0 / 2.0 * (K_0 * Kprime_0 - 4.0 * K_0),
+        G2_1=5.0 - 3.0 * Gprime_0 * K_0 / G_0 if G_0 != 0.0 else np.nan,
+        G3_1=3.0 * K_0 * Gprime_0 - 5.0 * G_0,
+        G3_2=(
+            6.0 * K_0 * Gprime_0 - 24.0 * K_0 - 14.0 * G_0 + 9.0 / 2.0 * K_0 * Kprime_0
+        ),
+        kernel=kernel,
+    )
+
+
+def _bulk_modulus_third_order(volume, p):
+    x = p.V_0 / volume
+    f = 0.5 * (pow(x, 2.0 / 3.0) - 1.0)
+    return pow(1.0 + 2.0 * f, 5.0 / 2.0) * (p.K_0 + p.K_1 * f + p.K_2 * f * f)
+
+
+def _pressure_third_order(invVrel, p):
+    return (
+        3.0
+        * p.K_0
+        / 2.0
+        * (pow(invVrel, 7.0 / 3.0) - pow(invVrel, 5.0 / 3.0))
+        * (1.0 - p.xi1 * (pow(invVrel, 2.0 / 3.0) - 1.0))
+        + p.P_0
+    )
+
+
+def _shear_modulus_second_order(volume, p):
+    x = p.V_0 / volume
+    return p.G_0 * pow(x, 5.0 / 3.0) * (1.0 - 0.5 * (pow(x, 2.0 / 3.0) - 1.0) * p.G2_1)
+
+
+def _shear_modulus_third_order(volume, p):
+    x = p.V_0 / volume
+    f = 0.5 * (pow(x, 2.0 / 3.0) - 1.0)
+    return pow((1.0 + 2.0 * f), 5.0 / 2.0) * (p.G_0 + p.G3_1 * f + p.G3_2 * f * f)
+
+
 def bulk_modulus_third_order(volume, params):
     """
     Bulk modulus for the third order Birch-Murnaghan equation of state.
@@ -22,20 +112,7 @@ def bulk_modulus_third_order(volume, params):
     :return: Bulk modulus in the same units as the reference bulk modulus.
     :rtype: float
     """
-
-    x = params["V_0"] / volume
-    f = 0.5 * (pow(x, 2.0 / 3.0) - 1.0)
-
-    K = pow(1.0 + 2.0 * f, 5.0 / 2.0) * (
-        params["K_0"]
-        + (3.0 * params["K_0"] * params["Kprime_0"] - 5 * params["K_0"]) * f
-        + 27.0
-        / 2.0
-        * (params["K_0"] * params["Kprime_0"] - 4.0 * params["K_0"])
-        * f
-        * f
-    )
-    return K
+    return _bulk_modulus_third_order(volume, _bm3_parameters(params))
 
 
 def pressure_third_order(invVrel, params):
@@ -50,15 +127,7 @@ def pressure_third_order(invVrel, params):
     for the reference bulk modulus (params['K_0']).
     :rtype: float
     """
-
-    return (
-        3.0
-        * params["K_0"]
-        / 2.0
-        * (pow(invVrel, 7.0 / 3.0) - pow(invVrel, 5.0 / 3.0))
-        * (1.0 - 0.75 * (4.0 - params["Kprime_0"]) * (pow(invVrel, 2.0 / 3.0) - 1.0))
-        + params["P_0"]
-    )
+    return _pressure_third_order(invVrel, _bm3_parameters(params))
 
 
 def volume_third_order(pressure, params):
@@ -74,6 +143,24 @@ def volume_third_order(pressure, params):
     :return: Molar volume in the same units as the reference volume.
     :rtype: float
     """
+    if np.ndim(pressure):
+        P = np.array(pressure, dtype=float).flatten()
+
+        def delta_pressures(volumes, indices):
+            return (
+                pressure_third_order(params["V_0"] / volumes, params) - P[indices],
+                -bulk_modulus_third_order(volumes, params) / volumes,
+            )
+
+        V_0 = np.full(P.shape, params["V_0"])
+        V, converged = safeguarded_newton(
+            delta_pressures, *bracket_vectorized(delta_pressures, V_0, 1.0e-2 * V_0)[:4]
+        )
+        # Use the scalar solver where the vectorized solver failed,
+        # so that the usual exception is raised for invalid pressures
+        for i in np.nonzero(~converged)[0]:
+            V[i] = volume_third_order(P[i], params)
+        return V.reshape(np.shape(pressure))
 
     def delta_pressure(volume):
         return pressure_third_order(params["V_0"] / volume, params) - pressure
@@ -170,6 +257,10 @@ def volume_fourth_order(pressure, params):
     :return: Molar volume in the same units as the reference volume.
     :rtype: float
     """
+    if np.ndim(pressure):
+        return np.array(
+            [volume_fourth_order(P, params) for P in np.ravel(pressure)]
+        ).reshape(np.shape(pressure))
 
     def delta_pressure(x):
         return pressure_fourth_order(params["V_0"] / x, params) - pressure
@@ -196,19 +287,7 @@ def shear_modulus_second_order(volume, params):
     :return: Shear modulus in the same units as the reference shear modulus.
     :rtype: float
     """
-
-    x = params["V_0"] / volume
-    G = (
-        params["G_0"]
-        * pow(x, 5.0 / 3.0)
-        * (
-            1.0
-            - 0.5
-            * (pow(x, 2.0 / 3.0) - 1.0)
-            * (5.0 - 3.0 * params["Gprime_0"] * params["K_0"] / params["G_0"])
-        )
-    )
-    return G
+    return _shear_modulus_second_order(volume, _bm3_parameters(params))
 
 
 def shear_modulus_third_order(volume, params):
@@ -222,22 +301,7 @@ def shear_modulus_third_order(volume, params):
     :return: Shear modulus in the same units as the reference shear modulus.
     :rtype: float
     """
-
-    x = params["V_0"] / volume
-    f = 0.5 * (pow(x, 2.0 / 3.0) - 1.0)
-    G = pow((1.0 + 2.0 * f), 5.0 / 2.0) * (
-        params["G_0"]
-        + (3.0 * params["K_0"] * params["Gprime_0"] - 5.0 * params["G_0"]) * f
-        + (
-            6.0 * params["K_0"] * params["Gprime_0"]
-            - 24.0 * params["K_0"]
-            - 14.0 * params["G_0"]
-            + 9.0 / 2.0 * params["K_0"] * params["Kprime_0"]
-        )
-        * f
-        * f
-    )
-    return G
+    return _shear_modulus_third_order(volume, _bm3_parameters(params))
 
 
 class BirchMurnaghanBase(eos.IsothermalEquationOfState):
@@ -250,14 +314,81 @@ class BirchMurnaghanBase(eos.IsothermalEquationOfState):
     and :class:`burnman.birch_murnaghan.BM3`.
     """
 
+    vectorized = True
+    _kernel = staticmethod(kernels.bm3_properties)
+
+    def _precompute_parameters(self, params):
+        """
+        Returns the parameters used by the third order Birch-Murnaghan
+        functions, along with the constants derived from them,
+        as a BM3Parameters object.
+        """
+        return _bm3_parameters(params, self._pack_kernel_parameters(params))
+
+    def _kernel_parameters(self, params):
+        """
+        Returns the parameters for :func:`burnman.eos.kernels.bm3_properties`.
+        """
+        return self._parameters(params).kernel
+
+    def _pack_kernel_parameters(self, params):
+        """
+        Packs the parameters for :func:`burnman.eos.kernels.bm3_properties`.
+        The kernel is third order in strain, so it is not used by BM4.
+        Returns None if the kernel cannot be used.
+        """
+        if not kernels.compiled or type(self) not in (BM3, BM3Shear2):
+            return None
+        try:
+            prms = np.array(
+                [
+                    params["V_0"],
+                    params["P_0"],
+                    params["K_0"],
+                    params["Kprime_0"],
+                    params["G_0"],
+                    params["Gprime_0"],
+                    params["F_0"],
+                    self.order,
+                ],
+                dtype=float,
+            )
+        except KeyError:
+            return None
+        # The array is shared by every call, so it must not be modified
+        prms.flags.writeable = False
+        return prms
+
     def volume(self, pressure, temperature, params):
         """
         Returns volume :math:`[m^3]` as a function of pressure :math:`[Pa]`.
         """
-        return volume_third_order(pressure, params)
+        if np.ndim(pressure):
+            return volume_third_order(pressure, params)
+        return self._continued_volume(
+            pressure, temperature, params, self._bracketed_volume
+        )
+
+    def _bracketed_volume(self, pressure, temperature, params):
+        """
+        Returns the volume :math:`[m^3]` at a single pressure :math:`[Pa]`,
+        found by bracketing from V_0 followed by brentq.
+        """
+        delta_pressure = self._counted(
+            lambda x: self.pressure(temperature, x, params) - pressure
+        )
+        try:
+            sol = bracket(delta_pressure, params["V_0"], 1.0e-2 * params["V_0"])
+        except ValueError:
+            raise ValueError(
+                "Cannot find a volume, perhaps you are outside of the "
+                "range of validity for the equation of state?"
+            )
+        return opt.brentq(delta_pressure, sol[0], sol[1])
 
     def pressure(self, temperature, volume, params):
-        return pressure_third_order(params["V_0"] / volume, params)
+        p = self._parameters(params)
+        return _pressure_third_order(p.V_0 / volume, p)
 
     def isothermal_bulk_modulus_reuss(self, pressure, temperature, volume, params):
         """
@@ -265,41 +396,40 @@ class BirchMurnaghanBase(eos.IsothermalEquationOfState):
         as a function of pressure :math:`[Pa]`,
         temperature :math:`[K]` and volume :math:`[m^3]`.
         """
-        return bulk_modulus_third_order(volume, params)
+        return _bulk_modulus_third_order(volume, self._parameters(params))
 
     def shear_modulus(self, pressure, temperature, volume, params):
         """
         Returns shear modulus :math:`G` of the mineral. :math:`[Pa]`
         """
         if self.order == 2:
-            return shear_modulus_second_order(volume, params)
+            return _shear_modulus_second_order(volume, self._parameters(params))
         elif self.order == 3:
-            return shear_modulus_third_order(volume, params)
+            return _shear_modulus_third_order(volume, self._parameters(params))
 
     def _molar_helmholtz_energy(self, pressure, temperature, volume, params):
         """
         Returns the Helmholtz energy :math:`\\mathcal{F}`
         of the mineral. :math:`[J/mol]`
         """
-        x = np.power(volume / params["V_0"], -1.0 / 3.0)
+        p = self._parameters(params)
+        x = np.power(volume / p.V_0, -1.0 / 3.0)
         x2 = x * x
         x4 = x2 * x2
         x6 = x4 * x2
 
-        xi1 = 3.0 * (4.0 - params["Kprime_0"]) / 4.0
-
         intPdV = (
             -9.0
             / 2.0
-            * params["V_0"]
-            * params["K_0"]
+            * p.V_0
+            * p.K_0
             * (
-                (xi1 + 1.0) * (x4 / 4.0 - x2 / 2.0 + 1.0 / 4.0)
-                - xi1 * (x6 / 6.0 - x4 / 4.0 + 1.0 / 12.0)
+                (p.xi1 + 1.0) * (x4 / 4.0 - x2 / 2.0 + 1.0 / 4.0)
+                - p.xi1 * (x6 / 6.0 - x4 / 4.0 + 1.0 / 12.0)
             )
         )
 
-        return -intPdV + params["F_0"]
+        return -intPdV + p.F_0
 
     def gibbs_energy(self, pressure, temperature, volume, params):
         """
@@ -358,6 +488,9 @@ class BirchMurnaghanBase(eos.IsothermalEquationOfState):
         if params["Gprime_0"] < -5.0 or params["Gprime_0"] > 10.0:
             warnings.warn("Unusual value for Gprime_0", stacklevel=2)
 
+        # Store the parameters used by the compiled kernel
+        self._parameters(params)
+
 
 class BM3(BirchMurnaghanBase):
     """
@@ -389,7 +522,11 @@ class BM4(BirchMurnaghanBase):
         """
         Returns volume :math:`[m^3]` as a function of pressure :math:`[Pa]`.
         """
-        return volume_fourth_order(pressure, params)
+        if np.ndim(pressure):
+            return volume_fourth_order(pressure, params)
+        return self._continued_volume(
+            pressure, temperature, params, self._bracketed_volume
+        )
 
     def pressure(self, temperature, volume, params):
         return pressure_fourth_order(params["V_0"] / volume, params)
@@ -71,6 +71,14 @@ class BroshCalphad(eos.EquationOfState):
         # V = dG_c/dP + dG_qh/dP - C_T*(dI_P/dP)
         return V_c + V_qh + V_th
 
+    def volume_after_parameter_change(self, pressure, temperature, volume, params):
+        """
+        Returns the volume [m^3] at the given pressure [Pa] and temperature [K].
+        The volume is calculated directly, so the volume before the
+        parameters were changed is not used.
+        """
+        return self.volume(pressure, temperature, params)
+
     def dvolume_dP(self, pressure, temperature, params):
         K_0 = params["K_0"]
         n = params["n"]
@@ -64,6 +64,14 @@ class CORK(eos.EquationOfState):
         )
         return V
 
+    def volume_after_parameter_change(self, pressure, temperature, volume, params):
+        """
+        Returns the volume [m^3] at the given pressure [Pa] and temperature [K].
+        The volume is calculated directly, so the volume before the
+        parameters were changed is not used.
+        """
+        return self.volume(pressure, temperature, params)
+
     def isothermal_bulk_modulus_reuss(self, pressure, temperature, volume, params):
         """
         Returns isothermal bulk modulus [Pa] as a function of pressure [Pa],
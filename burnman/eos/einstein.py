@@ -4,6 +4,7 @@
 
 
 import numpy as np
+from types import SimpleNamespace
 from .. import constants
 
 # Try to import the jit from numba.  If it is
@@ -14,7 +15,7 @@ try:
 
     if "NUMBA_DISABLE_JIT" in os.environ and int(os.environ["NUMBA_DISABLE_JIT"]) == 1:
         raise ImportError("NOOOO!")
-    from numba import jit
+    from numba import jit, vectorize
 except ImportError:
 
     def jit(nopython=True):
@@ -23,6 +24,12 @@ except ImportError:
 
         return decorator
 
+    def vectorize(nopython=True):
+        def decorator(fn):
+            return np.vectorize(fn, otypes=[float])
+
+        return decorator
+
 
 """
 Functions for the Einstein model of a solid.
@@ -150,3 +157,26 @@ def d2helmholtz_dTheta2(T, einstein_T, n):
     x = einstein_T / T
     f = np.exp(x) - 1.0
     return -3.0 * n * constants.gas_constant * np.exp(x) / (f * f * T)
+
+
+def _vectorized(fn):
+    """
+    Returns a version of the scalar function fn that broadcasts
+    elementwise over numpy arrays. If numba is available, this is a
+    compiled ufunc; otherwise it falls back to numpy.vectorize.
+    """
+    return vectorize(nopython=True)(getattr(fn, "py_func", fn))
+
+
+"""
+Array-valued versions of the scalar Einstein functions above.
+These are used by the equations of state when they are passed arrays
+of pressures, temperatures or volumes (see Mineral.evaluate).
+"""
+vectorized = SimpleNamespace(
+    thermal_energy=_vectorized(thermal_energy),
+    molar_heat_capacity_v=_vectorized(molar_heat_capacity_v),
+    helmholtz_energy=_vectorized(helmholtz_energy),
+    entropy=_vectorized(entropy),
+    dmolar_heat_capacity_v_dT=_vectorized(dmolar_heat_capacity_v_dT),
+)
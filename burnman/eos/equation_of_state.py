@@ -4,6 +4,77 @@
 # GPL v2 or later.
 
 
+from copy import deepcopy
+from operator import itemgetter
+
+import numpy as np
+
+from ..utils.math import bracket_vectorized, safeguarded_newton
+
+
+class _RecordingDict(dict):
+    """
+    Copy of a params dictionary which records the keys that are read
+    from it, so that the values used to precompute the parameters
+    of an equation of state can be checked for changes.
+    """
+
+    def __init__(self, params):
+        dict.__init__(self, params)
+        self.keys_read = set()
+
+    def __getitem__(self, key):
+        self.keys_read.add(key)
+        return dict.__getitem__(self, key)
+
+    def __contains__(self, key):
+        self.keys_read.add(key)
+        return dict.__contains__(self, key)
+
+    def get(self, key, default=None):
+        self.keys_read.add(key)
+        return dict.get(self, key, default)
+
+    def __iter__(self):
+        self.keys_read.update(dict.keys(self))
+        return dict.__iter__(self)
+
+    def keys(self):
+        self.keys_read.update(dict.keys(self))
+        return dict.keys(self)
+
+    def values(self):
+        self.keys_read.update(dict.keys(self))
+        return dict.values(self)
+
+    def items(self):
+        self.keys_read.update(dict.keys(self))
+        return dict.items(self)
+
+
+def _no_parameters(params):
+    """
+    Returns the values of the parameters used by an equation of state
+    which does not read any parameters.
+    """
+    return ()
+
+
+def _unchanged(value, copy):
+    """
+    Returns True if a mutable parameter value (such as a list or
+    numpy array) is equal to a copy taken when the parameters of an
+    equation of state were precomputed.
+    """
+    if isinstance(value, np.ndarray) or isinstance(copy, np.ndarray):
+        return np.array_equal(value, copy)
+    try:
+        return type(value) is type(copy) and value == copy
+    except ValueError:
+        # Containers of numpy arrays cannot be compared directly
+        return False
+
+
 class EquationOfState(object):
     """
     This class defines the interface for an equation of state
@@ -22,8 +93,52 @@ class EquationOfState(object):
     The functions for volume and density are just functions
     of temperature, pressure, and "params"; after all, it
     does not make sense for them to be functions of volume or density.
+
+    Equations of state whose functions also accept and return
+    numpy arrays of pressures, temperatures and volumes should set
+    the class attribute vectorized to True. Minerals using
+    those equations of state evaluate whole grids of states in a single
+    call (see :func:`burnman.Mineral.evaluate`).
+
+    Equations of state that solve for the volume numerically can
+    optionally seed each solve with the volume and bulk modulus from the
+    previous solve. This is useful when the states are visited along
+    a smooth P-T path (for example, when calculating an adiabat, building
+    a Layer or evaluating a mineral at many states), as a few Newton steps
+    usually replace the full bracketing and root-finding procedure.
+    This continuation mode is switched on by setting
+    the attribute warm_start to True, either on an instance or on the class
+    EquationOfState (to switch it on for all materials). If a solve
+    from the previous state fails, the volume is found from scratch.
+    The number of pressure evaluations taken by each scalar volume solve
+    can be monitored by setting volume_solver_hook to a function
+    with the signature hook(equation_of_state, n_evaluations, warm_started).
+
+    Equations of state can avoid reading the params dictionary and
+    recomputing constants derived from the parameters on every call
+    by implementing _precompute_parameters, which returns an immutable
+    object (e.g. a namedtuple) containing those values.
+    The functions of the equation of state then obtain this object
+    by calling _parameters(params). The object is stored by the
+    equation of state, and is recomputed whenever a different params
+    dictionary is passed, or when any of the parameters used to build it
+    has changed, including in-place changes to lists or arrays.
+
+    Equations of state may also provide a compiled kernel which returns
+    all the main properties of a mineral at a given pressure and
+    temperature in a single call (see :mod:`burnman.eos.kernels`).
+    Such equations of state should set the class attribute _kernel
+    and implement _kernel_parameters, which packs the params
+    dictionary into an array of floats. The pure-Python functions
+    remain the reference implementation, and are used whenever the
+    kernel is unavailable or fails.
     """
 
+    vectorized = False
+    warm_start = False
+    volume_solver_hook = None
+    _kernel = None
+
     def volume(self, pressure, temperature, params):
         """
         :param pressure: Pressure at which to evaluate the equation of state
@@ -62,6 +177,41 @@ class EquationOfState(object):
         """
         raise NotImplementedError("")
 
+    def volume_after_parameter_change(self, pressure, temperature, volume, params):
+        """
+        Returns the volume at the given pressure and temperature after
+        a small change to the parameters, given the volume before the change.
+        By default, a single Newton step is taken from the old volume,
+        so that the error is second order in the change of the parameters.
+        This allows the derivatives of properties with respect to the
+        parameters at fixed pressure and temperature to be calculated
+        without solving for the volume (see
+        :func:`burnman.optimize.eos_fitting.MineralFit.function_parameter_derivatives`).
+        Equations of state which calculate the volume directly
+        may instead return the volume.
+
+        :param pressure: Pressure at which to evaluate the equation of state
+            :math:`[Pa]`.
+        :type pressure: float or numpy array
+
+        :param temperature: Temperature at which to evaluate the equation of state
+            :math:`[K]`.
+        :type temperature: float or numpy array
+
+        :param volume: Molar volume of the mineral before the parameters
+            were changed :math:`[m^3]`.
+        :type volume: float or numpy array
+
+        :param params: Dictionary containing the changed material parameters.
+        :type params: dict
+
+        :returns: Molar volume of the mineral :math:`[m^3]`.
+        :rtype: float or numpy array
+        """
+        delta_P = self.pressure(temperature, volume, params) - pressure
+        K_T = self.isothermal_bulk_modulus_reuss(pressure, temperature, volume, params)
+        return volume + delta_P * volume / K_T
+
     def density(self, volume, params):
         """
         Calculate the density of the mineral :math:`[kg/m^3]`.
@@ -357,6 +507,231 @@ class EquationOfState(object):
         """
         raise NotImplementedError("")
 
+    def _solve_volumes(self, pressure, temperature, params):
+        """
+        Solves for the volumes at arrays of pressures and temperatures
+        in a single pass, using :func:`burnman.utils.math.bracket_vectorized`
+        and :func:`burnman.utils.math.safeguarded_newton`.
+        The derivative of the pressure with respect to volume is
+        given by the isothermal bulk modulus (dP/dV = -K_T/V).
+        This function can be used by any equation of state that
+        implements pressure and isothermal_bulk_modulus_reuss
+        for arrays. Pressure functions may return NaN for volumes
+        outside their range of validity.
+
+        :param pressure: Pressures :math:`[Pa]`.
+        :type pressure: numpy.array
+        :param temperature: Temperatures :math:`[K]`.
+        :type temperature: numpy.array
+        :param params: Dictionary containing material parameters required by
+            the equation of state.
+        :type params: dict
+
+        :returns: The molar volumes :math:`[m^3]` and a boolean array
+            which is False wherever the solver failed to converge
+            (the volume is NaN at those points).
+        :rtype: tuple of numpy.arrays
+        """
+        pressure, temperature = np.broadcast_arrays(
+            np.array(pressure, dtype=float), np.array(temperature, dtype=float)
+        )
+        P = pressure.flatten()
+        T = temperature.flatten()
+
+        def delta_pressure(V, indices):
+            dP = np.asarray(self.pressure(T[indices], V, params)) - P[indices]
+            dPdV = np.full_like(V, np.nan)
+            valid = np.isfinite(dP)
+            dPdV[valid] = (
+                -self.isothermal_bulk_modulus_reuss(
+                    P[indices][valid], T[indices][valid], V[valid], params
+                )
+                / V[valid]
+            )
+            return dP, dPdV
+
+        V_0 = np.full(P.shape, params["V_0"])
+        xa, xb, fa, fb, bracketed = bracket_vectorized(
+            delta_pressure, V_0, 1.0e-2 * V_0
+        )
+        x0 = np.where(np.abs(fa) < np.abs(fb), xa, xb)
+        V, converged = safeguarded_newton(delta_pressure, xa, xb, fa, fb, x0=x0)
+        return V.reshape(pressure.shape), converged.reshape(pressure.shape)
+
+    def _volume_vectorized(self, pressure, temperature, params):
+        """
+        Returns the molar volumes :math:`[m^3]` at arrays of
+        pressures and temperatures. Volumes are found using
+        :func:`_solve_volumes`, and any states at which that
+        solver does not converge are passed individually
+        to the (scalar) volume function of the equation of state.
+        """
+        V, converged = self._solve_volumes(pressure, temperature, params)
+        if not np.all(converged):
+            pressure, temperature = np.broadcast_arrays(pressure, temperature)
+            for i in zip(*np.nonzero(~converged)):
+                V[i] = self.volume(pressure[i], temperature[i], params)
+        return V
+
+    def _counted(self, fn):
+        """
+        Returns the function fn, wrapped so that its calls are
+        counted if a volume_solver_hook has been set.
+        """
+        if self.volume_solver_hook is None:
+            return fn
+
+        def counted_fn(*args):
+            self._n_volume_evaluations += 1
+            return fn(*args)
+
+        return counted_fn
+
+    def _continued_volume(self, pressure, temperature, params, solve):
+        """
+        Returns the molar volume :math:`[m^3]` at a single pressure
+        and temperature. If warm_start is True, the volume is found
+        using Newton's method, starting from the previously
+        converged volume and bulk modulus. Otherwise, or if that fails,
+        the volume is found by calling solve(pressure, temperature, params).
+        """
+        if not self.warm_start and self.volume_solver_hook is None:
+            return solve(pressure, temperature, params)
+
+        self._n_volume_evaluations = 0
+        solution = None
+        if self.warm_start:
+            solution = self._newton_volume(pressure, temperature, params)
+        warm_started = solution is not None
+
+        if warm_started:
+            V, K_T = solution
+        else:
+            V = solve(pressure, temperature, params)
+            if self.warm_start:
+                K_T = self.isothermal_bulk_modulus_reuss(
+                    pressure, temperature, V, params
+                )
+
+        if self.warm_start:
+            self._previous_volume_solution = (params, V, K_T)
+        if self.volume_solver_hook is not None:
+            self.volume_solver_hook(self, self._n_volume_evaluations, warm_started)
+        return V
+
+    def _newton_volume(self, pressure, temperature, params, rtol=1.0e-12, maxiter=8):
+        """
+        Finds the volume using Newton's method, starting from the volume
+        and isothermal bulk modulus of the previous solve with the same
+        parameters. Returns the volume and bulk modulus, or None if there
+        is no previous solve or the iterations fail to converge.
+        """
+        previous = getattr(self, "_previous_volume_solution", None)
+        if previous is None or previous[0] is not params:
+            return None
+
+        _, V, K_T = previous
+        delta_pressure = self._counted(
+            lambda x: self.pressure(temperature, x, params) - pressure
+        )
+        try:
+            for i in range(maxiter):
+                dV = delta_pressure(V) * V / K_T
+                V = V + dV
+                if not (np.isfinite(V) and V > 0.0):
+                    return None
+                if np.abs(dV) < rtol * V:
+                    return V, K_T
+                K_T = self.isothermal_bulk_modulus_reuss(
+                    pressure, temperature, V, params
+                )
+                if not K_T > 0.0:
+                    return None
+        except Exception:
+            # The trial volume lies outside the range of validity
+            # of the equation of state
+            return None
+        return None
+
+    def _precompute_parameters(self, params):
+        """
+        Returns an immutable object containing the parameters and
+        derived constants used by the functions of this equation of state,
+        or None if the equation of state does not use one.
+        """
+        return None
+
+    def _parameters(self, params):
+        """
+        Returns the object created by _precompute_parameters(params).
+        The object is stored along with the values of the parameters
+        read by _precompute_parameters, and is only recomputed when
+        params is a different dictionary or when one of those values
+        has been added, removed, replaced or modified in place.
+        """
+        precomputed = self.__dict__.get("_precomputed")
+        if precomputed is not None and precomputed[0] is params:
+            _, getter, values, missing, copies, prms = precomputed
+            try:
+                unchanged = getter(params) == values
+            except (KeyError, ValueError):
+                # A parameter has been removed, or a numpy array
+                # has been replaced by another array
+                unchanged = False
+            if unchanged and missing:
+                unchanged = not any(key in params for key in missing)
+            if unchanged:
+                for key, copy in copies:
+                    if not _unchanged(params[key], copy):
+                        unchanged = False
+                        break
+            if unchanged:
+                return prms
+
+        recorder = _RecordingDict(params)
+        prms = self._precompute_parameters(recorder)
+        present = tuple(key for key in recorder.keys_read if key in params)
+        missing = tuple(key for key in recorder.keys_read if key not in params)
+        getter = itemgetter(*present) if present else _no_parameters
+        copies = tuple(
+            (key, deepcopy(params[key]))
+            for key in present
+            if isinstance(params[key], (list, tuple, dict, np.ndarray))
+        )
+        self._precomputed = (params, getter, getter(params), missing, copies, prms)
+        return prms
+
+    def _kernel_parameters(self, params):
+        """
+        Returns the parameters used by the compiled kernel of this
+        equation of state as a 1D numpy array, or None if there is no
+        compiled kernel for this equation of state.
+        """
+        return None
+
+    def _compiled_properties(self, pressure, temperature, params):
+        """
+        Returns an array containing the properties listed in
+        :data:`burnman.eos.kernels.kernel_properties`
+        at a single pressure and temperature, calculated by the compiled
+        kernel of this equation of state. Returns None if there is no
+        kernel, if some of the parameters are missing, if the volume solve
+        is being warm started or monitored, or if the kernel fails to
+        find a volume.
+        """
+        if self.warm_start or self.volume_solver_hook is not None:
+            return None
+        try:
+            prms = self._kernel_parameters(params)
+        except KeyError:
+            return None
+        if prms is None:
+            return None
+        properties = self._kernel(float(pressure), float(temperature), prms)
+        if not np.isfinite(properties[0]):
+            return None
+        return properties
+
     def validate_parameters(self, params):
         """
         The params object is just a dictionary associating mineral physics parameters
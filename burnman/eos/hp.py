@@ -6,6 +6,7 @@
 
 import numpy as np
 import warnings
+from collections import namedtuple
 
 from . import modified_tait as mt
 from . import murnaghan as murn
@@ -14,6 +15,42 @@ from . import equation_of_state as eos
 from . import einstein
 
 
+# Parameters and derived constants used by the HP_TMT functions
+# (see HP_TMT._precompute_parameters)
+HPParameters = namedtuple(
+    "HPParameters",
+    [
+        "V_0",
+        "K_0",
+        "P_0",
+        "T_0",
+        "H_0",
+        "S_0",
+        "a_0",
+        "n",
+        "T_einstein",
+        "Cp",
+        "a",
+        "b",
+        "c",
+        "C_V0",
+        "P_th_0",
+        "intCpdT_0",
+        "intCpoverTdT_0",
+    ],
+)
+
+
+def _einstein_functions(*args):
+    """
+    Returns the (jitted) scalar Einstein functions if all the arguments
+    are scalars, or their array-valued counterparts otherwise.
+    """
+    if any(np.ndim(arg) for arg in args):
+        return einstein.vectorized
+    return einstein
+
+
 class HP_TMT(eos.EquationOfState):
     """
     Base class for the thermal equation of state based on
@@ -27,6 +64,58 @@ class HP_TMT(eos.EquationOfState):
     equation_of_state = 'hp_tmt'
     """
 
+    vectorized = True
+
+    def _precompute_parameters(self, params):
+        """
+        Returns the parameters used by the HP_TMT functions, along with
+        the modified Tait constants, the Einstein heat capacity and
+        the thermal pressure at the reference temperature, and
+        the reference values of the heat capacity integrals,
+        as an HPParameters object.
+        """
+        Cp = tuple(params["Cp"])
+        T_0 = params["T_0"]
+        a, b, c = mt.tait_constants(params)
+        C_V0 = einstein.molar_heat_capacity_v(T_0, params["T_einstein"], params["n"])
+        P_th_0 = (
+            params["a_0"]
+            * params["K_0"]
+            / C_V0
+            * einstein.thermal_energy(T_0, params["T_einstein"], params["n"])
+        )
+        intCpdT_0 = (
+            Cp[0] * T_0
+            + 0.5 * Cp[1] * T_0 * T_0
+            - Cp[2] / T_0
+            + 2.0 * Cp[3] * np.sqrt(T_0)
+        )
+        intCpoverTdT_0 = (
+            Cp[0] * np.log(T_0)
+            + Cp[1] * T_0
+            - 0.5 * Cp[2] / (T_0 * T_0)
+            - 2.0 * Cp[3] / np.sqrt(T_0)
+        )
+        return HPParameters(
+            V_0=params["V_0"],
+            K_0=params["K_0"],
+            P_0=params["P_0"],
+            T_0=T_0,
+            H_0=params.get("H_0", np.nan),
+            S_0=params.get("S_0", np.nan),
+            a_0=params["a_0"],
+            n=params["n"],
+            T_einstein=params["T_einstein"],
+            Cp=Cp,
+            a=a,
+            b=b,
+            c=c,
+            C_V0=C_V0,
+            P_th_0=P_th_0,
+            intCpdT_0=intCpdT_0,
+            intCpoverTdT_0=intCpoverTdT_0,
+        )
+
     def volume(self, pressure, temperature, params):
         """
         Returns volume [m^3] as a function of pressure [Pa] and temperature [K]
@@ -67,19 +156,17 @@ class HP_TMT(eos.EquationOfState):
         and volume [1/K]. This function replaces -Pth in Equation 13+1
         in :cite:`HP2011` with P-Pth for non-ambient temperature
         """
-        a, b, c = mt.tait_constants(params)
+        p = self._parameters(params)
+        a, b, c = p.a, p.b, p.c
         Pth = self.__relative_thermal_pressure(temperature, params)
-        psubpth = pressure - params["P_0"] - Pth
+        psubpth = pressure - p.P_0 - Pth
 
-        C_V0 = einstein.molar_heat_capacity_v(
-            params["T_0"], params["T_einstein"], params["n"]
-        )
-        C_V = einstein.molar_heat_capacity_v(
-            temperature, params["T_einstein"], params["n"]
+        C_V = _einstein_functions(temperature).molar_heat_capacity_v(
+            temperature, p.T_einstein, p.n
         )
         alpha = (
-            params["a_0"]
-            * (C_V / C_V0)
+            p.a_0
+            * (C_V / p.C_V0)
             * 1.0
             / ((1.0 + b * psubpth) * (a + (1.0 - a) * np.power((1 + b * psubpth), c)))
         )
@@ -104,16 +191,38 @@ class HP_TMT(eos.EquationOfState):
         and temperature [K].
         """
         # Calculate temperature and pressure integrals
-        a, b, c = mt.tait_constants(params)
+        p = self._parameters(params)
+        a, b, c = p.a, p.b, p.c
         Pth = self.__relative_thermal_pressure(temperature, params)
 
-        psubpth = pressure - params["P_0"] - Pth
+        psubpth = pressure - p.P_0 - Pth
 
         # Equation 13 in HP2011
-        if pressure != params["P_0"]:
+        if np.ndim(pressure) or np.ndim(temperature):
+            dP = pressure - p.P_0
+            with np.errstate(divide="ignore", invalid="ignore"):
+                intVdP = np.where(
+                    dP != 0.0,
+                    dP
+                    * p.V_0
+                    * (
+                        1.0
+                        - a
+                        + (
+                            a
+                            * (
+                                np.power((1.0 - b * Pth), 1.0 - c)
+                                - np.power((1.0 + b * (psubpth)), 1.0 - c)
+                            )
+                            / (b * (c - 1.0) * dP)
+                        )
+                    ),
+                    0.0,
+                )
+        elif pressure != p.P_0:
             intVdP = (
-                (pressure - params["P_0"])
-                * params["V_0"]
+                (pressure - p.P_0)
+                * p.V_0
                 * (
                     1.0
                     - a
@@ -123,16 +232,16 @@ class HP_TMT(eos.EquationOfState):
                             np.power((1.0 - b * Pth), 1.0 - c)
                             - np.power((1.0 + b * (psubpth)), 1.0 - c)
                         )
-                        / (b * (c - 1.0) * (pressure - params["P_0"]))
+                        / (b * (c - 1.0) * (pressure - p.P_0))
                     )
                 )
             )
         else:
             intVdP = 0.0
         return (
-            params["H_0"]
+            p.H_0
             + self.__intCpdT(temperature, params)
-            - temperature * (params["S_0"] + self.__intCpoverTdT(temperature, params))
+            - temperature * (p.S_0 + self.__intCpoverTdT(temperature, params))
             + intVdP
         )
 
@@ -141,64 +250,62 @@ class HP_TMT(eos.EquationOfState):
         Returns the entropy [J/K/mol] as a function of pressure [Pa]
         and temperature [K].
         """
-        a, b, c = mt.tait_constants(params)
+        p = self._parameters(params)
+        a, b, c = p.a, p.b, p.c
         Pth = self.__relative_thermal_pressure(temperature, params)
 
-        ksi_over_ksi_0 = einstein.molar_heat_capacity_v(
-            temperature, params["T_einstein"], params["n"]
-        ) / einstein.molar_heat_capacity_v(
-            params["T_0"], params["T_einstein"], params["n"]
+        ksi_over_ksi_0 = (
+            _einstein_functions(temperature).molar_heat_capacity_v(
+                temperature, p.T_einstein, p.n
+            )
+            / p.C_V0
         )
 
-        dintVdpdT = (
-            params["V_0"] * params["a_0"] * params["K_0"] * a * ksi_over_ksi_0
-        ) * (
-            np.power((1.0 + b * (pressure - params["P_0"] - Pth)), 0.0 - c)
+        dintVdpdT = (p.V_0 * p.a_0 * p.K_0 * a * ksi_over_ksi_0) * (
+            np.power((1.0 + b * (pressure - p.P_0 - Pth)), 0.0 - c)
             - np.power((1.0 - b * Pth), 0.0 - c)
         )
-        return params["S_0"] + self.__intCpoverTdT(temperature, params) + dintVdpdT
+        return p.S_0 + self.__intCpoverTdT(temperature, params) + dintVdpdT
 
     def molar_heat_capacity_p(self, pressure, temperature, volume, params):
         """
         Returns the heat capacity [J/K/mol] as a function of pressure [Pa]
         and temperature [K].
         """
-        a, b, c = mt.tait_constants(params)
+        p = self._parameters(params)
+        a, b, c = p.a, p.b, p.c
         T = temperature
-        T_e = params["T_einstein"]
-        n = params["n"]
+        T_e = p.T_einstein
+        n = p.n
         Pth = self.__relative_thermal_pressure(T, params)
+        e = _einstein_functions(T)
 
-        ksi_over_ksi_0 = einstein.molar_heat_capacity_v(
-            T, T_e, n
-        ) / einstein.molar_heat_capacity_v(params["T_0"], T_e, n)
+        ksi_over_ksi_0 = e.molar_heat_capacity_v(T, T_e, n) / p.C_V0
 
-        dintVdpdT = (
-            params["V_0"] * params["a_0"] * params["K_0"] * a * ksi_over_ksi_0
-        ) * (
-            np.power((1.0 + b * (pressure - params["P_0"] - Pth)), 0.0 - c)
+        dintVdpdT = (p.V_0 * p.a_0 * p.K_0 * a * ksi_over_ksi_0) * (
+            np.power((1.0 + b * (pressure - p.P_0 - Pth)), 0.0 - c)
             - np.power((1.0 - b * Pth), 0.0 - c)
         )
 
         dSdT0 = (
-            params["V_0"]
-            * params["K_0"]
-            * np.power((ksi_over_ksi_0 * params["a_0"]), 2.0)
+            p.V_0
+            * p.K_0
+            * np.power((ksi_over_ksi_0 * p.a_0), 2.0)
             * (
-                np.power((1.0 + b * (pressure - params["P_0"] - Pth)), -1.0 - c)
+                np.power((1.0 + b * (pressure - p.P_0 - Pth)), -1.0 - c)
                 - np.power((1.0 + b * (-Pth)), -1.0 - c)
             )
         )
 
         x = T_e / T
         dCv_einstdT = -(
-            einstein.molar_heat_capacity_v(T, T_e, n)
+            e.molar_heat_capacity_v(T, T_e, n)
             * (1 - 2.0 / x + 2.0 / (np.exp(x) - 1.0))
             * x
             / T
         )
 
-        dSdT1 = -dintVdpdT * dCv_einstdT / einstein.molar_heat_capacity_v(T, T_e, n)
+        dSdT1 = -dintVdpdT * dCv_einstdT / e.molar_heat_capacity_v(T, T_e, n)
 
         dSdT = dSdT0 + dSdT1
         return self._molar_heat_capacity_p0(temperature, params) + temperature * dSdT
@@ -219,11 +326,9 @@ class HP_TMT(eos.EquationOfState):
         # heat capacity - Holland and Powell (2011) prefer the additional
         # freedom provided by their polynomial expression.
 
-        E_th = einstein.thermal_energy(T, params["T_einstein"], params["n"])
-        C_V0 = einstein.molar_heat_capacity_v(
-            params["T_0"], params["T_einstein"], params["n"]
-        )
-        P_th = params["a_0"] * params["K_0"] / C_V0 * E_th
+        p = self._parameters(params)
+        E_th = _einstein_functions(T).thermal_energy(T, p.T_einstein, p.n)
+        P_th = p.a_0 * p.K_0 / p.C_V0 * E_th
         return P_th
 
     def __relative_thermal_pressure(self, T, params):
@@ -231,43 +336,35 @@ class HP_TMT(eos.EquationOfState):
         Returns relative thermal pressure [Pa] as a function of T-params['T_0'] [K]
         EQ 12 - 1 of :cite:`HP2011`.
         """
-        return self.__thermal_pressure(T, params) - self.__thermal_pressure(
-            params["T_0"], params
-        )
+        return self.__thermal_pressure(T, params) - self._parameters(params).P_th_0
 
     def __intCpdT(self, temperature, params):
         """
         Returns the thermal addition to the standard state enthalpy [J/mol]
         at ambient pressure [Pa]
         """
+        p = self._parameters(params)
+        Cp = p.Cp
         return (
-            params["Cp"][0] * temperature
-            + 0.5 * params["Cp"][1] * np.power(temperature, 2.0)
-            - params["Cp"][2] / temperature
-            + 2.0 * params["Cp"][3] * np.sqrt(temperature)
-        ) - (
-            params["Cp"][0] * params["T_0"]
-            + 0.5 * params["Cp"][1] * params["T_0"] * params["T_0"]
-            - params["Cp"][2] / params["T_0"]
-            + 2.0 * params["Cp"][3] * np.sqrt(params["T_0"])
-        )
+            Cp[0] * temperature
+            + 0.5 * Cp[1] * np.power(temperature, 2.0)
+            - Cp[2] / temperature
+            + 2.0 * Cp[3] * np.sqrt(temperature)
+        ) - p.intCpdT_0
 
     def __intCpoverTdT(self, temperature, params):
         """
         Returns the thermal addition to the standard state entropy [J/K/mol]
         at ambient pressure [Pa]
         """
+        p = self._parameters(params)
+        Cp = p.Cp
         return (
-            params["Cp"][0] * np.log(temperature)
-            + params["Cp"][1] * temperature
-            - 0.5 * params["Cp"][2] / np.power(temperature, 2.0)
-            - 2.0 * params["Cp"][3] / np.sqrt(temperature)
-        ) - (
-            params["Cp"][0] * np.log(params["T_0"])
-            + params["Cp"][1] * params["T_0"]
-            - 0.5 * params["Cp"][2] / (params["T_0"] * params["T_0"])
-            - 2.0 * params["Cp"][3] / np.sqrt(params["T_0"])
-        )
+            Cp[0] * np.log(temperature)
+            + Cp[1] * temperature
+            - 0.5 * Cp[2] / np.power(temperature, 2.0)
+            - 2.0 * Cp[3] / np.sqrt(temperature)
+        ) - p.intCpoverTdT_0
 
     def validate_parameters(self, params):
         """
@@ -332,6 +429,9 @@ class HP_TMT(eos.EquationOfState):
         if params["molar_mass"] < 0.001 or params["molar_mass"] > 10.0:
             warnings.warn("Unusual value for molar_mass", stacklevel=2)
 
+        # Store the parameters and derived constants used by the functions
+        self._parameters(params)
+
 
 class HP_TMTL(eos.EquationOfState):
     """
@@ -362,6 +462,14 @@ class HP_TMTL(eos.EquationOfState):
         self.static_params["K_0"] = self._K_T_1bar(temperature, params)
         return mt.volume(pressure, self.static_params)
 
+    def volume_after_parameter_change(self, pressure, temperature, volume, params):
+        """
+        Returns the volume [m^3] at the given pressure [Pa] and temperature [K].
+        The volume is calculated directly, so the volume before the
+        parameters were changed is not used.
+        """
+        return self.volume(pressure, temperature, params)
+
     def isothermal_bulk_modulus_reuss(self, pressure, temperature, volume, params):
         """
         Returns isothermal bulk modulus [Pa] as a function of pressure [Pa],
@@ -582,6 +690,14 @@ class HP98(eos.EquationOfState):
             params["Kprime_0"],
         )
 
+    def volume_after_parameter_change(self, pressure, temperature, volume, params):
+        """
+        Returns the volume [m^3] at the given pressure [Pa] and temperature [K].
+        The volume is calculated directly, so the volume before the
+        parameters were changed is not used.
+        """
+        return self.volume(pressure, temperature, params)
+
     def isothermal_bulk_modulus_reuss(self, pressure, temperature, volume, params):
         """
         Returns isothermal bulk modulus [Pa] as a function of pressure [Pa],
@@ -0,0 +1,552 @@
+# This file is part of BurnMan - a thermoelastic and thermodynamic toolkit
+# for the Earth and Planetary Sciences
+# Copyright (C) 2012 - 2025 by the BurnMan team, released under the GNU
+# GPL v2 or later.
+
+"""
+Compiled kernels for the SLB, MGD and BM3 equations of state.
+
+Each kernel takes a pressure, a temperature and a 1D array of packed
+parameters, and returns all of the main thermodynamic and elastic
+properties of the material at once, in the order given by
+kernel_properties. The volume is found by bracketing from V_0 followed by
+Newton's method safeguarded by bisection.
+If no volume can be found, the returned volume is NaN.
+
+The equations of state pack their parameters in
+_kernel_parameters, and the kernels are called by
+:func:`burnman.Mineral.set_state` via
+:func:`burnman.eos.EquationOfState._compiled_properties`.
+The kernels are only used if numba is available
+(the compiled functions are cached on disk, so they are only compiled
+once); otherwise, the pure-Python functions of the equations of state
+are used.
+"""
+
+import numpy as np
+
+from .. import constants
+from . import debye
+
+# Try to import the jit from numba.  If it is
+# not available, just go with the standard
+# python interpreter
+try:
+    import os
+
+    if "NUMBA_DISABLE_JIT" in os.environ and int(os.environ["NUMBA_DISABLE_JIT"]) == 1:
+        raise ImportError("NOOOO!")
+    from numba import jit
+
+    compiled = True
+except ImportError:
+
+    def jit(nopython=True, cache=False):
+        def decorator(fn):
+            return fn
+
+        return decorator
+
+    compiled = False
+
+
+kernel_properties = [
+    "V",
+    "gibbs",
+    "S",
+    "K_T",
+    "K_S",
+    "G",
+    "alpha",
+    "C_p",
+    "C_v",
+    "gr",
+]
+
+eps = np.finfo(float).eps
+
+# Equation of state families
+SLB = 0
+MGD = 1
+BM3 = 2
+R = constants.gas_constant
+
+
+@jit(nopython=True, cache=True)
+def _bm3_pressure(x, K_0, Kprime_0):
+    """
+    Third order Birch-Murnaghan pressure (excluding P_0) at x = V_0/V.
+    """
+    return (
+        3.0
+        * K_0
+        / 2.0
+        * (pow(x, 7.0 / 3.0) - pow(x, 5.0 / 3.0))
+        * (1.0 - 0.75 * (4.0 - Kprime_0) * (pow(x, 2.0 / 3.0) - 1.0))
+    )
+
+
+@jit(nopython=True, cache=True)
+def _bm3_bulk_modulus(f, K_0, Kprime_0):
+    """
+    Third order Birch-Murnaghan bulk modulus at Eulerian strain f.
+    """
+    return pow(1.0 + 2.0 * f, 5.0 / 2.0) * (
+        K_0
+        + (3.0 * K_0 * Kprime_0 - 5 * K_0) * f
+        + 27.0 / 2.0 * (K_0 * Kprime_0 - 4.0 * K_0) * f * f
+    )
+
+
+@jit(nopython=True, cache=True)
+def _bm_shear_modulus(x, f, K_0, Kprime_0, G_0, Gprime_0, order):
+    """
+    Second or third order Birch-Murnaghan shear modulus.
+    """
+    if order == 2:
+        return (
+            G_0
+            * pow(x, 5.0 / 3.0)
+            * (
+                1.0
+                - 0.5 * (pow(x, 2.0 / 3.0) - 1.0) * (5.0 - 3.0 * Gprime_0 * K_0 / G_0)
+            )
+        )
+    return pow((1.0 + 2.0 * f), 5.0 / 2.0) * (
+        G_0
+        + (3.0 * K_0 * Gprime_0 - 5.0 * G_0) * f
+        + (6.0 * K_0 * Gprime_0 - 24.0 * K_0 - 14.0 * G_0 + 9.0 / 2.0 * K_0 * Kprime_0)
+        * f
+        * f
+    )
+
+
+@jit(nopython=True, cache=True)
+def _solve_volume(family, pressure, temperature, prms, maxiter=200):
+    """
+    Finds the volume at which the pressure of the given
+    equation of state family is equal to the target pressure.
+    The search starts from V_0 = prms[0], with an initial step of 0.01 V_0
+    which grows by the golden ratio until the root is bracketed.
+    The root is then found using Newton's method (with dP/dV = -K_T/V),
+    safeguarded by bisection. Returns NaN if the root cannot be found,
+    or if the pressure cannot be evaluated (also returned as NaN).
+    """
+    V_0 = prms[0]
+    dV = 1.0e-2 * V_0
+    x0 = V_0
+    f0 = _pressure_and_bulk_modulus(family, x0, temperature, prms)[0] - pressure
+    x1 = x0 + dV
+    f1 = _pressure_and_bulk_modulus(family, x1, temperature, prms)[0] - pressure
+    if (f1 - f0) * f0 > 0.0:
+        dV = -dV
+        x1 = x0 + dV
+        f1 = _pressure_and_bulk_modulus(family, x1, temperature, prms)[0] - pressure
+
+    i = 0
+    while f0 * f1 > 0.0 and i < maxiter:
+        dV *= 1.618
+        x0, f0 = x1, f1
+        x1 = x1 + dV
+        if x1 <= 0.0:
+            return np.nan
+        f1 = _pressure_and_bulk_modulus(family, x1, temperature, prms)[0] - pressure
+        i += 1
+    if not (f0 * f1 <= 0.0):
+        return np.nan
+    if f0 == 0.0:
+        return x0
+    if f1 == 0.0:
+        return x1
+
+    # Orient the bracket so that f(lo) < 0 < f(hi)
+    if f0 < 0.0:
+        lo, hi = x0, x1
+    else:
+        lo, hi = x1, x0
+
+    V = 0.5 * (lo + hi)
+    dx_old = abs(hi - lo)
+    dx = dx_old
+    P, K_T = _pressure_and_bulk_modulus(family, V, temperature, prms)
+    f = P - pressure
+    df = -K_T / V
+    for i in range(maxiter):
+        if not (np.isfinite(f) and np.isfinite(df)):
+            return np.nan
+        if ((V - f / df - lo) * (V - f / df - hi) >= 0.0) or (
+            abs(2.0 * f) > abs(dx_old * df)
+        ):
+            dx_old = dx
+            dx = 0.5 * (hi - lo)
+            V = lo + dx
+        else:
+            dx_old = dx
+            dx = f / df
+            V = V - dx
+        if abs(dx) <= 4.0 * eps * V:
+            return V
+        P, K_T = _pressure_and_bulk_modulus(family, V, temperature, prms)
+        f = P - pressure
+        df = -K_T / V
+        if f < 0.0:
+            lo = V
+        else:
+            hi = V
+    return np.nan
+
+
+@jit(nopython=True, cache=True)
+def _mineral_properties(pressure, temperature, V, F, S, K_T, G, alpha, C_p, gr_eos):
+    """
+    Packs the properties returned by a kernel, calculating
+    the isochoric heat capacity, the isentropic bulk modulus and
+    the Grueneisen parameter in the same way as :class:`burnman.Mineral`.
+    """
+    C_v = C_p - V * temperature * alpha * alpha * K_T
+    if temperature < 1.0e-10:
+        K_S = K_T
+    else:
+        K_S = K_T * C_p / C_v
+    if abs(C_v) > eps:
+        gr = alpha * K_T * V / C_v
+    else:
+        gr = gr_eos
+    out = np.empty(10)
+    out[0] = V
+    out[1] = F + pressure * V
+    out[2] = S
+    out[3] = K_T
+    out[4] = K_S
+    out[5] = G
+    out[6] = alpha
+    out[7] = C_p
+    out[8] = C_v
+    out[9] = gr
+    return out
+
+
+"""
+SLB (Stixrude and Lithgow-Bertelloni, 2005)
+Packed parameters: V_0, T_0, Debye_0, n, grueneisen_0, q_0, eta_s_0,
+K_0, Kprime_0, G_0, Gprime_0, F_0, order
+"""
+
+
+@jit(nopython=True, cache=True)
+def _slb_strain(V, prms):
+    V_0, gr_0, q_0 = prms[0], prms[4], prms[5]
+    x = V_0 / V
+    f = 0.5 * (pow(x, 2.0 / 3.0) - 1.0)
+    a1_ii = 6.0 * gr_0  # EQ 47
+    a2_iikk = -12.0 * gr_0 + 36.0 * pow(gr_0, 2.0) - 18.0 * q_0 * gr_0  # EQ 47
+    nu_o_nu0_sq = 1.0 + a1_ii * f + (1.0 / 2.0) * a2_iikk * f * f  # EQ 41
+    return x, f, a1_ii, a2_iikk, nu_o_nu0_sq
+
+
+@jit(nopython=True, cache=True)
+def _slb_P_and_K_T(V, temperature, prms):
+    """
+    Returns the pressure and isothermal bulk modulus (NaN if the volume
+    is outside the range of validity of the thermal model).
+    """
+    V_0, T_0, Debye_0, n, gr_0, K_0, Kprime_0 = (
+        prms[0],
+        prms[1],
+        prms[2],
+        prms[3],
+        prms[4],
+        prms[7],
+        prms[8],
+    )
+    x, f, a1_ii, a2_iikk, nu_o_nu0_sq = _slb_strain(V, prms)
+    if nu_o_nu0_sq <= 0.0:
+        return np.nan, np.nan
+    debye_T = Debye_0 * np.sqrt(nu_o_nu0_sq)
+    gr = 1.0 / 6.0 / nu_o_nu0_sq * (2.0 * f + 1.0) * (a1_ii + a2_iikk * f)
+    E_th = debye.thermal_energy(temperature, debye_T, n)
+    E_th_ref = debye.thermal_energy(T_0, debye_T, n)
+    C_v = debye.molar_heat_capacity_v(temperature, debye_T, n)
+    C_v_ref = debye.molar_heat_capacity_v(T_0, debye_T, n)
+
+    if abs(gr_0) < 1.0e-10:
+        q = 1.0 / 9.0 * (18.0 * gr - 6.0)
+    else:
+        q = (
+            1.0
+            / 9.0
+            * (
+                18.0 * gr
+                - 6.0
+                - 1.0
+                / 2.0
+                / nu_o_nu0_sq
+                * (2.0 * f + 1.0)
+                * (2.0 * f + 1.0)
+                * a2_iikk
+                / gr
+            )
+        )
+
+    b_iikk = 9.0 * K_0  # EQ 28
+    b_iikkmm = 27.0 * K_0 * (Kprime_0 - 4.0)  # EQ 29
+    P = (1.0 / 3.0) * (pow(1.0 + 2.0 * f, 5.0 / 2.0)) * (
+        (b_iikk * f) + (0.5 * b_iikkmm * f * f)
+    ) + gr * (
+        E_th - E_th_ref
+    ) / V  # EQ 21
+    K = (
+        _bm3_bulk_modulus(f, K_0, Kprime_0)
+        + (gr + 1.0 - q) * (gr / V) * (E_th - E_th_ref)
+        - (pow(gr, 2.0) / V) * (C_v * temperature - C_v_ref * T_0)
+    )
+    return P, K
+
+
+@jit(nopython=True, cache=True)
+def slb_properties(pressure, temperature, prms):
+    """
+    Compiled kernel for the SLB2 and SLB3 equations of state.
+    """
+    V = _solve_volume(SLB, pressure, temperature, prms)
+    out = np.full(10, np.nan)
+    if not np.isfinite(V):
+        return out
+
+    V_0, T_0, Debye_0, n, gr_0, eta_s_0 = (
+        prms[0],
+        prms[1],
+        prms[2],
+        prms[3],
+        prms[4],
+        prms[6],
+    )
+    K_0, Kprime_0, G_0, Gprime_0, F_0, order = (
+        prms[7],
+        prms[8],
+        prms[9],
+        prms[10],
+        prms[11],
+        prms[12],
+    )
+    x, f, a1_ii, a2_iikk, nu_o_nu0_sq = _slb_strain(V, prms)
+    debye_T = Debye_0 * np.sqrt(nu_o_nu0_sq)
+    gr = 1.0 / 6.0 / nu_o_nu0_sq * (2.0 * f + 1.0) * (a1_ii + a2_iikk * f)
+
+    P, K_T = _slb_P_and_K_T(V, temperature, prms)
+    C_v = debye.molar_heat_capacity_v(temperature, debye_T, n)
+    alpha = gr * C_v / V / K_T
+    C_p = C_v + alpha * alpha * K_T * V * temperature
+    S = debye.entropy(temperature, debye_T, n)
+
+    b_iikk = 9.0 * K_0  # EQ 28
+    b_iikkmm = 27.0 * K_0 * (Kprime_0 - 4.0)  # EQ 29
+    F = (
+        F_0
+        + 0.5 * b_iikk * f * f * V_0
+        + (1.0 / 6.0) * V_0 * b_iikkmm * f * f * f
+        + debye.helmholtz_energy(temperature, debye_T, n)
+        - debye.helmholtz_energy(T_0, debye_T, n)
+    )
+
+    a2_s = -2.0 * gr_0 - 2.0 * eta_s_0  # EQ 47
+    eta_s = -gr - (
+        1.0 / 2.0 * pow(nu_o_nu0_sq, -1.0) * pow((2.0 * f) + 1.0, 2.0) * a2_s
+    )  # EQ 46
+    E_th = debye.thermal_energy(temperature, debye_T, n)
+    E_th_ref = debye.thermal_energy(T_0, debye_T, n)
+    G = (
+        _bm_shear_modulus(x, f, K_0, Kprime_0, G_0, Gprime_0, order)
+        - eta_s * (E_th - E_th_ref) / V
+    )
+    return _mineral_properties(pressure, temperature, V, F, S, K_T, G, alpha, C_p, gr)
+
+
+"""
+MGD (Mie-Grueneisen-Debye, following Matas et al., 2007)
+Packed parameters: V_0, T_0, Debye_0, n, grueneisen_0, q_0, P_0,
+K_0, Kprime_0, G_0, Gprime_0, F_0, order
+"""
+
+
+@jit(nopython=True, cache=True)
+def _mgd_thermal_moduli(T, V, prms):
+    """
+    Returns the thermal contributions to the bulk and shear moduli (EQ B5, B10).
+    """
+    if T <= 1.0e-10:
+        return 0.0, 0.0
+    V_0, Debye_0, n, gr_0, q_0 = prms[0], prms[2], prms[3], prms[4], prms[5]
+    gr = gr_0 * pow(V / V_0, q_0)
+    debye_T = Debye_0 * np.exp((gr_0 - gr) / q_0)
+    x = debye_T / T
+    D = debye.debye_fn_cheb(x)
+    K_th = (
+        3.0
+        * n
+        * R
+        * T
+        / V
+        * gr
+        * ((1.0 - q_0 - 3.0 * gr) * D + 3.0 * gr * x / (np.exp(x) - 1.0))
+    )
+    G_th = 3.0 / 5.0 * (K_th - 6 * R * T * n / V * gr * D)
+    return K_th, G_th
+
+
+@jit(nopython=True, cache=True)
+def _mgd_P_and_K_T(V, temperature, prms):
+    V_0, T_0, Debye_0, n, gr_0, q_0, P_0, K_0, Kprime_0 = (
+        prms[0],
+        prms[1],
+        prms[2],
+        prms[3],
+        prms[4],
+        prms[5],
+        prms[6],
+        prms[7],
+        prms[8],
+    )
+    x = V_0 / V
+    f = 0.5 * (pow(x, 2.0 / 3.0) - 1.0)
+    gr = gr_0 * pow(1.0 / x, q_0)
+    debye_T = Debye_0 * np.exp((gr_0 - gr) / q_0)
+    P = (
+        _bm3_pressure(x, K_0, Kprime_0)
+        + P_0
+        + gr * debye.thermal_energy(temperature, debye_T, n) / V
+        - gr * debye.thermal_energy(T_0, debye_T, n) / V
+    )
+    K = (
+        _bm3_bulk_modulus(f, K_0, Kprime_0)
+        + _mgd_thermal_moduli(temperature, V, prms)[0]
+        - _mgd_thermal_moduli(T_0, V, prms)[0]
+    )
+    return P, K
+
+
+@jit(nopython=True, cache=True)
+def mgd_properties(pressure, temperature, prms):
+    """
+    Compiled kernel for the MGD2 and MGD3 equations of state.
+    """
+    V = _solve_volume(MGD, pressure, temperature, prms)
+    out = np.full(10, np.nan)
+    if not np.isfinite(V):
+        return out
+
+    V_0, T_0, Debye_0, n, gr_0, q_0 = (
+        prms[0],
+        prms[1],
+        prms[2],
+        prms[3],
+        prms[4],
+        prms[5],
+    )
+    K_0, Kprime_0, G_0, Gprime_0, F_0, order = (
+        prms[7],
+        prms[8],
+        prms[9],
+        prms[10],
+        prms[11],
+        prms[12],
+    )
+    x = V_0 / V
+    f = 0.5 * (pow(x, 2.0 / 3.0) - 1.0)
+    gr = gr_0 * pow(1.0 / x, q_0)
+    debye_T = Debye_0 * np.exp((gr_0 - gr) / q_0)
+
+    P, K_T = _mgd_P_and_K_T(V, temperature, prms)
+    C_v = debye.molar_heat_capacity_v(temperature, debye_T, n)
+    alpha = gr * C_v / K_T / V
+    C_p = C_v * (1.0 + gr * alpha * temperature)
+    S = debye.entropy(temperature, debye_T, n)
+
+    b_iikk = 9.0 * K_0  # EQ 28, SLB2005
+    b_iikkmm = 27.0 * K_0 * (Kprime_0 - 4.0)  # EQ 29, SLB2005
+    F = (
+        F_0
+        + 0.5 * b_iikk * f * f * V_0
+        + (1.0 / 6.0) * V_0 * b_iikkmm * f * f * f
+        + debye.helmholtz_energy(temperature, debye_T, n)
+        - debye.helmholtz_energy(T_0, debye_T, n)
+    )
+    G = (
+        _bm_shear_modulus(x, f, K_0, Kprime_0, G_0, Gprime_0, order)
+        + _mgd_thermal_moduli(temperature, V, prms)[1]
+        - _mgd_thermal_moduli(T_0, V, prms)[1]
+    )  # EQ B11
+    return _mineral_properties(pressure, temperature, V, F, S, K_T, G, alpha, C_p, gr)
+
+
+"""
+BM3 (isothermal third order Birch-Murnaghan)
+Packed parameters: V_0, P_0, K_0, Kprime_0, G_0, Gprime_0, F_0, order
+"""
+
+
+@jit(nopython=True, cache=True)
+def _bm3_P_and_K_T(V, temperature, prms):
+    V_0, P_0, K_0, Kprime_0 = prms[0], prms[1], prms[2], prms[3]
+    x = V_0 / V
+    f = 0.5 * (pow(x, 2.0 / 3.0) - 1.0)
+    return _bm3_pressure(x, K_0, Kprime_0) + P_0, _bm3_bulk_modulus(f, K_0, Kprime_0)
+
+
+@jit(nopython=True, cache=True)
+def _pressure_and_bulk_modulus(family, V, temperature, prms):
+    """
+    Returns the pressure and isothermal bulk modulus
+    of the given equation of state family.
+    """
+    if family == SLB:
+        return _slb_P_and_K_T(V, temperature, prms)
+    elif family == MGD:
+        return _mgd_P_and_K_T(V, temperature, prms)
+    return _bm3_P_and_K_T(V, temperature, prms)
+
+
+@jit(nopython=True, cache=True)
+def bm3_properties(pressure, temperature, prms):
+    """
+    Compiled kernel for the BM3 and BM3Shear2 equations of state.
+    """
+    V = _solve_volume(BM3, pressure, temperature, prms)
+    out = np.full(10, np.nan)
+    if not np.isfinite(V):
+        return out
+
+    V_0, K_0, Kprime_0, G_0, Gprime_0, F_0, order = (
+        prms[0],
+        prms[2],
+        prms[3],
+        prms[4],
+        prms[5],
+        prms[6],
+        prms[7],
+    )
+    x = V_0 / V
+    f = 0.5 * (pow(x, 2.0 / 3.0) - 1.0)
+    K_T = _bm3_bulk_modulus(f, K_0, Kprime_0)
+
+    y = pow(V / V_0, -1.0 / 3.0)
+    y2 = y * y
+    y4 = y2 * y2
+    y6 = y4 * y2
+    xi1 = 3.0 * (4.0 - Kprime_0) / 4.0
+    intPdV = (
+        -9.0
+        / 2.0
+        * V_0
+        * K_0
+        * (
+            (xi1 + 1.0) * (y4 / 4.0 - y2 / 2.0 + 1.0 / 4.0)
+            - xi1 * (y6 / 6.0 - y4 / 4.0 + 1.0 / 12.0)
+        )
+    )
+    F = -intPdV + F_0
+    G = _bm_shear_modulus(x, f, K_0, Kprime_0, G_0, Gprime_0, order)
+    # Isothermal equations of state have S = alpha = gr = 0 and C_p = 1.e-99
+    return _mineral_properties(
+        pressure, temperature, V, F, 0.0, K_T, G, 0.0, 1.0e-99, 0.0
+    )
@@ -3,6 +3,7 @@
 # GPL v2 or later.
 
 
+from collections import namedtuple
 import numpy as np
 import scipy.optimize as opt
 import warnings
@@ -10,10 +11,154 @@ import warnings
 from . import equation_of_state as eos
 from . import birch_murnaghan as bm
 from . import debye
+from . import kernels
 from .. import constants
 from ..utils.math import bracket
 
 
+# Parameters and derived constants used by the MGD functions
+# (see MGDBase._precompute_parameters)
+MGDParameters = namedtuple(
+    "MGDParameters",
+    [
+        "V_0",
+        "T_0",
+        "Debye_0",
+        "n",
+        "grueneisen_0",
+        "q_0",
+        "F_0",
+        "b_iikk",
+        "b_iikkmm",
+        "bm",
+        "kernel",
+    ],
+)
+
+
+def _debye_functions(*args):
+    """
+    Returns the (jitted) scalar Debye functions if all the arguments
+    are scalars, or their array-valued counterparts otherwise.
+    """
+    if any(np.ndim(arg) for arg in args):
+        return debye.vectorized
+    return debye
+
+
+# calculate the thermal correction to the shear modulus as a function of
+# V, T
+def _thermal_shear_modulus(T, V, p):
+    if np.ndim(T) or np.ndim(V):
+        T, V = np.broadcast_arrays(T, V)
+        G_th = np.zeros(T.shape)
+        mask = T > 1.0e-10
+        gr = _grueneisen_parameter(p.V_0 / V[mask], p)
+        Debye_T = _debye_temperature(p.V_0 / V[mask], p)
+        G_th[mask] = (
+            3.0
+            / 5.0
+            * (
+                _thermal_bulk_modulus(T[mask], V[mask], p)
+                - 6
+                * constants.gas_constant
+                * T[mask]
+                * p.n
+                / V[mask]
+                * gr
+                * debye.vectorized.debye_fn_cheb(Debye_T / T[mask])
+            )
+        )  # EQ B10
+        return G_th
+    elif T > 1.0e-10:
+        gr = _grueneisen_parameter(p.V_0 / V, p)
+        Debye_T = _debye_temperature(p.V_0 / V, p)
+        G_th = (
+            3.0
+            / 5.0
+            * (
+                _thermal_bulk_modulus(T, V, p)
+                - 6
+                * constants.gas_constant
+                * T
+                * p.n
+                / V
+                * gr
+                * debye.debye_fn(Debye_T / T)
+            )
+        )  # EQ B10
+        return G_th
+    else:
+        return 0.0
+
+
+# compute the Debye temperature in K.  Takes the
+# parameter x, which is V_0/V (molar volumes).
+# Depends on the reference grueneisen parameter,
+# the reference Debye temperature, and the factor
+# q_0, see Matas eq B6
+def _debye_temperature(x, p):
+    return p.Debye_0 * np.exp((p.grueneisen_0 - _grueneisen_parameter(x, p)) / p.q_0)
+
+
+# compute the grueneisen parameter with depth, according
+# to q_0.  Takes x=V_0/V. See Matas eq B6
+def _grueneisen_parameter(x, p):
+    return p.grueneisen_0 * pow(1.0 / x, p.q_0)
+
+
+# calculate isotropic thermal pressure, see
+# Matas et. al. (2007) eq B4
+def _thermal_pressure(T, V, p):
+    d = _debye_functions(T, V)
+    Debye_T = _debye_temperature(p.V_0 / V, p)
+    gr = _grueneisen_parameter(p.V_0 / V, p)
+    P_th = gr * d.thermal_energy(T, Debye_T, p.n) / V
+    return P_th
+
+
+# calculate the thermal correction for the mgd
+# bulk modulus (see matas et al, 2007)
+def _thermal_bulk_modulus(T, V, p):
+    if np.ndim(T) or np.ndim(V):
+        T, V = np.broadcast_arrays(T, V)
+        K_th = np.zeros(T.shape)
+        mask = T > 1.0e-10
+        gr = _grueneisen_parameter(p.V_0 / V[mask], p)
+        x = _debye_temperature(p.V_0 / V[mask], p) / T[mask]
+        K_th[mask] = (
+            3.0
+            * p.n
+            * constants.gas_constant
+            * T[mask]
+            / V[mask]
+            * gr
+            * (
+                (1.0 - p.q_0 - 3.0 * gr) * debye.vectorized.debye_fn_cheb(x)
+                + 3.0 * gr * x / (np.exp(x) - 1.0)
+            )
+        )  # EQ B5
+        return K_th
+    elif T > 1.0e-10:
+        gr = _grueneisen_parameter(p.V_0 / V, p)
+        Debye_T = _debye_temperature(p.V_0 / V, p)
+        K_th = (
+            3.0
+            * p.n
+            * constants.gas_constant
+            * T
+            / V
+            * gr
+            * (
+                (1.0 - p.q_0 - 3.0 * gr) * debye.debye_fn(Debye_T / T)
+                + 3.0 * gr * (Debye_T / T) / (np.exp(Debye_T / T) - 1.0)
+            )
+        )  # EQ B5
+        return K_th
+    else:
+        return 0.0
+
+
 class MGDBase(eos.EquationOfState):
     """
     Base class for a generic finite-strain Mie-Grueneisen-Debye
@@ -24,6 +169,66 @@ class MGDBase(eos.EquationOfState):
     was developed by Hama and Suito (1998).
     """
 
+    vectorized = True
+    _kernel = staticmethod(kernels.mgd_properties)
+
+    def _precompute_parameters(self, params):
+        """
+        Returns the parameters used by the MGD functions,
+        along with the constants derived from them,
+        as an MGDParameters object.
+        """
+        return MGDParameters(
+            V_0=params["V_0"],
+            T_0=params.get("T_0", np.nan),
+            Debye_0=params["Debye_0"],
+            n=params["n"],
+            grueneisen_0=params["grueneisen_0"],
+            q_0=params["q_0"],
+            F_0=params.get("F_0", 0.0),
+            b_iikk=9.0 * params["K_0"],  # EQ 28, SLB2005
+            b_iikkmm=27.0 * params["K_0"] * (params["Kprime_0"] - 4.0),  # EQ 29
+            bm=bm._bm3_parameters(params),
+            kernel=self._pack_kernel_parameters(params),
+        )
+
+    def _kernel_parameters(self, params):
+        """
+        Returns the parameters for :func:`burnman.eos.kernels.mgd_properties`.
+        """
+        return self._parameters(params).kernel
+
+    def _pack_kernel_parameters(self, params):
+        """
+        Packs the parameters for :func:`burnman.eos.kernels.mgd_properties`.
+        Returns None if the kernel cannot be used.
+        """
+        if not kernels.compiled or type(self) not in (MGD2, MGD3):
+            return None
+        try:
+            prms = np.array(
+                [
+                    params["V_0"],
+                    params["T_0"],
+                    params["Debye_0"],
+                    params["n"],
+                    params["grueneisen_0"],
+                    params["q_0"],
+                    params["P_0"],
+                    params["K_0"],
+                    params["Kprime_0"],
+                    params["G_0"],
+                    params["Gprime_0"],
+                    params["F_0"],
+                    self.order,
+                ],
+                dtype=float,
+            )
+        except KeyError:
+            return None
+        prms.flags.writeable = False
+        return prms
+
     def _grueneisen_parameter(self, pressure, temperature, volume, params):
         """
         Returns grueneisen parameter [unitless] as a function of pressure,
@@ -36,15 +241,26 @@ class MGDBase(eos.EquationOfState):
         Returns volume [m^3] as a function of pressure [Pa] and temperature [K]
         EQ B7
         """
-        T_0 = params["T_0"]
-        func = (
-            lambda x: bm.pressure_third_order(params["V_0"] / x, params)
-            + self._thermal_pressure(temperature, x, params)
-            - self._thermal_pressure(T_0, x, params)
+        if np.ndim(pressure) or np.ndim(temperature):
+            return self._volume_vectorized(pressure, temperature, params)
+        return self._continued_volume(
+            pressure, temperature, params, self._bracketed_volume
+        )
+
+    def _bracketed_volume(self, pressure, temperature, params):
+        """
+        Returns the volume [m^3] at a single pressure [Pa] and
+        temperature [K], found by bracketing from V_0 followed by brentq.
+        """
+        p = self._parameters(params)
+        func = self._counted(
+            lambda x: bm._pressure_third_order(p.V_0 / x, p.bm)
+            + _thermal_pressure(temperature, x, p)
+            - _thermal_pressure(p.T_0, x, p)
             - pressure
         )
         try:
-            sol = bracket(func, params["V_0"], 1.0e-2 * params["V_0"])
+            sol = bracket(func, p.V_0, 1.0e-2 * p.V_0)
         except:
             raise ValueError(
                 "Cannot find a volume, perhaps you are outside of the range of validity for the equation of state?"
@@ -56,11 +272,11 @@ class MGDBase(eos.EquationOfState):
         Returns isothermal bulk modulus [Pa] as a function of pressure [Pa],
         temperature [K], and volume [m^3].  EQ B8
         """
-        T_0 = params["T_0"]
+        p = self._parameters(params)
         K_T = (
-            bm.bulk_modulus_third_order(volume, params)
-            + self._thermal_bulk_modulus(temperature, volume, params)
-            - self._thermal_bulk_modulus(T_0, volume, params)
+            bm._bulk_modulus_third_order(volume, p.bm)
+            + _thermal_bulk_modulus(temperature, volume, p)
+            - _thermal_bulk_modulus(p.T_0, volume, p)
         )  # EQB13
         return K_T
 
@@ -70,18 +286,18 @@ class MGDBase(eos.EquationOfState):
         Returns shear modulus [Pa] as a function of pressure [Pa],
         temperature [K], and volume [m^3].  EQ B11
         """
-        T_0 = params["T_0"]
+        p = self._parameters(params)
         if self.order == 2:
             return (
-                bm.shear_modulus_second_order(volume, params)
-                + self._thermal_shear_modulus(temperature, volume, params)
-                - self._thermal_shear_modulus(T_0, volume, params)
+                bm._shear_modulus_second_order(volume, p.bm)
+                + _thermal_shear_modulus(temperature, volume, p)
+                - _thermal_shear_modulus(p.T_0, volume, p)
             )  # EQ B11
         elif self.order == 3:
             return (
-                bm.shear_modulus_third_order(volume, params)
-                + self._thermal_shear_modulus(temperature, volume, params)
-                - self._thermal_shear_modulus(T_0, volume, params)
+                bm._shear_modulus_third_order(volume, p.bm)
+                + _thermal_shear_modulus(temperature, volume, p)
+                - _thermal_shear_modulus(p.T_0, volume, p)
             )  # EQ B11
         else:
             raise NotImplementedError("")
@@ -91,16 +307,19 @@ class MGDBase(eos.EquationOfState):
         """
         Returns heat capacity at constant volume at the pressure, temperature, and volume [J/K/mol]
         """
-        Debye_T = self._debye_temperature(params["V_0"] / volume, params)
-        C_v = debye.molar_heat_capacity_v(temperature, Debye_T, params["n"])
+        p = self._parameters(params)
+        d = _debye_functions(temperature, volume)
+        Debye_T = _debye_temperature(p.V_0 / volume, p)
+        C_v = d.molar_heat_capacity_v(temperature, Debye_T, p.n)
         return C_v
 
     def thermal_expansivity(self, pressure, temperature, volume, params):
         """
         Returns thermal expansivity at the pressure, temperature, and volume [1/K]
         """
+        p = self._parameters(params)
         C_v = self._molar_heat_capacity_v(pressure, temperature, volume, params)
-        gr = self._grueneisen_parameter(params["V_0"] / volume, params)
+        gr = _grueneisen_parameter(p.V_0 / volume, p)
         K = self.isothermal_bulk_modulus_reuss(pressure, temperature, volume, params)
         alpha = gr * C_v / K / volume
         return alpha
@@ -109,8 +328,9 @@ class MGDBase(eos.EquationOfState):
         """
         Returns heat capacity at constant pressure at the pressure, temperature, and volume [J/K/mol]
         """
+        p = self._parameters(params)
         alpha = self.thermal_expansivity(pressure, temperature, volume, params)
-        gr = self._grueneisen_parameter(params["V_0"] / volume, params)
+        gr = _grueneisen_parameter(p.V_0 / volume, p)
         C_v = self._molar_heat_capacity_v(pressure, temperature, volume, params)
         C_p = C_v * (1.0 + gr * alpha * temperature)
         return C_p
@@ -120,11 +340,11 @@ class MGDBase(eos.EquationOfState):
         Returns pressure [Pa] as a function of temperature [K] and volume[m^3]
         EQ B7
         """
-        T_0 = params["T_0"]
+        p = self._parameters(params)
         return (
-            bm.pressure_third_order(params["V_0"] / volume, params)
-            + self._thermal_pressure(temperature, volume, params)
-            - self._thermal_pressure(T_0, volume, params)
+            bm._pressure_third_order(p.V_0 / volume, p.bm)
+            + _thermal_pressure(temperature, volume, p)
+            - _thermal_pressure(p.T_0, volume, p)
         )
 
     def gibbs_energy(self, pressure, temperature, volume, params):
@@ -141,100 +361,55 @@ class MGDBase(eos.EquationOfState):
         """
         Returns the entropy at the pressure and temperature of the mineral [J/K/mol]
         """
-        Debye_T = self._debye_temperature(params["V_0"] / volume, params)
-        S = debye.entropy(temperature, Debye_T, params["n"])
+        p = self._parameters(params)
+        d = _debye_functions(temperature, volume)
+        Debye_T = _debye_temperature(p.V_0 / volume, p)
+        S = d.entropy(temperature, Debye_T, p.n)
         return S
 
     def _helmholtz_energy(self, pressure, temperature, volume, params):
         """
         Returns the Helmholtz free energy at the pressure and temperature of the mineral [J/mol]
         """
-        x = params["V_0"] / volume
+        p = self._parameters(params)
+        x = p.V_0 / volume
         f = 1.0 / 2.0 * (pow(x, 2.0 / 3.0) - 1.0)
-        b_iikk = 9.0 * params["K_0"]  # EQ 28, SLB2005
-        b_iikkmm = 27.0 * params["K_0"] * (params["Kprime_0"] - 4.0)  # EQ 29, SLB2005
 
         F_pressure = (
-            0.5 * b_iikk * f * f * params["V_0"]
-            + (1.0 / 6.0) * params["V_0"] * b_iikkmm * f * f * f
+            0.5 * p.b_iikk * f * f * p.V_0
+            + (1.0 / 6.0) * p.V_0 * p.b_iikkmm * f * f * f
         )
 
-        Debye_T = self._debye_temperature(params["V_0"] / volume, params)
-        F_thermal = debye.helmholtz_energy(
-            temperature, Debye_T, params["n"]
-        ) - debye.helmholtz_energy(params["T_0"], Debye_T, params["n"])
+        d = _debye_functions(temperature, volume)
+        Debye_T = _debye_temperature(x, p)
+        F_thermal = d.helmholtz_energy(temperature, Debye_T, p.n) - d.helmholtz_energy(
+            p.T_0, Debye_T, p.n
+        )
 
-        return params["F_0"] + F_pressure + F_thermal
+        return p.F_0 + F_pressure + F_thermal
 
     # calculate the thermal correction to the shear modulus as a function of
     # V, T
     def _thermal_shear_modulus(self, T, V, params):
-        if T > 1.0e-10:
-            gr = self._grueneisen_parameter(params["V_0"] / V, params)
-            Debye_T = self._debye_temperature(params["V_0"] / V, params)
-            G_th = (
-                3.0
-                / 5.0
-                * (
-                    self._thermal_bulk_modulus(T, V, params)
-                    - 6
-                    * constants.gas_constant
-                    * T
-                    * params["n"]
-                    / V
-                    * gr
-                    * debye.debye_fn(Debye_T / T)
-                )
-            )  # EQ B10
-            return G_th
-        else:
-            return 0.0
+        return _thermal_shear_modulus(T, V, self._parameters(params))
 
     # compute the Debye temperature in K.  Takes the
     # parameter x, which is V_0/V (molar volumes).
-    # Depends on the reference grueneisen parameter,
-    # the reference Debye temperature, and the factor
-    # q_0, see Matas eq B6
     def _debye_temperature(self, x, params):
-        return params["Debye_0"] * np.exp(
-            (params["grueneisen_0"] - self._grueneisen_parameter(x, params))
-            / params["q_0"]
-        )
+        return _debye_temperature(x, self._parameters(params))
 
     # compute the grueneisen parameter with depth, according
-    # to q_0.  Takes x=V_0/V. See Matas eq B6
+    # to q_0.  Takes x=V_0/V.
     def _grueneisen_parameter(self, x, params):
-        return params["grueneisen_0"] * pow(1.0 / x, params["q_0"])
+        return _grueneisen_parameter(x, self._parameters(params))
 
-    # calculate isotropic thermal pressure, see
-    # Matas et. al. (2007) eq B4
+    # calculate isotropic thermal pressure
     def _thermal_pressure(self, T, V, params):
-        Debye_T = self._debye_temperature(params["V_0"] / V, params)
-        gr = self._grueneisen_parameter(params["V_0"] / V, params)
-        P_th = gr * debye.thermal_energy(T, Debye_T, params["n"]) / V
-        return P_th
+        return _thermal_pressure(T, V, self._parameters(params))
 
-    # calculate the thermal correction for the mgd
-    # bulk modulus (see matas et al, 2007)
+    # calculate the thermal correction for the mgd bulk modulus
     def _thermal_bulk_modulus(self, T, V, params):
-        if T > 1.0e-10:
-            gr = self._grueneisen_parameter(params["V_0"] / V, params)
-            Debye_T = self._debye_temperature(params["V_0"] / V, params)
-            K_th = (
-                3.0
-                * params["n"]
-                * constants.gas_constant
-                * T
-                / V
-                * gr
-                * (
-                    (1.0 - params["q_0"] - 3.0 * gr) * debye.debye_fn(Debye_T / T)
-                    + 3.0 * gr * (Debye_T / T) / (np.exp(Debye_T / T) - 1.0)
-                )
-            )  # EQ B5
-            return K_th
-        else:
-            return 0.0
+        return _thermal_bulk_modulus(T, V, self._parameters(params))
 
     def validate_parameters(self, params):
         """
@@ -269,6 +444,9 @@ class MGDBase(eos.EquationOfState):
         if params["q_0"] < -10.0 or params["q_0"] > 10.0:
             warnings.warn("Unusual value for q_0", stacklevel=2)
 
+        # Store the parameters used by the compiled kernel
+        self._parameters(params)
+
 
 class MGD3(MGDBase):
     """
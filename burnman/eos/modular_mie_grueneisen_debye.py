@@ -29,6 +29,16 @@ from . import bukowinski_electronic as el
 from .anharmonic_debye import AnharmonicDebye as Anharmonic
 
 
+def _debye_functions(*args):
+    """
+    Returns the (jitted) scalar Debye functions if all the arguments
+    are scalars, or their array-valued counterparts otherwise.
+    """
+    if any(np.ndim(arg) for arg in args):
+        return debye.vectorized
+    return debye
+
+
 class ModularMGD(eos.EquationOfState):
     """
     Base class for a modular Mie-Grueneisen-Debye equation of state.
@@ -83,12 +93,13 @@ class ModularMGD(eos.EquationOfState):
         Vrel = volume / params["V_0"]
         T_0 = params["T_0"]
 
+        d = _debye_functions(temperature, volume)
         P_ref = params["reference_eos"].pressure(T_0, volume, params)
         Debye_T = params["debye_temperature_model"].value(Vrel, params)
         dThetadV = params["debye_temperature_model"].dVrel(Vrel, params) / params["V_0"]
         P_th = -dThetadV * (
-            debye.dhelmholtz_dTheta(temperature, Debye_T, params["n"])
-            - debye.dhelmholtz_dTheta(T_0, Debye_T, params["n"])
+            d.dhelmholtz_dTheta(temperature, Debye_T, params["n"])
+            - d.dhelmholtz_dTheta(T_0, Debye_T, params["n"])
         )
 
         P = P_ref + P_th
@@ -131,10 +142,11 @@ class ModularMGD(eos.EquationOfState):
             params["debye_temperature_model"].dVrel(V / params["V_0"], params)
             / params["V_0"]
         )
-        dFthdTheta = debye.dhelmholtz_dTheta(temperature, Debye_T, params["n"])
-        dFthdTheta_T0 = debye.dhelmholtz_dTheta(params["T_0"], Debye_T, params["n"])
-        d2FthdTheta2 = debye.d2helmholtz_dTheta2(temperature, Debye_T, params["n"])
-        d2FthdTheta2_T0 = debye.d2helmholtz_dTheta2(params["T_0"], Debye_T, params["n"])
+        d = _debye_functions(temperature, volume)
+        dFthdTheta = d.dhelmholtz_dTheta(temperature, Debye_T, params["n"])
+        dFthdTheta_T0 = d.dhelmholtz_dTheta(params["T_0"], Debye_T, params["n"])
+        d2FthdTheta2 = d.d2helmholtz_dTheta2(temperature, Debye_T, params["n"])
+        d2FthdTheta2_T0 = d.d2helmholtz_dTheta2(params["T_0"], Debye_T, params["n"])
         d2FthdV2 = d2ThetadV2 * (dFthdTheta - dFthdTheta_T0) + dThetadV**2 * (
             d2FthdTheta2 - d2FthdTheta2_T0
         )
@@ -165,7 +177,8 @@ class ModularMGD(eos.EquationOfState):
         debye_T = params["debye_temperature_model"].value(
             volume / params["V_0"], params
         )
-        C_v = debye.molar_heat_capacity_v(temperature, debye_T, params["n"])
+        d = _debye_functions(temperature, volume)
+        C_v = d.molar_heat_capacity_v(temperature, debye_T, params["n"])
 
         # If the material is conductive, add the electronic contribution
         if params["bel_0"] is not None:
@@ -190,7 +203,8 @@ class ModularMGD(eos.EquationOfState):
             params["debye_temperature_model"].dVrel(volume / params["V_0"], params)
             / params["V_0"]
         )
-        dSdTheta = debye.dentropy_dTheta(temperature, debye_T, params["n"])
+        d = _debye_functions(temperature, volume)
+        dSdTheta = d.dentropy_dTheta(temperature, debye_T, params["n"])
         aKT = dSdTheta * dThetadV
 
         # If the material is conductive, add the electronic contribution
@@ -215,7 +229,8 @@ class ModularMGD(eos.EquationOfState):
         Debye_T = params["debye_temperature_model"].value(
             volume / params["V_0"], params
         )
-        S = debye.entropy(temperature, Debye_T, params["n"])
+        d = _debye_functions(temperature, volume)
+        S = d.entropy(temperature, Debye_T, params["n"])
 
         # If the material is conductive, add the electronic contribution
         if params["bel_0"] is not None:
@@ -245,9 +260,10 @@ class ModularMGD(eos.EquationOfState):
             volume / params["V_0"], params
         )
 
-        F_th = debye.helmholtz_energy(
+        d = _debye_functions(temperature, volume)
+        F_th = d.helmholtz_energy(
             temperature, Debye_T, params["n"]
-        ) - debye.helmholtz_energy(params["T_0"], Debye_T, params["n"])
+        ) - d.helmholtz_energy(params["T_0"], Debye_T, params["n"])
 
         F = F_ref + F_th
 
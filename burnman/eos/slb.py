@@ -7,6 +7,7 @@
 import numpy as np
 import scipy.optimize as opt
 import warnings
+from collections import namedtuple
 
 # Try to import the jit from numba.  If it is
 # not available, just go with the standard
@@ -24,7 +25,9 @@ except ImportError:
 
 from . import birch_murnaghan as bm
 from . import debye
+from .debye import _vectorized
 from . import equation_of_state as eos
+from . import kernels
 from . import bukowinski_electronic as el
 from ..utils.math import bracket
 
@@ -33,7 +36,7 @@ from ..utils.math import bracket
 def _grueneisen_parameter_slb(V_0, volume, gruen_0, q_0):
     """global function with plain parameters so jit will work"""
     x = V_0 / volume
-    f = 1.0 / 2.0 * (pow(x, 2.0 / 3.0) - 1.0)
+    f = 1.0 / 2.0 * (np.power(x, 2.0 / 3.0) - 1.0)
     a1_ii = 6.0 * gruen_0  # EQ 47
     a2_iikk = -12.0 * gruen_0 + 36.0 * gruen_0 * gruen_0 - 18.0 * q_0 * gruen_0  # EQ 47
     nu_o_nu0_sq = 1.0 + a1_ii * f + (1.0 / 2.0) * a2_iikk * f * f  # EQ 41
@@ -87,6 +90,84 @@ def _delta_pressure(
     )  # EQ 21
 
 
+@jit(nopython=True)
+def _delta_pressure_or_nan(
+    x,
+    pressure,
+    temperature,
+    V_0,
+    T_0,
+    Debye_0,
+    n,
+    a1_ii,
+    a2_iikk,
+    b_iikk,
+    b_iikkmm,
+    bel_0,
+    gel,
+):
+    """
+    As _delta_pressure, but returns NaN rather than failing if the
+    volume is outside the valid range of the thermal model.
+    """
+    f = 0.5 * (pow(V_0 / x, 2.0 / 3.0) - 1.0)
+    if 1.0 + a1_ii * f + 1.0 / 2.0 * a2_iikk * f * f <= 0.0:
+        return np.nan
+    return _delta_pressure(
+        x,
+        pressure,
+        temperature,
+        V_0,
+        T_0,
+        Debye_0,
+        n,
+        a1_ii,
+        a2_iikk,
+        b_iikk,
+        b_iikkmm,
+        bel_0,
+        gel,
+    )
+
+
+# Elementwise version of _delta_pressure, used when
+# volumes, pressures or temperatures are passed as arrays
+_delta_pressure_vectorized = _vectorized(_delta_pressure_or_nan)
+
+
+# Parameters and derived constants used by the SLB functions
+# (see SLBBase._precompute_parameters)
+SLBParameters = namedtuple(
+    "SLBParameters",
+    [
+        "V_0",
+        "T_0",
+        "Debye_0",
+        "n",
+        "grueneisen_0",
+        "q_0",
+        "a1_ii",
+        "a2_iikk",
+        "a2_s",
+        "b_iikk",
+        "b_iikkmm",
+        "bel_0",
+        "gel",
+        "kernel",
+    ],
+)
+
+
+def _debye_functions(*args):
+    """
+    Returns the (jitted) scalar Debye functions if all the arguments
+    are scalars, or their array-valued counterparts otherwise.
+    """
+    if any(np.ndim(arg) for arg in args):
+        return debye.vectorized
+    return debye
+
+
 class SLBBase(eos.EquationOfState):
     """
     Base class for the finite strain-Mie-Grueneiesen-Debye equation of state
@@ -95,24 +176,95 @@ class SLBBase(eos.EquationOfState):
     and :class:`burnman.slb.SLB3` classes.
     """
 
+    vectorized = True
+    _kernel = staticmethod(kernels.slb_properties)
+
+    def _precompute_parameters(self, params):
+        """
+        Returns the parameters used by the SLB functions,
+        along with the constants derived from them (EQ 28, 29 and 47),
+        as an SLBParameters object.
+        """
+        gr_0, q_0 = params["grueneisen_0"], params["q_0"]
+        a1_ii = 6.0 * gr_0  # EQ 47
+        a2_iikk = -12.0 * gr_0 + 36.0 * pow(gr_0, 2.0) - 18.0 * q_0 * gr_0  # EQ 47
+        a2_s = -2.0 * gr_0 - 2.0 * params.get("eta_s_0", np.nan)  # EQ 47
+        b_iikk = 9.0 * params["K_0"]  # EQ 28
+        b_iikkmm = 27.0 * params["K_0"] * (params["Kprime_0"] - 4.0)  # EQ 29
+
+        bel_0, gel = 0.0, 1.0
+        if self.conductive:
+            bel_0, gel = params["bel_0"], params["gel"]
+
+        return SLBParameters(
+            V_0=params["V_0"],
+            T_0=params["T_0"],
+            Debye_0=params["Debye_0"],
+            n=params["n"],
+            grueneisen_0=gr_0,
+            q_0=q_0,
+            a1_ii=a1_ii,
+            a2_iikk=a2_iikk,
+            a2_s=a2_s,
+            b_iikk=b_iikk,
+            b_iikkmm=b_iikkmm,
+            bel_0=bel_0,
+            gel=gel,
+            kernel=self._pack_kernel_parameters(params),
+        )
+
+    def _kernel_parameters(self, params):
+        """
+        Returns the parameters for :func:`burnman.eos.kernels.slb_properties`.
+        """
+        return self._parameters(params).kernel
+
+    def _pack_kernel_parameters(self, params):
+        """
+        Packs the parameters for :func:`burnman.eos.kernels.slb_properties`.
+        The kernel does not include the electronic contribution to the
+        Helmholtz energy, so it is only used by SLB2 and SLB3.
+        Returns None if the kernel cannot be used.
+        """
+        if not kernels.compiled or type(self) not in (SLB2, SLB3):
+            return None
+        try:
+            prms = np.array(
+                [
+                    params["V_0"],
+                    params["T_0"],
+                    params["Debye_0"],
+                    params["n"],
+                    params["grueneisen_0"],
+                    params["q_0"],
+                    params["eta_s_0"],
+                    params["K_0"],
+                    params["Kprime_0"],
+                    params["G_0"],
+                    params["Gprime_0"],
+                    params["F_0"],
+                    self.order,
+                ],
+                dtype=float,
+            )
+        except KeyError:
+            return None
+        prms.flags.writeable = False
+        return prms
+
     def _debye_temperature(self, x, params):
         """
         Finite strain approximation for Debye Temperature [K]
         x = ref_vol/vol
         """
+        p = self._parameters(params)
         f = 1.0 / 2.0 * (pow(x, 2.0 / 3.0) - 1.0)
-        a1_ii = 6.0 * params["grueneisen_0"]  # EQ 47
-        a2_iikk = (
-            -12.0 * params["grueneisen_0"]
-            + 36.0 * pow(params["grueneisen_0"], 2.0)
-            - 18.0 * params["q_0"] * params["grueneisen_0"]
-        )  # EQ 47
-        nu_o_nu0_sq = 1.0 + a1_ii * f + 1.0 / 2.0 * a2_iikk * f * f
-        if nu_o_nu0_sq > 0.0:
-            return params["Debye_0"] * np.sqrt(nu_o_nu0_sq)
+        nu_o_nu0_sq = 1.0 + p.a1_ii * f + 1.0 / 2.0 * p.a2_iikk * f * f
+        if np.all(nu_o_nu0_sq > 0.0):
+            return p.Debye_0 * np.sqrt(nu_o_nu0_sq)
         else:
             raise Exception(
-                f"This volume (V = {1./x:.2f}*V_0) exceeds the "
+                f"This volume (V = {np.max(1./x):.2f}*V_0) exceeds the "
                 "valid range of the thermal "
                 "part of the slb equation of state."
             )
@@ -122,17 +274,13 @@ class SLBBase(eos.EquationOfState):
         Finite strain approximation for :math:`q`, the isotropic volume strain
         derivative of the grueneisen parameter.
         """
+        p = self._parameters(params)
+        a1_ii, a2_iikk = p.a1_ii, p.a2_iikk
         f = 1.0 / 2.0 * (pow(x, 2.0 / 3.0) - 1.0)
-        a1_ii = 6.0 * params["grueneisen_0"]  # EQ 47
-        a2_iikk = (
-            -12.0 * params["grueneisen_0"]
-            + 36.0 * pow(params["grueneisen_0"], 2.0)
-            - 18.0 * params["q_0"] * params["grueneisen_0"]
-        )  # EQ 47
         nu_o_nu0_sq = 1.0 + a1_ii * f + (1.0 / 2.0) * a2_iikk * f * f  # EQ 41
         gr = 1.0 / 6.0 / nu_o_nu0_sq * (2.0 * f + 1.0) * (a1_ii + a2_iikk * f)
         # avoids divide by zero if grueneisen_0 = 0.
-        if np.abs(params["grueneisen_0"]) < 1.0e-10:
+        if np.abs(p.grueneisen_0) < 1.0e-10:
             q = 1.0 / 9.0 * (18.0 * gr - 6.0)
         else:
             q = (
@@ -157,14 +305,9 @@ class SLBBase(eos.EquationOfState):
         Finite strain approximation for :math:`eta_{s0}`, the isotropic shear
         strain derivative of the grueneisen parameter.
         """
+        p = self._parameters(params)
+        a1_ii, a2_iikk, a2_s = p.a1_ii, p.a2_iikk, p.a2_s
         f = 1.0 / 2.0 * (pow(x, 2.0 / 3.0) - 1.0)
-        a2_s = -2.0 * params["grueneisen_0"] - 2.0 * params["eta_s_0"]  # EQ 47
-        a1_ii = 6.0 * params["grueneisen_0"]  # EQ 47
-        a2_iikk = (
-            -12.0 * params["grueneisen_0"]
-            + 36.0 * pow(params["grueneisen_0"], 2.0)
-            - 18.0 * params["q_0"] * params["grueneisen_0"]
-        )  # EQ 47
         nu_o_nu0_sq = 1.0 + a1_ii * f + (1.0 / 2.0) * a2_iikk * pow(f, 2.0)  # EQ 41
         gr = 1.0 / 6.0 / nu_o_nu0_sq * (2.0 * f + 1.0) * (a1_ii + a2_iikk * f)
         # EQ 46 NOTE the typo from Stixrude 2005:
@@ -178,25 +321,20 @@ class SLBBase(eos.EquationOfState):
         """
         Returns molar volume. :math:`[m^3]`
         """
-        T_0 = params["T_0"]
-        Debye_0 = params["Debye_0"]
-        V_0 = params["V_0"]
-        dV = 1.0e-2 * params["V_0"]
-        n = params["n"]
-
-        a1_ii = 6.0 * params["grueneisen_0"]  # EQ 47
-        a2_iikk = (
-            -12.0 * params["grueneisen_0"]
-            + 36.0 * pow(params["grueneisen_0"], 2.0)
-            - 18.0 * params["q_0"] * params["grueneisen_0"]
-        )  # EQ 47
-
-        b_iikk = 9.0 * params["K_0"]  # EQ 28
-        b_iikkmm = 27.0 * params["K_0"] * (params["Kprime_0"] - 4.0)  # EQ 29z
+        if np.ndim(pressure) or np.ndim(temperature):
+            return self._volume_vectorized(pressure, temperature, params)
+        return self._continued_volume(
+            pressure, temperature, params, self._bracketed_volume
+        )
 
-        bel_0, gel = 0.0, 1.0
-        if self.conductive:
-            bel_0, gel = params["bel_0"], params["gel"]
+    def _bracketed_volume(self, pressure, temperature, params):
+        """
+        Returns the volume [m^3] at a single pressure [Pa] and
+        temperature [K], found by bracketing from V_0 followed by brentq.
+        """
+        p = self._parameters(params)
+        V_0 = p.V_0
+        dV = 1.0e-2 * p.V_0
 
         # Finding the volume at a given pressure requires a
         # root-finding scheme. Here we use brentq to find the root.
@@ -206,22 +344,24 @@ class SLBBase(eos.EquationOfState):
         args = (
             pressure,
             temperature,
-            V_0,
-            T_0,
-            Debye_0,
-            n,
-            a1_ii,
-            a2_iikk,
-            b_iikk,
-            b_iikkmm,
-            bel_0,
-            gel,
+            p.V_0,
+            p.T_0,
+            p.Debye_0,
+            p.n,
+            p.a1_ii,
+            p.a2_iikk,
+            p.b_iikk,
+            p.b_iikkmm,
+            p.bel_0,
+            p.gel,
         )
 
+        delta_pressure = self._counted(_delta_pressure)
+
         try:
             # The first attempt to find a bracket for
             # root finding uses V_0 as a starting point
-            sol = bracket(_delta_pressure, V_0, dV, args)
+            sol = bracket(delta_pressure, V_0, dV, args)
         except Exception:
             # At high temperature, the naive bracketing above may
             # try a volume guess that exceeds the point at which the
@@ -248,7 +388,7 @@ class SLBBase(eos.EquationOfState):
                 )
             else:
                 try:
-                    sol = bracket(_delta_pressure, V_crit - dV, dV, args)
+                    sol = bracket(delta_pressure, V_crit - dV, dV, args)
                 except Exception:
                     raise Exception(
                         "Cannot find a volume, perhaps you are "
@@ -256,69 +396,56 @@ class SLBBase(eos.EquationOfState):
                         "the equation of state?"
                     )
 
-        return opt.brentq(_delta_pressure, sol[0], sol[1], args=args, xtol=1.0e-24)
+        return opt.brentq(delta_pressure, sol[0], sol[1], args=args, xtol=1.0e-24)
 
     def pressure(self, temperature, volume, params):
         """
         Returns the pressure of the mineral at a given temperature and volume
         [Pa]
         """
-        T_0 = params["T_0"]
-        Debye_0 = params["Debye_0"]
-        V_0 = params["V_0"]
-        n = params["n"]
-
-        a1_ii = 6.0 * params["grueneisen_0"]  # EQ 47
-        a2_iikk = (
-            -12.0 * params["grueneisen_0"]
-            + 36.0 * pow(params["grueneisen_0"], 2.0)
-            - 18.0 * params["q_0"] * params["grueneisen_0"]
-        )  # EQ 47
-
-        b_iikk = 9.0 * params["K_0"]  # EQ 28
-        b_iikkmm = 27.0 * params["K_0"] * (params["Kprime_0"] - 4.0)  # EQ 29z
-
-        bel_0, gel = 0.0, 1.0
-        if self.conductive:
-            bel_0, gel = params["bel_0"], params["gel"]
+        p = self._parameters(params)
+        if np.ndim(temperature) or np.ndim(volume):
+            delta_pressure = _delta_pressure_vectorized
+        else:
+            delta_pressure = _delta_pressure
 
-        return _delta_pressure(
+        return delta_pressure(
             volume,
             0.0,
             temperature,
-            V_0,
-            T_0,
-            Debye_0,
-            n,
-            a1_ii,
-            a2_iikk,
-            b_iikk,
-            b_iikkmm,
-            bel_0,
-            gel,
+            p.V_0,
+            p.T_0,
+            p.Debye_0,
+            p.n,
+            p.a1_ii,
+            p.a2_iikk,
+            p.b_iikk,
+            p.b_iikkmm,
+            p.bel_0,
+            p.gel,
         )
 
     def isothermal_bulk_modulus_reuss(self, pressure, temperature, volume, params):
         """
         Returns isothermal bulk modulus :math:`[Pa]`
         """
-        T_0 = params["T_0"]
-        debye_T = self._debye_temperature(params["V_0"] / volume, params)
-        gr = _grueneisen_parameter_slb(
-            params["V_0"], volume, params["grueneisen_0"], params["q_0"]
-        )
+        p = self._parameters(params)
+        T_0 = p.T_0
+        d = _debye_functions(temperature, volume)
+        debye_T = self._debye_temperature(p.V_0 / volume, params)
+        gr = _grueneisen_parameter_slb(p.V_0, volume, p.grueneisen_0, p.q_0)
 
         # thermal energy at temperature T
-        E_th = debye.thermal_energy(temperature, debye_T, params["n"])
+        E_th = d.thermal_energy(temperature, debye_T, p.n)
         # thermal energy at reference temperature
-        E_th_ref = debye.thermal_energy(T_0, debye_T, params["n"])
+        E_th_ref = d.thermal_energy(T_0, debye_T, p.n)
 
         # heat capacity at temperature T
-        C_v = debye.molar_heat_capacity_v(temperature, debye_T, params["n"])
+        C_v = d.molar_heat_capacity_v(temperature, debye_T, p.n)
         # heat capacity at reference temperature
-        C_v_ref = debye.molar_heat_capacity_v(T_0, debye_T, params["n"])
+        C_v_ref = d.molar_heat_capacity_v(T_0, debye_T, p.n)
 
-        q = self._volume_dependent_q(params["V_0"] / volume, params)
+        q = self._volume_dependent_q(p.V_0 / volume, params)
 
         K = (
             bm.bulk_modulus_third_order(volume, params)
@@ -327,26 +454,20 @@ class SLBBase(eos.EquationOfState):
         )
 
         if self.conductive:
-            K += volume * el.KToverV(
-                temperature,
-                volume,
-                params["T_0"],
-                params["V_0"],
-                params["bel_0"],
-                params["gel"],
-            )
+            K = K + volume * el.KToverV(temperature, volume, T_0, p.V_0, p.bel_0, p.gel)
         return K
 
     def shear_modulus(self, pressure, temperature, volume, params):
         """
         Returns shear modulus. :math:`[Pa]`
         """
-        T_0 = params["T_0"]
-        debye_T = self._debye_temperature(params["V_0"] / volume, params)
-        eta_s = self._isotropic_eta_s(params["V_0"] / volume, params)
+        p = self._parameters(params)
+        d = _debye_functions(temperature, volume)
+        debye_T = self._debye_temperature(p.V_0 / volume, params)
+        eta_s = self._isotropic_eta_s(p.V_0 / volume, params)
 
-        E_th = debye.thermal_energy(temperature, debye_T, params["n"])
-        E_th_ref = debye.thermal_energy(T_0, debye_T, params["n"])
+        E_th = d.thermal_energy(temperature, debye_T, p.n)
+        E_th_ref = d.thermal_energy(p.T_0, debye_T, p.n)
 
         if self.order == 2:
             return (
@@ -365,32 +486,30 @@ class SLBBase(eos.EquationOfState):
         """
         Returns heat capacity at constant volume. :math:`[J/K/mol]`
         """
-        debye_T = self._debye_temperature(params["V_0"] / volume, params)
-        C_v = debye.molar_heat_capacity_v(temperature, debye_T, params["n"])
+        p = self._parameters(params)
+        d = _debye_functions(temperature, volume)
+        debye_T = self._debye_temperature(p.V_0 / volume, params)
+        C_v = d.molar_heat_capacity_v(temperature, debye_T, p.n)
 
         if self.conductive:
-            C_v += temperature * el.CVoverT(
-                volume, params["V_0"], params["bel_0"], params["gel"]
-            )
+            C_v = C_v + temperature * el.CVoverT(volume, p.V_0, p.bel_0, p.gel)
         return C_v
 
     def thermal_expansivity(self, pressure, temperature, volume, params):
         """
         Returns thermal expansivity. :math:`[1/K]`
         """
-        debye_T = self._debye_temperature(params["V_0"] / volume, params)
-        C_v = debye.molar_heat_capacity_v(temperature, debye_T, params["n"])
-        gr_slb = _grueneisen_parameter_slb(
-            params["V_0"], volume, params["grueneisen_0"], params["q_0"]
-        )
+        p = self._parameters(params)
+        d = _debye_functions(temperature, volume)
+        debye_T = self._debye_temperature(p.V_0 / volume, params)
+        C_v = d.molar_heat_capacity_v(temperature, debye_T, p.n)
+        gr_slb = _grueneisen_parameter_slb(p.V_0, volume, p.grueneisen_0, p.q_0)
         K = self.isothermal_bulk_modulus_reuss(pressure, temperature, volume, params)
         alpha = gr_slb * C_v / volume / K
 
         if self.conductive:
-            aKTel = el.aKT(
-                temperature, volume, params["V_0"], params["bel_0"], params["gel"]
-            )
-            alpha += aKTel / K
+            aKTel = el.aKT(temperature, volume, p.V_0, p.bel_0, p.gel)
+            alpha = alpha + aKTel / K
         return alpha
 
     def entropy(self, pressure, temperature, volume, params):
@@ -398,13 +517,13 @@ class SLBBase(eos.EquationOfState):
         Returns the entropy at the pressure and temperature
         of the mineral [J/K/mol]
         """
-        Debye_T = self._debye_temperature(params["V_0"] / volume, params)
-        S = debye.entropy(temperature, Debye_T, params["n"])
+        p = self._parameters(params)
+        d = _debye_functions(temperature, volume)
+        Debye_T = self._debye_temperature(p.V_0 / volume, params)
+        S = d.entropy(temperature, Debye_T, p.n)
 
         if self.conductive:
-            S += el.entropy(
-                temperature, volume, params["V_0"], params["bel_0"], params["gel"]
-            )
+            S = S + el.entropy(temperature, volume, p.V_0, p.bel_0, p.gel)
         return S
 
     def _helmholtz_energy(self, pressure, temperature, volume, params):
@@ -412,33 +531,25 @@ class SLBBase(eos.EquationOfState):
         Returns the Helmholtz free energy at the pressure and temperature
         of the mineral [J/mol]
         """
-        x = params["V_0"] / volume
+        p = self._parameters(params)
+        x = p.V_0 / volume
         f = 1.0 / 2.0 * (pow(x, 2.0 / 3.0) - 1.0)
-        Debye_T = self._debye_temperature(params["V_0"] / volume, params)
+        d = _debye_functions(temperature, volume)
+        Debye_T = self._debye_temperature(x, params)
 
-        F_quasiharmonic = debye.helmholtz_energy(
-            temperature, Debye_T, params["n"]
-        ) - debye.helmholtz_energy(params["T_0"], Debye_T, params["n"])
-
-        b_iikk = 9.0 * params["K_0"]  # EQ 28
-        b_iikkmm = 27.0 * params["K_0"] * (params["Kprime_0"] - 4.0)  # EQ 29
+        F_quasiharmonic = d.helmholtz_energy(
+            temperature, Debye_T, p.n
+        ) - d.helmholtz_energy(p.T_0, Debye_T, p.n)
 
         F = (
             params["F_0"]
-            + 0.5 * b_iikk * f * f * params["V_0"]
-            + (1.0 / 6.0) * params["V_0"] * b_iikkmm * f * f * f
+            + 0.5 * p.b_iikk * f * f * p.V_0
+            + (1.0 / 6.0) * p.V_0 * p.b_iikkmm * f * f * f
             + F_quasiharmonic
         )
 
         if self.conductive:
-            F += el.helmholtz(
-                temperature,
-                volume,
-                params["T_0"],
-                params["V_0"],
-                params["bel_0"],
-                params["gel"],
-            )
+            F = F + el.helmholtz(temperature, volume, p.T_0, p.V_0, p.bel_0, p.gel)
         return F
 
     # Derived properties from here
@@ -454,7 +565,7 @@ class SLBBase(eos.EquationOfState):
         Therefore a direct calculation is more robust.
         """
         if self.conductive:
-            temperature = max(temperature, 1.0e-6)
+            temperature = np.maximum(temperature, 1.0e-6)
             K_T = self.isothermal_bulk_modulus_reuss(
                 pressure, temperature, volume, params
             )
@@ -462,9 +573,8 @@ class SLBBase(eos.EquationOfState):
             C_v = self._molar_heat_capacity_v(pressure, temperature, volume, params)
             return alpha * K_T * volume / C_v
         else:
-            return _grueneisen_parameter_slb(
-                params["V_0"], volume, params["grueneisen_0"], params["q_0"]
-            )
+            p = self._parameters(params)
+            return _grueneisen_parameter_slb(p.V_0, volume, p.grueneisen_0, p.q_0)
 
     def molar_heat_capacity_p(self, pressure, temperature, volume, params):
         """
@@ -532,6 +642,9 @@ class SLBBase(eos.EquationOfState):
         if params["eta_s_0"] < -10.0 or params["eta_s_0"] > 10.0:
             warnings.warn("Unusual value for eta_s_0", stacklevel=2)
 
+        # Store the parameters and derived constants used by the functions
+        self._parameters(params)
+
 
 class SLB3(SLBBase):
     """
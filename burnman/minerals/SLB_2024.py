@@ -1998,6 +1998,9 @@ class sp(Mineral):
 
 
 class SLB3Stishovite(SLB3):
+    # The shear modulus softening below is only defined for scalars
+    vectorized = False
+
     def shear_modulus(self, pressure, temperature, volume, params):
         """
         Returns the shear modulus. :math:`[Pa]`
@@ -27,45 +27,46 @@ Mineral database
 """
 
 
-# Stixrude and Lithgow-Bertelloni
-from . import SLB_2024
-from . import SLB_2022
-from . import SLB_2011
-from . import SLB_2011_ZSB_2013
-from . import SLB_2005
+from ..utils.misc import lazy_submodules
 
-# ab initio
-from . import RS_2014_liquids
-from . import DKS_2013_liquids
-from . import DKS_2013_solids
+# The submodules are only imported when they are first accessed,
+# as importing all of them makes importing burnman slow.
+__all__ = [
+    # Stixrude and Lithgow-Bertelloni
+    "SLB_2024",
+    "SLB_2022",
+    "SLB_2011",
+    "SLB_2011_ZSB_2013",
+    "SLB_2005",
+    # ab initio
+    "RS_2014_liquids",
+    "DKS_2013_liquids",
+    "DKS_2013_solids",
+    # Murakami and coworkers
+    "Murakami_etal_2012",
+    "Murakami_2013",
+    # Matas and coworkers
+    "Matas_etal_2007",
+    # Holland, Powell and coworkers
+    "HP_2011_ds62",
+    "HP_2011_fluids",
+    "HHPH_2013",
+    "JH_2015",
+    "HGP_2018_ds633",
+    "ig50NCKFMASHTOCr",
+    "ig50NCKFMASTOCr",
+    "mb50NCKFMASHTO",
+    "mp50KFMASH",
+    "mp50MnNCKFMASHTO",
+    "mp50NCKFMASHTO",
+    # Kurnosov et al. 2017
+    "KMFBZ_2017",
+    # Irving et al. 2018
+    "ICL_2018",
+    # Other
+    "Sundman_1991",
+    "SE_2015",
+    "other",
+]
 
-# Murakami and coworkers
-from . import Murakami_etal_2012
-from . import Murakami_2013
-
-# Matas and coworkers
-from . import Matas_etal_2007
-
-# Holland, Powell and coworkers
-from . import HP_2011_ds62
-from . import HP_2011_fluids
-from . import HHPH_2013
-from . import JH_2015
-from . import HGP_2018_ds633
-from . import ig50NCKFMASHTOCr
-from . import ig50NCKFMASTOCr
-from . import mb50NCKFMASHTO
-from . import mp50KFMASH
-from . import mp50MnNCKFMASHTO
-from . import mp50NCKFMASHTO
-
-# Kurnosov et al. 2017
-from . import KMFBZ_2017
-
-# Irving et al. 2018
-from . import ICL_2018
-
-# Other
-from . import Sundman_1991
-from . import SE_2015
-from . import other
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
@@ -7,10 +7,32 @@
 import numpy as np
 
 from . import nonlinear_fitting
+from ..classes.mineral import Mineral
+from ..eos.equation_of_state import EquationOfState
 from ..utils.misc import flatten
 from ..utils.math import unit_normalize
 from .nonlinear_fitting import NonLinearModel, nonlinear_least_squares_fit
 
+# Mineral properties for which MineralFit calculates parameter derivatives
+# directly from the equation of state. The property modifiers of a mineral
+# add terms to these properties which do not depend on the parameters.
+_eos_derivative_properties = {
+    "V": "molar_volume",
+    "molar_volume": "molar_volume",
+    "gibbs": "molar_gibbs",
+    "molar_gibbs": "molar_gibbs",
+    "S": "molar_entropy",
+    "molar_entropy": "molar_entropy",
+    "H": "molar_enthalpy",
+    "molar_enthalpy": "molar_enthalpy",
+    "helmholtz": "molar_helmholtz",
+    "molar_helmholtz": "molar_helmholtz",
+    "energy": "molar_internal_energy",
+    "molar_internal_energy": "molar_internal_energy",
+    "C_p": "molar_heat_capacity_p",
+    "molar_heat_capacity_p": "molar_heat_capacity_p",
+}
+
 
 def default_mle_tolerances(material, flags):
     """
@@ -162,6 +184,144 @@ class MineralFit(NonLinearModel):
         n = np.array([-1.0, dPdT, dPdp])
         return unit_normalize(n)
 
+    def function_parameter_derivatives(self, x_array, flags, param_indices=None):
+        """
+        Returns the derivatives of the model function with respect to the
+        fitted parameters at fixed pressure and temperature.
+
+        If the mineral does not override the properties of
+        :class:`burnman.Mineral`, the derivatives of the volume, entropy,
+        heat capacity and thermodynamic potentials are calculated from
+        the functions of the equation of state. The volume at each
+        perturbed set of parameters is then found with
+        :func:`burnman.eos.equation_of_state.EquationOfState.volume_after_parameter_change`,
+        rather than by solving for the volume at each datum. Other
+        derivatives are calculated by finite differences of the
+        model function.
+
+        :param x_array: P-T-property positions at which to evaluate
+            the derivatives.
+        :type x_array: 2D numpy.ndarray
+
+        :param flags: Property names at each position.
+        :type flags: list of str
+
+        :param param_indices: Indices of the parameters with respect to
+            which the derivatives are calculated. Defaults to all parameters.
+        :type param_indices: list of int
+
+        :returns: Derivatives with shape (n_positions, len(param_indices), 3).
+        :rtype: numpy.ndarray
+        """
+        x_array = np.asarray(x_array)
+        flags = np.asarray(flags)
+        param_values = self.get_params()
+        if param_indices is None:
+            param_indices = range(len(param_values))
+        names = np.array([self._eos_derivative_property(flag) for flag in flags])
+        fast = np.array([name is not None for name in names], dtype=bool)
+        derivatives = np.zeros((len(x_array), len(param_indices), 3))
+        if not np.all(fast):
+            derivatives[~fast] = nonlinear_fitting.function_parameter_derivatives(
+                self, x_array[~fast], flags[~fast], param_indices
+            )
+        if not np.any(fast):
+            return derivatives
+
+        method = self.m.method
+        vectorized = getattr(method, "vectorized", False)
+        names = names[fast]
+        P, T = x_array[fast, 0], x_array[fast, 1]
+        # A Newton step from each volume reduces the error of the numerical
+        # volume solve, which would otherwise affect the derivatives
+        if vectorized:
+            V = method.volume(P, T, self.m.params)
+            V = method.volume_after_parameter_change(P, T, V, self.m.params)
+        else:
+            V = np.array(
+                [
+                    method.volume_after_parameter_change(
+                        Pi, Ti, method.volume(Pi, Ti, self.m.params), self.m.params
+                    )
+                    for Pi, Ti in zip(P, T)
+                ]
+            )
+
+        def eos_properties():
+            values = np.empty(len(names))
+            for name in set(names):
+                mask = names == name
+                if vectorized:
+                    values[mask] = self._eos_property(name, P[mask], T[mask], V[mask])
+                else:
+                    values[mask] = [
+                        self._eos_property(name, Pi, Ti, Vi)
+                        for Pi, Ti, Vi in zip(P[mask], T[mask], V[mask])
+                    ]
+            return values
+
+        diag_delta = np.diag(self.delta_params)
+        for j, i in enumerate(param_indices):
+            # set_params may modify the perturbed parameters to satisfy bounds
+            self.set_params(param_values - diag_delta[i])
+            p_0 = self.get_params()[i]
+            f_0 = eos_properties()
+
+            self.set_params(param_values + diag_delta[i])
+            p_1 = self.get_params()[i]
+            f_1 = eos_properties()
+
+            derivatives[fast, j, 2] = (f_1 - f_0) / (p_1 - p_0)
+
+        self.set_params(param_values)
+        return derivatives
+
+    def _eos_derivative_property(self, flag):
+        """
+        Returns the name of the property given by flag if its parameter
+        derivatives can be calculated from the equation of state
+        of the mineral, and None otherwise.
+        """
+        name = _eos_derivative_properties.get(flag)
+        if (
+            name is None
+            or not isinstance(self.m.method, EquationOfState)
+            or type(self.m).set_state is not Mineral.set_state
+        ):
+            return None
+        for prop in ["molar_volume", "molar_gibbs", "molar_entropy", name]:
+            if getattr(type(self.m), prop) is not getattr(Mineral, prop):
+                return None
+        return name
+
+    def _eos_property(self, name, P, T, V):
+        """
+        Returns the part of a mineral property which is calculated by the
+        equation of state, using the current parameters of the mineral.
+        V is the (unmodified) volume of the mineral before the
+        parameters were last changed.
+        """
+        method = self.m.method
+        params = self.m.params
+        V = method.volume_after_parameter_change(P, T, V, params)
+        if name == "molar_volume":
+            return V
+        if name == "molar_heat_capacity_p":
+            return method.molar_heat_capacity_p(P, T, V, params)
+
+        G = method.gibbs_energy(P, T, V, params)
+        if name == "molar_gibbs":
+            return G
+        if name == "molar_helmholtz":
+            return G - P * V
+
+        S = method.entropy(P, T, V, params)
+        if name == "molar_entropy":
+            return S
+        if name == "molar_enthalpy":
+            return G + T * S
+        return G - P * V + T * S
+
 
 def fit_PTp_data(
     mineral,
@@ -177,6 +337,8 @@ def fit_PTp_data(
     param_priors=None,
     param_prior_inv_cov_matrix=None,
     verbose=True,
+    executor=None,
+    perturbed_mle_jacobian=False,
 ):
     """
     Given a mineral of any type, a list of fit parameters
@@ -229,6 +391,17 @@ def fit_PTp_data(
         optimization to screen.
     :type verbose: bool
 
+    :param executor: Executor used to parallelize the calculation
+        of the maximum likelihood estimates of the data and
+        the Jacobian (optional). See
+        :func:`burnman.optimize.nonlinear_fitting.nonlinear_least_squares_fit`.
+    :type executor: concurrent.futures.Executor
+
+    :param perturbed_mle_jacobian: Whether to calculate the Jacobian
+        from perturbed maximum likelihood estimates. See
+        :func:`burnman.optimize.nonlinear_fitting.nonlinear_least_squares_fit`.
+    :type perturbed_mle_jacobian: bool
+
     :returns: Model with optimized parameters.
     :rtype: :class:`burnman.optimize.eos_fitting.MineralFit`
     """
@@ -274,6 +447,8 @@ def fit_PTp_data(
         param_priors=param_priors,
         param_prior_inv_cov_matrix=param_prior_inv_cov_matrix,
         verbose=verbose,
+        executor=executor,
+        perturbed_mle_jacobian=perturbed_mle_jacobian,
     )
 
     if verbose is True and covariances_defined is True:
@@ -320,6 +495,8 @@ def fit_PTV_data(
     param_priors=None,
     param_prior_inv_cov_matrix=None,
     verbose=True,
+    executor=None,
+    perturbed_mle_jacobian=False,
 ):
     """
     A simple alias for the fit_PTp_data for when all the data is volume data
@@ -338,6 +515,8 @@ def fit_PTV_data(
         param_priors=param_priors,
         param_prior_inv_cov_matrix=param_prior_inv_cov_matrix,
         verbose=verbose,
+        executor=executor,
+        perturbed_mle_jacobian=perturbed_mle_jacobian,
     )
 
 
@@ -447,6 +626,8 @@ def fit_VTp_data(
     param_priors=None,
     param_prior_inv_cov_matrix=None,
     verbose=True,
+    executor=None,
+    perturbed_mle_jacobian=False,
 ):
     """
     Given a mineral of any type, a list of fit parameters
@@ -499,6 +680,17 @@ def fit_VTp_data(
         optimization to screen.
     :type verbose: bool
 
+    :param executor: Executor used to parallelize the calculation
+        of the maximum likelihood estimates of the data and
+        the Jacobian (optional). See
+        :func:`burnman.optimize.nonlinear_fitting.nonlinear_least_squares_fit`.
+    :type executor: concurrent.futures.Executor
+
+    :param perturbed_mle_jacobian: Whether to calculate the Jacobian
+        from perturbed maximum likelihood estimates. See
+        :func:`burnman.optimize.nonlinear_fitting.nonlinear_least_squares_fit`.
+    :type perturbed_mle_jacobian: bool
+
     :returns: Model with optimized parameters.
     :rtype: :class:`burnman.optimize.eos_fitting.MineralFitV`
     """
@@ -544,6 +736,8 @@ def fit_VTp_data(
         param_priors=param_priors,
         param_prior_inv_cov_matrix=param_prior_inv_cov_matrix,
         verbose=verbose,
+        executor=executor,
+        perturbed_mle_jacobian=perturbed_mle_jacobian,
     )
 
     if verbose is True and covariances_defined is True:
@@ -590,6 +784,8 @@ def fit_VTP_data(
     param_priors=None,
     param_prior_inv_cov_matrix=None,
     verbose=True,
+    executor=None,
+    perturbed_mle_jacobian=False,
 ):
     """
     A simple alias for the fit_VTp_data for when all the data is pressure data
@@ -608,6 +804,8 @@ def fit_VTP_data(
         param_priors=param_priors,
         param_prior_inv_cov_matrix=param_prior_inv_cov_matrix,
         verbose=verbose,
+        executor=executor,
+        perturbed_mle_jacobian=perturbed_mle_jacobian,
     )
 
 
@@ -789,6 +987,8 @@ def fit_XPTp_data(
     param_priors=None,
     param_prior_inv_cov_matrix=None,
     verbose=True,
+    executor=None,
+    perturbed_mle_jacobian=False,
 ):
     """
     Given a symmetric solution, a list of fit parameters
@@ -849,6 +1049,17 @@ def fit_XPTp_data(
         optimization to screen.
     :type verbose: bool
 
+    :param executor: Executor used to parallelize the calculation
+        of the maximum likelihood estimates of the data and
+        the Jacobian (optional). See
+        :func:`burnman.optimize.nonlinear_fitting.nonlinear_least_squares_fit`.
+    :type executor: concurrent.futures.Executor
+
+    :param perturbed_mle_jacobian: Whether to calculate the Jacobian
+        from perturbed maximum likelihood estimates. See
+        :func:`burnman.optimize.nonlinear_fitting.nonlinear_least_squares_fit`.
+    :type perturbed_mle_jacobian: bool
+
     :returns: Model with optimized parameters.
     :rtype: :class:`burnman.optimize.eos_fitting.SolutionFit`
     """
@@ -894,6 +1105,8 @@ def fit_XPTp_data(
         param_priors=param_priors,
         param_prior_inv_cov_matrix=param_prior_inv_cov_matrix,
         verbose=verbose,
+        executor=executor,
+        perturbed_mle_jacobian=perturbed_mle_jacobian,
     )
 
     if verbose is True and covariances_defined is True:
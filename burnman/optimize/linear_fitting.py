@@ -9,12 +9,19 @@ import numpy as np
 from scipy.linalg import inv, sqrtm
 import warnings
 
-try:
-    cp = importlib.import_module("cvxpy")
-except ImportError as err:
-    print(
-        f"Warning: {err}. " "For full functionality of BurnMan, please install cvxpy."
-    )
+
+def _import_cvxpy():
+    """
+    Returns the cvxpy module. It is only imported when it is
+    first needed, as importing it is slow.
+    """
+    try:
+        return importlib.import_module("cvxpy")
+    except ImportError as err:
+        raise ImportError(
+            f"{err}. Constrained least squares fitting requires cvxpy, "
+            "please install it."
+        ) from err
 
 
 def weighted_constrained_least_squares(
@@ -61,6 +68,7 @@ def weighted_constrained_least_squares(
     m = inv(sqrtm(Cov_b))
     mA = m @ A
     mb = m @ b
+    cp = _import_cvxpy()
     x = cp.Variable(n_vars)
     objective = cp.Minimize(cp.sum_squares(mA @ x - mb))
 
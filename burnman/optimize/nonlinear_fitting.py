@@ -8,6 +8,7 @@ from abc import ABC, abstractmethod
 import numpy as np
 from scipy.stats import t, norm, genextreme
 import copy
+import os
 
 from ..utils.math import unit_normalize
 import matplotlib.pyplot as plt
@@ -66,6 +67,31 @@ class NonLinearModel(ABC):
         """
         raise NotImplementedError("normal() must be implemented by subclass")
 
+    def function_parameter_derivatives(self, x_array, flags, param_indices=None):
+        """
+        Returns the derivatives of the model function with respect to the
+        model parameters, at fixed positions x. By default, these are
+        calculated by central differences of the model function, using
+        the parameter perturbations given by delta_params. Models which
+        can calculate the derivatives more efficiently should override
+        this method.
+
+        :param x_array: Positions at which to evaluate the derivatives.
+        :type x_array: 2D numpy.ndarray
+
+        :param flags: Flags passed to the model function at each position.
+        :type flags: list
+
+        :param param_indices: Indices of the parameters with respect to
+            which the derivatives are calculated. Defaults to all parameters.
+        :type param_indices: list of int
+
+        :returns: Derivatives of function(x_array[i], flags[i])[k] with
+            respect to parameter j, with shape (n_positions, n_params, n_dims).
+        :rtype: numpy.ndarray
+        """
+        return function_parameter_derivatives(self, x_array, flags, param_indices)
+
     def validate(self):
         """
         Ensure that all required model attributes are present before fitting.
@@ -142,7 +168,7 @@ def mle_estimate(model, x, x_m, cov, flag):
     return x_mle, d, var_n
 
 
-def find_mle(model):
+def find_mle(model, indices=None, executor=None):
     """
     Find the maximum likelihood point for
     each datum given the current model parameters.
@@ -152,60 +178,247 @@ def find_mle(model):
     :param model: Model object with required attributes.
     :type model: FittableModel
 
+    :param indices: Indices of the data for which to find the
+        maximum likelihood points. Defaults to all the data.
+    :type indices: list of int
+
+    :param executor: If given, the data are split into chunks which
+        are processed in parallel by this executor, each using its
+        own deep copy of the model.
+    :type executor: concurrent.futures.Executor
+
     :returns: MLE data positions, weighted residuals, and weights.
     :rtype: tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray)
     """
-    x_mle_arr = np.empty_like(model.data)
-    residual_arr = np.empty(len(model.data))
-    var_arr = np.empty(len(model.data))
+    if indices is None:
+        indices = np.arange(len(model.data))
+
+    if executor is not None:
+        chunks = _split_indices(indices)
+        results = _map_with_model_copies(executor, find_mle, model, chunks)
+        return tuple(np.concatenate(r) for r in zip(*results))
+
+    x_mle_arr = np.empty((len(indices), len(model.data[0])))
+    residual_arr = np.empty(len(indices))
+    var_arr = np.empty(len(indices))
 
     # For each datum, iterate over the MLE estimates until the
     # global minimum is found.
-    for i, (x, cov, flag) in enumerate(
-        zip(model.data, model.data_covariances, model.flags)
-    ):
-        x_mle_arr[i] = model.function(x, flag)
-        x_mle_est, residual_arr[i], var_arr[i] = mle_estimate(
-            model, x, x_mle_arr[i], cov, flag
+    for j, i in enumerate(indices):
+        x, cov, flag = model.data[i], model.data_covariances[i], model.flags[i]
+        x_mle_arr[j] = model.function(x, flag)
+        x_mle_est, residual_arr[j], var_arr[j] = mle_estimate(
+            model, x, x_mle_arr[j], cov, flag
         )
-        delta_x = x_mle_arr[i] - x
+        delta_x = x_mle_arr[j] - x
         while np.linalg.norm(delta_x) > model.mle_tolerances[i]:
-            x_mle_est, residual_arr[i], var_arr[i] = mle_estimate(
-                model, x, x_mle_arr[i], cov, flag
+            x_mle_est, residual_arr[j], var_arr[j] = mle_estimate(
+                model, x, x_mle_arr[j], cov, flag
             )
-            x_mle_arr[i] = model.function(x_mle_est, flag)
-            delta_x = x_mle_arr[i] - x_mle_est
+            x_mle_arr[j] = model.function(x_mle_est, flag)
+            delta_x = x_mle_arr[j] - x_mle_est
     return x_mle_arr, residual_arr / np.sqrt(var_arr), 1.0 / var_arr
 
 
-def calculate_jacobian(model):
+def _split_indices(indices):
+    """
+    Splits a list of indices into one contiguous chunk per CPU.
+    """
+    n_chunks = min(len(indices), os.cpu_count() or 1)
+    return [chunk for chunk in np.array_split(indices, n_chunks) if len(chunk) > 0]
+
+
+def _map_with_model_copies(executor, fn, model, chunks, *args):
+    """
+    Calls fn(model_copy, chunk, *args) for each chunk using the executor,
+    where each call is passed its own deep copy of the model,
+    and returns the results in the order of the chunks.
+    """
+    futures = [
+        executor.submit(fn, copy.deepcopy(model), chunk, *args) for chunk in chunks
+    ]
+    return [future.result() for future in futures]
+
+
+def function_parameter_derivatives(model, x_array, flags, param_indices=None):
     """
-    Compute the Jacobian matrix of weighted residuals with respect
-    to model parameters using central finite differences.
+    Compute the derivatives of the model function with respect to the
+    model parameters at fixed positions x, using central finite differences.
 
     :param model: Model object.
     :type model: FittableModel
 
-    :modifies: model.jacobian — Populated with partial derivatives.
+    :param x_array: Positions at which to evaluate the derivatives.
+    :type x_array: 2D numpy.ndarray
+
+    :param flags: Flags passed to the model function at each position.
+    :type flags: list
+
+    :param param_indices: Indices of the parameters with respect to
+        which the derivatives are calculated. Defaults to all parameters.
+    :type param_indices: list of int
+
+    :returns: Derivatives of model.function(x_array[i], flags[i])[k] with
+        respect to parameter param_indices[j], with shape
+        (n_positions, len(param_indices), n_dims).
+    :rtype: numpy.ndarray
     """
-    n_data = len(model.data)
-    n_params = len(model.get_params())
-    model.jacobian = np.empty((n_data, n_params))
-    diag_delta = np.diag(model.delta_params)
     param_values = model.get_params()
+    if param_indices is None:
+        param_indices = range(len(param_values))
+    diag_delta = np.diag(model.delta_params)
+    derivatives = np.empty((len(x_array), len(param_indices), len(x_array[0])))
 
-    # Get d (weighted residual) / d parameter by numerical differences
-    for i in range(n_params):
+    for j, i in enumerate(param_indices):
+        # set_params may modify the perturbed parameters to satisfy bounds
         model.set_params(param_values - diag_delta[i])
-        _, res_0, _ = find_mle(model)
+        p_0 = model.get_params()[i]
+        f_0 = np.array([model.function(x, flag) for x, flag in zip(x_array, flags)])
 
         model.set_params(param_values + diag_delta[i])
-        _, res_1, _ = find_mle(model)
+        p_1 = model.get_params()[i]
+        f_1 = np.array([model.function(x, flag) for x, flag in zip(x_array, flags)])
 
-        model.jacobian[:, i] = (res_1 - res_0) / (2.0 * diag_delta[i][i])
+        derivatives[:, j, :] = (f_1 - f_0) / (p_1 - p_0)
 
     # Reset parameter values
     model.set_params(param_values)
+    return derivatives
+
+
+def calculate_jacobian(model, executor=None):
+    """
+    Compute the maximum likelihood estimates of the data positions,
+    the weighted residuals and their Jacobian with respect to the
+    model parameters.
+
+    The weighted residual of each datum is the distance from the datum
+    to the model surface along the normal n at the maximum likelihood
+    estimate, divided by the standard deviation of the datum along n.
+    To first order, changing a parameter only changes the weighted
+    residual by moving the model surface along n, so that
+    d(weighted residual)/d(parameter) = n.(df/d(parameter)) / sigma_n,
+    where f is the model function evaluated at the maximum likelihood
+    estimate. The derivatives of f are provided by
+    model.function_parameter_derivatives if the model has this method,
+    and are otherwise calculated by central finite differences of f.
+    In either case, the maximum likelihood estimates do not need to be
+    recalculated for each perturbation of the parameters.
+
+    If an executor is given, the maximum likelihood estimates of chunks
+    of the data and the derivatives with respect to each parameter
+    are calculated in parallel, each task using its own deep copy of
+    the model. The results are identical to those of the serial
+    calculation.
+
+    :param model: Model object.
+    :type model: FittableModel
+
+    :param executor: Executor used to parallelize the calculation
+        (optional).
+    :type executor: concurrent.futures.Executor
+
+    :modifies: model.jacobian — Populated with partial derivatives.
+        model.data_mle, model.weighted_residuals, model.weights — As
+        returned by :func:`find_mle`.
+    """
+    model.data_mle, model.weighted_residuals, model.weights = find_mle(
+        model, executor=executor
+    )
+
+    # The normals are not normalised, for consistency with mle_estimate
+    normals = np.array(
+        [model.normal(x, flag) for x, flag in zip(model.data_mle, model.flags)]
+    )
+    if executor is None:
+        derivatives = _parameter_derivatives(model, None, model.data_mle, model.flags)
+    else:
+        chunks = [[i] for i in range(len(model.get_params()))]
+        derivatives = np.concatenate(
+            _map_with_model_copies(
+                executor,
+                _parameter_derivatives,
+                model,
+                chunks,
+                model.data_mle,
+                model.flags,
+            ),
+            axis=1,
+        )
+
+    model.jacobian = (
+        np.einsum("ijk, ik->ij", derivatives, normals)
+        * np.sqrt(model.weights)[:, np.newaxis]
+    )
+
+
+def calculate_perturbed_mle_jacobian(model, executor=None):
+    """
+    Compute the maximum likelihood estimates of the data positions,
+    the weighted residuals and their Jacobian with respect to the
+    model parameters, where the Jacobian is calculated by central
+    finite differences of the weighted residuals. The maximum
+    likelihood estimates are recalculated for each perturbation of the
+    parameters, so this is slower than :func:`calculate_jacobian`,
+    but the Jacobian is consistent with the weighted residuals
+    to within the precision of the finite differences.
+
+    :param model: Model object.
+    :type model: FittableModel
+
+    :param executor: Executor used to parallelize the calculation
+        (optional).
+    :type executor: concurrent.futures.Executor
+
+    :modifies: model.jacobian — Populated with partial derivatives.
+        model.data_mle, model.weighted_residuals, model.weights — As
+        returned by :func:`find_mle`.
+    """
+    model.data_mle, model.weighted_residuals, model.weights = find_mle(
+        model, executor=executor
+    )
+    if executor is None:
+        model.jacobian = _perturbed_mle_derivatives(model, None)
+    else:
+        chunks = [[i] for i in range(len(model.get_params()))]
+        model.jacobian = np.concatenate(
+            _map_with_model_copies(executor, _perturbed_mle_derivatives, model, chunks),
+            axis=1,
+        )
+
+
+def _perturbed_mle_derivatives(model, param_indices):
+    """
+    Returns the derivatives of the weighted residuals with respect to the
+    parameters given by param_indices, by central finite differences.
+    """
+    param_values = model.get_params()
+    if param_indices is None:
+        param_indices = range(len(param_values))
+    derivatives = np.empty((len(model.data), len(param_indices)))
+    for j, i in enumerate(param_indices):
+        delta = np.zeros(len(param_values))
+        delta[i] = model.delta_params[i]
+        model.set_params(param_values - delta)
+        _, res_0, _ = find_mle(model)
+        model.set_params(param_values + delta)
+        _, res_1, _ = find_mle(model)
+        derivatives[:, j] = (res_1 - res_0) / (2.0 * delta[i])
+
+    # Reset parameter values
+    model.set_params(param_values)
+    return derivatives
+
+
+def _parameter_derivatives(model, param_indices, x_array, flags):
+    """
+    Returns the derivatives of the model function with respect to the
+    parameters given by param_indices, using
+    model.function_parameter_derivatives if the model has this method.
+    """
+    if hasattr(model, "function_parameter_derivatives"):
+        return model.function_parameter_derivatives(x_array, flags, param_indices)
+    return function_parameter_derivatives(model, x_array, flags, param_indices)
 
 
 def nonlinear_least_squares_fit(
@@ -216,6 +429,8 @@ def nonlinear_least_squares_fit(
     param_priors=None,
     param_prior_inv_cov_matrix=None,
     verbose=False,
+    executor=None,
+    perturbed_mle_jacobian=False,
 ):
     """
     Function to compute the "best-fit" parameters for a model
@@ -246,6 +461,24 @@ def nonlinear_least_squares_fit(
     :param verbose: If True, print iteration status.
     :type verbose: bool
 
+    :param executor: If given, the maximum likelihood estimates of the data
+        and the columns of the Jacobian are calculated in parallel
+        by this executor (for example, a
+        concurrent.futures.ProcessPoolExecutor). Each task is given
+        its own deep copy of the model, so the model must be picklable
+        if a process pool is used. The results are identical to
+        those of the serial calculation.
+    :type executor: concurrent.futures.Executor
+
+    :param perturbed_mle_jacobian: If True, the Jacobian is calculated by
+        :func:`calculate_perturbed_mle_jacobian`, rather than
+        :func:`calculate_jacobian`. This is several times slower,
+        but the Jacobian then includes the effect of the MLE tolerances
+        on the weighted residuals, which can matter when these
+        tolerances are large compared with the changes in the
+        residuals close to the optimum.
+    :type perturbed_mle_jacobian: bool
+
     :modifies: model — Sets optimized parameters, covariance matrix, weighted residuals, Jacobian, and noise estimates.
 
     .. note:: The object passed as model must have the following attributes:
@@ -293,15 +526,18 @@ def nonlinear_least_squares_fit(
         assert param_prior_inv_cov_matrix.shape == (n_params, n_params)
         with_param_priors = True
 
+    if perturbed_mle_jacobian:
+        jacobian = calculate_perturbed_mle_jacobian
+    else:
+        jacobian = calculate_jacobian
+
     def _update_beta(lmbda):
         # Performs a single Levenberg-Marquardt iteration
-        # Step 1: Compute Jacobian matrix of weighted residuals
+        # Step 1: Compute MLE projections and residuals given the current
+        # parameters (does not update parameter values), and the Jacobian
+        # matrix of weighted residuals
         # Note that if lmbda = 0, this is a simple Gauss-Newton iteration
-        calculate_jacobian(model)
-
-        # Step 2: Compute MLE projections and residuals given the current
-        # parameters (does not update parameter values)
-        model.data_mle, model.weighted_residuals, model.weights = find_mle(model)
+        jacobian(model, executor)
 
         # Step 2: Build data terms
         current_params = model.get_params()
@@ -15,6 +15,9 @@ class Solution:
         - F: Function evaluation at the solution, F(x).
         - F_norm: Euclidean (L2) norm of F(x).
         - J: Jacobian matrix at the solution, J(x).
+        - n_J_saved: Number of iterations which reused the Jacobian
+            (and its LU factorization) from the previous iteration,
+            rather than evaluating J(x).
         - code: Exit status code (0=success, >0=failure).
         - text: Description of the exit status.
         - success: Boolean indicating whether the solver converged.
@@ -33,12 +36,14 @@ class Solution:
         text=None,
         success=False,
         iterates=None,
+        n_J_saved=0,
     ):
         self.x = x
         self.n_it = n_it
         self.F = F
         self.F_norm = F_norm
         self.J = J
+        self.n_J_saved = n_J_saved
         self.code = code
         self.text = text
         self.success = success
@@ -100,6 +105,15 @@ class DampedNewtonSolver:
     the method of Lagrangian multipliers, minimizing the L2-norm of F(x_{i+1})
     subject to the violated constraints.
 
+    If reuse_jacobian is True, the solver runs in a quasi-Newton
+    (Shamanskii, or chord) mode: the Jacobian and its LU factorization
+    are reused from one iteration to the next as long as the previous
+    iteration took an undamped step and the simplified Newton steps
+    contracted by at least a factor of max_contraction. A step computed
+    with a reused Jacobian which would need damping is discarded, and
+    recalculated with a new Jacobian. The number of Jacobian evaluations
+    saved is stored in the n_J_saved attribute of the solution.
+
     Successful termination of the solver requires meeting all of the following
     criteria:
       - all(np.abs(dx (simplified Newton step)) < tol)
@@ -129,6 +143,8 @@ class DampedNewtonSolver:
         cond_lu_thresh: float = 1e12,
         cond_lstsq_thresh: float = 1e15,
         constraint_thresh: float = 2 * np.finfo(float).eps,
+        reuse_jacobian: bool = False,
+        max_contraction: float = 0.25,
     ):
         """
         Initialize the solver instance.
@@ -188,6 +204,16 @@ class DampedNewtonSolver:
         :param constraint_thresh: Threshold for considering a constraint
             "active" when determining step feasibility, defaults to 2*eps.
         :type constraint_thresh: float, optional
+
+        :param reuse_jacobian: If True, reuse the Jacobian and its
+            LU factorization from the previous iteration while the
+            iterations converge quickly, defaults to False.
+        :type reuse_jacobian: bool, optional
+
+        :param max_contraction: Maximum ratio of the norms of the
+            simplified Newton step and the Newton step of the previous
+            iteration for which the Jacobian is reused, defaults to 0.25.
+        :type max_contraction: float, optional
         """
         self.F = F
         self.J = J
@@ -202,6 +228,8 @@ class DampedNewtonSolver:
         self.regularization = regularization
         self.cond_lu_thresh = cond_lu_thresh
         self.cond_lstsq_thresh = cond_lstsq_thresh
+        self.reuse_jacobian = reuse_jacobian
+        self.max_contraction = max_contraction
         self.eps = 2.0 * np.finfo(float).eps
         self.max_condition_number = 1.0 / np.finfo(float).eps
 
@@ -704,6 +732,7 @@ class DampedNewtonSolver:
         sol.n_it = 0
         n_constraints = len(self._constraints(sol.x))
         minimum_lmda = converged = persistent_bound_violation = False
+        reuse_J = J_reused = False
 
         while (
             sol.n_it < self.max_iterations
@@ -711,14 +740,17 @@ class DampedNewtonSolver:
             and not persistent_bound_violation
             and not converged
         ):
-            sol.J = self.J(sol.x)
-            condition_number = np.linalg.cond(sol.J)
+            lmda_prev = lmda
+            J_reused = reuse_J
+            if not reuse_J:
+                sol.J = self.J(sol.x)
+                condition_number = np.linalg.cond(sol.J)
 
-            # Regularize ill-conditioned Jacobian
-            if condition_number > self.cond_lu_thresh:
-                sol.J = sol.J + np.eye(sol.J.shape[0]) * self.regularization
+                # Regularize ill-conditioned Jacobian
+                if condition_number > self.cond_lu_thresh:
+                    sol.J = sol.J + np.eye(sol.J.shape[0]) * self.regularization
 
-            luJ = lu_factor(sol.J)
+                luJ = lu_factor(sol.J)
             dx = lu_solve(luJ, -sol.F)
             dx_norm = np.linalg.norm(dx, ord=2)
 
@@ -741,6 +773,12 @@ class DampedNewtonSolver:
                     )
                 )
 
+            # In quasi-Newton mode, steps which are damped by the constraints
+            # are recalculated using a new Jacobian
+            if reuse_J and np.abs(lmda - lmda_bounds[1]) > self.eps:
+                lmda, reuse_J = lmda_prev, False
+                continue
+
             if lmda < self.eps:
                 lmda, x_j, dx, persistent_bound_violation = (
                     self._lagrangian_walk_along_constraints(
@@ -758,6 +796,17 @@ class DampedNewtonSolver:
             if converged and not all(np.abs(F_j) < self.F_tol):
                 converged = False
 
+            # In quasi-Newton mode, if the simplified Newton step
+            # is not smaller than the Newton step, the iteration is
+            # repeated using a new Jacobian. F is first reevaluated at x,
+            # because J may depend on state set during the evaluation of F.
+            if reuse_J:
+                if not converged and dxbar_j_norm > dx_norm:
+                    sol.F = self.F(sol.x)
+                    lmda, reuse_J = lmda_prev, False
+                    continue
+                sol.n_J_saved += 1
+
             require_posteriori_loop = not converged
 
             loop_vars = self._posteriori_loop(
@@ -779,10 +828,25 @@ class DampedNewtonSolver:
 
             sol.x, sol.F, dxbar, dxprev, lmda, minimum_lmda, converged = loop_vars
 
+            # In quasi-Newton mode, keep the current factorization
+            # only if the last step was undamped and contracted quickly
+            reuse_J = (
+                self.reuse_jacobian
+                and np.abs(lmda - lmda_bounds[1]) < self.eps
+                and np.linalg.norm(dxbar, ord=2) < self.max_contraction * dx_norm
+            )
+
             sol.n_it += 1
             if self.store_iterates:
                 sol.iterates.append(sol.x, sol.F, lmda)
 
+        # If the last iteration reused the Jacobian, J and its condition
+        # number belong to an earlier iterate, so they are recalculated
+        if J_reused and condition_number >= self.max_condition_number:
+            sol.F = self.F(sol.x)
+            sol.J = self.J(sol.x)
+            condition_number = np.linalg.cond(sol.J)
+
         # Final adjustment for constraints
         # and recompute F, J, condition number without regularization
         if condition_number < self.max_condition_number:
@@ -819,6 +883,7 @@ def damped_newton_solve(
     lambda_bounds=lambda dx, x: (1.0e-8, 1.0),
     linear_constraints=(0.0, np.array([-1.0])),
     store_iterates: bool = False,
+    reuse_jacobian: bool = False,
 ) -> SimpleNamespace:
     """
     Helper function to run the DampedNewtonSolver.
@@ -854,6 +919,10 @@ def damped_newton_solve(
         evaluations, and lambda values in the solution object, defaults to False.
     :type store_iterates: bool, optional
 
+    :param reuse_jacobian: If True, reuse the Jacobian and its LU
+        factorization across iterations while the iterations converge
+        quickly (see :class:`DampedNewtonSolver`), defaults to False.
+    :type reuse_jacobian: bool, optional
 
     :rtype: SimpleNamespace
     """
@@ -867,5 +936,6 @@ def damped_newton_solve(
         lambda_bounds,
         linear_constraints,
         store_iterates,
+        reuse_jacobian=reuse_jacobian,
     )
     return solver.solve()
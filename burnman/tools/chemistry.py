@@ -9,7 +9,6 @@
 import numpy as np
 from scipy.optimize import fsolve
 import itertools
-from sympy import Rational
 
 from .. import constants
 
@@ -274,6 +273,8 @@ def reactions_from_stoichiometric_matrix(stoichiometric_matrix):
         compound j in reaction i.
     :rtype: 2D numpy array
     """
+    from sympy import Rational
+
     n_components = stoichiometric_matrix.shape[1]
 
     equalities = np.concatenate(
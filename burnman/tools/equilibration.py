@@ -8,6 +8,8 @@ import numpy as np
 from itertools import product
 from scipy.linalg import lu_factor, lu_solve
 from collections import namedtuple
+from types import SimpleNamespace
+from concurrent.futures import ProcessPoolExecutor
 
 from ..optimize.nonlinear_solvers import damped_newton_solve
 from ..classes.solution import Solution
@@ -630,6 +632,31 @@ def phase_composition_constraints(phase, assemblage, constraints, prm):
     return x_constraints
 
 
+def bulk_composition_vector(assemblage, composition):
+    """
+    Returns the amounts of each of the elements of the assemblage
+    in a bulk composition, checking that the bulk composition lies
+    within the compositional space of the assemblage.
+
+    :param assemblage: The assemblage to be equilibrated.
+    :type assemblage: :class:`burnman.Composite`
+
+    :param composition: The bulk composition.
+    :type composition: dict
+
+    :returns: The amounts of each element in assemblage.elements.
+    :rtype: numpy.array
+    """
+    vector = np.array([composition[e] for e in assemblage.elements])
+    if assemblage.compositional_null_basis.shape[0] != 0:
+        if np.abs(assemblage.compositional_null_basis.dot(vector)[0]) > 1.0e-12:
+            raise Exception(
+                "The bulk composition is not within the "
+                "compositional space of the assemblage"
+            )
+    return vector
+
+
 def get_equilibration_parameters(assemblage, composition, free_compositional_vectors):
     """
     Builds a named tuple containing the parameter names and
@@ -694,9 +721,7 @@ def get_equilibration_parameters(assemblage, composition, free_compositional_vec
     ]
 
     # Find the bulk composition vector
-    prm.bulk_composition_vector = np.array(
-        [composition[e] for e in assemblage.elements]
-    )
+    prm.bulk_composition_vector = bulk_composition_vector(assemblage, composition)
 
     if n_free_compositional_vectors > 0:
         prm.free_compositional_vectors = np.array(
@@ -715,18 +740,6 @@ def get_equilibration_parameters(assemblage, composition, free_compositional_vec
     else:
         prm.free_compositional_vectors = np.empty((0, len(assemblage.elements)))
 
-    if assemblage.compositional_null_basis.shape[0] != 0:
-        if (
-            np.abs(
-                assemblage.compositional_null_basis.dot(prm.bulk_composition_vector)[0]
-            )
-            > 1.0e-12
-        ):
-            raise Exception(
-                "The bulk composition is not within the "
-                "compositional space of the assemblage"
-            )
-
     prm.reduced_composition_vector = prm.bulk_composition_vector[
         assemblage.independent_element_indices
     ]
@@ -849,6 +862,202 @@ def process_eq_constraints(equality_constraints, assemblage, prm):
     return eq_constraint_lists
 
 
+def _equilibrate_problems(
+    assemblage,
+    problems,
+    eq_constraint_lists,
+    parameters,
+    prm,
+    n_atoms,
+    tol,
+    store_iterates,
+    store_assemblage,
+    max_iterations,
+    verbose,
+    solved=None,
+    reuse_jacobian=False,
+):
+    """
+    Solves a sequence of equilibrium problems, using the solution
+    (and Jacobian) of each problem to construct a starting guess
+    for the next. This is the serial core of :func:`equilibrate`.
+
+    :param problems: The indices of the equality constraints
+        for each problem, in the order in which they are solved.
+    :type problems: list of tuples
+
+    :param solved: Solutions to problems that have already been solved,
+        keyed by problem indices. These problems are not solved again,
+        but their solutions are used to construct starting guesses
+        for the problems that follow them.
+    :type solved: dict or None
+
+    :param reuse_jacobian: Passed to
+        :func:`burnman.optimize.nonlinear_solvers.damped_newton_solve`.
+    :type reuse_jacobian: bool
+
+    :returns: A dictionary of solution objects, keyed by problem indices.
+    :rtype: dict
+    """
+    nc = [len(eq_constraint_list) for eq_constraint_list in eq_constraint_lists]
+    sols = {}
+    n_problems = len(problems)
+    for i_problem, i_c in enumerate(problems):
+        if solved is not None and i_c in solved:
+            sol = solved[i_c]
+        else:
+            if verbose:
+                string = "Processing solution"
+                for i in range(len(i_c)):
+                    string += " {0}/{1}".format(i_c[i] + 1, nc[i])
+
+                print(string + ":")
+
+            equality_constraints = [
+                eq_constraint_lists[i][i_c[i]] for i in range(len(nc))
+            ]
+
+            F_tol = default_F_tolerances(assemblage, equality_constraints, n_atoms)
+
+            # Set the initial fractions and compositions
+            # of the phases in the assemblage:
+            sol = damped_newton_solve(
+                F=lambda x: F(
+                    x,
+                    assemblage,
+                    equality_constraints,
+                    prm.reduced_composition_vector,
+                    prm.reduced_free_composition_vectors,
+                ),
+                J=lambda x: jacobian(
+                    x,
+                    assemblage,
+                    equality_constraints,
+                    prm.reduced_free_composition_vectors,
+                ),
+                lambda_bounds=lambda dx, x: lambda_bounds(
+                    dx, x, assemblage.endmembers_per_phase
+                ),
+                guess=parameters,
+                linear_constraints=(prm.constraint_matrix, prm.constraint_vector),
+                tol=tol,
+                F_tol=F_tol,
+                store_iterates=store_iterates,
+                max_iterations=max_iterations,
+                reuse_jacobian=reuse_jacobian,
+            )
+
+            if sol.success and len(assemblage.reaction_affinities) > 0.0:
+                maxres = np.max(np.abs(assemblage.reaction_affinities)) + 1.0e-5
+                assemblage.equilibrium_tolerance = maxres
+
+            if store_assemblage:
+                sol.assemblage = assemblage.copy()
+                if sol.success and len(assemblage.reaction_affinities) > 0.0:
+                    sol.assemblage.equilibrium_tolerance = maxres
+
+            if verbose:
+                print(sol.text)
+
+        sols[i_c] = sol
+
+        # Next, we use the solution values and Jacobian
+        # to provide a starting guess for the next problem.
+        # First, we find the equality constraints for the next problem
+        if i_problem < n_problems - 1:
+            next_i_c = problems[i_problem + 1]
+
+            next_equality_constraints = [
+                eq_constraint_lists[i][next_i_c[i]] for i in range(len(nc))
+            ]
+
+            # We use the nearest solutions as potential starting points
+            # to make the next guess
+            # (neighbours that have not been solved in this sequence
+            # are ignored)
+            prev_sols = []
+            for i in range(len(nc)):
+                if next_i_c[i] != 0:
+                    prev_i_c = np.copy(next_i_c)
+                    prev_i_c[i] -= 1
+                    if tuple(prev_i_c) in sols:
+                        prev_sols.append(sols[tuple(prev_i_c)])
+
+            # If none of the neighbours have been solved
+            # (only possible if the problems are not in grid order),
+            # use the solution to the current problem instead
+            if len(prev_sols) == 0:
+                prev_sols.append(sol)
+
+            updated_params = False
+            for s in prev_sols:
+                if s.success and not updated_params:
+                    # next guess based on a Newton step
+                    # using the old solution vector and Jacobian
+                    # with the new constraints.
+                    dF = F(
+                        s.x,
+                        assemblage,
+                        next_equality_constraints,
+                        prm.reduced_composition_vector,
+                        prm.reduced_free_composition_vectors,
+                    )
+                    luJ = lu_factor(s.J)
+                    new_parameters = s.x + lu_solve(luJ, -dF)
+                    c = (
+                        prm.constraint_matrix.dot(new_parameters)
+                        + prm.constraint_vector
+                    )
+                    if all(c <= 0.0):  # accept new guess
+                        parameters = new_parameters
+                    else:  # use the parameters from this step
+                        parameters = s.x
+                        exhausted_phases = [
+                            assemblage.phases[phase_idx].name
+                            for phase_idx, v in enumerate(
+                                new_parameters[prm.phase_amount_indices]
+                            )
+                            if v < 0.0
+                        ]
+                        if len(exhausted_phases) > 0 and verbose:
+                            print(
+                                "A phase might be exhausted before the "
+                                f"next step: {exhausted_phases}"
+                            )
+
+                    updated_params = True
+
+    return sols
+
+
+def _worker_parameters(prm):
+    """
+    The parameter object returned by :func:`get_equilibration_parameters`
+    is a dynamically created class that cannot be pickled, so workers are
+    passed a namespace containing the attributes that they need.
+    """
+    return SimpleNamespace(
+        **{
+            k: getattr(prm, k)
+            for k in [
+                "reduced_composition_vector",
+                "reduced_free_composition_vectors",
+                "constraint_matrix",
+                "constraint_vector",
+                "phase_amount_indices",
+            ]
+        }
+    )
+
+
+def _equilibrate_problems_from_tuple(args):
+    """
+    Calls :func:`_equilibrate_problems` with a tuple of arguments.
+    Used to map strips of problems onto the workers of an executor.
+    """
+    return _equilibrate_problems(*args)
+
+
 def equilibrate(
     composition,
     assemblage,
@@ -859,6 +1068,9 @@ def equilibrate(
     store_assemblage=True,
     max_iterations=100.0,
     verbose=False,
+    n_workers=1,
+    executor=None,
+    reuse_jacobian=False,
 ):
     """
     A function that finds the thermodynamic equilibrium state of an
@@ -950,6 +1162,29 @@ def equilibrate(
         equilibration.
     :type verbose: bool
 
+    :param n_workers: The number of strips into which the grid of problems
+        is split. Each strip is a contiguous chunk of the problems
+        (in the order in which they are solved serially) and is solved
+        with warm starts by a separate worker process. The first problems
+        in the strips are solved serially beforehand, so that each strip
+        starts from a converged solution. Output from the worker processes
+        is suppressed, even if verbose is True. Defaults to 1 (serial solve).
+    :type n_workers: int
+
+    :param executor: An executor (for example a
+        :class:`concurrent.futures.ProcessPoolExecutor`) used to solve the
+        strips. If None (default) and n_workers > 1, a ProcessPoolExecutor
+        with n_workers processes is created for the duration of the call.
+    :type executor: :class:`concurrent.futures.Executor`
+
+    :param reuse_jacobian: If True, the nonlinear solver reuses the
+        Jacobian and its LU factorization across iterations while the
+        iterations converge quickly, reducing the number of
+        (expensive) Jacobian evaluations. The number of evaluations
+        saved is given by the n_J_saved attribute of each solution object.
+        See :class:`burnman.optimize.nonlinear_solvers.DampedNewtonSolver`.
+    :type reuse_jacobian: bool
+
     :returns: Solver solution object (or a list, or a 2D list of solution objects)
         created by :func:`burnman.optimize.nonlinear_solvers.damped_newton_solve`,
         and a namedtuple object created by
@@ -961,6 +1196,9 @@ def equilibrate(
         sols[0][1].x[0] or sols[0][1].assemblage.pressure to get the pressure.
     :rtype: tuple
     """
+    if n_workers < 1:
+        raise ValueError(f"n_workers must be at least 1 (currently {n_workers}).")
+
     for ph in assemblage.phases:
         if isinstance(ph, Solution) and not hasattr(ph, "molar_fractions"):
             raise Exception(
@@ -1032,124 +1270,390 @@ def equilibrate(
 
     # Solve the system of equations, loop over input parameters
     sol_array = np.empty(shape=tuple(nc), dtype="object")
-
-    # Loop over problems
     problems = list(product(*[list(range(nc[i])) for i in range(len(nc))]))
-    n_problems = len(problems)
-    for i_problem, i_c in enumerate(problems):
-        if verbose:
-            string = "Processing solution"
-            for i in range(len(i_c)):
-                string += " {0}/{1}".format(i_c[i] + 1, nc[i])
+    args = (
+        eq_constraint_lists,
+        parameters,
+        prm,
+        n_atoms,
+        tol,
+        store_iterates,
+        store_assemblage,
+        max_iterations,
+        verbose,
+    )
+
+    if n_workers == 1 and executor is None:
+        sols = _equilibrate_problems(
+            assemblage, problems, *args, reuse_jacobian=reuse_jacobian
+        )
+    else:
+        # Split the problems into contiguous strips, each of which
+        # is solved serially (with warm starts) by one worker.
+        strips = [
+            [problems[i] for i in indices]
+            for indices in np.array_split(np.arange(len(problems)), n_workers)
+            if len(indices) > 0
+        ]
 
-            print(string + ":")
+        # The first problems in the strips are solved serially,
+        # each starting from the solution to the previous one,
+        # so that every strip starts from a converged solution.
+        starts = [strip[0] for strip in strips]
+        start_sols = _equilibrate_problems(
+            assemblage, starts, *args, reuse_jacobian=reuse_jacobian
+        )
 
-        equality_constraints = [eq_constraint_lists[i][i_c[i]] for i in range(len(nc))]
+        # Each strip works on its own copy of the assemblage.
+        worker_prm = _worker_parameters(prm)
+        # Output from the workers would be interleaved, so the
+        # strips are always solved quietly.
+        args = args[:2] + (worker_prm,) + args[3:-1] + (False,)
+        tasks = [
+            (
+                assemblage.copy(),
+                strip,
+                *args,
+                {strip[0]: start_sols[strip[0]]},
+                reuse_jacobian,
+            )
+            for strip in strips
+        ]
+        if executor is None:
+            with ProcessPoolExecutor(max_workers=n_workers) as pool:
+                strip_sols = list(pool.map(_equilibrate_problems_from_tuple, tasks))
+        else:
+            strip_sols = list(executor.map(_equilibrate_problems_from_tuple, tasks))
+
+        sols = {}
+        for s in strip_sols:
+            sols.update(s)
+
+        # Leave the assemblage in the state of the last problem,
+        # as in the serial case
+        last_sol = sols[problems[-1]]
+        set_compositions_and_state_from_parameters(assemblage, last_sol.x)
+        if hasattr(last_sol, "assemblage") and hasattr(
+            last_sol.assemblage, "equilibrium_tolerance"
+        ):
+            assemblage.equilibrium_tolerance = last_sol.assemblage.equilibrium_tolerance
 
-        F_tol = default_F_tolerances(assemblage, equality_constraints, n_atoms)
+    for i_c, sol in sols.items():
+        sol_array[i_c] = sol
 
-        # Set the initial fractions and compositions
-        # of the phases in the assemblage:
-        sol = damped_newton_solve(
-            F=lambda x: F(
-                x,
-                assemblage,
-                equality_constraints,
-                prm.reduced_composition_vector,
-                prm.reduced_free_composition_vectors,
-            ),
-            J=lambda x: jacobian(
+    # Finally, make dimensions of sol_array equal the input dimensions
+    if np.prod(sol_array.shape) > 1:
+        sol_array = np.squeeze(sol_array)
+    else:
+        sol_array = sol_array.flatten()[0]
+
+    return sol_array, prm
+
+
+def _equilibrate_compositions(
+    assemblage,
+    reduced_composition_vectors,
+    n_atoms,
+    problems,
+    eq_constraint_lists,
+    initial_parameters,
+    prm,
+    tol,
+    max_iterations,
+    verbose,
+    dtype,
+    reuse_jacobian=False,
+):
+    """
+    Solves the equilibrium problems for a sequence of bulk compositions.
+    Each composition is started from the solution of the nearest
+    composition (in atomic proportions) that has already been solved
+    successfully. This is the serial core of :func:`equilibrate_many`.
+
+    :returns: A structured array with shape (n_compositions, n_problems).
+    :rtype: numpy.ndarray
+    """
+    results = np.zeros((len(n_atoms), len(problems)), dtype=dtype)
+    first_constraints = [
+        eq_constraint_list[0] for eq_constraint_list in eq_constraint_lists
+    ]
+    solved_proportions = []
+    solved_starts = []
+    for i_comp, (c, n) in enumerate(zip(reduced_composition_vectors, n_atoms)):
+        if verbose:
+            print(f"Processing composition {i_comp + 1}/{len(n_atoms)}:")
+
+        c_prm = SimpleNamespace(**vars(prm))
+        c_prm.reduced_composition_vector = c
+
+        if len(solved_starts) > 0:
+            # Take a Newton step from the solution for the nearest
+            # composition, using its Jacobian with the new composition.
+            distances = np.linalg.norm(np.array(solved_proportions) - c / n, axis=1)
+            x, J = solved_starts[np.argmin(distances)]
+            dF = F(
                 x,
                 assemblage,
-                equality_constraints,
+                first_constraints,
+                c,
                 prm.reduced_free_composition_vectors,
-            ),
-            lambda_bounds=lambda dx, x: lambda_bounds(
-                dx, x, assemblage.endmembers_per_phase
-            ),
-            guess=parameters,
-            linear_constraints=(prm.constraint_matrix, prm.constraint_vector),
-            tol=tol,
-            F_tol=F_tol,
-            store_iterates=store_iterates,
-            max_iterations=max_iterations,
+            )
+            parameters = x + lu_solve(lu_factor(J), -dF)
+            if any(prm.constraint_matrix.dot(parameters) + prm.constraint_vector > 0.0):
+                parameters = x
+        else:
+            parameters = np.copy(initial_parameters)
+            parameters[prm.phase_amount_indices] *= n
+
+        sols = _equilibrate_problems(
+            assemblage,
+            problems,
+            eq_constraint_lists,
+            parameters,
+            c_prm,
+            n,
+            tol,
+            False,
+            False,
+            max_iterations,
+            verbose,
+            reuse_jacobian=reuse_jacobian,
         )
 
-        if sol.success and len(assemblage.reaction_affinities) > 0.0:
-            maxres = np.max(np.abs(assemblage.reaction_affinities)) + 1.0e-5
-            assemblage.equilibrium_tolerance = maxres
+        for i_problem, i_c in enumerate(problems):
+            sol = sols[i_c]
+            results[i_comp, i_problem] = (
+                sol.x,
+                sol.success,
+                sol.x[prm.phase_amount_indices],
+                sol.n_it,
+            )
 
-        if store_assemblage:
-            sol.assemblage = assemblage.copy()
-            if sol.success and len(assemblage.reaction_affinities) > 0.0:
-                sol.assemblage.equilibrium_tolerance = maxres
+        sol = sols[problems[0]]
+        if sol.success:
+            solved_proportions.append(c / n)
+            solved_starts.append((sol.x, sol.J))
 
-        if verbose:
-            print(sol.text)
+    return results
 
-        sol_array[i_c] = sol
 
-        # Next, we use the solution values and Jacobian
-        # to provide a starting guess for the next problem.
-        # First, we find the equality constraints for the next problem
-        if i_problem < n_problems - 1:
-            next_i_c = problems[i_problem + 1]
+def _equilibrate_compositions_from_tuple(args):
+    """
+    Calls :func:`_equilibrate_compositions` with a tuple of arguments.
+    Used to map strips of compositions onto the workers of an executor.
+    """
+    return _equilibrate_compositions(*args)
 
-            next_equality_constraints = [
-                eq_constraint_lists[i][next_i_c[i]] for i in range(len(nc))
+
+def equilibrate_many(
+    compositions,
+    assemblage,
+    equality_constraints,
+    free_compositional_vectors=[],
+    tol=None,
+    max_iterations=100.0,
+    verbose=False,
+    n_workers=1,
+    executor=None,
+    reuse_jacobian=False,
+):
+    """
+    A function that finds the thermodynamic equilibrium states of an
+    assemblage for many independent bulk compositions, subject to the
+    same equality constraints.
+
+    The equilibration parameters and constraint matrices are built once
+    and reused for every composition. The compositions are solved in
+    order, and each one is started from the solution for the nearest
+    composition (in atomic proportions) that has already been solved.
+    If the equality constraints contain arrays, the full grid of
+    problems is solved for each composition, as in :func:`equilibrate`.
+
+    :param compositions: The bulk compositions that the assemblage
+        must satisfy.
+    :type compositions: list of dict
+
+    :param assemblage: The assemblage to be equilibrated.
+    :type assemblage: :class:`burnman.Composite`
+
+    :param equality_constraints: The list of equality constraints.
+        See :func:`burnman.equilibrate` for valid formats.
+    :type equality_constraints: list of list
+
+    :param free_compositional_vectors: A list of dictionaries containing
+        the compositional freedom of the solution.
+        See :func:`burnman.equilibrate`.
+    :type free_compositional_vectors: list of dict
+
+    :param tol: The tolerance for the nonlinear solver.
+        See :func:`burnman.equilibrate`.
+    :type tol: float or numpy.array
+
+    :param max_iterations: The maximum number of iterations for the
+        nonlinear solver.
+    :type max_iterations: int
+
+    :param verbose: Whether to print output updating the user on the status of
+        equilibration.
+    :type verbose: bool
+
+    :param n_workers: The number of strips into which the compositions
+        are split. Each strip is a contiguous chunk of the compositions,
+        and is solved by a separate worker process, starting from the
+        initial state of the assemblage. Output from the worker processes
+        is suppressed, even if verbose is True. Defaults to 1 (serial solve).
+    :type n_workers: int
+
+    :param executor: An executor (for example a
+        :class:`concurrent.futures.ProcessPoolExecutor`) used to solve the
+        strips. If None (default) and n_workers > 1, a ProcessPoolExecutor
+        with n_workers processes is created for the duration of the call.
+    :type executor: :class:`concurrent.futures.Executor`
+
+    :param reuse_jacobian: If True, the nonlinear solver reuses the
+        Jacobian across iterations while they converge quickly.
+        See :func:`burnman.equilibrate`.
+    :type reuse_jacobian: bool
+
+    :returns: A structured array with shape
+        (n_compositions, ...), where the trailing dimensions are those of
+        the grid of equality constraints (squeezed as in
+        :func:`burnman.equilibrate`). The fields are 'x' (the solution
+        parameters), 'success', 'phase_amounts' (the molar amounts
+        of each phase) and 'n_iterations'. Also returns the namedtuple
+        created by
+        :func:`burnman.tools.equilibration.get_equilibration_parameters`
+        for the first composition. The parameter names and
+        constraint matrices in this object apply to all the compositions.
+    :rtype: tuple
+    """
+    if n_workers < 1:
+        raise ValueError(f"n_workers must be at least 1 (currently {n_workers}).")
+
+    for ph in assemblage.phases:
+        if isinstance(ph, Solution) and not hasattr(ph, "molar_fractions"):
+            raise Exception(
+                f"set_composition for solution {ph} before running equilibrate_many."
+            )
+
+    if assemblage.molar_fractions is None:
+        n_phases = len(assemblage.phases)
+        f = 1.0 / float(n_phases)
+        assemblage.set_fractions([f for i in range(n_phases)])
+
+    n_equality_constraints = len(equality_constraints)
+    n_free_compositional_vectors = len(free_compositional_vectors)
+
+    if n_equality_constraints != n_free_compositional_vectors + 2:
+        raise Exception(
+            "The number of equality constraints "
+            f"(currently {n_equality_constraints}) "
+            "must be two more than the number of "
+            "free_compositional vectors "
+            f"(currently {n_free_compositional_vectors})."
+        )
+
+    for v in free_compositional_vectors:
+        if np.abs(sum(v.values())) > 1.0e-12:
+            raise Exception(
+                "The amounts of each free_compositional_vector" "must sum to zero"
+            )
+
+    prm = get_equilibration_parameters(
+        assemblage, compositions[0], free_compositional_vectors
+    )
+    reduced_composition_vectors = np.array(
+        [
+            bulk_composition_vector(assemblage, composition)[
+                assemblage.independent_element_indices
             ]
+            for composition in compositions
+        ]
+    )
+    n_atoms = np.array([sum(composition.values()) for composition in compositions])
 
-            # We use the nearest solutions as potential starting points
-            # to make the next guess
-            prev_sols = []
-            for i in range(len(nc)):
-                if next_i_c[i] != 0:
-                    prev_i_c = np.copy(next_i_c)
-                    prev_i_c[i] -= 1
-                    prev_sols.append(sol_array[tuple(prev_i_c)])
+    if tol is None:
+        tol = prm.default_tolerances
 
-            updated_params = False
-            for s in prev_sols:
-                if s.success and not updated_params:
-                    # next guess based on a Newton step
-                    # using the old solution vector and Jacobian
-                    # with the new constraints.
-                    dF = F(
-                        s.x,
-                        assemblage,
-                        next_equality_constraints,
-                        prm.reduced_composition_vector,
-                        prm.reduced_free_composition_vectors,
-                    )
-                    luJ = lu_factor(s.J)
-                    new_parameters = s.x + lu_solve(luJ, -dF)
-                    c = (
-                        prm.constraint_matrix.dot(new_parameters)
-                        + prm.constraint_vector
-                    )
-                    if all(c <= 0.0):  # accept new guess
-                        parameters = new_parameters
-                    else:  # use the parameters from this step
-                        parameters = s.x
-                        exhausted_phases = [
-                            assemblage.phases[phase_idx].name
-                            for phase_idx, v in enumerate(
-                                new_parameters[prm.phase_amount_indices]
-                            )
-                            if v < 0.0
-                        ]
-                        if len(exhausted_phases) > 0 and verbose:
-                            print(
-                                "A phase might be exhausted before the "
-                                f"next step: {exhausted_phases}"
-                            )
+    eq_constraint_lists = process_eq_constraints(equality_constraints, assemblage, prm)
+    nc = [len(eq_constraint_list) for eq_constraint_list in eq_constraint_lists]
+    problems = list(product(*[list(range(nc[i])) for i in range(len(nc))]))
 
-                    updated_params = True
+    # Find the initial state, as in equilibrate
+    initial_state = [assemblage.pressure, assemblage.temperature]
+    for i in range(n_equality_constraints):
+        if eq_constraint_lists[i][0][0] == "P":
+            initial_state[0] = eq_constraint_lists[i][0][1]
+        elif eq_constraint_lists[i][0][0] == "T":
+            initial_state[1] = eq_constraint_lists[i][0][1]
+        elif eq_constraint_lists[i][0][0] == "PT_ellipse":
+            initial_state = eq_constraint_lists[i][0][1][1]
 
-    # Finally, make dimensions of sol_array equal the input dimensions
-    if np.prod(sol_array.shape) > 1:
-        sol_array = np.squeeze(sol_array)
+    if initial_state[0] is None:
+        initial_state[0] = 5.0e9
+    if initial_state[1] is None:
+        initial_state[1] = 1200.0
+
+    # The initial parameters are calculated for one mole of atoms,
+    # and the phase amounts are scaled for each composition
+    assemblage.n_moles = 1.0 / sum(assemblage.formula.values())
+    assemblage.set_state(*initial_state)
+    initial_parameters = get_parameters(assemblage, n_free_compositional_vectors)
+
+    dtype = np.dtype(
+        [
+            ("x", float, (prm.n_parameters,)),
+            ("success", bool),
+            ("phase_amounts", float, (len(assemblage.phases),)),
+            ("n_iterations", int),
+        ]
+    )
+    worker_prm = _worker_parameters(prm)
+    args = (
+        problems,
+        eq_constraint_lists,
+        initial_parameters,
+        worker_prm,
+        tol,
+        max_iterations,
+    )
+
+    if n_workers == 1 and executor is None:
+        results = _equilibrate_compositions(
+            assemblage,
+            reduced_composition_vectors,
+            n_atoms,
+            *args,
+            verbose,
+            dtype,
+            reuse_jacobian,
+        )
     else:
-        sol_array = sol_array.flatten()[0]
+        # Output from the workers would be interleaved, so the
+        # strips are always solved quietly.
+        tasks = [
+            (
+                assemblage.copy(),
+                reduced_composition_vectors[indices],
+                n_atoms[indices],
+                *args,
+                False,
+                dtype,
+                reuse_jacobian,
+            )
+            for indices in np.array_split(np.arange(len(compositions)), n_workers)
+            if len(indices) > 0
+        ]
+        if executor is None:
+            with ProcessPoolExecutor(max_workers=n_workers) as pool:
+                strip_results = list(
+                    pool.map(_equilibrate_compositions_from_tuple, tasks)
+                )
+        else:
+            strip_results = list(
+                executor.map(_equilibrate_compositions_from_tuple, tasks)
+            )
+        results = np.concatenate(strip_results)
 
-    return sol_array, prm
+    grid_shape = tuple(n for n in nc if n > 1)
+    return results.reshape((len(compositions),) + grid_shape), prm
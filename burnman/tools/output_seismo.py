@@ -201,12 +201,13 @@ def tvel_formatted_data_and_header(planet_or_layer, background_model=None):
                 np.zeros_like(depths[above_layer]),
             )
         )
+        v_p, v_s, density = layer.evaluate(["v_p", "v_s", "density"])
         data_layer = list(
             zip(
                 (np.max(depths) - layer.radii)[::-1] / 1.0e3,
-                layer.v_p[::-1] / 1.0e3,
-                layer.v_s[::-1] / 1.0e3,
-                layer.density[::-1] / 1.0e3,
+                v_p[::-1] / 1.0e3,
+                v_s[::-1] / 1.0e3,
+                density[::-1] / 1.0e3,
             )
         )
         data_below = list(
@@ -232,12 +233,13 @@ def tvel_formatted_data_and_header(planet_or_layer, background_model=None):
 
     if isinstance(planet_or_layer, Planet):
         planet = planet_or_layer
+        v_p, v_s, density = planet.evaluate(["v_p", "v_s", "density"])
         data = list(
             zip(
                 (planet.radius_planet - planet.radii)[::-1] / 1.0e3,
-                planet.v_p[::-1] / 1.0e3,
-                planet.v_s[::-1] / 1.0e3,
-                planet.density[::-1] / 1.0e3,
+                v_p[::-1] / 1.0e3,
+                v_s[::-1] / 1.0e3,
+                density[::-1] / 1.0e3,
             )
         )
 
@@ -5,16 +5,15 @@
 
 
 import numpy as np
-from sympy import Matrix
 from scipy.linalg import block_diag
 
 import warnings
 import logging
-import importlib
 from ..classes.polytope import MaterialPolytope, independent_row_indices
 from ..classes.solution import Solution
 from ..classes.composite import Composite
 from .solution import transform_solution_to_new_basis
+from ..optimize.linear_fitting import _import_cvxpy
 
 logging.captureWarnings(True)
 warnings.filterwarnings(
@@ -23,13 +22,6 @@ warnings.filterwarnings(
     category=FutureWarning,
 )
 
-try:
-    cp = importlib.import_module("cvxpy")
-except ImportError as err:
-    print(
-        f"Warning: {err}. " "For full functionality of BurnMan, please install cvxpy."
-    )
-
 
 def solution_polytope_from_charge_balance(
     charges, charge_total, return_fractions=False
@@ -104,6 +96,8 @@ def solution_polytope_from_endmember_occupancies(
     :returns: A polytope object corresponding to the parameters provided.
     :rtype: :class:`burnman.polytope.MaterialPolytope` object
     """
+    from sympy import Matrix
+
     n_sites = sum(endmember_occupancies[0])
     n_occs = endmember_occupancies.shape[1]
 
@@ -238,6 +232,7 @@ def simplify_composite_with_composition(composite, composition):
                 )
                 dmbrs = poly.endmembers_as_independent_endmember_amounts
 
+                cp = _import_cvxpy()
                 x = cp.Variable(dmbrs.shape[0])
                 objective = cp.Minimize(cp.sum_squares(x))
                 constraints = [dmbrs.T @ x == c_mean, x >= 0]
@@ -17,7 +17,6 @@ from fractions import Fraction
 from collections import Counter
 import pkgutil
 from string import ascii_uppercase as ucase
-from sympy import nsimplify
 
 
 def read_masses():
@@ -465,6 +464,7 @@ def site_occupancies_to_strings(
         classic two-site pyrope garnet.
     :rtype: list of strings
     """
+    from sympy import nsimplify
 
     site_multiplicities = np.array(site_multiplicities)
     endmember_occupancies = np.array(endmember_occupancies)
@@ -572,6 +572,7 @@ def formula_to_string(formula):
         in the periodic table, then they are added at the end of the string.
     :rtype: str
     """
+    from sympy import nsimplify
 
     formula_string = ""
     for e in IUPAC_element_order:
@@ -5,9 +5,9 @@
 
 
 import numpy as np
-from scipy.optimize import brentq
+import warnings
+from scipy.integrate import solve_ivp
 from ..utils.misc import read_table, lookup_and_interpolate
-from ..utils.math import bracket
 
 
 def brown_shankland(depths):
@@ -95,7 +95,7 @@ def stacey_oceanic(depths):
     return temperature
 
 
-def adiabatic(pressures, T0, rock):
+def adiabatic(pressures, T0, rock, rtol=1.0e-6, T_tol=1.0e-10):
     """
     This calculates a geotherm based on an anchor temperature and a rock,
     assuming that the rock's temperature follows an adiabatic gradient with
@@ -105,46 +105,98 @@ def adiabatic(pressures, T0, rock):
         \\frac{\\partial T}{\\partial P} = \\frac{ \\gamma  T}{ K_s }
 
     where :math:`\\gamma` is the Grueneisen parameter and :math:`K_s` is
-    the adiabatic bulk modulus.
+    the adiabatic bulk modulus. This equation is integrated with an
+    adaptive eighth order Runge-Kutta method (DOP853) with dense output,
+    so that the properties of the rock are only evaluated at the
+    pressures chosen by the integrator. The temperatures at the requested
+    pressures are then corrected by Newton iterations on the isentrope
+    :math:`S(P, T) = S(P_0, T_0)`, using
+    :math:`\\partial S / \\partial T = C_p / T`.
+
+    Several adiabats can be computed in a single batched call
+    (for example, to build lookup tables for geodynamic simulations)
+    by passing an array of anchor temperatures.
 
     :param pressures: The list of pressures in :math:`[Pa]` at which
         to evaluate the geotherm.
     :type pressures: list of floats
 
     :param T0: An anchor temperature, corresponding to the temperature of the first
-        pressure in the list. :math:`[K]`
-    :type T0: float
+        pressure in the list, or a 1D array of anchor temperatures. :math:`[K]`
+    :type T0: float or numpy.array of floats
 
     :param rock: Composite for which we compute the adiabat.  From this material we
         must compute average Grueneisen parameters and adiabatic bulk moduli
         for each pressure/temperature.
     :type rock: :class:`burnman.composite`
 
+    :param rtol: The relative tolerance used by the ODE integrator.
+    :type rtol: float
+
+    :param T_tol: The relative tolerance in temperature used to
+        terminate the isentropic correction. A warning is raised if
+        the correction has not converged to this tolerance after
+        10 iterations.
+    :type T_tol: float
+
     :returns: The list of temperatures for each pressure. :math:`[K]`
+        If T0 is an array, the returned array has shape
+        (len(T0), len(pressures)), with one adiabat per row.
     :rtype: numpy.array of floats
     """
-
-    rock.set_state(pressures[0], T0)
-    S0 = rock.S
-
-    delta_S = lambda T, P, rock, S0: S0 - rock.evaluate(["S"], [P], [T])[0][0]
-
-    temperatures = np.empty_like(pressures)
-    temperatures[0] = T0
-    for i in range(1, len(pressures)):
-        args = (pressures[i], rock, S0)
-        sol = bracket(
-            fn=delta_S,
-            x0=(
-                temperatures[i - 1]
-                + (rock.gr * temperatures[i - 1] / rock.K_S)
-                * (pressures[i] - pressures[i - 1])
-            ),
-            dx=1.0,
-            args=args,
+    pressures = np.array(pressures, dtype=float)
+    T0s = np.atleast_1d(np.array(T0, dtype=float))
+    n_adiabats = len(T0s)
+    P0 = pressures[0]
+
+    def dTdP(P, T):
+        gr, K_S = rock.evaluate(["gr", "K_S"], np.full(n_adiabats, P), T)
+        return gr * T / K_S
+
+    # The integration proceeds away from P0 in each direction
+    # spanned by the requested pressures. Adiabats are smooth, so the
+    # integrator first attempts to cross the whole range in one step
+    # rather than starting from a tiny step.
+    temperatures = np.empty((n_adiabats, len(pressures)))
+    for P_end, mask in [
+        (pressures.max(), pressures >= P0),
+        (pressures.min(), pressures < P0),
+    ]:
+        if P_end == P0:
+            temperatures[:, mask] = T0s[:, np.newaxis]
+        elif np.any(mask):
+            sol = solve_ivp(
+                dTdP,
+                (P0, P_end),
+                T0s,
+                method="DOP853",
+                dense_output=True,
+                rtol=rtol,
+                first_step=np.abs(P_end - P0),
+            )
+            if not sol.success:
+                raise Exception(f"Adiabat integration failed: {sol.message}")
+            temperatures[:, mask] = sol.sol(pressures[mask])
+
+    # Correct the integrated temperatures onto the isentropes
+    P_grid = np.broadcast_to(pressures, temperatures.shape)
+    S0 = rock.evaluate(["S"], np.full(n_adiabats, P0), T0s)[0]
+    for i in range(10):
+        S, C_p = rock.evaluate(["S", "C_p"], P_grid, temperatures)
+        delta_T = (S0[:, np.newaxis] - S) * temperatures / C_p
+        temperatures += delta_T
+        if np.all(np.abs(delta_T) < T_tol * temperatures):
+            break
+    else:
+        warnings.warn(
+            "The isentropic correction of the adiabat did not converge "
+            f"(maximum relative temperature change {np.max(np.abs(delta_T) / temperatures):.2e}, "
+            f"T_tol = {T_tol:.2e}).",
+            stacklevel=2,
         )
-        temperatures[i] = brentq(delta_S, sol[0], sol[1], args=args)
 
+    if np.ndim(T0) == 0:
+        return temperatures[0]
     return temperatures
 
 
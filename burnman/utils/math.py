@@ -7,7 +7,6 @@
 import numpy as np
 from scipy.ndimage.filters import gaussian_filter
 from scipy.interpolate import RegularGridInterpolator
-from sympy import Matrix, Rational
 import scipy.integrate as integrate
 from collections import Counter
 import itertools
@@ -134,6 +133,177 @@ def bracket(fn, x0, dx, args=(), ratio=1.618, maxiter=100):
         return x0, x1, f0, f1
 
 
+def bracket_vectorized(fn, x0, dx, ratio=1.618, maxiter=100):
+    """
+    Vectorized version of :func:`bracket`. Given a function and arrays
+    of starting guesses and initial step sizes, walks downhill from
+    each starting guess until the function changes sign.
+
+    :param fn: The function to bracket. It is called as fn(x, indices),
+        where x is a 1D array of trial values and indices is an integer
+        array giving the (flattened) indices of the problems to which
+        the trial values correspond. It must return a tuple whose first
+        element is the array of function values (further elements,
+        such as derivatives, are ignored). NaN values are treated as
+        a failure to bracket that problem.
+    :type fn: function
+    :param x0: The starting guesses.
+    :type x0: numpy.array
+    :param dx: Small steps for starting the search.
+    :type dx: float or numpy.array
+    :param ratio: The step size increases by this ratio
+        every step in the search. Defaults to
+        the golden ratio.
+    :type ratio: float
+    :param maxiter: The maximum number of steps before giving up.
+    :type maxiter: int
+
+    :returns: xa, xb, fa, fb, success. xa and xb are 1D arrays of the
+        inputs which bracket a root of fn, and fa and fb are the values of the
+        function at those points. success is a boolean array which is
+        False where no bracket could be found.
+    :rtype: tuple of numpy.arrays
+    """
+    assert ratio > 1.0
+    x0 = np.array(x0, dtype=float).flatten()
+    dx = np.abs(np.broadcast_to(dx, x0.shape)).astype(float)
+    indices = np.arange(len(x0))
+
+    f0 = fn(x0, indices)[0]
+    x1 = x0 + dx
+    f1 = fn(x1, indices)[0]
+
+    # Walk in the direction in which the magnitude of the function decreases
+    walk_left = (f1 - f0) * f0 > 0.0
+    dx[walk_left] *= -1.0
+    x1[walk_left] = x0[walk_left] + dx[walk_left]
+    if np.any(walk_left):
+        f1[walk_left] = fn(x1[walk_left], indices[walk_left])[0]
+
+    active = (f0 * f1 > 0.0) & np.isfinite(f0) & np.isfinite(f1)
+    niter = 0
+    while np.any(active) and niter < maxiter:
+        dx[active] *= ratio
+        x0[active], f0[active] = x1[active], f1[active]
+        x1[active] = x1[active] + dx[active]
+        f1[active] = fn(x1[active], indices[active])[0]
+        active = active & (f0 * f1 > 0.0) & np.isfinite(f1)
+        niter += 1
+
+    success = (f0 * f1 <= 0.0) & np.isfinite(f0) & np.isfinite(f1)
+    return x0, x1, f0, f1, success
+
+
+def safeguarded_newton(fn, xa, xb, fa, fb, x0=None, rtol=1.0e-12, maxiter=100):
+    """
+    Finds the roots of many independent one-dimensional problems at once,
+    using Newton's method safeguarded by bisection (the vectorized
+    equivalent of rtsafe in Numerical Recipes). Each root must be
+    bracketed, for example by :func:`bracket_vectorized`.
+
+    Newton steps that would leave the current bracket, or that do not
+    reduce the size of the step fast enough, are replaced by bisection,
+    so the iterations converge for every bracketed problem. Where the
+    function is smooth, convergence is quadratic.
+
+    :param fn: The function to solve. It is called as fn(x, indices),
+        where x is a 1D array of trial values and indices is an integer
+        array giving the (flattened) indices of the problems to which
+        the trial values correspond. It must return a tuple containing
+        the function values and their derivatives with respect to x.
+    :type fn: function
+    :param xa: One end of the bracket for each problem.
+    :type xa: numpy.array
+    :param xb: The other end of the bracket for each problem.
+    :type xb: numpy.array
+    :param fa: The function values at xa.
+    :type fa: numpy.array
+    :param fb: The function values at xb.
+    :type fb: numpy.array
+    :param x0: Optional starting guesses. Guesses outside the bracket
+        are replaced by the bracket midpoints. Defaults to the midpoints.
+    :type x0: numpy.array
+    :param rtol: Relative tolerance on the size of the final step.
+        As the final step is usually a Newton step, the error in the
+        returned roots is typically much smaller than this.
+    :type rtol: float
+    :param maxiter: The maximum number of iterations.
+    :type maxiter: int
+
+    :returns: x, converged. x is a 1D array containing the roots, and
+        converged is a boolean array which is False for
+        problems that were not bracketed, returned a non-finite value
+        or did not converge within maxiter iterations
+        (for these problems, x is NaN).
+    :rtype: tuple of numpy.arrays
+    """
+    xa, xb, fa, fb = [np.array(a, dtype=float).flatten() for a in (xa, xb, fa, fb)]
+    n = len(xa)
+    indices = np.arange(n)
+
+    # Orient each bracket so that f(lo) < 0 < f(hi)
+    lo = np.where(fa < 0.0, xa, xb)
+    hi = np.where(fa < 0.0, xb, xa)
+
+    converged = np.zeros(n, dtype=bool)
+    failed = ~((fa * fb <= 0.0) & np.isfinite(fa) & np.isfinite(fb))
+
+    # Roots that already lie on the bracket
+    on_a = (fa == 0.0) & ~failed
+    on_b = (fb == 0.0) & ~failed & ~on_a
+    x = 0.5 * (lo + hi)
+    x[on_a] = xa[on_a]
+    x[on_b] = xb[on_b]
+    converged[on_a | on_b] = True
+
+    if x0 is not None:
+        x0 = np.broadcast_to(np.array(x0, dtype=float).flatten(), (n,))
+        inside = (x0 - lo) * (x0 - hi) < 0.0
+        use_guess = inside & ~converged
+        x[use_guess] = x0[use_guess]
+
+    dx_old = np.abs(hi - lo)
+    dx = dx_old.copy()
+    f = np.full(n, np.nan)
+    df = np.full(n, np.nan)
+
+    active = ~(converged | failed)
+    if np.any(active):
+        f[active], df[active] = fn(x[active], indices[active])
+
+    for _ in range(maxiter):
+        failed |= active & ~(np.isfinite(f) & np.isfinite(df))
+        active &= ~failed
+        if not np.any(active):
+            break
+
+        i = indices[active]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x_newton = x[i] - f[i] / df[i]
+        bisect = (
+            ((x_newton - lo[i]) * (x_newton - hi[i]) >= 0.0)
+            | (np.abs(2.0 * f[i]) > np.abs(dx_old[i] * df[i]))
+            | ~np.isfinite(x_newton)
+        )
+        dx_old[i] = dx[i]
+        dx[i] = np.where(bisect, 0.5 * (hi[i] - lo[i]), x[i] - x_newton)
+        x[i] = np.where(bisect, lo[i] + dx[i], x_newton)
+
+        done = np.abs(dx[i]) <= rtol * np.abs(x[i])
+        converged[i[done]] = True
+        active[i[done]] = False
+
+        i = i[~done]
+        if len(i) > 0:
+            f[i], df[i] = fn(x[i], i)
+            below = f[i] < 0.0
+            lo[i[below]] = x[i[below]]
+            hi[i[~below]] = x[i[~below]]
+
+    x[~converged] = np.nan
+    return x, converged
+
+
 def _pad_ndarray_inverse_mirror(array, padding):
     """
     Pads an ndarray according to an inverse mirror
@@ -346,6 +516,60 @@ def interp_smoothed_array_and_derivatives(
     return interps
 
 
+def cumulative_integral(y, x, initial=0.0, high_order=False):
+    """
+    Cumulatively integrates the sampled function y(x) from x[0].
+
+    By default, the integral is evaluated with the trapezoidal rule.
+    The error of the integral over each interval is then
+    :math:`-h^3 y''/12`, where h is the interval width,
+    so that the total error decreases as :math:`h^2`.
+    If high_order is True, the function is integrated over each interval
+    using the quadratic polynomials passing through that interval and
+    each of its neighbouring points, and the two estimates are averaged.
+    The error then decreases as :math:`h^4` on evenly spaced points
+    (and at least as :math:`h^3` on unevenly spaced points).
+    The high order integral requires at least three points;
+    the trapezoidal rule is used for shorter arrays.
+
+    :param y: Values of the function to integrate.
+    :type y: 1D numpy array
+    :param x: Strictly monotonic values of the independent variable.
+    :type x: 1D numpy array
+    :param initial: Value of the integral at x[0].
+    :type initial: float
+    :param high_order: Whether to use the high order integration scheme.
+    :type high_order: bool
+
+    :returns: The integral of y from x[0] to each value of x.
+    :rtype: 1D numpy array
+    """
+    y = np.asarray(y, dtype=float)
+    x = np.asarray(x, dtype=float)
+    h = np.diff(x)
+    intervals = 0.5 * h * (y[1:] + y[:-1])
+
+    if high_order and len(x) > 2:
+        h0, h1 = h[:-1], h[1:]
+        # Quadratics through points i, i+1 and i+2, integrated over
+        # the first (forward) and second (backward) interval
+        forward = (
+            h0 * (2.0 * h0 + 3.0 * h1) / (6.0 * (h0 + h1)) * y[:-2]
+            + h0 * (h0 + 3.0 * h1) / (6.0 * h1) * y[1:-1]
+            - h0 * h0 * h0 / (6.0 * h1 * (h0 + h1)) * y[2:]
+        )
+        backward = (
+            -h1 * h1 * h1 / (6.0 * h0 * (h0 + h1)) * y[:-2]
+            + h1 * (h1 + 3.0 * h0) / (6.0 * h0) * y[1:-1]
+            + h1 * (2.0 * h1 + 3.0 * h0) / (6.0 * (h0 + h1)) * y[2:]
+        )
+        intervals[0] = forward[0]
+        intervals[-1] = backward[-1]
+        intervals[1:-1] = 0.5 * (forward[1:] + backward[:-1])
+
+    return initial + np.concatenate(([0.0], np.cumsum(intervals)))
+
+
 def l2_norm_profiles(depth, calc, obs):
     """
     Computes the L2 norm for N profiles at a time (assumed to be linear between points).
@@ -456,6 +680,8 @@ def independent_row_indices(array):
         of the input array.
     :rtype: 1D numpy array of integers
     """
+    from sympy import Matrix, Rational
+
     m = Matrix(
         array.shape[0],
         array.shape[1],
@@ -477,6 +703,8 @@ def array_to_rational_matrix(array):
     Converts a numpy array into a sympy matrix
     filled with rationals
     """
+    from sympy import Matrix, Rational
+
     return Matrix([[Rational(v).limit_denominator(1000) for v in row] for row in array])
 
 
@@ -503,6 +731,8 @@ def complete_basis(basis, flip_columns=True):
              original rows plus additional rows from the identity matrix.
     :rtype: numpy.ndarray
     """
+    from sympy import Matrix
+
     n, m = basis.shape
     if n < m:
         if flip_columns:
@@ -8,6 +8,8 @@ import subprocess
 import operator
 import bisect
 import pkgutil
+import importlib
+from importlib import resources
 from collections import Counter, OrderedDict
 import numpy as np
 from .math import round_to_n, linear_interpol
@@ -54,6 +56,37 @@ def copy_documentation(copy_from):
     return mydecorator
 
 
+def lazy_submodules(package_name, submodule_names):
+    """
+    Returns the module-level functions __getattr__ and __dir__ (PEP 562)
+    for a package whose submodules should only be imported when they
+    are first accessed, e.g. as package.submodule or
+    with from package import submodule. This keeps the import of the
+    package itself fast. After the first access, the submodule is an
+    ordinary attribute of the package.
+
+    :param package_name: The name of the package (i.e. its __name__).
+    :type package_name: str
+
+    :param submodule_names: The names of the lazily imported submodules.
+    :type submodule_names: list of str
+
+    :returns: The __getattr__ and __dir__ functions for the package.
+    :rtype: tuple of two functions
+    """
+    package = importlib.import_module(package_name)
+
+    def __getattr__(name):
+        if name in submodule_names:
+            return importlib.import_module(f"{package_name}.{name}")
+        raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+
+    def __dir__():
+        return sorted(set(vars(package)) | set(submodule_names))
+
+    return __getattr__, __dir__
+
+
 def merge_two_dicts(x, y):
     """Given two dicts, merge them into a new dict as a shallow copy."""
     z = x.copy()
@@ -181,6 +214,30 @@ def read_table(filename):
     return np.array(table)
 
 
+def read_array(filename, mmap_mode="r"):
+    """
+    Reads an array stored in numpy binary format (.npy)
+    in the burnman data directory.
+
+    By default the file is memory-mapped read-only, so that
+    the data are only read from disk when they are accessed,
+    and all processes that read the same file share a single copy
+    of the data in memory.
+
+    :param filename: The path of the file relative to burnman/data.
+    :type filename: str
+
+    :param mmap_mode: The mode passed to :func:`numpy.load`.
+        If None, the whole array is read into memory.
+    :type mmap_mode: str or None
+
+    :returns: The stored array.
+    :rtype: numpy.ndarray or numpy.memmap
+    """
+    with resources.as_file(resources.files("burnman") / "data" / filename) as path:
+        return np.load(path, mmap_mode=mmap_mode)
+
+
 def lookup_and_interpolate(table_x, table_y, x_value):
     idx = bisect.bisect_left(table_x, x_value) - 1
     if idx < 0:
@@ -1,12 +1,10 @@
 import numpy as np
-from sympy.core import S
-from sympy.core.numbers import Float, Integer, Rational
-from sympy.simplify.simplify import simplify as _simplify
 
 # The following functions are taken from sympy.matrices.utilities
 # and sympy.matrices.determinant and sympy.matrices.reductions.
 # This bit of sympy appears to be in a high state of flux,
 # so we copy the functions here for the time being.
+# sympy is imported inside the functions, as it is slow to import.
 
 
 def _iszero(x):
@@ -14,6 +12,20 @@ def _iszero(x):
     return getattr(x, "is_zero", None)
 
 
+def _simplify(x):
+    """Simplifies x using sympy.simplify."""
+    from sympy.simplify.simplify import simplify
+
+    return simplify(x)
+
+
+def _rational_simplify(x):
+    """Returns the closest rational to x with a denominator <= 1000."""
+    from sympy.core.numbers import Rational
+
+    return Rational(x).limit_denominator(1000)
+
+
 def _find_reasonable_pivot(col, iszerofunc=_iszero, simpfunc=_simplify):
     """
     Find the lowest index of an item in ``col`` that is
@@ -32,6 +44,8 @@ def _find_reasonable_pivot(col, iszerofunc=_iszero, simpfunc=_simplify):
     was made without being proved, and newly_determined are
     elements that were simplified during the process of pivot
     finding."""
+    from sympy.core import S
+    from sympy.core.numbers import Float, Integer
 
     newly_determined = []
     col = list(col)
@@ -167,6 +181,7 @@ def _row_reduce_list(
         If ``zero_above=False``, an echelon matrix will be returned.
     :type zero_above: bool
     """
+    from sympy.core import S
 
     def get_col(i):
         return mat[i::cols]
@@ -256,7 +271,7 @@ def _row_reduce_list(
 def row_reduce(
     M,
     iszerofunc=lambda x: x.is_zero,
-    simpfunc=lambda x: Rational(x).limit_denominator(1000),
+    simpfunc=_rational_simplify,
     normalize_last=True,
     normalize=True,
     zero_above=True,
@@ -278,7 +293,7 @@ def row_reduce(
 def independent_row_indices(
     m,
     iszerofunc=lambda x: x.is_zero,
-    simpfunc=lambda x: Rational(x).limit_denominator(1000),
+    simpfunc=_rational_simplify,
 ):
     _, pivots, swaps = row_reduce(m, iszerofunc, simpfunc)
     indices = np.array(range(len(m)))
@@ -87,11 +87,20 @@ if __name__ == "__main__":
     PTV_covariances = np.power(PTV_covariances, 2.0)
 
     # Here's where we fit the data
-    # The mineral parameters are automatically updated during fitting
+    # The mineral parameters are automatically updated during fitting.
+    # In this example, the Jacobian is calculated from perturbed maximum
+    # likelihood estimates. This is slower than the default, but the
+    # Jacobian then accounts for the tolerances used to find those
+    # estimates, which matters for the low resolution fits below.
     stv = burnman.minerals.HP_2011_ds62.stv()
     params = ["V_0", "K_0", "Kprime_0"]
     fitted_eos = burnman.eos_fitting.fit_PTV_data(
-        stv, params, PTV, PTV_covariances, verbose=False
+        stv,
+        params,
+        PTV,
+        PTV_covariances,
+        verbose=False,
+        perturbed_mle_jacobian=True,
     )
 
     # Print the optimized parameters
@@ -230,6 +239,7 @@ if __name__ == "__main__":
         data_covariances=PTV_covariances,
         param_tolerance=param_tolerance,
         verbose=False,
+        perturbed_mle_jacobian=True,
     )
 
     # We're done! That wasn't too painful, was it?!
@@ -377,6 +387,7 @@ if __name__ == "__main__":
         data_covariances=PTp_covariances,
         param_tolerance=param_tolerance,
         verbose=False,
+        perturbed_mle_jacobian=True,
     )
 
     # Print the optimized parameters
@@ -502,6 +513,7 @@ if __name__ == "__main__":
         data_covariances=PTp_covariances,
         param_tolerance=1.0e-5,  # higher resolution fitting now that we removed those outliers
         verbose=False,
+        perturbed_mle_jacobian=True,
     )
 
     # Print the optimized parameters
@@ -1,18 +1,33 @@
+# This file is part of BurnMan - a thermoelastic and thermodynamic toolkit
+# for the Earth and Planetary Sciences
+# Copyright (C) 2012 - 2025 by the BurnMan team, released under the GNU
+# GPL v2 or later.
+
+"""
+debye
+-----
+
+Compares the Debye functions in burnman.eos.debye against
+reference implementations that integrate the Debye function by
+quadrature (burnman.eos.debye.debye_fn). Both the scalar (jitted)
+functions and their array-valued counterparts in
+burnman.eos.debye.vectorized are checked over a wide range of
+temperatures and Debye temperatures. Timings are only printed
+when this script is not being run as part of the test suite.
+"""
+
+import time
 import numpy as np
 import matplotlib.pyplot as plt
-from burnman import constants
-from burnman.eos import debye
 import scipy.integrate
-import time
 
+from burnman import constants
+from burnman.eos import debye
 
-def old_thermal(T, debye_T, n):
-    if T == 0:
-        return 0
-    return 3.0 * n * constants.gas_constant * T * debye.debye_fn(debye_T / T)
+R = constants.gas_constant
 
 
-def old_heat(T, debye_T, n):
+def quad_heat_capacity(T, debye_T, n):
     if T == 0:
         return 0
     deb = scipy.integrate.quad(
@@ -20,34 +35,95 @@ def old_heat(T, debye_T, n):
         0.0,
         debye_T / T,
     )
-    return 9.0 * n * constants.gas_constant * deb[0] / pow(debye_T / T, 3.0)
+    return 9.0 * n * R * deb[0] / pow(debye_T / T, 3.0)
+
+
+def quad_thermal_energy(T, debye_T, n):
+    return 3.0 * n * R * T * debye.debye_fn(debye_T / T)
+
+
+def quad_helmholtz_energy(T, debye_T, n):
+    x = debye_T / T
+    return n * R * T * (3.0 * np.log(1.0 - np.exp(-x)) - debye.debye_fn(x))
 
 
-temperatures = np.linspace(100, 5000, 10000)
+def quad_entropy(T, debye_T, n):
+    x = debye_T / T
+    return n * R * (4.0 * debye.debye_fn(x) - 3.0 * np.log(1.0 - np.exp(-x)))
+
+
+def quad_dhelmholtz_dTheta(T, debye_T, n):
+    x = debye_T / T
+    return 3.0 * n * R * debye.debye_fn(x) / x
+
+
+def quad_d2helmholtz_dTheta2(T, debye_T, n):
+    x = debye_T / T
+    D = debye.debye_fn(x)
+    return 3.0 * n * R / T * (3.0 / (x * (np.exp(x) - 1.0)) - 4.0 * D / x**2)
+
+
+def quad_dentropy_dTheta(T, debye_T, n):
+    x = debye_T / T
+    D = debye.debye_fn(x)
+    return n * R / T * (9.0 / (np.exp(x) - 1.0) - 12.0 * D / x)
+
+
+references = {
+    "thermal_energy": quad_thermal_energy,
+    "molar_heat_capacity_v": quad_heat_capacity,
+    "helmholtz_energy": quad_helmholtz_energy,
+    "entropy": quad_entropy,
+    "dhelmholtz_dTheta": quad_dhelmholtz_dTheta,
+    "d2helmholtz_dTheta2": quad_d2helmholtz_dTheta2,
+    "dentropy_dTheta": quad_dentropy_dTheta,
+}
+
+# Temperatures and Debye temperatures spanning x = Theta/T from
+# about 0.02 to 200, which covers all four branches of debye_fn_cheb
+T, debye_T = np.meshgrid(np.linspace(10.0, 5000.0, 50), np.linspace(100.0, 2000.0, 20))
+T = T.ravel()
+debye_T = debye_T.ravel()
+n = 2.0
+
+print("Maximum relative differences from the quadrature-based functions")
+print("(all should be below 1e-10):")
+for name, reference in references.items():
+    ref = np.array([reference(t, d, n) for t, d in zip(T, debye_T)])
+    scalar = np.array([getattr(debye, name)(t, d, n) for t, d in zip(T, debye_T)])
+    array = getattr(debye.vectorized, name)(T, debye_T, n)
+
+    assert np.array_equal(scalar, array)
+    max_error = np.max(np.abs((scalar - ref) / ref))
+    print(f"    {name}: {max_error < 1.0e-10}")
+
+# Microbenchmark of the heat capacity evaluated over a temperature array
+temperatures = np.linspace(100.0, 5000.0, 10000)
 Debye_T = 1000.0
-old = np.empty_like(temperatures)
-start = time.process_time()
-for i in range(len(temperatures)):
-    old[i] = old_heat(temperatures[i], Debye_T, 1.0)
-time_old = time.process_time() - start
+debye.vectorized.molar_heat_capacity_v(temperatures[:2], Debye_T, 1.0)
 
-new = np.empty_like(temperatures)
-start = time.process_time()
-for i in range(len(temperatures)):
-    new[i] = debye.molar_heat_capacity_v(temperatures[i], Debye_T, 1.0)
-time_new = time.process_time() - start
+start = time.perf_counter()
+old = np.array([quad_heat_capacity(t, Debye_T, 1.0) for t in temperatures])
+time_quad = time.perf_counter() - start
 
-assert np.abs(np.linalg.norm((old - new) / new)) < 1.0e-7
-print("time old %g, time new %g" % (time_old, time_new))
+start = time.perf_counter()
+scalar = np.array([debye.molar_heat_capacity_v(t, Debye_T, 1.0) for t in temperatures])
+time_scalar = time.perf_counter() - start
 
+start = time.perf_counter()
+array = debye.vectorized.molar_heat_capacity_v(temperatures, Debye_T, 1.0)
+time_array = time.perf_counter() - start
+
+print(f"Heat capacities agree: {np.linalg.norm((old - array) / array) < 1.0e-7}")
+if "RUNNING_TESTS" not in globals():
+    print(
+        f"quadrature: {time_quad:.4f} s, scalar: {time_scalar:.4f} s, "
+        f"array: {time_array:.4f} s"
+    )
 
 temperatures = np.linspace(0, 5000, 200)
-vibrational_energy = np.empty_like(temperatures)
-heat_capacity = np.empty_like(temperatures)
-Debye_T = 1000.0
-for i in range(len(temperatures)):
-    vibrational_energy[i] = debye.thermal_energy(temperatures[i], Debye_T, 1.0)
-    heat_capacity[i] = debye.molar_heat_capacity_v(temperatures[i], Debye_T, 1.0)
+vibrational_energy = debye.vectorized.thermal_energy(temperatures, Debye_T, 1.0)
+heat_capacity = debye.vectorized.molar_heat_capacity_v(temperatures, Debye_T, 1.0)
 
 plt.subplot(121)
 plt.plot(temperatures, vibrational_energy)
@@ -0,0 +1,60 @@
+# This file is part of BurnMan - a thermoelastic and thermodynamic toolkit
+# for the Earth and Planetary Sciences
+# Copyright (C) 2012 - 2025 by the BurnMan team, released under the GNU
+# GPL v2 or later.
+
+"""
+evaluate_benchmarks
+-------------------
+
+Compares the array-native evaluation of endmember properties
+(Mineral.evaluate, used when the equation of state supports arrays)
+against the original state-by-state path (Material.evaluate).
+The results should agree to within the tolerances of the
+volume solvers used by each path. Timings are
+only printed when this script is not being run as part of the test suite.
+"""
+
+import time
+import numpy as np
+
+from burnman import Material
+from burnman.minerals import SLB_2011, HP_2011_ds62, Matas_etal_2007
+
+properties = ["V", "gibbs", "S", "K_S", "G", "alpha", "C_p", "gr"]
+
+n_points = 2000
+pressures = np.linspace(1.0e9, 100.0e9, n_points)
+temperatures = np.linspace(300.0, 3000.0, n_points)
+
+for m in [
+    SLB_2011.forsterite(),
+    SLB_2011.mg_perovskite(),
+    HP_2011_ds62.fo(),
+    Matas_etal_2007.mg_perovskite(),
+]:
+    # Evaluate once to make sure that any jitted functions are compiled
+    m.evaluate(properties, pressures[:2], temperatures[:2])
+
+    start = time.perf_counter()
+    scalar = Material.evaluate(m, properties, pressures, temperatures)
+    time_scalar = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vectorized = m.evaluate(properties, pressures, temperatures)
+    time_vectorized = time.perf_counter() - start
+
+    # HP_TMT has no shear modulus, so avoid dividing by zero
+    rel_error = np.max(
+        np.abs(vectorized - scalar) / np.maximum(np.abs(scalar), 1.0e-30), axis=1
+    )
+    print(
+        f"{m.name} ({m.method.__class__.__name__}): "
+        f"max relative difference < 1e-6: {np.all(rel_error < 1.0e-6)}"
+    )
+    if "RUNNING_TESTS" not in globals():
+        print(
+            f"    state-by-state: {time_scalar:.3f} s, "
+            f"vectorized: {time_vectorized:.3f} s, "
+            f"speedup: {time_scalar / time_vectorized:.1f}x"
+        )
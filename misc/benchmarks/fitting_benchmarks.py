@@ -0,0 +1,88 @@
+# This file is part of BurnMan - a thermoelastic and thermodynamic toolkit
+# for the Earth and Planetary Sciences
+# Copyright (C) 2012 - 2025 by the BurnMan team, released under the GNU
+# GPL v2 or later.
+
+"""
+fitting_benchmarks
+------------------
+
+Compares the fit of the SLB_2011 periclase equation of state to the
+P-T-V data of Dewaele et al. (2000) using the default Jacobian calculated by
+burnman.nonlinear_least_squares_fit with the fit obtained by
+perturbing each parameter in turn and recalculating the maximum
+likelihood estimates of all the data (perturbed_mle_jacobian=True,
+the method used by earlier versions of BurnMan).
+The number of calls to set_state needed by each method is reported,
+as are the wall times of each fit when this script
+is not being run as part of the test suite.
+"""
+
+import time
+import numpy as np
+
+import burnman
+from burnman.minerals import SLB_2011
+from burnman.utils.unitcell import molar_volume_from_unit_cell_volume
+
+
+class CountingPericlase(SLB_2011.periclase):
+    n_set_state = 0
+
+    def set_state(self, pressure, temperature):
+        CountingPericlase.n_set_state += 1
+        burnman.Mineral.set_state(self, pressure, temperature)
+
+
+T, Terr, Pta, P, Perr, V, Verr = np.loadtxt(
+    "../../burnman/data/input_fitting/PVT_MgO_Dewaele_et_al_2000.dat", unpack=True
+)
+P, Perr = P * 1.0e9, Perr * 1.0e9
+V = molar_volume_from_unit_cell_volume(V, 4.0)
+Verr = molar_volume_from_unit_cell_volume(Verr, 4.0)
+data = np.array([P, T, V]).T
+nul = 0.0 * P
+covariances = np.array(
+    [[Perr**2, nul, nul], [nul, Terr**2, nul], [nul, nul, Verr**2]]
+).T
+flags = ["V"] * len(data)
+
+params = ["V_0", "K_0", "Kprime_0", "grueneisen_0", "q_0"]
+print(f"{len(data)} data, {len(params)} parameters")
+
+fits = []
+times = []
+for name, perturbed_mle_jacobian in [
+    ("perturbed MLE", True),
+    ("parameter derivatives", False),
+]:
+    CountingPericlase.n_set_state = 0
+    start = time.perf_counter()
+    fits.append(
+        burnman.eos_fitting.fit_PTV_data(
+            CountingPericlase(),
+            params,
+            data,
+            covariances,
+            param_tolerance=1.0e-5,
+            verbose=False,
+            perturbed_mle_jacobian=perturbed_mle_jacobian,
+        )
+    )
+    times.append(time.perf_counter() - start)
+    print(f"\n{name}: {CountingPericlase.n_set_state} calls to set_state")
+    burnman.utils.misc.pretty_print_values(
+        fits[-1].popt, fits[-1].pcov, fits[-1].fit_params
+    )
+
+# Both fits should agree to within a small fraction of the uncertainties
+sigma = np.sqrt(np.diag(fits[1].pcov))
+max_diff = np.max(np.abs(fits[1].popt - fits[0].popt) / sigma)
+print(f"\nParameters agree to within 0.05 standard deviations: {max_diff < 0.05}")
+
+if "RUNNING_TESTS" not in globals():
+    print(
+        f"Fit time: perturbed MLE: {times[0]:.3f} s, "
+        f"parameter derivatives: {times[1]:.3f} s, "
+        f"speedup: {times[0] / times[1]:.1f}x"
+    )
@@ -0,0 +1,78 @@
+# This file is part of BurnMan - a thermoelastic and thermodynamic toolkit
+# for the Earth and Planetary Sciences
+# Copyright (C) 2012 - 2025 by the BurnMan team, released under the GNU
+# GPL v2 or later.
+
+"""
+import_benchmarks
+-----------------
+
+Measures the time taken by import burnman in a fresh Python process,
+and checks which of the slow-to-import parts of BurnMan and its
+dependencies are deferred until they are first used.
+The mineral library and calibrants are imported when they are
+first accessed (e.g. burnman.minerals.SLB_2011), and sympy, autograd
+and cvxpy are imported by the functions that need them.
+Timings are only printed when this script is not being run
+as part of the test suite.
+"""
+
+import subprocess
+import sys
+
+deferred_modules = [
+    "burnman.minerals",
+    "burnman.minerals.HGP_2018_ds633",
+    "burnman.calibrants",
+    "sympy",
+    "autograd",
+    "cvxpy",
+]
+
+script = f"""
+import sys
+import time
+
+start = time.perf_counter()
+import burnman
+time_burnman = time.perf_counter() - start
+
+print(*[m in sys.modules for m in {deferred_modules}])
+
+start = time.perf_counter()
+from burnman.minerals import SLB_2011
+fo = burnman.minerals.SLB_2011.forsterite()
+time_minerals = time.perf_counter() - start
+print(fo.name, "minerals" in dir(burnman))
+print(time_burnman, time_minerals)
+"""
+
+star_script = """
+from burnman import *
+print(minerals.__name__, calibrants.__name__)
+"""
+
+n_runs = 5
+times = []
+for i in range(n_runs):
+    output = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    ).stdout.splitlines()
+    times.append([float(t) for t in output[2].split()])
+
+print("Imported by import burnman:")
+for module, imported in zip(deferred_modules, output[0].split()):
+    print(f"    {module}: {imported}")
+name, in_dir = output[1].split()
+print(f"Access to burnman.minerals.SLB_2011 returns {name}")
+print(f"minerals listed by dir(burnman): {in_dir}")
+
+output = subprocess.run(
+    [sys.executable, "-c", star_script], capture_output=True, text=True, check=True
+).stdout.split()
+print(f"from burnman import * binds: {', '.join(output)}")
+
+if "RUNNING_TESTS" not in globals():
+    time_burnman, time_minerals = min(t[0] for t in times), min(t[1] for t in times)
+    print(f"import burnman: {time_burnman:.3f} s (best of {n_runs})")
+    print(f"first access to burnman.minerals.SLB_2011: {time_minerals:.3f} s")
@@ -0,0 +1,52 @@
+# This file is part of BurnMan - a thermoelastic and thermodynamic toolkit
+# for the Earth and Planetary Sciences
+# Copyright (C) 2012 - 2025 by the BurnMan team, released under the GNU
+# GPL v2 or later.
+
+"""
+warm_start_benchmarks
+---------------------
+
+Counts the number of pressure evaluations needed to find the volume
+of a mineral at each point along a P-T path, with and without
+warm-started volume solves (see the warm_start attribute of
+burnman.eos.EquationOfState). The counts are reported through the
+volume_solver_hook of the equation of state. Timings are
+only printed when this script is not being run as part of the test suite.
+"""
+
+import time
+import numpy as np
+
+from burnman.minerals import SLB_2011, Matas_etal_2007
+
+n_points = 500
+pressures = np.linspace(1.0e9, 100.0e9, n_points)
+temperatures = np.linspace(300.0, 3000.0, n_points)
+
+bm3_periclase = SLB_2011.periclase()
+bm3_periclase.set_method("bm3")
+
+for m in [SLB_2011.forsterite(), Matas_etal_2007.mg_perovskite(), bm3_periclase]:
+    evaluations = []
+    m.method.volume_solver_hook = lambda method, n, warm: evaluations.append(n)
+
+    volumes = []
+    times = []
+    for warm_start in [False, True]:
+        m.method.warm_start = warm_start
+        evaluations.clear()
+        start = time.perf_counter()
+        volumes.append(
+            [m.method.volume(P, T, m.params) for P, T in zip(pressures, temperatures)]
+        )
+        times.append(time.perf_counter() - start)
+        print(
+            f"{m.name} ({m.method.__class__.__name__}), warm_start={warm_start}: "
+            f"{np.mean(evaluations):.2f} pressure evaluations per volume"
+        )
+
+    rel_error = np.max(np.abs(np.array(volumes[1]) / np.array(volumes[0]) - 1.0))
+    print(f"    max relative difference < 1e-6: {rel_error < 1.0e-6}")
+    if "RUNNING_TESTS" not in globals():
+        print(f"    cold: {times[0]:.3f} s, warm: {times[1]:.3f} s")
@@ -429,6 +429,44 @@ class composite(BurnManTest):
         self.assertArraysAlmostEqual(rock.dependent_element_indices, [2, 3])
         self.assertTrue(rock.n_reactions == 4)
 
+    def test_state_registry(self):
+        def make_rock():
+            gt1 = minerals.SLB_2011.garnet()
+            gt1.set_composition([0.2, 0.2, 0.2, 0.2, 0.2])
+            gt2 = minerals.SLB_2011.garnet()
+            gt2.set_composition([0.6, 0.1, 0.1, 0.1, 0.1])
+            py = minerals.SLB_2011.pyrope()
+            return burnman.Composite([gt1, gt2, py], [0.3, 0.3, 0.4])
+
+        rock = make_rock()
+        rock.set_state(10.0e9, 1500.0)
+        properties = [rock.gibbs, rock.V, rock.K_S, rock.G]
+
+        rock = make_rock()
+        registry = burnman.EndmemberStateRegistry()
+        rock.state_registry = registry
+        for phase in rock.phases[:2]:
+            phase.state_registry = registry
+        rock.set_state(10.0e9, 1500.0)
+        self.assertArraysAlmostEqual([rock.gibbs, rock.V, rock.K_S, rock.G], properties)
+        # the second garnet and the pure pyrope reuse the first garnet states
+        self.assertEqual(registry.misses, 5)
+        self.assertEqual(registry.hits, 6)
+        self.assertTrue(
+            rock.phases[2]._cached is rock.phases[0].endmembers[0][0]._cached
+        )
+
+        # states are not shared between different pressures
+        # or different parameters
+        rock.phases[2].params["V_0"] *= 1.01
+        rock.set_state(11.0e9, 1500.0)
+        self.assertEqual(registry.misses, 11)
+        self.assertEqual(registry.hits, 11)
+        self.assertFalse(
+            rock.phases[2]._cached is rock.phases[0].endmembers[0][0]._cached
+        )
+        self.assertAlmostEqual(registry.hit_rate, 0.5)
+
 
 if __name__ == "__main__":
     unittest.main()
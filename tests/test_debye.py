@@ -1,7 +1,10 @@
 import unittest
 from util import BurnManTest
 
+import numpy as np
+
 import burnman
+from burnman.eos import debye
 
 
 class mypericlase(burnman.Mineral):
@@ -94,6 +97,28 @@ class Debye(BurnManTest):
         self.assertFloatEqual(d2F_dTheta2_num, d2F_dTheta2_analytical)
         self.assertFloatEqual(dS_dTheta_num, dS_dTheta_analytical)
 
+    def test_vectorized(self):
+        T = np.array([0.0, 1.0e-16, 10.0, 300.0, 2000.0])
+        debye_T = np.array([773.0, 773.0, 500.0, 773.0, 1000.0])
+        n = 2.0
+        for name in [
+            "thermal_energy",
+            "molar_heat_capacity_v",
+            "helmholtz_energy",
+            "entropy",
+            "dmolar_heat_capacity_v_dT",
+            "dhelmholtz_dTheta",
+            "d2helmholtz_dTheta2",
+            "dentropy_dTheta",
+        ]:
+            scalar = [getattr(debye, name)(t, d, n) for t, d in zip(T, debye_T)]
+            array = getattr(debye.vectorized, name)(T, debye_T, n)
+            self.assertArraysAlmostEqual(scalar, array)
+
+        # Broadcasting over the Debye temperature
+        array = debye.vectorized.dhelmholtz_dTheta(300.0, debye_T, n)
+        self.assertEqual(array.shape, debye_T.shape)
+
 
 if __name__ == "__main__":
     unittest.main()
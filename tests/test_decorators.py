@@ -40,6 +40,27 @@ class test_decorators__material_property(BurnManTest):
 
         self.assertEqual(m.counter, 2)
 
+    def test_reset_with_dependencies(self):
+        class MyPTMaterial(self.MyCountingMaterial):
+            @material_property(dependencies=("pressure", "temperature"))
+            def some_PT_property(self):
+                self.counter += 1
+                return 2.0
+
+        m = MyPTMaterial()
+        self.assertEqual(m.some_property, 1.0)
+        self.assertEqual(m.some_PT_property, 2.0)
+        self.assertEqual(m.counter, 2)
+
+        m.reset(changed=("composition",))
+        self.assertEqual(list(m._cached.keys()), ["some_PT_property"])
+        self.assertEqual(m.some_property, 1.0)
+        self.assertEqual(m.some_PT_property, 2.0)
+        self.assertEqual(m.counter, 3)
+
+        m.reset(changed=("temperature",))
+        self.assertEqual(len(m._cached), 0)
+
     def test_doc(self):
         """make sure documentation is passed through with the new decorator"""
 
@@ -1,6 +1,8 @@
 import unittest
 from util import BurnManTest
 import warnings
+from collections import OrderedDict
+import numpy as np
 
 import burnman
 from burnman import minerals
@@ -451,6 +453,155 @@ class test_eos_validation(BurnManTest):
         self.assertAlmostEqual(Cv, Cv2)
         self.assertAlmostEqual(S, S2)
 
+    def test_volume_arrays(self):
+        pressures = np.linspace(1.0e5, 100.0e9, 21)
+        temperatures = np.linspace(300.0, 2500.0, 21)
+        for m in [
+            minerals.SLB_2011.periclase(),
+            minerals.Matas_etal_2007.mg_perovskite(),
+        ]:
+            V = m.method.volume(pressures, temperatures, m.params)
+            V_scalar = [
+                m.method.volume(P, T, m.params) for P, T in zip(pressures, temperatures)
+            ]
+            self.assertArraysAlmostEqual(V, V_scalar)
+
+            V, converged = m.method._solve_volumes(pressures, temperatures[0], m.params)
+            self.assertTrue(np.all(converged))
+            self.assertArraysAlmostEqual(
+                m.method.pressure(temperatures[0], V, m.params), pressures
+            )
+
+        m = minerals.HP_2011_ds62.fo()
+        V = burnman.eos.birch_murnaghan.volume_third_order(pressures, m.params)
+        V_scalar = [
+            burnman.eos.birch_murnaghan.volume_third_order(P, m.params)
+            for P in pressures
+        ]
+        self.assertArraysAlmostEqual(V, V_scalar)
+
+    def test_warm_started_volumes(self):
+        pressures = np.linspace(1.0e9, 100.0e9, 21)
+        temperatures = np.linspace(300.0, 2500.0, 21)
+        bm3_periclase = mypericlase()
+        bm3_periclase.set_method("bm3")
+        for m in [
+            minerals.SLB_2011.periclase(),
+            minerals.Matas_etal_2007.mg_perovskite(),
+            bm3_periclase,
+        ]:
+            evaluations = {False: [], True: []}
+
+            def hook(method, n_evaluations, warm_started):
+                evaluations[warm_started].append(n_evaluations)
+
+            m.method.volume_solver_hook = hook
+            V_cold = [
+                m.method.volume(P, T, m.params) for P, T in zip(pressures, temperatures)
+            ]
+            m.method.warm_start = True
+            V_warm = [
+                m.method.volume(P, T, m.params) for P, T in zip(pressures, temperatures)
+            ]
+            self.assertArraysAlmostEqual(V_cold, V_warm)
+            # Only the first solve along the path starts from V_0
+            self.assertEqual(len(evaluations[False]), len(pressures) + 1)
+            self.assertEqual(len(evaluations[True]), len(pressures) - 1)
+            self.assertTrue(
+                np.mean(evaluations[True]) < 0.5 * np.mean(evaluations[False])
+            )
+
+    def test_compiled_properties(self):
+        properties = [
+            "molar_volume",
+            "molar_gibbs",
+            "molar_entropy",
+            "isothermal_bulk_modulus_reuss",
+            "isentropic_bulk_modulus_reuss",
+            "shear_modulus",
+            "thermal_expansivity",
+            "molar_heat_capacity_p",
+            "molar_heat_capacity_v",
+            "grueneisen_parameter",
+        ]
+        periclases = {}
+        for method in ["slb2", "mgd2", "bm3"]:
+            periclases[method] = mypericlase()
+            periclases[method].params["F_0"] = 0.0
+            periclases[method].set_method(method)
+        for m in [
+            minerals.SLB_2011.periclase(),
+            periclases["slb2"],
+            minerals.Matas_etal_2007.mg_perovskite(),
+            periclases["mgd2"],
+            periclases["bm3"],
+        ]:
+            for P, T in [(1.0e5, 300.0), (30.0e9, 1500.0), (120.0e9, 3000.0)]:
+                m.set_state(P, T)
+                if burnman.eos.kernels.compiled:
+                    self.assertTrue(all(p in m._cached for p in properties))
+                compiled = [getattr(m, p) for p in properties]
+                m._cached = {}
+                self.assertArraysAlmostEqual(
+                    compiled, [getattr(m, p) for p in properties]
+                )
+
+        # States outside the range of validity of the kernel
+        # fall back to the Python functions
+        m = minerals.SLB_2011.periclase()
+        self.assertIsNone(m.method._compiled_properties(-1.0e12, 300.0, m.params))
+
+    def test_precomputed_parameters(self):
+        P, T = 10.0e9, 1500.0
+        bm3_params = dict(minerals.Matas_etal_2007.mg_perovskite().params)
+        bm3_params["equation_of_state"] = "bm3"
+        for m, key in [
+            (minerals.SLB_2011.periclase(), "grueneisen_0"),
+            (minerals.Matas_etal_2007.mg_perovskite(), "K_0"),
+            (minerals.Matas_etal_2007.mg_perovskite(), "q_0"),
+            (burnman.Mineral(bm3_params), "Kprime_0"),
+            (minerals.HP_2011_ds62.per(), "K_0"),
+        ]:
+            prms = m.method._parameters(m.params)
+            self.assertIsNotNone(prms)
+            self.assertIs(m.method._parameters(m.params), prms)
+
+            # Editing the parameters invalidates the precomputed object
+            m.params[key] *= 1.01
+            self.assertIsNot(m.method._parameters(m.params), prms)
+            m.set_state(P, T)
+            m2 = burnman.Mineral(dict(m.params))
+            m2.set_state(P, T)
+            self.assertArraysAlmostEqual(
+                [m.V, m.gibbs, m.K_S, m.alpha], [m2.V, m2.gibbs, m2.K_S, m2.alpha]
+            )
+
+            # Plain dictionaries are also accepted
+            self.assertFloatEqual(m.method.volume(P, T, dict(m.params)), m.V)
+
+        # In-place changes to mutable parameters are also detected
+        m.params["Cp"][0] += 10.0
+        m.set_state(P, T)
+        m2 = burnman.Mineral(dict(m.params))
+        m2.set_state(P, T)
+        self.assertFloatEqual(m.gibbs, m2.gibbs)
+
+        # The compiled kernel parameters cannot be modified
+        m = minerals.SLB_2011.periclase()
+        kernel = m.method._parameters(m.params).kernel
+        if kernel is not None:
+            self.assertFalse(kernel.flags.writeable)
+
+    def test_params_identity(self):
+        params = minerals.SLB_2011.periclase().params
+        m = burnman.Mineral(params)
+        self.assertIs(m.params, params)
+
+        params = OrderedDict(params)
+        m = burnman.Mineral(params)
+        self.assertIs(type(m.params), OrderedDict)
+        m.set_state(1.0e9, 300.0)
+
     def test_pressure_finding_SLB(self):
         with warnings.catch_warnings(record=True) as w:
             warnings.simplefilter("always")
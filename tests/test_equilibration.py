@@ -2,7 +2,7 @@ import unittest
 from util import BurnManTest
 
 import burnman
-from burnman import equilibrate
+from burnman import equilibrate, equilibrate_many
 from burnman.minerals import HP_2011_ds62, SLB_2011
 
 import numpy as np
@@ -49,6 +49,128 @@ class equilibration(BurnManTest):
         ]
         self.assertArraysAlmostEqual(Ts, Ts_ref)
 
+    def test_univariant_line_parallel(self):
+        andalusite = HP_2011_ds62.andalusite()
+        kyanite = HP_2011_ds62.ky()
+        composition = kyanite.formula
+
+        pressures = np.linspace(1.0e5, 1.0e9, 11)
+
+        assemblage = burnman.Composite([andalusite, kyanite])
+        equality_constraints = [
+            ("P", pressures),
+            ("phase_fraction", (andalusite, np.array([0.0]))),
+        ]
+        sols, prm = equilibrate(composition, assemblage, equality_constraints)
+        T_serial = assemblage.temperature
+        sols_parallel, prm = equilibrate(
+            composition, assemblage, equality_constraints, n_workers=3
+        )
+
+        self.assertEqual(sols.shape, sols_parallel.shape)
+        self.assertArraysAlmostEqual(
+            [sol.assemblage.temperature for sol in sols],
+            [sol.assemblage.temperature for sol in sols_parallel],
+        )
+        self.assertAlmostEqual(assemblage.temperature, T_serial)
+
+    def test_PT_grid_parallel(self):
+        composition = {"Mg": 1.0, "Fe": 1.0, "Si": 1.0, "O": 4.0}
+        equality_constraints = [
+            ("P", np.linspace(10.2e9, 10.6e9, 3)),
+            ("T", np.linspace(1550.0, 1700.0, 4)),
+        ]
+
+        def make_assemblage():
+            assemblage = make_ol_wad_assemblage()
+            assemblage.phases[0].set_composition([0.6, 0.4])
+            assemblage.phases[1].set_composition([0.3, 0.7])
+            return assemblage
+
+        sols, prm = equilibrate(composition, make_assemblage(), equality_constraints)
+        sols_parallel, prm = equilibrate(
+            composition, make_assemblage(), equality_constraints, n_workers=5
+        )
+
+        self.assertEqual(sols.shape, sols_parallel.shape)
+        for sol, sol_parallel in zip(sols.flat, sols_parallel.flat):
+            self.assertTrue(sol.success)
+            self.assertTrue(sol_parallel.success)
+            self.assertArraysAlmostEqual(sol.x, sol_parallel.x)
+
+    def test_PT_grid_reuse_jacobian(self):
+        composition = {"Mg": 1.0, "Fe": 1.0, "Si": 1.0, "O": 4.0}
+        equality_constraints = [
+            ("P", np.linspace(10.2e9, 10.6e9, 3)),
+            ("T", np.linspace(1550.0, 1700.0, 4)),
+        ]
+
+        def make_assemblage():
+            assemblage = make_ol_wad_assemblage()
+            assemblage.phases[0].set_composition([0.6, 0.4])
+            assemblage.phases[1].set_composition([0.3, 0.7])
+            return assemblage
+
+        sols, prm = equilibrate(composition, make_assemblage(), equality_constraints)
+        sols_qn, prm = equilibrate(
+            composition,
+            make_assemblage(),
+            equality_constraints,
+            reuse_jacobian=True,
+        )
+        for sol, sol_qn in zip(sols.flat, sols_qn.flat):
+            self.assertTrue(sol_qn.success)
+            self.assertEqual(sol.n_J_saved, 0)
+            self.assertArraysAlmostEqual(sol.x, sol_qn.x)
+        self.assertTrue(sum(sol.n_J_saved for sol in sols_qn.flat) > 0)
+
+    def test_equilibrate_many(self):
+        def constraints(assemblage):
+            return [
+                ("T", np.array([1600.0, 1700.0])),
+                ("phase_fraction", (assemblage.phases[0], 0.5)),
+            ]
+
+        compositions = [
+            {"Mg": 2.0 * (1.0 - x), "Fe": 2.0 * x, "Si": 1.0, "O": 4.0}
+            for x in [0.2, 0.5, 0.3, 0.4]
+        ]
+        assemblage = make_ol_wad_assemblage()
+        results, prm = equilibrate_many(
+            compositions, assemblage, constraints(assemblage)
+        )
+        self.assertEqual(results.shape, (4, 2))
+        self.assertTrue(np.all(results["success"]))
+        self.assertArraysAlmostEqual(results["phase_amounts"].flatten(), [0.5] * 16)
+
+        for composition, result in zip(compositions, results):
+            assemblage = make_ol_wad_assemblage()
+            sols, prm = equilibrate(composition, assemblage, constraints(assemblage))
+            for sol, x in zip(sols, result["x"]):
+                self.assertArraysAlmostEqual(sol.x, x)
+
+        assemblage = make_ol_wad_assemblage()
+        results_parallel, prm = equilibrate_many(
+            compositions, assemblage, constraints(assemblage), n_workers=2
+        )
+        self.assertEqual(results.dtype, results_parallel.dtype)
+        for x, x_parallel in zip(
+            results["x"].reshape(-1, prm.n_parameters),
+            results_parallel["x"].reshape(-1, prm.n_parameters),
+        ):
+            self.assertArraysAlmostEqual(x, x_parallel)
+
+    def test_n_workers_validation(self):
+        andalusite = HP_2011_ds62.andalusite()
+        kyanite = HP_2011_ds62.ky()
+        assemblage = burnman.Composite([andalusite, kyanite])
+        equality_constraints = [
+            ("P", np.linspace(1.0e5, 1.0e9, 3)),
+            ("phase_fraction", (andalusite, np.array([0.0]))),
+        ]
+        with self.assertRaises(ValueError):
+            equilibrate(kyanite.formula, assemblage, equality_constraints, n_workers=0)
+
     def test_invariant(self):
         sillimanite = HP_2011_ds62.sill()
         andalusite = HP_2011_ds62.andalusite()
@@ -1,5 +1,6 @@
 import os
 import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from util import BurnManTest
 import numpy as np
 from numpy import random
@@ -9,6 +10,9 @@ import burnman
 from burnman.optimize.eos_fitting import fit_XPTp_data
 from burnman.optimize.nonlinear_fitting import (
     NonLinearModel,
+    calculate_jacobian,
+    calculate_perturbed_mle_jacobian,
+    function_parameter_derivatives,
     nonlinear_least_squares_fit,
 )
 from burnman.utils.misc import attribute_function, pretty_string_values
@@ -153,6 +157,48 @@ class test_fitting(BurnManTest):
             zeros = np.zeros_like(fitted_eos.pcov[0])
             self.assertArraysAlmostEqual(fitted_eos.pcov[0], zeros)
 
+    def test_function_parameter_derivatives(self):
+        PTp = np.array([[1.0e9, 300.0, 0.0], [1.0e10, 1500.0, 0.0]])
+        covariances = np.array([np.eye(3)] * 2)
+        params = ["V_0", "K_0", "Kprime_0"]
+        for m in [
+            burnman.minerals.SLB_2011.periclase(),
+            burnman.minerals.HP_2011_ds62.fo(),
+        ]:
+            for flag in ["V", "gibbs", "S", "H", "C_p"]:
+                flags = [flag] * 2
+                model = burnman.eos_fitting.MineralFit(
+                    m, PTp, covariances, flags, params, [0.0, 0.0]
+                )
+                p = np.array([model.function(x, flag)[2] for x in PTp])
+                d0 = model.function_parameter_derivatives(PTp, flags)
+                d1 = function_parameter_derivatives(model, PTp, flags)
+                # Compare the relative changes in the property
+                # caused by each parameter perturbation
+                for i in range(len(params)):
+                    scale = model.delta_params[i] / np.abs(p)
+                    self.assertArraysAlmostEqual(
+                        d0[:, i, 2] * scale, d1[:, i, 2] * scale, tol_zero=1.0e-10
+                    )
+
+    def test_perturbed_mle_jacobian(self):
+        fo = burnman.minerals.HP_2011_ds62.fo()
+        pressures = np.linspace(1.0e9, 1.0e10, 6)
+        temperatures = np.linspace(300.0, 1500.0, 6)
+        volumes = fo.evaluate(["V"], pressures, temperatures)[0]
+        PTV = np.array([pressures, temperatures, volumes * 1.001]).T
+        covariances = np.array([np.diag([1.0e16, 1.0, 1.0e-16])] * 6)
+        model = burnman.eos_fitting.MineralFit(
+            fo, PTV, covariances, ["V"] * 6, ["V_0", "K_0", "Kprime_0"], [1.0e-12] * 6
+        )
+        # With tight MLE tolerances, the Jacobians agree to within
+        # the precision of the finite differences
+        calculate_jacobian(model)
+        J = model.jacobian
+        calculate_perturbed_mle_jacobian(model)
+        for i in range(3):
+            self.assertArraysAlmostEqual(J[:, i], model.jacobian[:, i], tol=1.0e-4)
+
     def test_fit_PTV_data_w_priors(self):
         fo = burnman.minerals.HP_2011_ds62.fo()
 
@@ -570,6 +616,51 @@ class test_fitting(BurnManTest):
             fitted_eos.popt, fitted_eos.pcov
         )
 
+    def test_parallel_solution_fitting(self):
+        solution = burnman.minerals.SLB_2011.mg_fe_olivine()
+        fit_params = [["V_0", 0], ["V_0", 1], ["V", 0, 1]]
+
+        random.seed(10)
+        data = []
+        for i in range(8):
+            x_fa = random.random()
+            P = random.random() * 1.0e10
+            T = random.random() * 1000.0 + 300.0
+            solution.set_composition([1.0 - x_fa, x_fa])
+            solution.set_state(P, T)
+            V = solution.V * (1.0 + random.normal() * 1.0e-3)
+            data.append([1.0 - x_fa, x_fa, P, T, V])
+        data = np.array(data)
+        data_covariances = np.zeros((len(data), 5, 5))
+        data_covariances[:, 4, 4] = np.power(data[:, 4] * 1.0e-3, 2.0)
+
+        fits = []
+        for executor in [None, ThreadPoolExecutor(2), ProcessPoolExecutor(2)]:
+            solution = burnman.minerals.SLB_2011.mg_fe_olivine()
+            solution.set_composition([0.5, 0.5])
+            fits.append(
+                fit_XPTp_data(
+                    solution=solution,
+                    flags="V",
+                    fit_params=fit_params,
+                    data=data,
+                    data_covariances=data_covariances,
+                    delta_params=np.array([1.0e-8, 1.0e-8, 1.0e-8]),
+                    param_tolerance=1.0e-5,
+                    verbose=False,
+                    executor=executor,
+                )
+            )
+            if executor is not None:
+                executor.shutdown()
+
+        # The parallel fits must be identical to the serial fit
+        for fit in fits[1:]:
+            for attr in ["popt", "pcov", "weighted_residuals", "jacobian"]:
+                self.assertTrue(
+                    np.array_equal(getattr(fit, attr), getattr(fits[0], attr))
+                )
+
     def test_fit_composition_to_solution(self):
         gt = burnman.minerals.JH_2015.garnet()
         fitted_species = ["Fe", "Ca", "Mg", "Cr", "Al", "Si", "Fe3+"]
@@ -1,4 +1,6 @@
 import unittest
+import warnings
+import numpy as np
 from util import BurnManTest
 
 import burnman
@@ -52,6 +54,30 @@ class geotherm(BurnManTest):
         test_K_adiabat = burnman.geotherm.adiabatic(pressure, T0, rock)
         self.assertArraysAlmostEqual(test_K_adiabat, [1500, 1650.22034002])
 
+    def test_batched_adiabats(self):
+        rock = mypericlase()
+        rock.set_method("slb3")
+        pressures = np.linspace(150.0e9, 10.0e9, 11)
+        T0s = np.array([1500.0, 2000.0, 2500.0])
+        temperatures = burnman.geotherm.adiabatic(pressures, T0s, rock)
+        self.assertEqual(temperatures.shape, (3, 11))
+        for T0, T in zip(T0s, temperatures):
+            self.assertArraysAlmostEqual(
+                T, burnman.geotherm.adiabatic(pressures, T0, rock)
+            )
+            S0 = rock.evaluate(["S"], [pressures[0]], [T0])[0][0]
+            S = rock.evaluate(["S"], pressures, T)[0]
+            self.assertArraysAlmostEqual(S, S0 * np.ones_like(S))
+
+    def test_unconverged_adiabat(self):
+        rock = mypericlase()
+        rock.set_method("slb3")
+        pressures = np.linspace(150.0e9, 10.0e9, 11)
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            burnman.geotherm.adiabatic(pressures, 2000.0, rock, T_tol=0.0)
+        self.assertTrue(any("did not converge" in str(wi.message) for wi in w))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -31,6 +31,12 @@ class min2(min1):
         self.params["V_0"] = 10e-6
 
 
+class min3(min1):
+    @property
+    def shear_modulus(self):
+        raise NotImplementedError("no shear modulus")
+
+
 class test_layer(BurnManTest):
     def layer1(self):
         rock = min1()
@@ -50,24 +56,24 @@ class test_layer(BurnManTest):
 
     def test_pressures(self):
         m = self.layer1()
-        self.assertArraysAlmostEqual(m.pressures[0::9] / 1.0e9, [61.62679132, 22.5])
+        self.assertArraysAlmostEqual(m.pressures[0::9] / 1.0e9, [61.06996736, 22.5])
 
     def test_vs1(self):
         m = self.layer1()
         self.assertArraysAlmostEqual(
-            m.shear_wave_velocity[0::9] / 1.0e3, [6.72149374, 5.94945973]
+            m.shear_wave_velocity[0::9] / 1.0e3, [6.71349873, 5.94945977]
         )
 
     def test_vp1(self):
         m = self.layer1()
         self.assertArraysAlmostEqual(
-            m.p_wave_velocity[0::9] / 1.0e3, [11.82332527, 10.21538394]
+            m.p_wave_velocity[0::9] / 1.0e3, [11.80553003, 10.21538402]
         )
 
     def test_vphi1(self):
         m = self.layer1()
         self.assertArraysAlmostEqual(
-            m.bulk_sound_velocity[0::9] / 1.0e3, [8.91925163, 7.56037749]
+            m.bulk_sound_velocity[0::9] / 1.0e3, [8.90369506, 7.56037755]
         )
 
     def test_evaluate(self):
@@ -78,12 +84,42 @@ class test_layer(BurnManTest):
             [700.0e3, 800.0e3, 750.0e3],
         )
 
-        d0 = [1.90903185e-05, 1.97610550e-05, 1.94185684e-05]
-        d1 = [5.14621379e01, 5.15786478e01, 5.15191396e01]
+        d0 = [1.91865920e-05, 1.98476090e-05, 1.95102201e-05]
+        d1 = [5.14788534e01, 5.15936936e01, 5.15350606e01]
 
         self.assertArraysAlmostEqual(d[0], d0)
         self.assertArraysAlmostEqual(d[1], d1)
 
+    def test_evaluate_radlist(self):
+        m = self.layer1()
+        props = ["density", "v_s", "gravity", "depth", "K_S"]
+        values = m.evaluate(props, radius_planet=6371.0e3)
+
+        calls = []
+        evaluate = m.material.evaluate
+
+        def counted_evaluate(vars_list, *args, **kwargs):
+            calls.append(vars_list)
+            return evaluate(vars_list, *args, **kwargs)
+
+        m.material.evaluate = counted_evaluate
+        values_radlist = m.evaluate(props, m.radii, radius_planet=6371.0e3)
+        for v1, v2 in zip(values, values_radlist):
+            self.assertArraysAlmostEqual(v1, v2)
+
+        # All the material properties are evaluated in a single pass
+        self.assertEqual(
+            calls,
+            [["density", "shear_wave_velocity", "isentropic_bulk_modulus_reuss"]],
+        )
+
+        # The interpolators are only built once per make()
+        interpolators = dict(m._interpolators)
+        m.evaluate(props, m.radii[1:-1], radius_planet=6371.0e3)
+        self.assertEqual(interpolators, m._interpolators)
+        m.make()
+        self.assertEqual(m._interpolators, {})
+
     def test_properties(self):
         m = self.layer1()
 
@@ -112,6 +148,43 @@ class test_layer(BurnManTest):
         self.assertTrue(isinstance(m.C_p, np.ndarray))
         self.assertTrue(isinstance(m.C_v, np.ndarray))
 
+    def test_material_properties(self):
+        m = self.layer1()
+        rock = m.material
+        props = ["density", "molar_entropy", "shear_wave_velocity"]
+        values = rock.evaluate(props, m.pressures, m.temperatures)
+        self.assertArraysAlmostEqual(m.rho, values[0])
+        self.assertArraysAlmostEqual(m.S, values[1])
+        self.assertArraysAlmostEqual(m.evaluate(["shear_wave_velocity"]), values[2])
+        # Properties not exposed by the layer itself are evaluated on request
+        self.assertArraysAlmostEqual(
+            m.evaluate(["isentropic_thermal_gradient"]),
+            rock.evaluate(["isentropic_thermal_gradient"], m.pressures, m.temperatures)[
+                0
+            ],
+        )
+
+    def test_material_property_fallback(self):
+        m = self.layer1()
+        rho = m.rho
+        m.set_material(min3())
+        m.make()
+
+        # If the properties cannot be evaluated in a single pass,
+        # the layer warns and evaluates them individually
+        with self.assertWarns(UserWarning):
+            with self.assertRaises(NotImplementedError):
+                m.evaluate(["density", "shear_modulus"])
+        self.assertArraysAlmostEqual(m.rho, rho)
+
+    def test_sublayers(self):
+        m = self.layer1()
+        with self.assertWarns(DeprecationWarning):
+            sublayers = m.sublayers
+        self.assertEqual(len(sublayers), len(m.radii))
+        self.assertFloatEqual(sublayers[3].rho, m.rho[3])
+        self.assertFloatEqual(sublayers[3].pressure, m.pressures[3])
+
     def test_tbl(self):
         p = BoundaryLayerPerturbation(
             radius_bottom=3480.0e3,
@@ -119,6 +119,53 @@ class test_material_name(BurnManTest):
         )
         self.assertEqual(Ss[0].shape, (2, 3))
 
+    def test_evaluate_vectorized_matches_scalar(self):
+        properties = ["gibbs", "V", "S", "K_S", "G", "alpha", "C_p", "gr", "v_p"]
+        pressures = np.linspace(1.0e9, 50.0e9, 6).reshape(2, 3)
+        temperatures = np.linspace(10.0, 2500.0, 6).reshape(2, 3)
+        for m in [
+            burnman.minerals.SLB_2011.periclase(),
+            burnman.minerals.HP_2011_ds62.fo(),
+            burnman.minerals.Matas_etal_2007.mg_perovskite(),
+        ]:
+            self.assertTrue(m._can_evaluate_arrays())
+            m.set_state(1.0e9, 300.0)
+            V = m.V
+            vectorized = m.evaluate(properties, pressures, temperatures)
+            scalar = burnman.Material.evaluate(m, properties, pressures, temperatures)
+            self.assertEqual(vectorized.shape, (len(properties), 2, 3))
+            self.assertArraysAlmostEqual(vectorized.flatten(), scalar.flatten())
+            # the original state is restored
+            self.assertFloatEqual(m.pressure, 1.0e9)
+            self.assertFloatEqual(m.V, V)
+
+    def test_evaluate_vectorized_fallback(self):
+        m = burnman.minerals.SLB_2011.stishovite()
+        self.assertFalse(m._can_evaluate_arrays())
+        Vs = m.evaluate(["V"], [1.0e9, 80.0e9], [300.0, 2000.0])
+        m.set_state(80.0e9, 2000.0)
+        self.assertFloatEqual(Vs[0][1], m.V)
+
+    def test_evaluate_vectorized_errors(self):
+        m = burnman.minerals.SLB_2011.periclase()
+
+        def scalar_only(vars_list, pressures, temperatures):
+            raise TypeError("only length-1 arrays can be converted")
+
+        def broken(vars_list, pressures, temperatures):
+            raise KeyError("K_0")
+
+        # Scalar-only implementations fall back to the state-by-state loop
+        m._evaluate_arrays = scalar_only
+        Vs = m.evaluate(["V"], [1.0e9, 80.0e9], [300.0, 2000.0])
+        m.set_state(80.0e9, 2000.0)
+        self.assertFloatEqual(Vs[0][1], m.V)
+
+        # Other errors are not hidden by the fallback
+        m._evaluate_arrays = broken
+        with self.assertRaises(KeyError):
+            m.evaluate(["V"], [1.0e9, 80.0e9], [300.0, 2000.0])
+
     def test_set_state_with_volume(self):
         m = self.min_with_name()
         P0 = 6.0e9
@@ -133,6 +180,65 @@ class test_material_name(BurnManTest):
         m.set_state(P1, T1)  # return to new state
         self.assertFloatEqual(V, m.V)
 
+    def test_state_cache(self):
+        m = burnman.minerals.SLB_2011.periclase()
+        cache = burnman.StateCache(maxsize=2)
+        m.state_cache = cache
+        states = [(10.0e9, 1000.0), (20.0e9, 1500.0), (10.0e9, 1000.0)]
+        Vs = []
+        for P, T in states:
+            m.set_state(P, T)
+            Vs.append(m.V)
+            self.assertFalse(m.molar_internal_energy is None)
+        self.assertEqual(cache.misses, 2)
+        self.assertEqual(cache.hits, 1)
+        self.assertFloatEqual(Vs[0], Vs[2])
+
+        # the stored states are not changed by later calculations
+        m.set_state_with_volume(1.01 * Vs[0], 1000.0)
+        m.set_state(10.0e9, 1000.0)
+        self.assertEqual(cache.hits, 2)
+        self.assertFloatEqual(m.V, Vs[0])
+
+        # the least recently used state is discarded
+        m.set_state(30.0e9, 2000.0)
+        self.assertEqual(len(cache), 2)
+        m.set_state(20.0e9, 1500.0)
+        self.assertEqual(cache.misses, 5)
+
+        m.set_state(30.0e9, 2000.0)
+        self.assertEqual(cache.hits, 3)
+
+        # changes to the parameters are picked up
+        m.set_state(10.0e9, 1000.0)
+        m.params["V_0"] *= 1.01
+        m.set_state(10.0e9, 1000.0)
+        self.assertEqual(cache.misses, 7)
+        self.assertTrue(m.V > Vs[0])
+        self.assertFloatEqual(cache.hit_rate, 3.0 / 10.0)
+
+        # solutions are cached by composition
+        ss = burnman.minerals.SLB_2011.mg_fe_olivine()
+        ss.state_cache = cache
+        ss.set_composition([0.9, 0.1])
+        ss.set_state(10.0e9, 1000.0)
+        G0 = ss.gibbs
+        ss.set_composition([0.8, 0.2])
+        ss.set_state(10.0e9, 1000.0)
+        ss.set_composition([0.9, 0.1])
+        ss.set_state(10.0e9, 1000.0)
+        self.assertEqual(cache.hits, 4)
+        self.assertFloatEqual(ss.gibbs, G0)
+        ss.endmembers[0][0].params["F_0"] += 1000.0
+        ss.set_state(10.0e9, 1000.0)
+        self.assertEqual(cache.misses, 10)
+        self.assertFloatEqual(ss.gibbs, G0 + 900.0)
+
+        # as are in-place changes to the solution model
+        ss.solution_model.We[0, 1] += 1000.0
+        ss.set_state(10.0e9, 1000.0)
+        self.assertEqual(cache.misses, 11)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,4 +1,6 @@
 import os
+import shutil
+import tempfile
 import unittest
 from util import BurnManTest
 import numpy as np
@@ -50,6 +52,37 @@ class PerpleX(BurnManTest):
             self.assertRaises(Exception, fnLT)
             self.assertRaises(Exception, fnHT)
 
+    def test_cache(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tab_file = os.path.join(tmpdir, "in23_1.tab")
+            shutil.copy(f"{path}/../burnman/data/input_perplex/in23_1.tab", tab_file)
+            rock1 = burnman.PerplexMaterial(tab_file, cache=True)
+            self.assertTrue(os.path.exists(tab_file + ".npz"))
+            rock2 = burnman.PerplexMaterial(tab_file, cache=True)
+            self.assertEqual(rock1.bounds, rock2.bounds)
+            self.assertEqual(rock1.params["molar_mass"], rock2.params["molar_mass"])
+            P, T = [10.0e9, 11.0e9], [2000.0, 2000.0]
+            properties = ["V", "S", "K_S", "shear_wave_velocity"]
+            self.assertArraysAlmostEqual(
+                rock1.evaluate(properties, P, T).flatten(),
+                rock2.evaluate(properties, P, T).flatten(),
+            )
+            self.assertArraysAlmostEqual(
+                rock.evaluate(properties, P, T).flatten(),
+                rock2.evaluate(properties, P, T).flatten(),
+            )
+
+    def test_nan_filling(self):
+        properties = np.ones((3, 4, 5)) * np.arange(5)
+        properties[0, 2, 2] = np.nan
+        properties[1, 2, 2] = np.nan
+        properties[2, 1, 3] = np.nan
+        properties[2, 0, 0] = np.nan
+        filled = burnman.classes.perplex._fill_nans(properties)
+        expected = np.ones((3, 4, 5)) * np.arange(5)
+        expected[2, 0, 0] = 0.0
+        self.assertArraysAlmostEqual(filled.flatten(), expected.flatten())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -29,7 +29,9 @@ class test_planet(BurnManTest):
         assert myplanet.get_layer_by_radius(2000.0e3) == core
         assert myplanet.get_layer_by_radius(4000.0e3) == mantle
         assert myplanet.get_layer_by_radius(5000.0e3) == mantle
-        self.assertFloatEqual(myplanet.pressure[0], 445219931774.84, tol=1.0e-4)
+        self.assertFloatEqual(myplanet.pressure[0], 445338592586.53, tol=1.0e-4)
+        self.assertTrue(len(myplanet.iteration_times) > 1)
+        self.assertTrue(np.all(np.array(myplanet.iteration_times) >= 0.0))
 
     def test_sort_layers(self):
         myplanet, core, mantle = make_simple_planet()
@@ -45,6 +47,19 @@ class test_planet(BurnManTest):
         self.assertFloatEqual(alpha[-2], myplanet.alpha[-2])
         self.assertFloatEqual(rho[-2], myplanet.density[-2])
 
+        radii = np.array([6000.0e3, 1000.0e3, 3480.0e3, 5000.0e3])
+        values = myplanet.evaluate(["rho", "gravity", "depth"], radii)
+        self.assertArraysAlmostEqual(values[2], myplanet.radius_planet - radii)
+        self.assertArraysAlmostEqual(
+            values[:2, 1], core.evaluate(["rho", "gravity"], [1000.0e3]).T[0]
+        )
+        self.assertArraysAlmostEqual(
+            values[:2, 0], mantle.evaluate(["rho", "gravity"], [6000.0e3]).T[0]
+        )
+        self.assertArraysAlmostEqual(
+            values[:2, 2], core.evaluate(["rho", "gravity"], [3480.0e3]).T[0]
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
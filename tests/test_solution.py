@@ -19,6 +19,8 @@ from burnman.minerals.SLB_2011 import mg_post_perovskite
 from burnman.minerals.SLB_2011 import fe_post_perovskite
 from burnman.minerals.SLB_2011 import al_post_perovskite
 from burnman.tools.eos import check_eos_consistency
+from burnman.classes import solution as solution_module
+from burnman.classes.solution import relax_solution
 from burnman.tools.solution import transform_solution_to_new_basis
 
 
@@ -1018,6 +1020,16 @@ class test_solidsolution(BurnManTest):
         self.assertAlmostEqual(ss.excess_entropy, 0.25 * 0.75 * 5)
         self.assertAlmostEqual(ss.excess_volume, 0.25 * 0.75 * 1.0e-6)
 
+    def test_polynomial_hessians_repeated_calls(self):
+        ss = polynomial_esv_and_mbr_mixing()
+        ss.set_state(1.0e5, 300.0)
+        ss.set_composition([0.25, 0.75])
+        m = ss.solution_model
+        for f in [m.entropy_hessian, m.volume_hessian]:
+            h1 = f(1.0e5, 300.0, ss.molar_fractions)
+            h2 = f(1.0e5, 300.0, ss.molar_fractions)
+            self.assertArraysAlmostEqual(h1.flatten(), h2.flatten())
+
     def test_polynomial_ternary_transformed(self):
         ss1 = two_site_ss_polynomial_ternary()
         ss2 = two_site_ss_polynomial_ternary_transformed()
@@ -1272,6 +1284,22 @@ class test_solidsolution(BurnManTest):
 
         self.assertArraysAlmostEqual(G1, G2)
 
+    def test_set_composition_keeps_endmember_properties(self):
+        ol = olivine_ss()
+        ol.set_state(1.0e9, 1000.0)
+        ol.set_composition([0.9, 0.1])
+        mbr_gibbs = ol._endmember_gibbs
+        partial_gibbs = ol.partial_gibbs
+
+        ol.set_composition([0.5, 0.5])
+        self.assertTrue("_endmember_gibbs" in ol._cached)
+        self.assertFalse("partial_gibbs" in ol._cached)
+        self.assertTrue(ol._endmember_gibbs is mbr_gibbs)
+        self.assertFalse(np.allclose(ol.partial_gibbs, partial_gibbs))
+
+        ol.set_state(2.0e9, 1000.0)
+        self.assertFalse("_endmember_gibbs" in ol._cached)
+
     def test_evaluate_with_volumes(self):
         ol = olivine_ideal_ss()
         molar_fractions = np.array([[0.1, 0.9], [0.2, 0.8]])
@@ -1341,6 +1369,89 @@ class test_solidsolution(BurnManTest):
             > ropx.unrelaxed.isothermal_compressibility_reuss
         )
 
+    def test_relaxed_solution_newton(self):
+        opx = burnman.minerals.JH_2015.orthopyroxene()
+        ropx = burnman.RelaxedSolution(opx, opx.reaction_basis, opx.compositional_basis)
+
+        # Relaxation during set_composition, after set_state
+        ropx.set_state(1.0e9, 1000.0)
+        for x in [[0.2, 0.2, 0.1, 0.1, 0.2, 0.2], [0.25, 0.15, 0.1, 0.1, 0.2, 0.2]]:
+            ropx.set_composition(x)
+            mu = np.einsum("ij, j", opx.reaction_basis, ropx.partial_gibbs)[0]
+            self.assertTrue(np.abs(mu) < 1.0e-6)
+            self.assertTrue(ropx.relaxation_iterations < 10)
+
+        # The relaxed state should have a lower Gibbs energy than
+        # nearby states along the relaxation vector
+        G = ropx.gibbs
+        n = ropx.molar_fractions
+        for dq in [-1.0e-4, 1.0e-4]:
+            opx.set_composition(n + dq * opx.reaction_basis[0])
+            self.assertTrue(opx.gibbs > G)
+
+        # Relaxation starting very close to the edge of the solution
+        occ = np.einsum("i, ij", n, opx.solution_model.endmember_occupancies)
+        docc = np.einsum(
+            "i, ij", opx.reaction_basis[0], opx.solution_model.endmember_occupancies
+        )
+        mask = docc > 0.0
+        dq = (1.0 - 1.0e-12) * np.min(occ[mask] / docc[mask])
+        opx.set_composition(n - dq * opx.reaction_basis[0])
+        ropx._relax_at_PTX()
+        self.assertArraysAlmostEqual(ropx.molar_fractions, n)
+
+    def test_relaxed_solution_line_search_failure(self):
+        class FlatSolution(object):
+            # The Gibbs energy (n.mu) is constant, but the partial
+            # Gibbs energies are not consistent with it, so no step
+            # along the Newton direction reduces the Gibbs energy
+            solution_model = None
+            gibbs_hessian = np.array([[1.0, 0.0], [0.0, 1.0]])
+
+            def set_composition(self, molar_fractions):
+                self.molar_fractions = np.array(molar_fractions)
+                self.partial_gibbs = np.array([1.0 / molar_fractions[0], 0.0])
+
+        ss = FlatSolution()
+        ss.set_composition([0.5, 0.5])
+        dq, iterations, converged = relax_solution(ss, np.array([[1.0], [-1.0]]))
+        self.assertFalse(converged)
+        self.assertEqual(iterations, 1)
+        self.assertArraysAlmostEqual(ss.molar_fractions, [0.5, 0.5])
+
+        # If the Newton minimization fails, the relaxed solution
+        # falls back to the Nelder-Mead method
+        opx = burnman.minerals.JH_2015.orthopyroxene()
+        ropx = burnman.RelaxedSolution(opx, opx.reaction_basis, opx.compositional_basis)
+        ropx.set_state(1.0e9, 1000.0)
+        ropx.set_composition([0.2, 0.2, 0.1, 0.1, 0.2, 0.2])
+        n = ropx.molar_fractions
+
+        def failed_relaxation(solution, dndq):
+            return np.zeros(dndq.shape[1]), 50, False
+
+        original = solution_module.relax_solution
+        solution_module.relax_solution = failed_relaxation
+        try:
+            ropx.set_composition([0.2, 0.2, 0.1, 0.1, 0.2, 0.2], q_initial=[0.0])
+        finally:
+            solution_module.relax_solution = original
+        self.assertTrue(np.max(np.abs(ropx.molar_fractions - n)) < 1.0e-4)
+
+    def test_relaxed_solution_evaluate(self):
+        opx = burnman.minerals.JH_2015.orthopyroxene()
+        ropx = burnman.RelaxedSolution(opx, opx.reaction_basis, opx.compositional_basis)
+        ropx.set_state(1.0e9, 1000.0)
+        ropx.set_composition([0.2, 0.2, 0.1, 0.1, 0.2, 0.2])
+        n = ropx.molar_fractions
+        G = ropx.gibbs
+
+        # evaluate restores the relaxed state and composition
+        gibbs = ropx.evaluate(["gibbs"], [1.0e9, 2.0e9], [1000.0, 1200.0])[0]
+        self.assertFloatEqual(gibbs[0], G)
+        self.assertArraysAlmostEqual(ropx.molar_fractions, n)
+        self.assertFloatEqual(ropx.gibbs, G)
+
     def test_transform_ideal(self):
         ol = olivine_ideal_ss()
         new_ol = transform_solution_to_new_basis(
@@ -1490,6 +1601,137 @@ class test_solidsolution(BurnManTest):
         np.testing.assert_allclose(alphas, ones)
         np.testing.assert_almost_equal(H_xs, 0.0)
 
+    def test_subregular_closed_form(self):
+        # reference implementation using the full
+        # 4D and 5D tensors of Kronecker deltas and proportions
+        def interactions(p, W):
+            n = len(p)
+            A = np.einsum("li, j, k->ijkl", np.identity(n), p, p)
+            ppp = np.einsum("i, j, k->ijk", p, p, p)
+            Asum = (
+                A
+                + np.transpose(A, axes=[1, 0, 2, 3])
+                + np.transpose(A, axes=[1, 2, 0, 3])
+                - 2 * ppp[:, :, :, None]
+            )
+            return np.einsum("ijk, ijkl->l", W, Asum)
+
+        def hessian(p, W):
+            n = len(p)
+            Id = np.identity(n)
+            IIp = np.einsum("il, jm, k->ijklm", Id, Id, p)
+            Ipp = np.einsum("il, j, k->ijkl", Id, p, p)
+            ppp = np.einsum("i, j, k->ijk", p, p, p)
+            A = (
+                IIp
+                + np.transpose(IIp, axes=[0, 2, 1, 3, 4])
+                + np.transpose(IIp, axes=[1, 0, 2, 3, 4])
+                + np.transpose(IIp, axes=[1, 2, 0, 3, 4])
+                + np.transpose(IIp, axes=[2, 1, 0, 3, 4])
+                + np.transpose(IIp, axes=[2, 0, 1, 3, 4])
+            )
+            B = 2.0 * (
+                Ipp
+                + np.transpose(Ipp, axes=[1, 0, 2, 3])
+                + np.transpose(Ipp, axes=[2, 1, 0, 3])
+            )
+            Asum = A - B[:, :, :, :, None] - B[:, :, :, None, :]
+            Asum += 6.0 * ppp[:, :, :, None, None]
+            return np.einsum("ijklm, ijk->lm", Asum, W)
+
+        ss = two_site_ss_subregular_ternary()
+        sm = ss.solution_model
+        P, T = 1.0e9, 1000.0
+        for p in [np.array([0.2, 0.3, 0.5]), np.array([0.7, 0.05, 0.25])]:
+            W = sm.Wijke - T * sm.Wijks + P * sm.Wijkv
+            mu = sm._non_ideal_excess_partial_gibbs(P, T, p)
+            self.assertArraysAlmostEqual(mu, interactions(p, W))
+            H = sm.gibbs_hessian(P, T, p) + T * sm._ideal_entropy_hessian(T, p)
+            self.assertArraysAlmostEqual(H.ravel(), hessian(p, W).ravel())
+            H = sm.volume_hessian(P, T, p)
+            self.assertArraysAlmostEqual(H.ravel(), hessian(p, sm.Wijkv).ravel())
+
+        # the interaction tensors can be replaced or modified in place
+        sm.Wijkv = np.zeros_like(sm.Wijkv)
+        self.assertArraysAlmostEqual(sm.excess_partial_volumes(P, T, p), np.zeros(3))
+        sm.Wijkv[0, 1, 1] = 1.0e-6
+        self.assertArraysAlmostEqual(
+            sm.excess_partial_volumes(P, T, p), interactions(p, sm.Wijkv)
+        )
+
+        # the contractions are reused for the composition set by the
+        # solution, and recalculated when the composition changes
+        ss.set_state(P, T)
+        for p in [np.array([0.2, 0.3, 0.5]), np.array([0.7, 0.05, 0.25])]:
+            ss.set_composition(p)
+            self.assertArraysAlmostEqual(
+                ss.excess_partial_volumes, interactions(p, sm.Wijkv)
+            )
+            self.assertArraysAlmostEqual(
+                ss.volume_hessian.ravel(), hessian(p, sm.Wijkv).ravel()
+            )
+
+    def test_batched_evaluate(self):
+        props = [
+            "activities",
+            "excess_partial_gibbs",
+            "partial_entropies",
+            "partial_volumes",
+            "gibbs",
+            "excess_enthalpy",
+            "gibbs_hessian",
+            "entropy_hessian",
+            "volume_hessian",
+        ]
+        for ss in [
+            olivine_ideal_ss(),
+            temkin_ss(),
+            two_site_ss_asymmetric(),
+            two_site_ss_subregular_ternary(),
+            two_site_ss_polynomial_high_order_transformed(),
+            polynomial_esv_and_mbr_mixing(),
+        ]:
+            n = ss.n_endmembers
+            X = np.array(
+                [[0.2, 0.3, 0.4, 0.1], [0.6, 0.1, 0.2, 0.1], [0.1, 0.7, 0.1, 0.1]]
+            )
+            X = X[:, :n] / np.sum(X[:, :n], axis=1)[:, np.newaxis]
+            P = np.array([1.0e9, 5.0e9, 1.0e9])
+            T = np.array([1000.0, 1500.0, 1000.0])
+            ss.set_composition(X[1])
+            ss.set_state(2.0e9, 1200.0)
+            G0 = ss.gibbs
+            self.assertTrue(ss._can_evaluate_batched(props))
+            batched = ss.evaluate(props, P, T, X)
+            looped = burnman.Material.evaluate(ss, props, P, T, X)
+            for b, l in zip(batched, looped):
+                self.assertArraysAlmostEqual(np.ravel(b), np.ravel(l))
+
+            # the state of the solution is unchanged
+            ss.set_state(2.0e9, 1200.0)
+            self.assertFloatEqual(ss.gibbs, G0)
+
+    def test_batched_solution_model(self):
+        ss = two_site_ss_subregular_ternary()
+        X = np.array([[0.2, 0.3, 0.5], [0.6, 0.1, 0.3]])
+        P = 1.0e9
+        T = np.array([1000.0, 1500.0])
+        sm = ss.solution_model
+        mu = sm.excess_partial_gibbs_energies(P, T, X)
+        hess = sm.gibbs_hessian(P, T, X)
+        G = sm.excess_gibbs_energy(P, T, X)
+        self.assertEqual(mu.shape, (2, 3))
+        self.assertEqual(hess.shape, (2, 3, 3))
+        self.assertEqual(G.shape, (2,))
+        for i in range(2):
+            self.assertArraysAlmostEqual(
+                mu[i], sm.excess_partial_gibbs_energies(P, T[i], X[i])
+            )
+            self.assertArraysAlmostEqual(
+                hess[i].ravel(), sm.gibbs_hessian(P, T[i], X[i]).ravel()
+            )
+            self.assertFloatEqual(G[i], sm.excess_gibbs_energy(P, T[i], X[i]))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -136,6 +136,69 @@ class test_solvers(BurnManTest):
             self.assertArraysAlmostEqual(sol.x, expected_solutions[n - 1])
             assert sol.success
 
+    def test_dns_broyden_tridiagonal_30_reuse_jacobian(self):
+        def F(x):
+            xpad = np.concatenate(([0.0], x, [0.0]))
+            f = np.zeros((len(xpad)))
+            for i in range(1, len(xpad) - 1):
+                f[i] = (
+                    (3.0 - 2.0 * xpad[i]) * xpad[i]
+                    - xpad[i - 1]
+                    - 2.0 * xpad[i + 1]
+                    + 1.0
+                )
+            return f[1:-1]
+
+        n_J = [0]
+
+        def J(x):
+            n_J[0] += 1
+            xpad = np.concatenate(([0.0], x, [0.0]))
+            j = np.zeros((len(xpad), len(xpad)))
+            for i in range(1, len(xpad) - 1):
+                j[i, i - 1] = -1.0
+                j[i, i] = 3.0 - 4.0 * xpad[i]
+                j[i, i + 1] = -2.0
+
+            return j[1:-1, 1:-1]
+
+        # check convergence for several test cases
+        expected_solutions = [
+            [-0.28077641],
+            [-0.45328926, -0.38540505],
+            [-0.52677285, -0.56764891, -0.41031222],
+            [-0.55457673, -0.63942044, -0.59070079, -0.41526838],
+            [-0.5648284, -0.66627372, -0.66091704, -0.59505005, -0.41620111],
+        ]
+
+        for n in range(1, 6):
+            guess = -1.0 * np.ones((n))
+            n_J[0] = 0
+            sol = damped_newton_solve(F, J, guess=guess)
+            n_J_newton = n_J[0]
+            n_J[0] = 0
+            sol = damped_newton_solve(F, J, guess=guess, reuse_jacobian=True)
+            self.assertArraysAlmostEqual(sol.x, expected_solutions[n - 1])
+            assert sol.success
+            # The final evaluation of J at the solution is not part
+            # of an iteration
+            self.assertEqual(n_J[0], sol.n_it - sol.n_J_saved + 1)
+            self.assertTrue(n_J[0] < n_J_newton)
+
+    def test_dns_singular_reuse_jacobian(self):
+        # The Jacobian is singular everywhere, so it is not recalculated
+        # at the solution by the final adjustment
+        def F(x):
+            return np.array([x[0] * x[0] - 1.0, 0.0])
+
+        def J(x):
+            return np.array([[2.0 * x[0], 0.0], [0.0, 0.0]])
+
+        sol = damped_newton_solve(F, J, guess=np.array([3.0, 1.0]), reuse_jacobian=True)
+        assert sol.success
+        self.assertTrue(sol.n_J_saved > 0)
+        self.assertArraysAlmostEqual(sol.J[0], J(sol.x)[0])
+
     # The following tests use the generalised Rosenbrock function:
     # f(x, y) = (a - x)^2 + b(y - x^2)^2
     # solving for f'=0
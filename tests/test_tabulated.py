@@ -0,0 +1,97 @@
+import unittest
+from util import BurnManTest
+import numpy as np
+import burnman
+from burnman import minerals
+
+
+class Tabulated(BurnManTest):
+    def test_mineral(self):
+        per = minerals.SLB_2011.periclase()
+        tab = burnman.TabulatedMaterial.from_material(
+            per, [10.0e9, 50.0e9], [1000.0, 2000.0], tolerance=1.0e-3
+        )
+        self.assertTrue(tab.max_error < 1.0e-3)
+        self.assertFloatEqual(tab.molar_mass, per.molar_mass)
+
+        # The grid points reproduce the mineral exactly
+        P, T = tab.pressures[1], tab.temperatures[2]
+        per.set_state(P, T)
+        tab.set_state(P, T)
+        for prop in ["gibbs", "V", "S", "C_p", "alpha", "K_T", "K_S", "G"]:
+            self.assertFloatEqual(getattr(tab, prop), getattr(per, prop))
+        self.assertFloatEqual(tab.rho, per.rho)
+        self.assertFloatEqual(tab.v_p, per.v_p)
+        self.assertFloatEqual(tab.gr, per.gr)
+        self.assertFloatEqual(tab.C_v, per.C_v)
+
+        # Points between grid points are within the tolerance
+        pressures = np.linspace(11.0e9, 49.0e9, 7)
+        temperatures = np.linspace(1010.0, 1990.0, 7)
+        props = ["V", "S", "K_S", "G", "v_s"]
+        values = per.evaluate(props, pressures, temperatures)
+        tab_values = tab.evaluate(props, pressures, temperatures)
+        self.assertTrue(np.max(np.abs(tab_values / values - 1.0)) < 2.0e-3)
+
+    def test_cell_centres(self):
+        class Bumpy(burnman.Material):
+            # Properties which are equal to one on all of the lines of
+            # the initial grid, but not in the centres of the grid cells
+            def evaluate(self, properties, pressures, temperatures):
+                bump = np.sin(np.pi * np.asarray(pressures) / 10.0e9) * np.sin(
+                    np.pi * (np.asarray(temperatures) - 1000.0) / 250.0
+                )
+                values = np.array([1.0 + 0.1 * bump for prop in properties])
+                if "molar_mass" in properties:
+                    values[properties.index("molar_mass")] = 0.1
+                return values
+
+        tab = burnman.TabulatedMaterial.from_material(
+            Bumpy(), [10.0e9, 50.0e9], [1000.0, 2000.0], tolerance=1.0e-2
+        )
+        self.assertTrue(len(tab.pressures) > 5)
+        self.assertTrue(len(tab.temperatures) > 5)
+
+        # The interpolated properties at the centres of the final
+        # grid cells are within the tolerance
+        Pmid = 0.5 * (tab.pressures[1:] + tab.pressures[:-1])
+        Tmid = 0.5 * (tab.temperatures[1:] + tab.temperatures[:-1])
+        pressures, temperatures = [a.flatten() for a in np.meshgrid(Pmid, Tmid)]
+        tab_V = tab.evaluate(["V"], pressures, temperatures)[0]
+        V = Bumpy().evaluate(["V"], pressures, temperatures)[0]
+        self.assertTrue(np.max(np.abs(tab_V / V - 1.0)) < 1.0e-2)
+
+    def test_evaluate(self):
+        rock = burnman.Composite(
+            [minerals.SLB_2011.mg_perovskite(), minerals.SLB_2011.periclase()],
+            [0.8, 0.2],
+        )
+        tab = burnman.TabulatedMaterial.from_material(
+            rock, [25.0e9, 30.0e9], [2000.0, 2200.0], tolerance=1.0e-2
+        )
+        pressures = [26.0e9, 27.0e9, 29.0e9]
+        temperatures = [2050.0, 2100.0, 2150.0]
+        props = ["H", "rho", "v_p", "v_phi"]
+        values = tab.evaluate(props, pressures, temperatures)
+        for i in range(3):
+            tab.set_state(pressures[i], temperatures[i])
+            self.assertArraysAlmostEqual(
+                values[:, i], [getattr(tab, prop) for prop in props]
+            )
+        self.assertArraysAlmostEqual(
+            values[0],
+            tab.evaluate(["gibbs"], pressures, temperatures)[0]
+            + np.array(temperatures) * tab.evaluate(["S"], pressures, temperatures)[0],
+        )
+
+    def test_bounds(self):
+        per = minerals.SLB_2011.periclase()
+        tab = burnman.TabulatedMaterial.from_material(
+            per, [10.0e9, 20.0e9], [1000.0, 1500.0], tolerance=1.0e-2
+        )
+        self.assertRaises(ValueError, tab.set_state, 5.0e9, 1200.0)
+        self.assertRaises(ValueError, tab.set_state, 15.0e9, 2000.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -207,6 +207,23 @@ class test_tools(BurnManTest):
         arr = np.array([[2.0, 0.0], [0.0, 1.0]])
         self.assertTrue(is_positive_definite(arr))
 
+    def test_dataset_covariances(self):
+        for dataset in [
+            burnman.minerals.HP_2011_ds62,
+            burnman.minerals.HGP_2018_ds633,
+        ]:
+            cov = dataset.cov()
+            M = cov["covariance_matrix"]
+            n = len(cov["endmember_names"])
+            self.assertEqual(M.shape, (n, n))
+            self.assertFalse(M.flags.writeable)
+            self.assertArraysAlmostEqual(M.ravel(), M.T.ravel())
+            self.assertTrue(dataset.cov() is cov)
+
+        cov = burnman.minerals.HP_2011_ds62.cov()
+        i = cov["endmember_names"].index("fo")
+        self.assertFloatEqual(cov["covariance_matrix"][i, i], 2.862e05)
+
     def test_plot_elastic(self):
 
         pretty_plot()
@@ -9,9 +9,10 @@ import scipy.integrate as integrate
 
 from burnman.utils.misc import extract_lines_between_markers
 from burnman.utils.misc import run_cli_program_with_input
-from burnman.utils.math import smooth_array
+from burnman.utils.math import smooth_array, cumulative_integral
 from burnman.utils.math import l2_norm_profile, l2_norm_profiles
 from burnman.utils.math import chisqr_profiles
+from burnman.utils.math import bracket_vectorized, safeguarded_newton
 from burnman.utils.math import independent_row_indices
 from burnman.utils.math import array_to_rational_matrix
 from burnman.utils.math import complete_basis, generate_complete_basis
@@ -83,6 +84,31 @@ class test_utils(BurnManTest):
         )
         np.testing.assert_allclose(result, expected, rtol=1e-5)
 
+    def test_cumulative_integral_trapezoid(self):
+        x = np.array([0.0, 0.1, 0.4, 1.0])
+        y = np.exp(x)
+        np.testing.assert_allclose(
+            cumulative_integral(y, x, initial=1.0),
+            1.0 + integrate.cumulative_trapezoid(y, x, initial=0.0),
+        )
+
+    def test_cumulative_integral_high_order(self):
+        # Errors decrease as the fourth power of the grid spacing
+        errors = []
+        for n in [11, 21]:
+            x = np.linspace(0.0, 2.0, n)
+            errors.append(
+                cumulative_integral(np.sin(x), x, high_order=True)[-1]
+                - (1.0 - np.cos(2.0))
+            )
+        self.assertTrue(np.abs(errors[0] / errors[1]) > 14.0)
+
+        # Quadratic polynomials are integrated exactly on uneven grids
+        x = np.array([0.0, 0.1, 0.4, 0.5, 1.0])
+        np.testing.assert_allclose(
+            cumulative_integral(x * x, x, high_order=True), x**3 / 3.0
+        )
+
     def test_l2_norm_exact_match(self):
         x = np.linspace(0, 10, 100)
         f = np.sin(x)
@@ -137,6 +163,23 @@ class test_utils(BurnManTest):
         with self.assertRaises(ValueError):
             l2_norm_profiles(depth, calc, obs)
 
+    def test_safeguarded_newton_vectorized(self):
+        # Roots of x^3 = a, with one problem that has no real root
+        # (x^2 = -1) to check the convergence mask
+        a = np.array([1.0, 8.0, 1.0e3, -27.0, 0.5])
+
+        def fn(x, indices):
+            f = np.where(indices == 4, x * x + 1.0, x**3 - a[indices])
+            dfdx = np.where(indices == 4, 2.0 * x, 3.0 * x * x)
+            return f, dfdx
+
+        xa, xb, fa, fb, bracketed = bracket_vectorized(fn, np.ones(5), 0.1)
+        self.assertArraysAlmostEqual(bracketed, [True, True, True, True, False])
+        x, converged = safeguarded_newton(fn, xa, xb, fa, fb)
+        self.assertArraysAlmostEqual(converged, [True, True, True, True, False])
+        self.assertArraysAlmostEqual(x[:4], np.cbrt(a[:4]))
+        self.assertTrue(np.isnan(x[4]))
+
     def test_chisqr_perfect_match(self):
         profile1 = np.array([1.0, 2.0, 3.0])
         profile2 = np.array([4.0, 5.0, 6.0])